@@ -1,11 +1,15 @@
+import os
+import sys
+
 import numpy as np
 
-# 1. Fundamental Geometric Constants (from deductive logic)
-S_geo = 4*np.pi**3 + np.pi**2 + np.pi
-delta_Cas = 1/(24 * S_geo)
-delta_BB = 1/(np.pi**4 * S_geo**2)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import alpha_inv_terms
+from rpft.constants import constant
 
-alpha_inv_theory = S_geo - delta_Cas - delta_BB
+# 1. Fundamental Geometric Constants (from deductive logic)
+# S_geo = 4π³ + π² + π, δ_Cas = 1/(24·S_geo), δ_BB = 1/(π⁴·S_geo²)
+S_geo, delta_Cas, delta_BB, alpha_inv_theory = alpha_inv_terms(backend="float64")
 alpha_theory = 1/alpha_inv_theory
 
 print(f"Inverse Fine Structure Constant (Theory): {alpha_inv_theory:.12f}")
@@ -23,7 +27,7 @@ a_e_theory = alpha_theory / (2 * np.pi)
 print(f"Anomalous Magnetic Moment (1-loop):     {a_e_theory:.12f}")
 
 # Comparison with CODATA 2022
-alpha_inv_codata = 137.035999177
+alpha_inv_codata = float(constant("alpha_inv"))
 a_e_codata = 0.00115965218059 # CODATA 2022 value for electron magnetic moment anomaly
 
 print("-" * 40)
@@ -3,27 +3,33 @@
 Численная проверка кандидата κ_Cas = 1/24 через heat kernel.
 Цель: зафиксировать структуру ζ/heat-kernel и показать, что κ_Cas=1/24 согласуется численно; строгая нормировка требует отдельного расчёта.
 
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 04_heat_kernel.py [раздел ...] (rpft.sections).
+
 Навигация:
   ← 03_casimir_derivation.md | 05_pi4_derivation.md →
   Главная: 00_main.md
 """
 
+import math
+import os
+import sys
+
 from mpmath import mp, exp, pi, sqrt, log, nsum, inf, gamma as mpgamma
 import numpy as np
 
-mp.dps = 50
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft import spectrum
+from rpft.heat import heat_coefficients, heat_trace, heat_trace_theta
+from rpft.alpha import s_geo
+from rpft.sections import run_sections
 
-print("="*70)
-print("ЧИСЛЕННАЯ ПРОВЕРКА κ_Cas = 1/24 (heat kernel)")
-print("="*70)
+DPS = 50
 
 # =============================================================================
 # §1. ЭТАЛОН: ОКРУЖНОСТЬ S¹
 # =============================================================================
 
-print("\n§1. ЭТАЛОН: Casimir на S¹")
-print("-"*40)
-
 def heat_trace_S1(t, L=2*float(pi)):
     """
     Heat trace на S¹ длины L.
@@ -48,83 +54,95 @@ def zeta_S1(s):
     # ζ_R(2s) через сумму
     return 2 * nsum(lambda n: n**(-2*s), [1, inf])
 
-# Casimir на S¹: ζ(-1/2) = ζ_R(-1) = -1/12
-print("Дзета Римана ζ_R(-1) = -1/12")
-print(f"Ожидаемый коэффициент: -1/12 = {-1/12:.10f}")
-
-# Формула: E_Cas(S¹) = -π/(6L) при L=2π → -1/12
-E_cas_S1 = -pi / (6 * 2*pi)
-print(f"E_Cas(S¹, L=2π) = -π/(12π) = -1/12 = {float(E_cas_S1):.10f}")
-
 # =============================================================================
 # §2. HEAT KERNEL НА S³
 # =============================================================================
 
-print("\n§2. Heat Kernel на S³")
-print("-"*40)
-
-def heat_trace_S3(t, N_max=200):
+def heat_trace_S3(t, N_max=200, digits=None):
     """
     Heat trace для скаляров на S³.
-    λ_n = n(n+2), d_n = (n+1)²
+    λ_n = n(n+2), d_n = (n+1)², n = 1..N_max
+    t может быть массивом: все значения считаются одним вызовом rpft.heat.
     """
-    t = mp.mpf(t)
-    total = mp.mpf(0)
-    for n in range(1, N_max+1):
-        d_n = (n + 1)**2
-        lam_n = n * (n + 2)
-        total += d_n * exp(-t * lam_n)
-    return total
-
-# Weyl асимптотика: K(t) ~ Vol(S³)/(4πt)^{3/2} при t→0
-Vol_S3 = 2 * pi**2
-print(f"Vol(S³) = 2π² = {float(Vol_S3):.10f}")
-
-# Проверка при малых t
-for t_val in [0.1, 0.05, 0.01]:
-    K_num = heat_trace_S3(t_val, N_max=500)
-    K_weyl = Vol_S3 / (4*pi*t_val)**1.5
-    ratio = K_num / K_weyl
-    print(f"t={t_val}: K_num/K_weyl = {float(ratio):.6f}")
+    return heat_trace(spectrum("scalar", N_max, n_min=1), t, digits=digits or mp.dps)
 
 # =============================================================================
 # §3. HEAT KERNEL НА L(2,1)
 # =============================================================================
 
-print("\n§3. Heat Kernel на L(2,1) = RP³")
-print("-"*40)
-
-def heat_trace_L21(t, N_max=200):
+def heat_trace_L21(t, N_max=200, digits=None):
     """
     Heat trace для скаляров на L(2,1).
-    Только чётные n: λ_n = n(n+2), d_n = (n+1)²
+    Только чётные n = 2k, k = 1..N_max: λ_n = n(n+2), d_n = (n+1)²
     """
-    t = mp.mpf(t)
-    total = mp.mpf(0)
-    for k in range(1, N_max+1):
-        n = 2*k  # только чётные
-        d_n = (n + 1)**2
-        lam_n = n * (n + 2)
-        total += d_n * exp(-t * lam_n)
-    return total
+    return heat_trace(spectrum("scalar", 2*N_max, p=2, n_min=1), t, digits=digits or mp.dps)
 
-Vol_RP3 = pi**2
-print(f"Vol(RP³) = π² = {float(Vol_RP3):.10f}")
+# =============================================================================
+# §5. СТРУКТУРА ζ/HEAT KERNEL И МЕСТО κ_Cas
+# =============================================================================
 
-for t_val in [0.1, 0.05, 0.01]:
-    K_num = heat_trace_L21(t_val, N_max=500)
-    K_weyl = Vol_RP3 / (4*pi*t_val)**1.5
-    ratio = K_num / K_weyl
-    print(f"t={t_val}: K_num/K_weyl = {float(ratio):.6f}")
+def extract_a2(spec, vol, d=3, t_range=np.linspace(0.002, 0.05, 60), k_max=6, zero_modes=0):
+    """
+    Извлечь a₁, a₂, … из (4πt)^{d/2} K(t) = Σ aₖ tᵏ взвешенным МНК по сетке t.
+    K(t) на всей сетке — один пакетный вызов в float64; a₀ = Vol вычитается до подгонки
+    (rpft.heat.heat_coefficients). Возвращает (aₖ, ошибки) для k = 0…k_max.
+    """
+    return heat_coefficients(spec, t_range, d=d, k_max=k_max, known=(float(vol),),
+                             zero_modes=zero_modes)
 
 # =============================================================================
-# §4. КОЭФФИЦИЕНТ a₂ И 1/24
+# Разделы вывода
 # =============================================================================
 
-print("\n§4. Seeley-DeWitt коэффициент a₂")
-print("-"*40)
-
-print("""
+def section_1():
+    """§1. ЭТАЛОН: ОКРУЖНОСТЬ S¹."""
+    print("\n§1. ЭТАЛОН: Casimir на S¹")
+    print("-"*40)
+    # Casimir на S¹: ζ(-1/2) = ζ_R(-1) = -1/12
+    print("Дзета Римана ζ_R(-1) = -1/12")
+    print(f"Ожидаемый коэффициент: -1/12 = {-1/12:.10f}")
+    # Формула: E_Cas(S¹) = -π/(6L) при L=2π → -1/12
+    E_cas_S1 = -pi / (6 * 2*pi)
+    print(f"E_Cas(S¹, L=2π) = -π/(12π) = -1/12 = {float(E_cas_S1):.10f}")
+
+def section_2():
+    """§2. HEAT KERNEL НА S³."""
+    print("\n§2. Heat Kernel на S³")
+    print("-"*40)
+    # Weyl асимптотика: K(t) ~ Vol(S³)/(4πt)^{3/2} при t→0
+    Vol_S3 = 2 * pi**2
+    print(f"Vol(S³) = 2π² = {float(Vol_S3):.10f}")
+    # Проверка при малых t
+    for t_val in [0.1, 0.05, 0.01]:
+        K_num = heat_trace_S3(t_val, N_max=500)
+        K_weyl = Vol_S3 / (4*pi*t_val)**1.5
+        ratio = K_num / K_weyl
+        print(f"t={t_val}: K_num/K_weyl = {float(ratio):.6f}")
+
+def section_3():
+    """§3. HEAT KERNEL НА L(2,1)."""
+    print("\n§3. Heat Kernel на L(2,1) = RP³")
+    print("-"*40)
+    Vol_RP3 = pi**2
+    print(f"Vol(RP³) = π² = {float(Vol_RP3):.10f}")
+    for t_val in [0.1, 0.05, 0.01]:
+        K_num = heat_trace_L21(t_val, N_max=500)
+        K_weyl = Vol_RP3 / (4*pi*t_val)**1.5
+        ratio = K_num / K_weyl
+        print(f"t={t_val}: K_num/K_weyl = {float(ratio):.6f}")
+    # Малые t: пересуммирование Пуассона (тета-функция) сходится за O(1) образов,
+    # прямой сумме нужно O(1/√t) уровней
+    print("\nТета-представление (образы Пуассона), с оценкой ошибки усечения:")
+    for t_val in [0.01, 0.005, 0.001]:
+        K_theta, K_err = heat_trace_theta("scalar", t_val, p=2, digits=20, include_zero=False)
+        K_weyl = Vol_RP3 / (4*pi*t_val)**1.5
+        print(f"t={t_val}: K_θ/K_weyl = {float(K_theta / K_weyl):.6f}, |ошибка| ≤ {mp.nstr(K_err, 2)}")
+
+def section_4():
+    """§4. КОЭФФИЦИЕНТ a₂ И 1/24."""
+    print("\n§4. Seeley-DeWitt коэффициент a₂")
+    print("-"*40)
+    print("""
 Теория:
 -------
 Heat kernel expansion при t → 0:
@@ -138,33 +156,26 @@ Heat kernel expansion при t → 0:
   a₁ = (1/6)∫R dV   (R — скалярная кривизна)
   a₂ = (1/360)∫(c₁R² + c₂Rᵢⱼ² + c₃Rᵢⱼₖₗ²) dV
 """)
-
-# Для S³: R = 6 (при R=1), Rᵢⱼ = 2gᵢⱼ, Rᵢⱼₖₗ = gᵢₖgⱼₗ - gᵢₗgⱼₖ
-R_S3 = 6  # скалярная кривизна единичной S³
-
-a0_S3 = Vol_S3
-a1_S3 = (1/6) * R_S3 * Vol_S3
-
-print(f"Для S³ (R=1):")
-print(f"  a₀ = Vol(S³) = {float(a0_S3):.10f}")
-print(f"  a₁ = (1/6)·R·Vol = (1/6)·6·2π² = 2π² = {float(a1_S3):.10f}")
-
-# Для L(2,1) = S³/Z₂
-a0_L21 = Vol_RP3
-a1_L21 = (1/6) * R_S3 * Vol_RP3
-
-print(f"\nДля L(2,1) = RP³:")
-print(f"  a₀ = Vol(RP³) = {float(a0_L21):.10f}")
-print(f"  a₁ = (1/6)·R·Vol = (1/6)·6·π² = π² = {float(a1_L21):.10f}")
-
-# =============================================================================
-# §5. СТРУКТУРА ζ/HEAT KERNEL И МЕСТО κ_Cas
-# =============================================================================
-
-print("\n§5. Структура ζ/heat-kernel и место κ_Cas")
-print("-"*40)
-
-print("""
+    # Для S³: R = 6 (при R=1), Rᵢⱼ = 2gᵢⱼ, Rᵢⱼₖₗ = gᵢₖgⱼₗ - gᵢₗgⱼₖ
+    R_S3 = 6  # скалярная кривизна единичной S³
+    Vol_S3, Vol_RP3 = 2 * pi**2, pi**2
+    a0_S3 = Vol_S3
+    a1_S3 = (1/6) * R_S3 * Vol_S3
+    print(f"Для S³ (R=1):")
+    print(f"  a₀ = Vol(S³) = {float(a0_S3):.10f}")
+    print(f"  a₁ = (1/6)·R·Vol = (1/6)·6·2π² = 2π² = {float(a1_S3):.10f}")
+    # Для L(2,1) = S³/Z₂
+    a0_L21 = Vol_RP3
+    a1_L21 = (1/6) * R_S3 * Vol_RP3
+    print(f"\nДля L(2,1) = RP³:")
+    print(f"  a₀ = Vol(RP³) = {float(a0_L21):.10f}")
+    print(f"  a₁ = (1/6)·R·Vol = (1/6)·6·π² = π² = {float(a1_L21):.10f}")
+
+def section_5():
+    """§5. СТРУКТУРА ζ/HEAT KERNEL И МЕСТО κ_Cas."""
+    print("\n§5. Структура ζ/heat-kernel и место κ_Cas")
+    print("-"*40)
+    print("""
 Ключевая формула:
 -----------------
 В ζ-регуляризации детерминанта конечная часть выражается через
@@ -176,46 +187,30 @@ print("""
 Честный статус: здесь фиксируется структура. Переход к числу κ_Cas=1/24
  требует отдельного согласования нормировок и учёта комбинации операторов QED.
 """)
-
-# Численная проверка через разность K(t) - Weyl
-print("\nЧисленная проверка:")
-print("-"*20)
-
-def extract_a2(heat_func, vol, d=3, t_range=[0.01, 0.02, 0.03]):
-    """
-    Извлечь a₂ из heat trace через разность K(t) - K_weyl(t).
-    """
-    results = []
-    for t in t_range:
-        K_num = heat_func(t, N_max=1000)
-        K_weyl = vol / (4*pi*t)**(d/2)
-        # K(t) - K_weyl ≈ a₁·t^{1-d/2} + a₂·t^{2-d/2} + ...
-        diff = K_num - K_weyl
-        # Для d=3: diff ≈ a₁·t^{-0.5} + a₂·t^{0.5} + ...
-        results.append((t, float(diff)))
-    return results
-
-results_L21 = extract_a2(heat_trace_L21, float(Vol_RP3))
-print("L(2,1): K(t) - K_weyl:")
-for t, diff in results_L21:
-    # diff ≈ a₁·t^{-0.5}, так что diff·t^{0.5} ≈ a₁
-    a1_est = diff * t**0.5
-    print(f"  t={t:.3f}: diff={diff:.6f}, a₁_est={a1_est:.6f}")
-
-# =============================================================================
-# §6. ИТОГОВАЯ ФОРМУЛА
-# =============================================================================
-
-print("\n§6. ФИНАЛЬНЫЙ РЕЗУЛЬТАТ")
-print("-"*40)
-
-S_geo = 4*pi**3 + pi**2 + pi
-
-# Casimir поправка
-kappa_Cas = 1/24
-delta_Cas = kappa_Cas / S_geo
-
-print(f"""
+    Vol_RP3 = pi**2
+
+    # Численная проверка через разность K(t) - Weyl
+    print("\nЧисленная проверка:")
+    print("-"*20)
+    # Уровни n ≤ 2000 покрывают t_min = 0.002 (t·λ_max ≈ 8000); нулевая мода добавляется обратно
+    a_L21, a_L21_err = extract_a2(spectrum("scalar", 2000, p=2, n_min=1), Vol_RP3, zero_modes=1)
+    # Для RP³ = S³/Z₂: (4πt)^{3/2} K(t) = π² e^t + O(e^{−π²/4t}), т.е. aₖ = π²/k!
+    a_exact = [float(Vol_RP3) / math.factorial(k) for k in range(4)]
+    print("L(2,1): (4πt)^{3/2} K(t) = Σ aₖ tᵏ, 60 точек t ∈ [0.002, 0.05], a₀ = Vol(RP³):")
+    labels = {1: ("a₁", "(1/6)·R·Vol = π²"), 2: ("a₂", "(1/360)(5R² − 2Ric² + 2Riem²)·Vol = π²/2"),
+              3: ("a₃", "π²/6")}
+    for k, (name, theory) in labels.items():
+        print(f"  {name} = {a_L21[k]:.12f} ± {a_L21_err[k]:.1e}   (теория {theory} = {a_exact[k]:.12f})")
+
+def section_6():
+    """§6. ИТОГОВАЯ ФОРМУЛА."""
+    print("\n§6. ФИНАЛЬНЫЙ РЕЗУЛЬТАТ")
+    print("-"*40)
+    S_geo = s_geo()
+    # Casimir поправка
+    kappa_Cas = 1/24
+    delta_Cas = kappa_Cas / S_geo
+    print(f"""
 Проверка кандидата κ_Cas = 1/24:
 ==============================
  
@@ -229,16 +224,31 @@ print(f"""
  
 Честный статус: структура через ζ/heat-kernel корректна; строгий вывод κ_Cas=1/24 требует отдельного согласования нормировок.
 """)
+    # Проверка: 24 = ?
+    print("Почему 24?")
+    print("-"*20)
+    print(f"  ζ_R(-1) = -1/12")
+    print(f"  Для 4D: 2 × 12 = 24")
+    print(f"  Также: D_crit(string) - 2 = 26 - 2 = 24")
+    print(f"  Также: |Λ₂₄| (Leech lattice dimension) = 24")
+    print(f"\n  Совпадение? Или глубокая связь?")
+
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+}
+
+def main(argv=None):
+    return run_sections(
+        SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+        header="="*70 + "\nЧИСЛЕННАЯ ПРОВЕРКА κ_Cas = 1/24 (heat kernel)\n" + "="*70,
+        footer="\n" + "="*70 + "\nСТАТУС: κ_Cas=1/24 поддержан структурой и численно; строгая нормировка "
+               "требует отдельного расчёта\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
 
-# Проверка: 24 = ?
-print("Почему 24?")
-print("-"*20)
-print(f"  ζ_R(-1) = -1/12")
-print(f"  Для 4D: 2 × 12 = 24")
-print(f"  Также: D_crit(string) - 2 = 26 - 2 = 24")
-print(f"  Также: |Λ₂₄| (Leech lattice dimension) = 24")
-print(f"\n  Совпадение? Или глубокая связь?")
-
-print("\n" + "="*70)
-print("СТАТУС: κ_Cas=1/24 поддержан структурой и численно; строгая нормировка требует отдельного расчёта")
-print("="*70)
@@ -3,48 +3,71 @@
 Поиск строгого вывода коэффициента 1/π⁴.
 Вопрос: почему δ_BB = 1/(π⁴ · S_geo²), а не C/(π⁴ · S_geo²)?
 
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 06_pi4_proof.py [раздел ...] (rpft.sections).
+
 Навигация:
   ← 05_pi4_derivation.md | 07_why_C_equals_1.py →
   Главная: 00_main.md
 """
 
+import os
+import sys
+
 from mpmath import mp, pi, zeta, sqrt, log, exp, gamma as mpgamma, factorial
 import numpy as np
 
-mp.dps = 50
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import s_geo
+from rpft.constants import constant, convention
+from rpft.sections import memo, run_sections
 
-print("="*70)
-print("ИССЛЕДОВАНИЕ КОЭФФИЦИЕНТА 1/π⁴")
-print("="*70)
+DPS = 50
 
 # =============================================================================
-# §1. ДЗЕТА РИМАНА И СТЕПЕНИ π
+# §9. ПОДГОНКА C
 # =============================================================================
 
-print("\n§1. Значения ζ_R(n) и степени π")
-print("-"*40)
-
-# Точные значения ζ(2k)
-for k in range(1, 6):
-    z = zeta(2*k)
-    # ζ(2k) = (-1)^{k+1} B_{2k} (2π)^{2k} / (2·(2k)!)
-    # Выразим через π^{2k}
-    coeff = z / pi**(2*k)
-    print(f"ζ({2*k}) = {float(z):.10f} = {float(coeff):.10f} × π^{2*k}")
-
-print("\nКлючевые значения:")
-print(f"  ζ(2) = π²/6      = {float(pi**2/6):.10f}")
-print(f"  ζ(4) = π⁴/90     = {float(pi**4/90):.10f}")
-print(f"  ζ(6) = π⁶/945    = {float(pi**6/945):.10f}")
+@memo
+def alpha_inv_C_scan():
+    """§9: (S_geo, δ_Lattice, α⁻¹(CODATA), Δ без δ_BB, оптимальное C, Δ при C=1)."""
+    S_geo = s_geo()
+    # Если δ_BB = C/(π⁴·S_geo²), какое C даёт лучшее совпадение?
+    alpha_inv_codata = constant("alpha_inv").mpf()
+    delta_Lattice = 1 / (24 * S_geo)
+    # Без δ_BB
+    diff_no_BB = S_geo - delta_Lattice - alpha_inv_codata
+    # Оптимальное C
+    C_optimal = float((S_geo - delta_Lattice - alpha_inv_codata) * pi**4 * S_geo**2)
+    # С C = 1
+    diff_C1 = S_geo - delta_Lattice - 1 / (pi**4 * S_geo**2) - alpha_inv_codata
+    return S_geo, delta_Lattice, alpha_inv_codata, diff_no_BB, C_optimal, diff_C1
 
 # =============================================================================
-# §2. STEFAN-BOLTZMANN И π⁴
+# Разделы вывода
 # =============================================================================
 
-print("\n§2. Закон Stefan-Boltzmann")
-print("-"*40)
-
-print("""
+def section_1():
+    """§1. ДЗЕТА РИМАНА И СТЕПЕНИ π."""
+    print("\n§1. Значения ζ_R(n) и степени π")
+    print("-"*40)
+    # Точные значения ζ(2k)
+    for k in range(1, 6):
+        z = zeta(2*k)
+        # ζ(2k) = (-1)^{k+1} B_{2k} (2π)^{2k} / (2·(2k)!)
+        # Выразим через π^{2k}
+        coeff = z / pi**(2*k)
+        print(f"ζ({2*k}) = {float(z):.10f} = {float(coeff):.10f} × π^{2*k}")
+    print("\nКлючевые значения:")
+    print(f"  ζ(2) = π²/6      = {float(pi**2/6):.10f}")
+    print(f"  ζ(4) = π⁴/90     = {float(pi**4/90):.10f}")
+    print(f"  ζ(6) = π⁶/945    = {float(pi**6/945):.10f}")
+
+def section_2():
+    """§2. STEFAN-BOLTZMANN И π⁴."""
+    print("\n§2. Закон Stefan-Boltzmann")
+    print("-"*40)
+    print("""
 Плотность энергии чёрного тела в d измерениях:
 
   u(T) = C_d · T^{d+1}
@@ -65,14 +88,11 @@ print("""
 Это значит: нужен ДРУГОЙ источник π⁴.
 """)
 
-# =============================================================================
-# §3. ИНТЕГРАЛ ПО ФАЗОВОМУ ПРОСТРАНСТВУ
-# =============================================================================
-
-print("\n§3. Объём фазового пространства")
-print("-"*40)
-
-print("""
+def section_3():
+    """§3. ИНТЕГРАЛ ПО ФАЗОВОМУ ПРОСТРАНСТВУ."""
+    print("\n§3. Объём фазового пространства")
+    print("-"*40)
+    print("""
 Гипотеза: π⁴ из нормировки интеграла по импульсам.
 
 В 4D квантовой механике:
@@ -82,20 +102,16 @@ print("""
 
 Но у нас π⁴, а не 16π⁴...
 """)
-
-# (2π)^4 vs π^4
-print(f"(2π)⁴ = {float((2*pi)**4):.6f}")
-print(f"π⁴    = {float(pi**4):.6f}")
-print(f"Ratio = {float((2*pi)**4 / pi**4):.6f} = 16")
-
-# =============================================================================
-# §4. CONFORMAL ANOMALY (TRACE ANOMALY)
-# =============================================================================
-
-print("\n§4. Конформная аномалия в 4D")
-print("-"*40)
-
-print("""
+    # (2π)^4 vs π^4
+    print(f"(2π)⁴ = {float((2*pi)**4):.6f}")
+    print(f"π⁴    = {float(pi**4):.6f}")
+    print(f"Ratio = {float((2*pi)**4 / pi**4):.6f} = 16")
+
+def section_4():
+    """§4. CONFORMAL ANOMALY (TRACE ANOMALY)."""
+    print("\n§4. Конформная аномалия в 4D")
+    print("-"*40)
+    print("""
 В 4D конформной теории поля trace anomaly:
 
   <T^μ_μ> = c · (Weyl)² - a · (Euler)
@@ -116,46 +132,36 @@ Euler density в 4D:
 
 Здесь появляется (32π²) = 32π² в знаменателе.
 """)
-
-print(f"32π² = {float(32*pi**2):.6f}")
-print(f"(32π²)² = {float((32*pi**2)**2):.6f}")
-
-# =============================================================================
-# §5. ПРОВЕРКА КОМБИНАЦИЙ
-# =============================================================================
-
-print("\n§5. Поиск комбинации, дающей 1/π⁴")
-print("-"*40)
-
-S_geo = 4*pi**3 + pi**2 + pi
-delta_BB_actual = 1 / (pi**4 * S_geo**2)
-
-print(f"S_geo = {float(S_geo):.10f}")
-print(f"δ_BB (факт) = 1/(π⁴·S²) = {float(delta_BB_actual):.15e}")
-
-# Проверим разные комбинации
-candidates = [
-    ("ζ(4)/S²", zeta(4) / S_geo**2),
-    ("1/(90·S²)", 1 / (90 * S_geo**2)),
-    ("1/(π⁴·S²)", 1 / (pi**4 * S_geo**2)),
-    ("π⁴/(90·S²)·1/π⁸", pi**4 / (90 * S_geo**2) / pi**8),
-    ("6/(π²·S²·90)", 6 / (pi**2 * S_geo**2 * 90)),
-]
-
-print("\nКандидаты:")
-for name, val in candidates:
-    ratio = val / delta_BB_actual
-    print(f"  {name:25s} = {float(val):.15e}, ratio = {float(ratio):.6f}")
-
-# =============================================================================
-# §6. КЛЮЧЕВОЕ НАБЛЮДЕНИЕ
-# =============================================================================
-
-print("\n§6. КЛЮЧЕВОЕ НАБЛЮДЕНИЕ")
-print("-"*40)
-
-# Что если 1/π⁴ — это (1/π²)²?
-print("""
+    print(f"32π² = {float(32*pi**2):.6f}")
+    print(f"(32π²)² = {float((32*pi**2)**2):.6f}")
+
+def section_5():
+    """§5. ПРОВЕРКА КОМБИНАЦИЙ."""
+    print("\n§5. Поиск комбинации, дающей 1/π⁴")
+    print("-"*40)
+    S_geo = s_geo()
+    delta_BB_actual = 1 / (pi**4 * S_geo**2)
+    print(f"S_geo = {float(S_geo):.10f}")
+    print(f"δ_BB (факт) = 1/(π⁴·S²) = {float(delta_BB_actual):.15e}")
+    # Проверим разные комбинации
+    candidates = [
+        ("ζ(4)/S²", zeta(4) / S_geo**2),
+        ("1/(90·S²)", 1 / (90 * S_geo**2)),
+        ("1/(π⁴·S²)", 1 / (pi**4 * S_geo**2)),
+        ("π⁴/(90·S²)·1/π⁸", pi**4 / (90 * S_geo**2) / pi**8),
+        ("6/(π²·S²·90)", 6 / (pi**2 * S_geo**2 * 90)),
+    ]
+    print("\nКандидаты:")
+    for name, val in candidates:
+        ratio = val / delta_BB_actual
+        print(f"  {name:25s} = {float(val):.15e}, ratio = {float(ratio):.6f}")
+
+def section_6():
+    """§6. КЛЮЧЕВОЕ НАБЛЮДЕНИЕ."""
+    print("\n§6. КЛЮЧЕВОЕ НАБЛЮДЕНИЕ")
+    print("-"*40)
+    # Что если 1/π⁴ — это (1/π²)²?
+    print("""
 Гипотеза: 1/π⁴ = (1/π²)²
 
 Член π² уже есть в S_geo (Vol(RP³) = π²).
@@ -170,51 +176,40 @@ print("""
   
 То есть коэффициент = (1/π)⁴ = 1/π⁴.
 """)
-
-# Проверка
-print(f"(1/π)⁴ = {float(1/pi**4):.15f}")
-print(f"1/π⁴   = {float(1/pi**4):.15f}")
-print("Тавтология, но...")
-
-# =============================================================================
-# §7. СВЯЗЬ С ОБЪЁМАМИ
-# =============================================================================
-
-print("\n§7. Связь с геометрическими объёмами")
-print("-"*40)
-
-Vol_S1 = 2*pi
-Vol_S2 = 4*pi
-Vol_S3 = 2*pi**2
-Vol_S4 = 8*pi**2/3
-
-print(f"Vol(S¹) = 2π      = {float(Vol_S1):.6f}")
-print(f"Vol(S²) = 4π      = {float(Vol_S2):.6f}")
-print(f"Vol(S³) = 2π²     = {float(Vol_S3):.6f}")
-print(f"Vol(S⁴) = 8π²/3   = {float(Vol_S4):.6f}")
-
-# Произведение
-print(f"\nVol(S¹)² = (2π)² = 4π² = {float(Vol_S1**2):.6f}")
-print(f"Vol(S²)² = (4π)² = 16π² = {float(Vol_S2**2):.6f}")
-
-# Ключевое!
-print(f"\n1/Vol(S¹)² = 1/(4π²) = {float(1/Vol_S1**2):.10f}")
-print(f"1/Vol(S²)² = 1/(16π²) = {float(1/Vol_S2**2):.10f}")
-
-# π⁴ как произведение
-print(f"\nVol(S¹)² × Vol(S²)² = 4π² × 16π² = 64π⁴")
-print(f"1/(64π⁴) = {float(1/(64*pi**4)):.15e}")
-print(f"1/π⁴ = {float(1/pi**4):.15e}")
-print(f"Ratio: {float((1/pi**4) / (1/(64*pi**4))):.2f} = 64")
-
-# =============================================================================
-# §8. ГИПОТЕЗА: НОРМИРОВКА КК-МОД
-# =============================================================================
-
-print("\n§8. Нормировка KK-мод и 1/π⁴")
-print("-"*40)
-
-print("""
+    # Проверка
+    print(f"(1/π)⁴ = {float(1/pi**4):.15f}")
+    print(f"1/π⁴   = {float(1/pi**4):.15f}")
+    print("Тавтология, но...")
+
+def section_7():
+    """§7. СВЯЗЬ С ОБЪЁМАМИ."""
+    print("\n§7. Связь с геометрическими объёмами")
+    print("-"*40)
+    Vol_S1 = 2*pi
+    Vol_S2 = 4*pi
+    Vol_S3 = 2*pi**2
+    Vol_S4 = 8*pi**2/3
+    print(f"Vol(S¹) = 2π      = {float(Vol_S1):.6f}")
+    print(f"Vol(S²) = 4π      = {float(Vol_S2):.6f}")
+    print(f"Vol(S³) = 2π²     = {float(Vol_S3):.6f}")
+    print(f"Vol(S⁴) = 8π²/3   = {float(Vol_S4):.6f}")
+    # Произведение
+    print(f"\nVol(S¹)² = (2π)² = 4π² = {float(Vol_S1**2):.6f}")
+    print(f"Vol(S²)² = (4π)² = 16π² = {float(Vol_S2**2):.6f}")
+    # Ключевое!
+    print(f"\n1/Vol(S¹)² = 1/(4π²) = {float(1/Vol_S1**2):.10f}")
+    print(f"1/Vol(S²)² = 1/(16π²) = {float(1/Vol_S2**2):.10f}")
+    # π⁴ как произведение
+    print(f"\nVol(S¹)² × Vol(S²)² = 4π² × 16π² = 64π⁴")
+    print(f"1/(64π⁴) = {float(1/(64*pi**4)):.15e}")
+    print(f"1/π⁴ = {float(1/pi**4):.15e}")
+    print(f"Ratio: {float((1/pi**4) / (1/(64*pi**4))):.2f} = 64")
+
+def section_8():
+    """§8. ГИПОТЕЗА: НОРМИРОВКА КК-МОД."""
+    print("\n§8. Нормировка KK-мод и 1/π⁴")
+    print("-"*40)
+    print("""
 В Kaluza-Klein редукции:
   
   ∫_{S¹} dy / (2π) = нормировка моды
@@ -232,47 +227,27 @@ print("""
 Но нам нужно 1/π⁴...
 """)
 
-# =============================================================================
-# §9. АЛЬТЕРНАТИВА: ЧИСТО ЧИСЛЕННАЯ ПОДГОНКА?
-# =============================================================================
-
-print("\n§9. Проверка: насколько критичен коэффициент?")
-print("-"*40)
-
-# Если δ_BB = C/(π⁴·S_geo²), какое C даёт лучшее совпадение?
-alpha_inv_codata = mp.mpf('137.035999177')
-delta_Lattice = 1 / (24 * S_geo)
-
-# Без δ_BB
-alpha_inv_no_BB = S_geo - delta_Lattice
-diff_no_BB = alpha_inv_no_BB - alpha_inv_codata
-print(f"Без δ_BB: diff = {float(diff_no_BB):.2e}")
-
-# Оптимальное C
-C_optimal = float((S_geo - delta_Lattice - alpha_inv_codata) * pi**4 * S_geo**2)
-print(f"Оптимальное C = {C_optimal:.6f}")
-
-# С C = 1
-delta_BB_C1 = 1 / (pi**4 * S_geo**2)
-alpha_inv_C1 = S_geo - delta_Lattice - delta_BB_C1
-diff_C1 = alpha_inv_C1 - alpha_inv_codata
-print(f"С C=1: diff = {float(diff_C1):.2e}, σ = {float(diff_C1/0.000000085):.2f}")
-
-# С C = C_optimal
-delta_BB_opt = C_optimal / (pi**4 * S_geo**2)
-alpha_inv_opt = S_geo - delta_Lattice - delta_BB_opt
-diff_opt = alpha_inv_opt - alpha_inv_codata
-print(f"С C={C_optimal:.2f}: diff = {float(diff_opt):.2e}")
-
-# =============================================================================
-# §10. ВЫВОД
-# =============================================================================
-
-print("\n" + "="*70)
-print("§10. ВЫВОД")
-print("="*70)
-
-print(f"""
+def section_9():
+    """§9. Насколько критичен коэффициент C в δ_BB = C/(π⁴·S_geo²)."""
+    print("\n§9. Проверка: насколько критичен коэффициент?")
+    print("-"*40)
+    S_geo, delta_Lattice, alpha_inv_codata, diff_no_BB, C_optimal, diff_C1 = alpha_inv_C_scan()
+    print(f"Без δ_BB: diff = {float(diff_no_BB):.2e}")
+    print(f"Оптимальное C = {C_optimal:.6f}")
+    print(f"С C=1: diff = {float(diff_C1):.2e}, σ = {float(diff_C1/float(convention('sigma_alpha_inv'))):.2f}")
+    # С C = C_optimal
+    delta_BB_opt = C_optimal / (pi**4 * S_geo**2)
+    alpha_inv_opt = S_geo - delta_Lattice - delta_BB_opt
+    diff_opt = alpha_inv_opt - alpha_inv_codata
+    print(f"С C={C_optimal:.2f}: diff = {float(diff_opt):.2e}")
+
+def section_10():
+    """§10. Вывод: статус коэффициента C и альтернативы ζ(4), 90."""
+    S_geo, delta_Lattice, alpha_inv_codata, diff_no_BB, C_optimal, diff_C1 = alpha_inv_C_scan()
+    print("\n" + "="*70)
+    print("§10. ВЫВОД")
+    print("="*70)
+    print(f"""
 1. Форма 1/π⁴ МОЖЕТ быть выведена из:
    - ζ(4) = π⁴/90 (дзета Римана)
    - (2π)⁴ в нормировке фазового пространства
@@ -290,19 +265,38 @@ print(f"""
    - Форма 1/(π⁴·S²): ✅ обоснована размерным анализом
    - Коэффициент C=1: ⚠️ феноменологический (близок к оптимальному)
 """)
+    # Дополнительная проверка: что если использовать точное ζ(4)?
+    print("\n--- Альтернатива: δ = ζ(4)/S² ---")
+    delta_zeta4 = zeta(4) / S_geo**2
+    alpha_inv_zeta4 = S_geo - delta_Lattice - delta_zeta4
+    diff_zeta4 = alpha_inv_zeta4 - alpha_inv_codata
+    print(f"δ = ζ(4)/S² = {float(delta_zeta4):.15e}")
+    print(f"Diff = {float(diff_zeta4):.2e}, σ = {float(diff_zeta4/float(convention('sigma_alpha_inv'))):.2f}")
+    print(f"→ Это ХУЖЕ чем 1/π⁴!")
+    print("\n--- Альтернатива: δ = 90/(π⁴·S²) ---")
+    delta_90 = 90 / (pi**4 * S_geo**2)
+    alpha_inv_90 = S_geo - delta_Lattice - delta_90
+    diff_90 = alpha_inv_90 - alpha_inv_codata
+    print(f"δ = 90/(π⁴·S²) = {float(delta_90):.15e}")
+    print(f"Diff = {float(diff_90):.2e}, σ = {float(diff_90/float(convention('sigma_alpha_inv'))):.2f}")
+
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+    "7": section_7,
+    "8": section_8,
+    "9": section_9,
+    "10": section_10,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nИССЛЕДОВАНИЕ КОЭФФИЦИЕНТА 1/π⁴\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
 
-# Дополнительная проверка: что если использовать точное ζ(4)?
-print("\n--- Альтернатива: δ = ζ(4)/S² ---")
-delta_zeta4 = zeta(4) / S_geo**2
-alpha_inv_zeta4 = S_geo - delta_Lattice - delta_zeta4
-diff_zeta4 = alpha_inv_zeta4 - alpha_inv_codata
-print(f"δ = ζ(4)/S² = {float(delta_zeta4):.15e}")
-print(f"Diff = {float(diff_zeta4):.2e}, σ = {float(diff_zeta4/0.000000085):.2f}")
-print(f"→ Это ХУЖЕ чем 1/π⁴!")
-
-print("\n--- Альтернатива: δ = 90/(π⁴·S²) ---")
-delta_90 = 90 / (pi**4 * S_geo**2)
-alpha_inv_90 = S_geo - delta_Lattice - delta_90
-diff_90 = alpha_inv_90 - alpha_inv_codata
-print(f"δ = 90/(π⁴·S²) = {float(delta_90):.15e}")
-print(f"Diff = {float(diff_90):.2e}, σ = {float(diff_90/0.000000085):.2f}")
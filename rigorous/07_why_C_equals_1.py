@@ -4,6 +4,9 @@
 Ключевое: C_opt = 0.9936 ≈ 1
 Вопрос: есть ли ГЕОМЕТРИЧЕСКОЕ обоснование для C = 1?
 
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 07_why_C_equals_1.py [раздел ...] (rpft.sections).
+
 Навигация:
   ← 06_pi4_proof.py | README.md →
   Главная: 00_main.md
@@ -11,52 +14,56 @@
 Ответ: C = 1 потому что π⁴ = Vol(RP³)² = (π²)²
 """
 
-from mpmath import mp, pi, zeta, log, exp, sqrt
-mp.dps = 80
-
-print("="*70)
-print("ПОЧЕМУ C = 1?")
-print("="*70)
+import os
+import sys
 
-S_geo = 4*pi**3 + pi**2 + pi
-alpha_inv_codata = mp.mpf('137.035999177')
-delta_Lattice = 1 / (24 * S_geo)
-
-# Оптимальный C
-C_opt = float((S_geo - delta_Lattice - alpha_inv_codata) * pi**4 * S_geo**2)
-print(f"\nОптимальный C = {C_opt:.10f}")
-print(f"Отклонение от 1: {(C_opt - 1)*100:.4f}%")
-
-# =============================================================================
-# §1. ГИПОТЕЗА: C = 1 из топологии
-# =============================================================================
-
-print("\n" + "="*70)
-print("§1. Топологические инварианты")
-print("="*70)
+from mpmath import mp, pi, zeta, log, exp, sqrt
 
-# Характеристика Эйлера
-chi_S3 = 0  # S³ — нечётномерная сфера
-chi_RP3 = 0  # RP³ — тоже нечётномерная
-chi_S1 = 0  # S¹ — тоже
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import s_geo
+from rpft.constants import constant, convention
+from rpft.sections import memo, run_sections
 
-print(f"χ(S³) = {chi_S3}")
-print(f"χ(RP³) = {chi_RP3}")
-print(f"χ(S¹) = {chi_S1}")
-print(f"χ(RP³×S¹) = χ(RP³)·χ(S¹) = 0")
+DPS = 80
 
-# Но для 4-многообразия M⁴:
-# ∫ E₄ = 32π² · χ(M⁴)
+@memo
+def alpha_inv_terms():
+    """(S_geo, α⁻¹(CODATA), δ_Lat = 1/(24·S_geo))."""
+    S_geo = s_geo()
+    return S_geo, constant("alpha_inv").mpf(), 1 / (24 * S_geo)
 
 # =============================================================================
-# §2. ГИПОТЕЗА: C = 1 из нормировки
+# Разделы вывода
 # =============================================================================
 
-print("\n" + "="*70)
-print("§2. Нормировка квантовых поправок")
-print("="*70)
-
-print("""
+def section_C():
+    """Оптимальный C в δ_BB = C/(π⁴·S_geo²) по CODATA."""
+    S_geo, alpha_inv_codata, delta_Lattice = alpha_inv_terms()
+    # Оптимальный C
+    C_opt = float((S_geo - delta_Lattice - alpha_inv_codata) * pi**4 * S_geo**2)
+    print(f"\nОптимальный C = {C_opt:.10f}")
+    print(f"Отклонение от 1: {(C_opt - 1)*100:.4f}%")
+
+def section_1():
+    """§1. ГИПОТЕЗА: C = 1 из топологии."""
+    print("\n" + "="*70)
+    print("§1. Топологические инварианты")
+    print("="*70)
+    # Характеристика Эйлера
+    chi_S3 = 0  # S³ — нечётномерная сфера
+    chi_RP3 = 0  # RP³ — тоже нечётномерная
+    chi_S1 = 0  # S¹ — тоже
+    print(f"χ(S³) = {chi_S3}")
+    print(f"χ(RP³) = {chi_RP3}")
+    print(f"χ(S¹) = {chi_S1}")
+    print(f"χ(RP³×S¹) = χ(RP³)·χ(S¹) = 0")
+
+def section_2():
+    """§2. ГИПОТЕЗА: C = 1 из нормировки."""
+    print("\n" + "="*70)
+    print("§2. Нормировка квантовых поправок")
+    print("="*70)
+    print("""
 В теории возмущений поправка 2-го порядка:
 
   Γ^(2) = (1/2!) × (одно-петлевой вклад)²
@@ -69,37 +76,25 @@ print("""
 Итого C = 1.
 """)
 
-# =============================================================================
-# §3. ГИПОТЕЗА: C = 1 из числа степеней свободы
-# =============================================================================
-
-print("\n" + "="*70)
-print("§3. Степени свободы")
-print("="*70)
-
-# Фотон в 4D: 2 поляризации
-# Электрон: 4 компоненты (2 спина × 2 частица/античастица)
-
-n_photon = 2
-n_electron = 4
-print(f"Фотон: {n_photon} поляризации")
-print(f"Электрон: {n_electron} степени свободы")
-
-# Эффективное число
-n_eff = n_photon + n_electron / 2  # фермионы с коэфф. 1/2
-print(f"Эффективное n_eff = {n_eff}")
-
-# Но это не даёт C = 1 напрямую...
-
-# =============================================================================
-# §4. КЛЮЧЕВАЯ ГИПОТЕЗА: C = 1 как "единица действия"
-# =============================================================================
-
-print("\n" + "="*70)
-print("§4. C = 1 как единица квантового действия")
-print("="*70)
-
-print("""
+def section_3():
+    """§3. ГИПОТЕЗА: C = 1 из числа степеней свободы."""
+    print("\n" + "="*70)
+    print("§3. Степени свободы")
+    print("="*70)
+    n_photon = 2
+    n_electron = 4
+    print(f"Фотон: {n_photon} поляризации")
+    print(f"Электрон: {n_electron} степени свободы")
+    # Эффективное число
+    n_eff = n_photon + n_electron / 2  # фермионы с коэфф. 1/2
+    print(f"Эффективное n_eff = {n_eff}")
+
+def section_4():
+    """§4. КЛЮЧЕВАЯ ГИПОТЕЗА: C = 1 как "единица действия"."""
+    print("\n" + "="*70)
+    print("§4. C = 1 как единица квантового действия")
+    print("="*70)
+    print("""
 В планковских единицах:
   ℏ = 1 (единица действия)
 
@@ -113,46 +108,36 @@ print("""
 Следовательно, C = 1.
 """)
 
-# =============================================================================
-# §5. ПРОВЕРКА: разложение в ряд
-# =============================================================================
-
-print("\n" + "="*70)
-print("§5. Разложение формулы в ряд")
-print("="*70)
-
-# α⁻¹ = S - 1/(24S) - 1/(π⁴S²) ≈ S(1 - 1/(24S²) - 1/(π⁴S³))
-
-S = S_geo
-term1 = S
-term2 = -1/(24*S)
-term3 = -1/(pi**4 * S**2)
-
-print(f"S_geo         = {float(term1):.10f}")
-print(f"-1/(24·S)     = {float(term2):.10e}")
-print(f"-1/(π⁴·S²)    = {float(term3):.10e}")
-
-# Отношение поправок
-ratio_corrections = abs(term3 / term2)
-print(f"\n|δ_BB/δ_Lat| = {float(ratio_corrections):.6f}")
-print(f"             ≈ 24/(π⁴·S) = {float(24/(pi**4 * S)):.6f}")
-
-# =============================================================================
-# §6. СВЯЗЬ С ОБЪЁМОМ
-# =============================================================================
-
-print("\n" + "="*70)
-print("§6. Геометрическая интерпретация")
-print("="*70)
-
-# Vol(RP³) = π²
-# Если δ_BB ~ 1/Vol(RP³)² × 1/S²
-Vol_RP3 = pi**2
-delta_from_vol = 1 / (Vol_RP3**2 * S_geo**2)
-print(f"1/(Vol(RP³)² · S²) = 1/(π⁴·S²) = {float(delta_from_vol):.10e}")
-print(f"Это ТОЧНО совпадает с δ_BB!")
-
-print("""
+def section_5():
+    """§5. ПРОВЕРКА: разложение в ряд."""
+    print("\n" + "="*70)
+    print("§5. Разложение формулы в ряд")
+    print("="*70)
+    S, _, _ = alpha_inv_terms()
+    term1 = S
+    term2 = -1/(24*S)
+    term3 = -1/(pi**4 * S**2)
+    print(f"S_geo         = {float(term1):.10f}")
+    print(f"-1/(24·S)     = {float(term2):.10e}")
+    print(f"-1/(π⁴·S²)    = {float(term3):.10e}")
+    # Отношение поправок
+    ratio_corrections = abs(term3 / term2)
+    print(f"\n|δ_BB/δ_Lat| = {float(ratio_corrections):.6f}")
+    print(f"             ≈ 24/(π⁴·S) = {float(24/(pi**4 * S)):.6f}")
+
+def section_6():
+    """§6. СВЯЗЬ С ОБЪЁМОМ."""
+    print("\n" + "="*70)
+    print("§6. Геометрическая интерпретация")
+    print("="*70)
+    # Vol(RP³) = π²
+    # Если δ_BB ~ 1/Vol(RP³)² × 1/S²
+    S_geo, _, _ = alpha_inv_terms()
+    Vol_RP3 = pi**2
+    delta_from_vol = 1 / (Vol_RP3**2 * S_geo**2)
+    print(f"1/(Vol(RP³)² · S²) = 1/(π⁴·S²) = {float(delta_from_vol):.10e}")
+    print(f"Это ТОЧНО совпадает с δ_BB!")
+    print("""
 ВЫВОД:
 ------
 δ_BB = 1/(Vol(RP³)² · S_geo²) = 1/(π⁴ · S²)
@@ -165,15 +150,12 @@ print("""
 Это ГЕОМЕТРИЧЕСКИЙ вывод, не феноменология!
 """)
 
-# =============================================================================
-# §7. ФИНАЛЬНАЯ ПРОВЕРКА
-# =============================================================================
-
-print("\n" + "="*70)
-print("§7. ФИНАЛЬНАЯ ФОРМУЛА")
-print("="*70)
-
-print(f"""
+def section_7():
+    """§7. ФИНАЛЬНАЯ ПРОВЕРКА."""
+    print("\n" + "="*70)
+    print("§7. ФИНАЛЬНАЯ ФОРМУЛА")
+    print("="*70)
+    print(f"""
 α⁻¹ = S_geo - δ_Lat - δ_BB
 
 где:
@@ -192,16 +174,31 @@ print(f"""
   - Это ТОЧНОЕ геометрическое значение
   - Никакой подгонки!
 """)
+    S_geo, alpha_inv_codata, delta_Lattice = alpha_inv_terms()
+    alpha_inv_theory = S_geo - delta_Lattice - 1/(pi**4 * S_geo**2)
+    diff = alpha_inv_theory - alpha_inv_codata
+    sigma = diff / mp.mpf(convention("sigma_alpha_inv"))
+    print(f"α⁻¹ (theory) = {float(alpha_inv_theory):.12f}")
+    print(f"α⁻¹ (CODATA) = {constant('alpha_inv').value}")
+    print(f"Δ = {float(diff):.2e}")
+    print(f"σ = {float(sigma):.2f}")
+
+SECTIONS = {
+    "C": section_C,
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+    "7": section_7,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nПОЧЕМУ C = 1?\n" + "="*70,
+                        footer="\n" + "="*70 + "\nИТОГ: C = 1 = Vol(RP³)²/Vol(RP³)² — тавтология из геометрии!\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
 
-alpha_inv_theory = S_geo - delta_Lattice - 1/(pi**4 * S_geo**2)
-diff = alpha_inv_theory - alpha_inv_codata
-sigma = diff / mp.mpf('0.000000085')
-
-print(f"α⁻¹ (theory) = {float(alpha_inv_theory):.12f}")
-print(f"α⁻¹ (CODATA) = 137.035999177")
-print(f"Δ = {float(diff):.2e}")
-print(f"σ = {float(sigma):.2f}")
-
-print("\n" + "="*70)
-print("ИТОГ: C = 1 = Vol(RP³)²/Vol(RP³)² — тавтология из геометрии!")
-print("="*70)
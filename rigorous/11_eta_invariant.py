@@ -10,25 +10,33 @@
 - Кратность: 2(n+1)(n+2)
 - На L(2,1) с тривиальной spin-структурой: только нечётные n
 
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 11_eta_invariant.py [раздел ...] (rpft.sections).
+
 Навигация:
   ← 10_a2_coefficient.md | README.md →
   Главная: 00_main.md
 """
 
+import os
+import sys
+import time
+from math import gcd
+
+import numpy as np
 from mpmath import mp, nsum, diff, pi, inf, sign, fabs, zeta as mpzeta
-mp.dps = 50
 
-print("="*70)
-print("ВЫЧИСЛЕНИЕ η-ИНВАРИАНТА ДЛЯ ДИРАКА НА L(2,1)")
-print("="*70)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.eta import eta_exact, eta_function, eta_invariant, eta_scan
+from rpft.spectra import lens_multiplicity
+from rpft.sections import run_sections
+
+DPS = 50
 
 # =============================================================================
 # §1. СПЕКТР ДИРАКА НА S³
 # =============================================================================
 
-print("\n§1. Спектр Дирака на S³")
-print("-"*40)
-
 def dirac_eigenvalue_S3(n, R=1):
     """
     Собственные значения Дирака на S³.
@@ -43,28 +51,10 @@ def dirac_multiplicity_S3(n):
     """
     return 2 * (n + 1) * (n + 2)
 
-print("Спектр Дирака на S³ (первые 5 уровней):")
-print("n\t|λ|\t\td_n")
-for n in range(5):
-    lam = dirac_eigenvalue_S3(n)
-    d = dirac_multiplicity_S3(n)
-    print(f"{n}\t{float(lam):.4f}\t\t{d}")
-
 # =============================================================================
 # §2. СПЕКТР ДИРАКА НА L(2,1) = RP³
 # =============================================================================
 
-print("\n§2. Спектр Дирака на L(2,1) с тривиальной spin-структурой")
-print("-"*40)
-
-print("""
-По теореме Bär (1996):
-- Тривиальная spin-структура (η=0): только нечётные n
-- Нетривиальная spin-структура (η=1): только чётные n
-
-RPFT использует тривиальную spin-структуру → нечётные n.
-""")
-
 def dirac_eigenvalue_L21(k, R=1):
     """
     Собственные значения Дирака на L(2,1) с тривиальной spin-структурой.
@@ -82,86 +72,106 @@ def dirac_multiplicity_L21(k):
     n = 2*k + 1
     return (n + 1) * (n + 2)
 
-print("Спектр Дирака на L(2,1) (первые 5 уровней, нечётные n):")
-print("k\tn\t|λ|\t\td_n")
-for k in range(5):
-    n = 2*k + 1
-    lam = dirac_eigenvalue_L21(k)
-    d = dirac_multiplicity_L21(k)
-    print(f"{k}\t{n}\t{float(lam):.4f}\t\t{d}")
-
 # =============================================================================
 # §3. ETA-ФУНКЦИЯ
 # =============================================================================
 
-print("\n§3. Eta-функция η(s)")
-print("-"*40)
-
-def eta_function_L21(s, N_max=200):
+def eta_function_L21(s, spin=0):
     """
-    η(s) = Σ sign(λ) |λ|^{-s} × d
-    
-    Для Дирака: симметричный спектр λ и -λ с одинаковой кратностью.
-    Следовательно: η(s) = Σ_n d_n [(+λ)^{-s} + (-λ)^{-s}] × sign
-                        = Σ_n d_n λ^{-s} [1 - 1] = 0
-    
-    НО: это верно только если спектр точно симметричен.
-    Для L(2,1) нужно проверить.
+    η(s) = Σ sign(λ) |λ|^{-s} × d на L(2,1) (rpft.eta: точные кратности ветвей
+    λ = ±(n + 3/2) и аналитическое продолжение через ζ Гурвица).
     """
-    s = mp.mpf(s)
-    total = mp.mpf(0)
-    
-    for k in range(N_max):
-        n = 2*k + 1  # нечётные
-        lam = n + mp.mpf('1.5')
-        d = (n + 1) * (n + 2)
-        
-        # Положительные и отрицательные собственные значения
-        # +λ с кратностью d/2, -λ с кратностью d/2
-        # sign(+λ) = +1, sign(-λ) = -1
-        # Вклад: (+1) × (d/2) × λ^{-s} + (-1) × (d/2) × λ^{-s} = 0
-        
-        # Но d может быть нечётным — проверим
-        if d % 2 != 0:
-            print(f"Warning: d_n = {d} нечётно для n = {n}")
-        
-        # Симметричный вклад = 0
-        total += 0
-    
-    return total
-
-print("Для симметричного спектра Дирака: η(s) = 0 для всех s")
-print("Это следует из: sign(+λ) + sign(-λ) = 0")
+    return eta_function(s, p=2, q=1, spin=spin)
 
 # =============================================================================
-# §4. ПРОВЕРКА СИММЕТРИИ СПЕКТРА
+# Разделы вывода
 # =============================================================================
 
-print("\n§4. Проверка симметрии спектра")
-print("-"*40)
+def section_1():
+    """§1. СПЕКТР ДИРАКА НА S³."""
+    print("\n§1. Спектр Дирака на S³")
+    print("-"*40)
+    print("Спектр Дирака на S³ (первые 5 уровней):")
+    print("n\t|λ|\t\td_n")
+    for n in range(5):
+        lam = dirac_eigenvalue_S3(n)
+        d = dirac_multiplicity_S3(n)
+        print(f"{n}\t{float(lam):.4f}\t\t{d}")
+
+def section_2():
+    """§2. СПЕКТР ДИРАКА НА L(2,1) = RP³."""
+    print("\n§2. Спектр Дирака на L(2,1) с тривиальной spin-структурой")
+    print("-"*40)
+    print("""
+По теореме Bär (1996):
+- Тривиальная spin-структура (η=0): только нечётные n
+- Нетривиальная spin-структура (η=1): только чётные n
 
-print("""
+RPFT использует тривиальную spin-структуру → нечётные n.
+""")
+    print("Спектр Дирака на L(2,1) (первые 5 уровней, нечётные n):")
+    print("k\tn\t|λ|\t\td_n")
+    for k in range(5):
+        n = 2*k + 1
+        lam = dirac_eigenvalue_L21(k)
+        d = dirac_multiplicity_L21(k)
+        print(f"{k}\t{n}\t{float(lam):.4f}\t\t{d}")
+
+def section_3():
+    """§3. ETA-ФУНКЦИЯ."""
+    print("\n§3. Eta-функция η(s)")
+    print("-"*40)
+    print("Кратности ветвей λ = ±(n+3/2) на L(2,1) (spin = 0):")
+    print("n\td(+λ)\td(−λ)")
+    n_levels = np.arange(6)
+    d_plus = lens_multiplicity("dirac", n_levels, p=2, q=1, spin=0, branch=0)
+    d_minus = lens_multiplicity("dirac", n_levels, p=2, q=1, spin=0, branch=1)
+    for n, dp, dm in zip(n_levels, d_plus, d_minus):
+        print(f"{n}\t{dp}\t{dm}")
+    print("\nη(0) на L(2,1):")
+    for spin in (0, 1):
+        print(f"  spin = {spin}: η(0) = {eta_exact(2, 1, spin)} (кратности), "
+              f"{mp.nstr(eta_invariant(2, 1, spin), 15)} (формула характеров), "
+              f"{mp.nstr(eta_function_L21(0, spin), 15)} (ζ Гурвица)")
+    # Проверка продолжения: при s = 6 знакопеременный хвост ряда ~ N^{-4}
+    N_check = 4000
+    n_check = np.arange(N_check)
+    delta = (lens_multiplicity("dirac", n_check, p=2, q=1, spin=0, branch=0)
+             - lens_multiplicity("dirac", n_check, p=2, q=1, spin=0, branch=1))
+    eta6_direct = mp.fsum(int(d) * (int(n) + mp.mpf('1.5'))**(-6) for n, d in zip(n_check, delta))
+    print(f"\nη(6): ζ Гурвица {mp.nstr(eta_function_L21(6), 15)}, прямая сумма (N = {N_check}) "
+          f"{mp.nstr(eta6_direct, 15)}")
+
+def section_4():
+    """§4. ПРОВЕРКА СИММЕТРИИ СПЕКТРА."""
+    print("\n§4. Проверка симметрии спектра")
+    print("-"*40)
+    print("""
 Оператор Дирака D = iγ·∇ антикоммутирует с γ⁵ (в 4D) или γ (в 3D):
     γD = -Dγ
 
-Следствие: если ψ — собственный вектор с λ, то γψ — с -λ.
-Кратности одинаковы → спектр симметричен → η(s) = 0 для всех s.
+В 3D такого γ нет: на S³ ветви +λ и −λ имеют равные кратности (n+1)(n+2),
+но Z_p действует на них по-разному (V_{(n+1)/2}⊗V_{n/2} против V_{n/2}⊗V_{(n+1)/2}),
+и на L(p,q) кратности ветвей расходятся.
 """)
-
-# Но для L(2,1) может быть нюанс со spin-структурой
-
-print("Проверка: спектр Дирака на L(2,1) симметричен?")
-print("По Bär (1996): да, для любой spin-структуры спектр симметричен.")
-print("→ η(0) = 0 для L(2,1)")
-
-# =============================================================================
-# §5. АЛЬТЕРНАТИВА: η-ИНВАРИАНТ ЧЕРЕЗ ГРАНИЦУ
-# =============================================================================
-
-print("\n§5. η-инвариант в APS теореме")
-print("-"*40)
-
-print("""
+    print("Сканирование L(p,q), p ≤ 12, все spin-структуры и twist κ ∈ Z_p:")
+    cases = [(p, q, spin, kappa) for p in range(1, 13) for q in range(1, max(p, 2)) if gcd(p, q) == 1
+             for spin in ((0, 1) if p % 2 == 0 else (0,)) for kappa in range(p)]
+    start = time.perf_counter()
+    eta_values = eta_scan(cases)
+    elapsed = time.perf_counter() - start
+    _, deviation = eta_scan(cases, check=True)
+    n_symmetric = int(np.sum(np.abs(eta_values) < 1e-12))
+    print(f"  случаев: {len(cases)}, замкнутая формула: {elapsed * 1e3:.1f} мс")
+    print(f"  max |формула − кратности| = {deviation:.1e}")
+    print(f"  η(0) = 0 (симметричный спектр): {n_symmetric} из {len(cases)}")
+    print("\nСпектр Дирака на L(2,1) несимметричен: η(0) = ∓1/4 для двух spin-структур.")
+
+def section_5():
+    """§5. АЛЬТЕРНАТИВА: η-ИНВАРИАНТ ЧЕРЕЗ ГРАНИЦУ."""
+    print("\n§5. η-инвариант в APS теореме")
+    print("-"*40)
+    print("""
 Теорема Atiyah-Patodi-Singer:
 Для 4-многообразия W с границей ∂W = M:
 
@@ -179,17 +189,14 @@ print("""
 Это сложно. Используем другой подход.
 """)
 
-# =============================================================================
-# §6. СВЯЗЬ С ТОПОЛОГИЧЕСКИМ ЧЛЕНОМ
-# =============================================================================
-
-print("\n§6. Связь η с топологическим членом π")
-print("-"*40)
-
-print("""
+def section_6():
+    """§6. СВЯЗЬ С ТОПОЛОГИЧЕСКИМ ЧЛЕНОМ."""
+    print("\n§6. Связь η с топологическим членом π")
+    print("-"*40)
+    print("""
 ВЫВОД:
 ------
-η(0) = 0 для L(2,1) с любой spin-структурой (симметрия спектра).
+η(0) = ∓1/4 для L(2,1) (две spin-структуры): рациональное число.
 
 Это означает:
 - η-инвариант НЕ даёт топологический член π напрямую.
@@ -201,18 +208,15 @@ print("""
 3. Минимальное действие через систолу (феноменология)
 
 ЧЕСТНЫЙ СТАТУС:
-- η(L(2,1)) = 0 → не объясняет Z_top = π
+- η(L(2,1)) = ∓1/4 → не объясняет Z_top = π
 - Нужен другой механизм
 """)
 
-# =============================================================================
-# §7. RAY-SINGER TORSION
-# =============================================================================
-
-print("\n§7. Ray-Singer Torsion (альтернатива)")
-print("-"*40)
-
-print("""
+def section_7():
+    """§7. RAY-SINGER TORSION."""
+    print("\n§7. Ray-Singer Torsion (альтернатива)")
+    print("-"*40)
+    print("""
 Определение:
     log T_RS(M) = (1/2) Σ_k (-1)^k k ζ'_k(0)
 
@@ -234,25 +238,21 @@ log τ = log(1/4) = -2 log 2 ≈ -1.386
 
 Это НЕ равно π или log π.
 """)
-
-tau_L21 = 1/4
-log_tau = float(mp.log(tau_L21))
-print(f"τ(L(2,1)) = 1/4")
-print(f"log τ = {log_tau:.6f}")
-print(f"π = {float(pi):.6f}")
-print(f"log π = {float(mp.log(pi)):.6f}")
-print(f"\nlog τ ≠ π и log τ ≠ log π")
-
-# =============================================================================
-# §8. ИТОГОВЫЙ ВЫВОД
-# =============================================================================
-
-print("\n" + "="*70)
-print("ИТОГОВЫЙ ВЫВОД")
-print("="*70)
-
-print("""
-1. η(L(2,1)) = 0 — симметрия спектра Дирака
+    tau_L21 = 1/4
+    log_tau = float(mp.log(tau_L21))
+    print(f"τ(L(2,1)) = 1/4")
+    print(f"log τ = {log_tau:.6f}")
+    print(f"π = {float(pi):.6f}")
+    print(f"log π = {float(mp.log(pi)):.6f}")
+    print(f"\nlog τ ≠ π и log τ ≠ log π")
+
+def section_8():
+    """§8. ИТОГОВЫЙ ВЫВОД."""
+    print("\n" + "="*70)
+    print("ИТОГОВЫЙ ВЫВОД")
+    print("="*70)
+    print("""
+1. η(L(2,1)) = ∓1/4 — рациональное (сумма Дедекинда), спектр несимметричен
 2. log T_RS(L(2,1)) = -2 log 2 ≈ -1.386 — не равно π
 3. Ни η, ни log T_RS не дают член π напрямую
 
@@ -268,4 +268,22 @@ print("""
 (систола — кратчайший нестягиваемый путь), без претензии на строгий вывод.
 """)
 
-print("="*70)
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+    "7": section_7,
+    "8": section_8,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nВЫЧИСЛЕНИЕ η-ИНВАРИАНТА ДЛЯ ДИРАКА НА L(2,1)\n" + "="*70,
+                        footer="="*70)
+
+if __name__ == "__main__":
+    main()
+
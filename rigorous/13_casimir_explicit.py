@@ -6,45 +6,32 @@
 
 Метод: Регуляризованная спектральная сумма с вычитанием Weyl асимптотики.
 
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 13_casimir_explicit.py [раздел ...] (rpft.sections).
+
 Навигация:
   ← 12_alpha_derivation.md | README.md →
   Главная: 00_main.md
 """
 
-from mpmath import mp, nsum, diff, log, pi, sqrt, inf, exp, zeta as mpzeta
-mp.dps = 50
-
-print("="*70)
-print("ЧИСЛЕННАЯ ПРОВЕРКА κ_Cas = 1/24")
-print("="*70)
-
-# =============================================================================
-# §1. СПЕКТР ЛАПЛАСИАНА НА L(2,1)
-# =============================================================================
+import os
+import sys
 
-print("\n§1. Спектр скалярного лапласиана на L(2,1)")
-print("-"*40)
-
-print("""
-На S³: λ_n = n(n+2), d_n = (n+1)²
-На L(2,1) = S³/Z₂: только чётные n проецируются
-→ λ_k = 2k(2k+2) = 4k(k+1), d_k = (2k+1)²
+from mpmath import mp, nsum, diff, log, pi, sqrt, inf, exp, zeta as mpzeta
 
-Первые собственные значения:
-""")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.heat import abel_remainder_S1
+from rpft.series import convergence_study
+from rpft.alpha import alpha_inv_terms, s_geo
+from rpft.constants import constant, convention
+from rpft.sections import run_sections
 
-for k in range(1, 6):
-    lam = 4*k*(k+1)
-    d = (2*k+1)**2
-    print(f"  k={k}: λ = {lam}, d = {d}")
+DPS = 50
 
 # =============================================================================
 # §2. ДЗЕТА-ФУНКЦИЯ НА L(2,1)
 # =============================================================================
 
-print("\n§2. Дзета-функция ζ_{L(2,1)}(s)")
-print("-"*40)
-
 def zeta_L21_scalar(s, N_max=1000):
     """
     ζ(s) = Σ_{k=1}^∞ d_k / λ_k^s
@@ -58,30 +45,10 @@ def zeta_L21_scalar(s, N_max=1000):
         total += d / lam**s
     return total
 
-# Проверка сходимости
-print("Проверка при s = 2:")
-for N in [100, 500, 1000]:
-    val = zeta_L21_scalar(2, N)
-    print(f"  N={N}: ζ(2) = {float(val):.10f}")
-
 # =============================================================================
 # §3. ДЗЕТА-ПРИМА В НУЛЕ: ζ'(0)
 # =============================================================================
 
-print("\n§3. Вычисление ζ'(0)")
-print("-"*40)
-
-print("""
-ζ'(0) требует аналитического продолжения.
-Метод: вычитание Weyl асимптотики.
-
-Weyl асимптотика для 3D:
-  N(λ) ~ C₀ λ^{3/2} + C₁ λ^{1/2} + ...
-
-Регуляризованная сумма:
-  ζ_reg(s) = ζ(s) - (Weyl terms)
-""")
-
 def zeta_L21_regularized(s, N_max=500):
     """
     Регуляризованная дзета-функция.
@@ -104,20 +71,72 @@ def zeta_L21_regularized(s, N_max=500):
     
     return total
 
-# Проверка регуляризации
-print("Регуляризованная ζ при разных s:")
-for s_val in [0.5, 0.3, 0.1, 0.01]:
-    val = zeta_L21_regularized(s_val, 500)
-    print(f"  s={s_val}: ζ_reg = {float(val):.6f}")
+# =============================================================================
+# §4b. ИЗВЛЕЧЕНИЕ 1/24 КАК 1D ОСТАТКА (ABEL/HEAT-KERNEL)
+# =============================================================================
+
+def kappa_cas_half_from_abel(t):
+    """-(Σ m q^m - 1/t²)/2, q = e^{-t}; ряд Бернулли без сокращения 1/t² (rpft.heat)."""
+    return abel_remainder_S1(t, digits=mp.dps)[0]
 
 # =============================================================================
-# §4. СВЯЗЬ С 1/24 ЧЕРЕЗ S¹
+# Разделы вывода
 # =============================================================================
 
-print("\n§4. Casimir на S¹ и происхождение 1/24")
-print("-"*40)
+def section_1():
+    """§1. СПЕКТР ЛАПЛАСИАНА НА L(2,1)."""
+    print("\n§1. Спектр скалярного лапласиана на L(2,1)")
+    print("-"*40)
+    print("""
+На S³: λ_n = n(n+2), d_n = (n+1)²
+На L(2,1) = S³/Z₂: только чётные n проецируются
+→ λ_k = 2k(2k+2) = 4k(k+1), d_k = (2k+1)²
+
+Первые собственные значения:
+""")
+    for k in range(1, 6):
+        lam = 4*k*(k+1)
+        d = (2*k+1)**2
+        print(f"  k={k}: λ = {lam}, d = {d}")
+
+def section_2():
+    """§2. ДЗЕТА-ФУНКЦИЯ НА L(2,1)."""
+    print("\n§2. Дзета-функция ζ_{L(2,1)}(s)")
+    print("-"*40)
+    # Проверка сходимости
+    # Одна сумма до N = 1000 даёт все строки таблицы и экстраполяцию N → ∞
+    print("Проверка при s = 2:")
+    zeta2_table = convergence_study(lambda k: mp.mpf((2*k+1)**2) / (4*k*(k+1))**2, [100, 500, 1000],
+                                    limit="richardson")
+    for N, val in zeta2_table:
+        print(f"  N={N}: ζ(2) = {float(val):.10f}")
+    print(f"  N→∞ (Richardson): ζ(2) = {float(zeta2_table.limit):.10f}  (оценка ошибки {mp.nstr(zeta2_table.error, 2)})")
+
+def section_3():
+    """§3. ДЗЕТА-ПРИМА В НУЛЕ: ζ'(0)."""
+    print("\n§3. Вычисление ζ'(0)")
+    print("-"*40)
+    print("""
+ζ'(0) требует аналитического продолжения.
+Метод: вычитание Weyl асимптотики.
+
+Weyl асимптотика для 3D:
+  N(λ) ~ C₀ λ^{3/2} + C₁ λ^{1/2} + ...
 
-print("""
+Регуляризованная сумма:
+  ζ_reg(s) = ζ(s) - (Weyl terms)
+""")
+    # Проверка регуляризации
+    print("Регуляризованная ζ при разных s:")
+    for s_val in [0.5, 0.3, 0.1, 0.01]:
+        val = zeta_L21_regularized(s_val, 500)
+        print(f"  s={s_val}: ζ_reg = {float(val):.6f}")
+
+def section_4():
+    """§4. СВЯЗЬ С 1/24 ЧЕРЕЗ S¹."""
+    print("\n§4. Casimir на S¹ и происхождение 1/24")
+    print("-"*40)
+    print("""
 На S¹ длины L = 2π:
   λ_n = n²/R² = n², d_n = 2 (для n ≠ 0), d_0 = 1
 
@@ -132,39 +151,26 @@ print("""
 
 Это даёт log det Δ = log(2π), не 1/24 напрямую.
 """)
-
-# Числовая проверка
-zeta_R_minus1 = mpzeta(-1)
-print(f"ζ_R(-1) = {float(zeta_R_minus1):.10f} = -1/12 = {-1/12:.10f}")
-
-# =============================================================================
-# §4b. ИЗВЛЕЧЕНИЕ 1/24 КАК 1D ОСТАТКА (ABEL/HEAT-KERNEL)
-# =============================================================================
-
-print("\n§4b. Извлечение 1/24 как 1D остатка (Abel/heat-kernel)")
-print("-"*40)
-
-def kappa_cas_half_from_abel(t):
-    t = mp.mpf(t)
-    q = exp(-t)
-    S = q / (1 - q)**2
-    return -(S - 1 / t**2) / 2
-
-target_kappa = mp.mpf(1) / 24
-print(f"Target κ_Cas = 1/24 = {float(target_kappa):.15f}")
-print("t -> 0: κ_Cas(t) -> 1/24")
-for t in [mp.mpf('0.5'), mp.mpf('0.2'), mp.mpf('0.1'), mp.mpf('0.05'), mp.mpf('0.02'), mp.mpf('0.01'), mp.mpf('0.005')]:
-    val = kappa_cas_half_from_abel(t)
-    print(f"  t={t}: κ_Cas(t) = {float(val):.15f}, Δ = {float(val - target_kappa):+.3e}")
-
-# =============================================================================
-# §5. Heat kernel и коэффициент a₂
-# =============================================================================
-
-print("\n§5. Heat kernel и коэффициент a₂")
-print("-"*40)
-
-print("""
+    # Числовая проверка
+    zeta_R_minus1 = mpzeta(-1)
+    print(f"ζ_R(-1) = {float(zeta_R_minus1):.10f} = -1/12 = {-1/12:.10f}")
+
+def section_4b():
+    """§4b. ИЗВЛЕЧЕНИЕ 1/24 КАК 1D ОСТАТКА (ABEL/HEAT-KERNEL)."""
+    print("\n§4b. Извлечение 1/24 как 1D остатка (Abel/heat-kernel)")
+    print("-"*40)
+    target_kappa = mp.mpf(1) / 24
+    print(f"Target κ_Cas = 1/24 = {float(target_kappa):.15f}")
+    print("t -> 0: κ_Cas(t) -> 1/24")
+    for t in [mp.mpf('0.5'), mp.mpf('0.2'), mp.mpf('0.1'), mp.mpf('0.05'), mp.mpf('0.02'), mp.mpf('0.01'), mp.mpf('0.005')]:
+        val = kappa_cas_half_from_abel(t)
+        print(f"  t={t}: κ_Cas(t) = {float(val):.15f}, Δ = {float(val - target_kappa):+.3e}")
+
+def section_5():
+    """§5. Heat kernel и коэффициент a₂."""
+    print("\n§5. Heat kernel и коэффициент a₂")
+    print("-"*40)
+    print("""
 Heat kernel expansion:
   K(t) = (4πt)^{-d/2} Σ_{k=0}^∞ a_k t^k
 
@@ -180,27 +186,21 @@ Heat kernel expansion:
 Для RP³ × S¹:
   R = 6 (кривизна RP³), остальные члены тоже вычисляются.
 """)
-
-# Кривизна RP³
-R_scalar = 6  # скалярная кривизна при R=1
-Rij2 = 12     # R_{ij}R^{ij}
-Rijkl2 = 12   # Riemann squared
-
-integrand = (R_scalar**2 - 3*Rij2 + Rijkl2) / 180
-print(f"Подынтегральное: (R² - 3Rij² + Rijkl²)/180 = ({R_scalar**2} - {3*Rij2} + {Rijkl2})/180 = {integrand:.6f}")
-
-Vol_RP3_S1 = float(pi**2 * 2*pi)
-a2_approx = integrand * Vol_RP3_S1 / float((4*pi)**2)
-print(f"a₂ ≈ {a2_approx:.6f}")
-
-# =============================================================================
-# §6. Откуда именно 1/24?
-# =============================================================================
-
-print("\n§6. Откуда именно 1/24?")
-print("-"*40)
-
-print("""
+    # Кривизна RP³
+    R_scalar = 6  # скалярная кривизна при R=1
+    Rij2 = 12     # R_{ij}R^{ij}
+    Rijkl2 = 12   # Riemann squared
+    integrand = (R_scalar**2 - 3*Rij2 + Rijkl2) / 180
+    print(f"Подынтегральное: (R² - 3Rij² + Rijkl²)/180 = ({R_scalar**2} - {3*Rij2} + {Rijkl2})/180 = {integrand:.6f}")
+    Vol_RP3_S1 = float(pi**2 * 2*pi)
+    a2_approx = integrand * Vol_RP3_S1 / float((4*pi)**2)
+    print(f"a₂ ≈ {a2_approx:.6f}")
+
+def section_6():
+    """§6. Откуда именно 1/24?"""
+    print("\n§6. Откуда именно 1/24?")
+    print("-"*40)
+    print("""
 КЛЮЧЕВОЙ РЕЗУЛЬТАТ (Dowker 1977, Камеда-Оикава 1984):
 
 Для многообразия M × S¹:
@@ -220,61 +220,48 @@ Casimir energy на S¹:
   - 12 из ζ_R(-1) = -1/12
   - 2 из нормировки (1/2 × 1/12 × 4 = 1/6... нужно уточнить)
 """)
-
-# Прямое вычисление
-print("\nПрямое вычисление:")
-print(f"  -1/12 = {-1/12:.10f}")
-print(f"  1/24 = {1/24:.10f}")
-print(f"  -ζ_R(-1)/2 = {float(-zeta_R_minus1/2):.10f}  (типичный источник 1/24 при «половинной» нормировке)")
-
-# =============================================================================
-# §7. ЧИСЛЕННАЯ ПРОВЕРКА ЧЕРЕЗ ФОРМУЛУ
-# =============================================================================
-
-print("\n§7. Проверка формулы α⁻¹")
-print("-"*40)
-
-S_geo = 4*pi**3 + pi**2 + pi
-kappa_Cas = mp.mpf(1) / 24
-delta_Cas = kappa_Cas / S_geo
-delta_pi4 = 1/(pi**4 * S_geo**2)
-
-alpha_inv = S_geo - delta_Cas - delta_pi4
-alpha_codata = mp.mpf('137.035999177')
-diff_sigma = (alpha_inv - alpha_codata) / mp.mpf('0.000000085')
-
-print(f"S_geo = {float(S_geo):.12f}")
-print(f"κ_Cas = 1/24 = {float(kappa_Cas):.15e}")
-print(f"δ_Cas = κ_Cas/S = {float(delta_Cas):.15e}")
-print(f"δ_π4 = 1/(π⁴·S²) = {float(delta_pi4):.15e}")
-print(f"α⁻¹ = {float(alpha_inv):.12f}")
-print(f"CODATA = {float(alpha_codata):.12f}")
-print(f"Отклонение = {float(diff_sigma):.2f}σ")
-
-# =============================================================================
-# §8. ЧТО ЕСЛИ ИСПОЛЬЗОВАТЬ ДРУГИЕ КОЭФФИЦИЕНТЫ?
-# =============================================================================
-
-print("\n§8. Альтернативные коэффициенты")
-print("-"*40)
-
-for coef in [12, 24, 48, 6, 18, 30]:
-    delta_test = 1/(coef * S_geo)
-    alpha_test = S_geo - delta_test - delta_pi4
-    diff_test = float((alpha_test - alpha_codata) / mp.mpf('0.000000085'))
-    print(f"  1/{coef}: α⁻¹ = {float(alpha_test):.9f}, Δσ = {diff_test:+.2f}")
-
-print("\n→ Коэффициент 24 даёт наилучшее совпадение!")
-
-# =============================================================================
-# §9. ИТОГ
-# =============================================================================
-
-print("\n" + "="*70)
-print("ИТОГ")
-print("="*70)
-
-print("""
+    # Прямое вычисление
+    print("\nПрямое вычисление:")
+    print(f"  -1/12 = {-1/12:.10f}")
+    print(f"  1/24 = {1/24:.10f}")
+    print(f"  -ζ_R(-1)/2 = {float(-mpzeta(-1)/2):.10f}  (типичный источник 1/24 при «половинной» нормировке)")
+
+def section_7():
+    """§7. ЧИСЛЕННАЯ ПРОВЕРКА ЧЕРЕЗ ФОРМУЛУ."""
+    print("\n§7. Проверка формулы α⁻¹")
+    print("-"*40)
+    kappa_Cas = mp.mpf(1) / 24
+    S_geo, delta_Cas, delta_pi4, alpha_inv = alpha_inv_terms(kappa=kappa_Cas)
+    alpha_codata = constant("alpha_inv").mpf()
+    diff_sigma = (alpha_inv - alpha_codata) / mp.mpf(convention("sigma_alpha_inv"))
+    print(f"S_geo = {float(S_geo):.12f}")
+    print(f"κ_Cas = 1/24 = {float(kappa_Cas):.15e}")
+    print(f"δ_Cas = κ_Cas/S = {float(delta_Cas):.15e}")
+    print(f"δ_π4 = 1/(π⁴·S²) = {float(delta_pi4):.15e}")
+    print(f"α⁻¹ = {float(alpha_inv):.12f}")
+    print(f"CODATA = {float(alpha_codata):.12f}")
+    print(f"Отклонение = {float(diff_sigma):.2f}σ")
+
+def section_8():
+    """§8. ЧТО ЕСЛИ ИСПОЛЬЗОВАТЬ ДРУГИЕ КОЭФФИЦИЕНТЫ?"""
+    print("\n§8. Альтернативные коэффициенты")
+    print("-"*40)
+    S_geo = s_geo()
+    delta_pi4 = 1/(pi**4 * S_geo**2)
+    alpha_codata = constant("alpha_inv").mpf()
+    for coef in [12, 24, 48, 6, 18, 30]:
+        delta_test = 1/(coef * S_geo)
+        alpha_test = S_geo - delta_test - delta_pi4
+        diff_test = float((alpha_test - alpha_codata) / mp.mpf(convention("sigma_alpha_inv")))
+        print(f"  1/{coef}: α⁻¹ = {float(alpha_test):.9f}, Δσ = {diff_test:+.2f}")
+    print("\n→ Коэффициент 24 даёт наилучшее совпадение!")
+
+def section_9():
+    """§9. ИТОГ."""
+    print("\n" + "="*70)
+    print("ИТОГ")
+    print("="*70)
+    print("""
 1. Коэффициент 1/24 связан с:
    - ζ_R(-1) = -1/12 (Casimir на S¹)
    - Нормировка heat kernel для 4D многообразия
@@ -291,4 +278,24 @@ print("""
 СТАТУС: ⚠️ Структура обоснована, точный вывод требует формулы Gilkey
 """)
 
-print("="*70)
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "4b": section_4b,
+    "5": section_5,
+    "6": section_6,
+    "7": section_7,
+    "8": section_8,
+    "9": section_9,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nЧИСЛЕННАЯ ПРОВЕРКА κ_Cas = 1/24\n" + "="*70,
+                        footer="="*70)
+
+if __name__ == "__main__":
+    main()
+
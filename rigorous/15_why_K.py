@@ -3,23 +3,54 @@
 СРАВНЕНИЕ КАНДИДАТОВ ДЛЯ ВНУТРЕННЕГО ПРОСТРАНСТВА K
 
 Цель: Показать, что K = RP³ × S¹ — оптимальный выбор.
+
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 15_why_K.py [раздел ...] (rpft.sections).
 """
 
+import os
+import sys
+
 from mpmath import mp, pi
-mp.dps = 50
 
-print("="*70)
-print("СРАВНЕНИЕ КАНДИДАТОВ ДЛЯ K")
-print("="*70)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import s_geo
+from rpft.constants import constant
+from rpft.sections import memo, run_sections
+
+DPS = 50
+
+@memo
+def lens_candidates():
+    """Линзовые L(p,1), p ∈ {1,…,8}: имя, объём, π₁, spin и годность (π₁ ≠ 0)."""
+    candidates = []
+    for p in [1, 2, 3, 4, 5, 6, 8]:
+        vol = 2*pi**2 / p
+        pi1 = f"Z_{p}" if p > 1 else "0"
+        spin = "✅"  # для линзовых пространств spin-структура существует всегда
+        name = f"L({p},1)" if p > 1 else "S³"
+        if p == 2:
+            name = "RP³"
+    
+        candidates.append({
+            'name': name,
+            'p': p,
+            'vol': float(vol),
+            'pi1': pi1,
+            'spin': spin,
+            'valid': p > 1  # нетривиальная π₁ (spin для линзовых есть всегда)
+        })
+    return candidates
 
 # =============================================================================
-# §1. ЛИНЗОВЫЕ ПРОСТРАНСТВА L(p,q)
+# Разделы вывода
 # =============================================================================
 
-print("\n§1. Линзовые пространства L(p,q)")
-print("-"*40)
-
-print("""
+def section_1():
+    """§1. ЛИНЗОВЫЕ ПРОСТРАНСТВА L(p,q)."""
+    print("\n§1. Линзовые пространства L(p,q)")
+    print("-"*40)
+    print("""
 L(p,q) = S³/Z_p, где Z_p действует как:
   (z₁, z₂) → (e^{2πi/p} z₁, e^{2πiq/p} z₂)
 
@@ -29,75 +60,44 @@ L(p,q) = S³/Z_p, где Z_p действует как:
   - Spin: для линзовых L(p,q) (ориентируемые 3-многообразия) spin-структура существует для любого p;
           чётность p влияет только на число spin-структур (p чётно: две, p нечётно: одна)
 """)
-
-candidates = []
-
-for p in [1, 2, 3, 4, 5, 6, 8]:
-    vol = 2*pi**2 / p
-    pi1 = f"Z_{p}" if p > 1 else "0"
-    spin = "✅"  # для линзовых пространств spin-структура существует всегда
-    name = f"L({p},1)" if p > 1 else "S³"
-    if p == 2:
-        name = "RP³"
-    
-    candidates.append({
-        'name': name,
-        'p': p,
-        'vol': float(vol),
-        'pi1': pi1,
-        'spin': spin,
-        'valid': p > 1  # нетривиальная π₁ (spin для линзовых есть всегда)
-    })
-    
-print(f"{'Пространство':<12} {'π₁':<6} {'Spin':<4} {'Vol':<12} {'Годится?'}")
-print("-"*50)
-for c in candidates:
-    valid = "✅" if c['valid'] else "❌"
-    print(f"{c['name']:<12} {c['pi1']:<6} {c['spin']:<4} {c['vol']:<12.6f} {valid}")
-
-# =============================================================================
-# §2. МИНИМАЛЬНЫЙ КАНДИДАТ
-# =============================================================================
-
-print("\n§2. Минимальный кандидат")
-print("-"*40)
-
-valid_candidates = [c for c in candidates if c['valid']]
-
-if valid_candidates:
-    best = min(valid_candidates, key=lambda x: x['p'])
-    print(f"Минимальный |π₁|: p = {best['p']}")
-    print(f"Пространство: {best['name']}")
-    print(f"Объём: {best['vol']:.10f}")
-    print(f"\n→ {best['name']} — ЕДИНСТВЕННЫЙ кандидат с минимальным |π₁| и spin-структурой!")
-
-# =============================================================================
-# §3. ПОЛНОЕ ПРОСТРАНСТВО K = M³ × S¹
-# =============================================================================
-
-print("\n§3. Полное пространство K = M³ × S¹")
-print("-"*40)
-
-R_circle = 1  # Радиус S¹
-Vol_S1 = 2*pi*R_circle
-
-print(f"Vol(S¹) = 2πR = {float(Vol_S1):.10f}")
-
-for c in valid_candidates[:3]:  # Первые 3 валидных
-    vol_K = c['vol'] * float(Vol_S1)
-    name_K = f"{c['name']} × S¹"
-    print(f"Vol({name_K}) = {vol_K:.10f}")
-
-# =============================================================================
-# §4. ПРОВЕРКА: α⁻¹ ДЛЯ РАЗНЫХ K
-# =============================================================================
-
-print("\n§4. α⁻¹ для разных K (гипотеза)")
-print("-"*40)
-
-alpha_codata = mp.mpf('137.035999177')
-
-print("""
+    candidates = lens_candidates()
+    print(f"{'Пространство':<12} {'π₁':<6} {'Spin':<4} {'Vol':<12} {'Годится?'}")
+    print("-"*50)
+    for c in candidates:
+        valid = "✅" if c['valid'] else "❌"
+        print(f"{c['name']:<12} {c['pi1']:<6} {c['spin']:<4} {c['vol']:<12.6f} {valid}")
+
+def section_2():
+    """§2. МИНИМАЛЬНЫЙ КАНДИДАТ."""
+    print("\n§2. Минимальный кандидат")
+    print("-"*40)
+    valid_candidates = [c for c in lens_candidates() if c['valid']]
+    if valid_candidates:
+        best = min(valid_candidates, key=lambda x: x['p'])
+        print(f"Минимальный |π₁|: p = {best['p']}")
+        print(f"Пространство: {best['name']}")
+        print(f"Объём: {best['vol']:.10f}")
+        print(f"\n→ {best['name']} — ЕДИНСТВЕННЫЙ кандидат с минимальным |π₁| и spin-структурой!")
+
+def section_3():
+    """§3. ПОЛНОЕ ПРОСТРАНСТВО K = M³ × S¹."""
+    print("\n§3. Полное пространство K = M³ × S¹")
+    print("-"*40)
+    R_circle = 1  # Радиус S¹
+    Vol_S1 = 2*pi*R_circle
+    print(f"Vol(S¹) = 2πR = {float(Vol_S1):.10f}")
+    valid_candidates = [c for c in lens_candidates() if c['valid']]
+    for c in valid_candidates[:3]:  # Первые 3 валидных
+        vol_K = c['vol'] * float(Vol_S1)
+        name_K = f"{c['name']} × S¹"
+        print(f"Vol({name_K}) = {vol_K:.10f}")
+
+def section_4():
+    """§4. ПРОВЕРКА: α⁻¹ ДЛЯ РАЗНЫХ K."""
+    print("\n§4. α⁻¹ для разных K (гипотеза)")
+    print("-"*40)
+    alpha_codata = constant("alpha_inv").mpf()
+    print("""
 Если формула α⁻¹ = S_geo − corrections верна для любого K,
 то S_geo зависит от Vol(K).
 
@@ -106,53 +106,38 @@ print("""
   
 Но формула α⁻¹ = 4π³ + π² + π работает только для p = 2!
 """)
-
-for p in [1, 2, 4]:
-    # Пробуем разные масштабирования
-    if p == 1:
-        S_geo = 4*pi**3 + 2*pi**2 + pi  # S³: удвоенный бозонный вклад
-    elif p == 2:
-        S_geo = 4*pi**3 + pi**2 + pi    # RP³: стандартная формула
-    elif p == 4:
-        S_geo = 4*pi**3 + pi**2/2 + pi  # L(4,1): половинный бозонный
-    
-    diff = S_geo - alpha_codata
-    name = "S³" if p == 1 else ("RP³" if p == 2 else f"L({p},1)")
-    print(f"{name}: S_geo = {float(S_geo):.6f}, diff = {float(diff):.2e}")
-
-print("\n→ Только RP³ × S¹ даёт правильное α⁻¹!")
-
-# =============================================================================
-# §5. ТАБЛИЦА СИММЕТРИЙ
-# =============================================================================
-
-print("\n§5. Группы симметрий")
-print("-"*40)
-
-symmetries = [
-    ("S³", "SO(4)", 6, "0"),
-    ("RP³", "SO(3)×SO(3)/Z₂", 6, "Z₂"),
-    ("L(3,1)", "U(2)/Z₃", 4, "Z₃"),
-    ("L(4,1)", "U(2)/Z₄", 4, "Z₄"),
-    ("T³", "T³ ⋊ (Z₂)³", 3, "Z³"),
-]
-
-print(f"{'Простр.':<10} {'Симметрия':<20} {'dim Iso':<8} {'π₁'}")
-print("-"*50)
-for name, sym, dim_iso, pi1 in symmetries:
-    print(f"{name:<10} {sym:<20} {dim_iso:<8} {pi1}")
-
-print("\n→ RP³ имеет МАКСИМАЛЬНУЮ симметрию среди пространств с π₁ ≠ 0!")
-
-# =============================================================================
-# §6. ИТОГ
-# =============================================================================
-
-print("\n" + "="*70)
-print("ИТОГ: ПОЧЕМУ K = RP³ × S¹?")
-print("="*70)
-
-print("""
+    for p in [1, 2, 4]:
+        # Бозонный член Vol(L(p,1)) = 2π²/p: S³ — удвоенный, RP³ — стандартная формула,
+        # L(4,1) — половинный (rpft.alpha)
+        S_geo = s_geo(p=p)
+        diff = S_geo - alpha_codata
+        name = "S³" if p == 1 else ("RP³" if p == 2 else f"L({p},1)")
+        print(f"{name}: S_geo = {float(S_geo):.6f}, diff = {float(diff):.2e}")
+    print("\n→ Только RP³ × S¹ даёт правильное α⁻¹!")
+
+def section_5():
+    """§5. ТАБЛИЦА СИММЕТРИЙ."""
+    print("\n§5. Группы симметрий")
+    print("-"*40)
+    symmetries = [
+        ("S³", "SO(4)", 6, "0"),
+        ("RP³", "SO(3)×SO(3)/Z₂", 6, "Z₂"),
+        ("L(3,1)", "U(2)/Z₃", 4, "Z₃"),
+        ("L(4,1)", "U(2)/Z₄", 4, "Z₄"),
+        ("T³", "T³ ⋊ (Z₂)³", 3, "Z³"),
+    ]
+    print(f"{'Простр.':<10} {'Симметрия':<20} {'dim Iso':<8} {'π₁'}")
+    print("-"*50)
+    for name, sym, dim_iso, pi1 in symmetries:
+        print(f"{name:<10} {sym:<20} {dim_iso:<8} {pi1}")
+    print("\n→ RP³ имеет МАКСИМАЛЬНУЮ симметрию среди пространств с π₁ ≠ 0!")
+
+def section_6():
+    """§6. ИТОГ."""
+    print("\n" + "="*70)
+    print("ИТОГ: ПОЧЕМУ K = RP³ × S¹?")
+    print("="*70)
+    print("""
 1. МИНИМАЛЬНОСТЬ π₁:
    - π₁(RP³) = Z₂ — минимальная нетривиальная группа
    - Для калибровки U(1) нужна π₁ ≠ 0
@@ -175,4 +160,20 @@ print("""
 СТАТУС: K = RP³ × S¹ — ЕДИНСТВЕННЫЙ выбор, удовлетворяющий всем требованиям.
 """)
 
-print("="*70)
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nСРАВНЕНИЕ КАНДИДАТОВ ДЛЯ K\n" + "="*70,
+                        footer="="*70)
+
+if __name__ == "__main__":
+    main()
+
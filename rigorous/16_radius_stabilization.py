@@ -11,123 +11,63 @@
   Это даёт правильный ответ ТОЛЬКО при R = 1.
   
 Вопрос: Есть ли механизм, фиксирующий R = 1?
+
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 16_radius_stabilization.py [раздел ...] (rpft.sections).
 """
 
+import os
+import sys
+
 from mpmath import mp, pi, sqrt, log, exp, diff
 import numpy as np
-# matplotlib опционально
-try:
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    HAS_MPL = True
-except ImportError:
-    HAS_MPL = False
 
-mp.dps = 50
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import s_vac, solve
+from rpft.constants import constant, convention
+from rpft.sections import memo, run_sections
 
-print("="*70)
-print("СТАБИЛИЗАЦИЯ РАДИУСА КОМПАКТИФИКАЦИИ")
-print("="*70)
+DPS = 50
+
+CODATA_ALPHA_INV = constant("alpha_inv").value  # издание — RPFT_CODATA (rpft.constants)
+SIGMA_CODATA = convention("sigma_alpha_inv")
 
 # =============================================================================
 # §1. ФОРМУЛА ПРИ ПРОИЗВОЛЬНОМ R
 # =============================================================================
 
-print("\n§1. α⁻¹ как функция R")
-print("-"*40)
-
 def alpha_inv(R):
-    """α⁻¹(R) для произвольного радиуса R."""
+    """α⁻¹(R) для произвольного радиуса R (скаляр — mpmath, массив — float64; rpft.alpha)."""
     # Члены с правильными степенями R:
     # Vol(S³×S¹) ~ R⁴  (4D объём)
     # Vol(RP³) ~ R³    (3D объём)
     # Sys(RP³) ~ R     (1D длина)
-    
-    S_geo = 4*pi**3 * R**4 + pi**2 * R**3 + pi * R
-    
     # Поправки тоже масштабируются:
     # δ_Cas ~ 1/S_geo (Casimir)
     # δ_BB ~ 1/S_geo² (2-loop)
-    delta_Cas = 1/(24 * S_geo)
-    delta_BB = 1/(pi**4 * S_geo**2)
-    
-    return S_geo - delta_Cas - delta_BB
-
-# Значения
-alpha_codata = mp.mpf('137.035999177')
-
-print("α⁻¹(R) = 4π³R⁴ + π²R³ + πR − corrections")
-print()
-for R in [0.5, 0.8, 0.9, 1.0, 1.1, 1.2, 2.0]:
-    a = alpha_inv(R)
-    diff_val = float(a - alpha_codata)
-    print(f"R = {R:.1f}: α⁻¹ = {float(a):.6f}, Δ = {diff_val:+.2f}")
+    return s_vac(R)
 
 # =============================================================================
 # §2. АНАЛИЗ: ПРИ КАКОМ R ПОЛУЧАЕТСЯ α⁻¹ = 137.036?
 # =============================================================================
 
-print("\n§2. Поиск R, дающего α⁻¹ = 137.036")
-print("-"*40)
-
-# Численный поиск корня (простой bisection)
-def target(R):
-    return float(alpha_inv(R) - alpha_codata)
+# Корень α⁻¹(R) = CODATA: итерации Галлея по аналитическим производным S_geo(R)
+# с запасной бисекцией (rpft.alpha.solve)
+@memo
+def R_solution():
+    """(R, оценка ошибки), при котором α⁻¹(R) = CODATA при текущей точности (§2, §11)."""
+    return solve(mp.mpf(CODATA_ALPHA_INV), "R")
 
-# Bisection method
-def bisect(f, a, b, tol=1e-12):
-    while b - a > tol:
-        mid = (a + b) / 2
-        if f(mid) * f(a) < 0:
-            b = mid
-        else:
-            a = mid
-    return (a + b) / 2
-
-R_solution = bisect(target, 0.5, 2.0)
-print(f"Решение: R = {R_solution:.15f}")
-print(f"Отклонение от 1: {(R_solution - 1)*100:.6f}%")
-
-# Проверка
-a_check = alpha_inv(R_solution)
-print(f"α⁻¹(R_solution) = {float(a_check):.12f}")
-print(f"CODATA = {float(alpha_codata):.12f}")
-
-# =============================================================================
-# §3. МЕХАНИЗМ 1: САМОСОГЛАСОВАННОСТЬ
-# =============================================================================
-
-print("\n§3. Механизм самосогласованности")
-print("-"*40)
-
-print("""
-ИДЕЯ: α⁻¹ = S_vac — это ОПРЕДЕЛЕНИЕ, не уравнение.
-
-В нашей теории:
-  - α — связь gauge поля
-  - S_vac — вакуумное действие
-  
-Утверждение: e² = 1/S_vac в естественных единицах.
-
-Тогда α = e²/(4π) = 1/(4π·S_vac)
-
-И α⁻¹ = 4π·S_vac ≠ S_vac !
-
-НО: Если мы определяем α через полный Jacobian:
-  Z_total = exp(−S_vac)
-  α⁻¹ = log(1/Z_total) = S_vac
-  
-Это работает, если S_vac — безразмерное действие.
-""")
+def R_distribution(n=100000, seed=0):
+    """(среднее, σ) корня R по n выборкам α⁻¹ ~ N(CODATA, σ_CODATA), float64 одним массивом."""
+    samples = np.random.default_rng(seed).normal(float(CODATA_ALPHA_INV), float(SIGMA_CODATA), n)
+    R, _ = solve(samples, "R")
+    return R.mean(), R.std()
 
 # =============================================================================
 # §4. МЕХАНИЗМ 2: CASIMIR СТАБИЛИЗАЦИЯ
 # =============================================================================
 
-print("\n§4. Casimir стабилизация")
-print("-"*40)
-
 def casimir_energy(R):
     """
     Энергия Казимира на S¹ радиуса R:
@@ -150,34 +90,87 @@ def total_energy(R):
     
     return A * R**3 - B / R
 
-# Найдём минимум
-R_values = np.linspace(0.1, 3.0, 1000)
-E_values = [total_energy(R) for R in R_values]
+# =============================================================================
+# Разделы вывода
+# =============================================================================
 
-R_min_idx = np.argmin(E_values)
-R_min = R_values[R_min_idx]
-print(f"Минимум E(R) при R ≈ {R_min:.4f}")
+def section_1():
+    """§1. ФОРМУЛА ПРИ ПРОИЗВОЛЬНОМ R."""
+    print("\n§1. α⁻¹ как функция R")
+    print("-"*40)
+    # Значения
+    alpha_codata = mp.mpf(CODATA_ALPHA_INV)
+    print("α⁻¹(R) = 4π³R⁴ + π²R³ + πR − corrections")
+    print()
+    for R in [0.5, 0.8, 0.9, 1.0, 1.1, 1.2, 2.0]:
+        a = alpha_inv(R)
+        diff_val = float(a - alpha_codata)
+        print(f"R = {R:.1f}: α⁻¹ = {float(a):.6f}, Δ = {diff_val:+.2f}")
+
+def section_2():
+    """§2. АНАЛИЗ: ПРИ КАКОМ R ПОЛУЧАЕТСЯ α⁻¹ = 137.036?"""
+    print("\n§2. Поиск R, дающего α⁻¹ = 137.036")
+    print("-"*40)
+    R_solution_, R_err = R_solution()
+    print(f"Решение: R = {float(R_solution_):.15f} (ошибка корня ≤ {float(R_err):.1e})")
+    print(f"Отклонение от 1: {float(R_solution_ - 1)*100:.6f}%")
+    R_mean, R_sigma = R_distribution()
+    print(f"По σ(CODATA), 10⁵ выборок: R = {R_mean:.12f} ± {R_sigma:.1e}")
+    # Проверка
+    a_check = alpha_inv(R_solution_)
+    print(f"α⁻¹(R_solution) = {float(a_check):.12f}")
+    print(f"CODATA = {float(mp.mpf(CODATA_ALPHA_INV)):.12f}")
+
+def section_3():
+    """§3. МЕХАНИЗМ 1: САМОСОГЛАСОВАННОСТЬ."""
+    print("\n§3. Механизм самосогласованности")
+    print("-"*40)
+    print("""
+ИДЕЯ: α⁻¹ = S_vac — это ОПРЕДЕЛЕНИЕ, не уравнение.
 
-# Аналитический минимум: dE/dR = 3AR² + B/R² = 0
-# 3AR⁴ = B  =>  R⁴ = B/(3A)  =>  R = (B/(3A))^(1/4)
-A, B = 1.0, pi/6
-R_analytic = (B / (3*A))**(1/4)
-print(f"Аналитический минимум: R = (π/(18))^(1/4) = {float(R_analytic):.6f}")
+В нашей теории:
+  - α — связь gauge поля
+  - S_vac — вакуумное действие
+  
+Утверждение: e² = 1/S_vac в естественных единицах.
 
-print("""
-ПРОБЛЕМА: Casimir даёт R ≈ 0.65, не 1.
+Тогда α = e²/(4π) = 1/(4π·S_vac)
 
-Нужен другой механизм или другие коэффициенты.
+И α⁻¹ = 4π·S_vac ≠ S_vac !
+
+НО: Если мы определяем α через полный Jacobian:
+  Z_total = exp(−S_vac)
+  α⁻¹ = log(1/Z_total) = S_vac
+  
+Это работает, если S_vac — безразмерное действие.
 """)
 
-# =============================================================================
-# §5. МЕХАНИЗМ 3: ФИКСАЦИЯ ИЗ РАЗМЕРНОГО АНАЛИЗА
-# =============================================================================
+def section_4():
+    """§4. МЕХАНИЗМ 2: CASIMIR СТАБИЛИЗАЦИЯ."""
+    print("\n§4. Casimir стабилизация")
+    print("-"*40)
+    # Найдём минимум
+    R_values = np.linspace(0.1, 3.0, 1000)
+    E_values = [total_energy(R) for R in R_values]
+    R_min_idx = np.argmin(E_values)
+    R_min = R_values[R_min_idx]
+    print(f"Минимум E(R) при R ≈ {R_min:.4f}")
+    # Аналитический минимум: dE/dR = 3AR² + B/R² = 0
+    # 3AR⁴ = B  =>  R⁴ = B/(3A)  =>  R = (B/(3A))^(1/4)
+    A, B = 1.0, pi/6
+    R_analytic = (B / (3*A))**(1/4)
+    print(f"Аналитический минимум: R = (π/(18))^(1/4) = {float(R_analytic):.6f}")
+    print("""
+ПРОБЛЕМА: Casimir даёт R ≈ 0.65, не 1.
 
-print("\n§5. Размерный анализ и планковские единицы")
-print("-"*40)
+Нужен другой механизм или другие коэффициенты.
+""")
 
-print("""
+def section_5():
+    """§5. МЕХАНИЗМ 3: ФИКСАЦИЯ ИЗ РАЗМЕРНОГО АНАЛИЗА."""
+    print("\n§5. Размерный анализ и планковские единицы")
+    print("-"*40)
+    print("""
 В ПЛАНКОВСКИХ ЕДИНИЦАХ:
   ℏ = c = G = 1
   
@@ -197,14 +190,11 @@ print("""
 Минимальный: n = 1 → R = l_P = 1.
 """)
 
-# =============================================================================
-# §6. МЕХАНИЗМ 4: КВАНТОВАНИЕ ОБЪЁМА
-# =============================================================================
-
-print("\n§6. Квантование объёма (LQG-аргумент)")
-print("-"*40)
-
-print("""
+def section_6():
+    """§6. МЕХАНИЗМ 4: КВАНТОВАНИЕ ОБЪЁМА."""
+    print("\n§6. Квантование объёма (LQG-аргумент)")
+    print("-"*40)
+    print("""
 В Loop Quantum Gravity (LQG):
   - Объём квантован: V = γ·l_P³·√(j(j+1))
   - Минимальный объём ~ l_P³
@@ -229,14 +219,11 @@ print("""
 Тоже не 1.
 """)
 
-# =============================================================================
-# §7. МЕХАНИЗМ 5: САМОСОГЛАСОВАННОСТЬ α⁻¹ = 137
-# =============================================================================
-
-print("\n§7. КЛЮЧЕВОЙ МЕХАНИЗМ: Самосогласованность")
-print("-"*40)
-
-print("""
+def section_7():
+    """§7. МЕХАНИЗМ 5: САМОСОГЛАСОВАННОСТЬ α⁻¹ = 137."""
+    print("\n§7. КЛЮЧЕВОЙ МЕХАНИЗМ: Самосогласованность")
+    print("-"*40)
+    print("""
 ГЛАВНАЯ ИДЕЯ:
 
 Постоянная α — это НЕ свободный параметр.
@@ -258,37 +245,30 @@ print("""
   У нас: α = 1/S_vac — геометрия фиксирует связь.
 """)
 
-# =============================================================================
-# §8. КОЛИЧЕСТВЕННАЯ ПРОВЕРКА
-# =============================================================================
-
-print("\n§8. Количественная проверка")
-print("-"*40)
-
-# Насколько чувствительна формула к R?
-print("Чувствительность α⁻¹ к R:")
-R0 = 1.0
-dR = 0.001
-dalpha = (alpha_inv(R0 + dR) - alpha_inv(R0 - dR)) / (2*dR)
-print(f"dα⁻¹/dR при R=1: {float(dalpha):.6f}")
-
-# Относительная чувствительность
-rel_sens = float(dalpha * R0 / alpha_inv(R0))
-print(f"(R/α⁻¹)·dα⁻¹/dR = {rel_sens:.4f}")
-print(f"→ При 1% изменении R, α⁻¹ меняется на {rel_sens:.1f}%")
-
-# =============================================================================
-# §9. ФИКСАЦИЯ R ИЗ ТРЕБОВАНИЯ α⁻¹ ∈ ℕ
-# =============================================================================
-
-print("\n§9. Дискретность: α⁻¹ близко к целому?")
-print("-"*40)
-
-print(f"α⁻¹ = {float(alpha_codata):.10f}")
-print(f"Ближайшее целое: 137")
-print(f"Отклонение: {float(alpha_codata - 137):.6f} = {float((alpha_codata - 137)/alpha_codata * 100):.4f}%")
-
-print("""
+def section_8():
+    """§8. КОЛИЧЕСТВЕННАЯ ПРОВЕРКА."""
+    print("\n§8. Количественная проверка")
+    print("-"*40)
+    # Насколько чувствительна формула к R?
+    print("Чувствительность α⁻¹ к R:")
+    R0 = 1.0
+    dR = 0.001
+    dalpha = (alpha_inv(R0 + dR) - alpha_inv(R0 - dR)) / (2*dR)
+    print(f"dα⁻¹/dR при R=1: {float(dalpha):.6f}")
+    # Относительная чувствительность
+    rel_sens = float(dalpha * R0 / alpha_inv(R0))
+    print(f"(R/α⁻¹)·dα⁻¹/dR = {rel_sens:.4f}")
+    print(f"→ При 1% изменении R, α⁻¹ меняется на {rel_sens:.1f}%")
+
+def section_9():
+    """§9. ФИКСАЦИЯ R ИЗ ТРЕБОВАНИЯ α⁻¹ ∈ ℕ."""
+    print("\n§9. Дискретность: α⁻¹ близко к целому?")
+    print("-"*40)
+    alpha_codata = mp.mpf(CODATA_ALPHA_INV)
+    print(f"α⁻¹ = {float(alpha_codata):.10f}")
+    print(f"Ближайшее целое: 137")
+    print(f"Отклонение: {float(alpha_codata - 137):.6f} = {float((alpha_codata - 137)/alpha_codata * 100):.4f}%")
+    print("""
 Гипотеза: α⁻¹ должно быть "почти целым" для консистентности.
 
 137.036 ≈ 137 + 1/28 ≈ 137 + π/100
@@ -296,15 +276,12 @@ print("""
 Но это слишком спекулятивно...
 """)
 
-# =============================================================================
-# §10. ИТОГОВЫЙ АРГУМЕНТ
-# =============================================================================
-
-print("\n" + "="*70)
-print("ИТОГ: ПОЧЕМУ R = 1?")
-print("="*70)
-
-print("""
+def section_10():
+    """§10. ИТОГОВЫЙ АРГУМЕНТ."""
+    print("\n" + "="*70)
+    print("ИТОГ: ПОЧЕМУ R = 1?")
+    print("="*70)
+    print("""
 АРГУМЕНТ 1 (Слабый): Размерный анализ
   - Единственный масштаб — l_P
   - R = l_P = 1 в планковских единицах
@@ -329,40 +306,45 @@ print("""
 УРОВЕНЬ ЗАЩИТЫ: ⚠️ 50-60% (было 0%, стало лучше)
 """)
 
-# =============================================================================
-# §11. ГРАФИК (если matplotlib доступен)
-# =============================================================================
-
-if HAS_MPL:
-    print("\n§11. Сохраняю график α⁻¹(R)")
-    print("-"*40)
-
-    R_plot = np.linspace(0.5, 1.5, 200)
-    alpha_plot = [float(alpha_inv(R)) for R in R_plot]
-
-    plt.figure(figsize=(10, 6))
-    plt.plot(R_plot, alpha_plot, 'b-', linewidth=2, label=r'$\alpha^{-1}(R)$')
-    plt.axhline(y=137.035999177, color='r', linestyle='--', label='CODATA')
-    plt.axvline(x=1.0, color='g', linestyle=':', label='R = 1')
-    plt.xlabel('R (планковские единицы)', fontsize=12)
-    plt.ylabel(r'$\alpha^{-1}$', fontsize=12)
-    plt.title(r'Зависимость $\alpha^{-1}$ от радиуса компактификации', fontsize=14)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.xlim(0.5, 1.5)
-    plt.ylim(50, 250)
-    plt.tight_layout()
-    plt.savefig('radius_dependence.png', dpi=150)
-    print("Сохранено: radius_dependence.png")
-else:
-    print("\n§11. График: matplotlib недоступен, пропускаю")
-
-print("\n" + "="*70)
-print("ВЫВОД")
-print("="*70)
-print(f"""
-Точное R, дающее α⁻¹ = CODATA: R = {R_solution:.10f}
-Отклонение от R = 1: {abs(R_solution - 1)*100:.6f}%
+def section_11():
+    """§11. ГРАФИК (если matplotlib доступен)."""
+    # matplotlib опционально
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        HAS_MPL = True
+    except ImportError:
+        HAS_MPL = False
+    if HAS_MPL:
+        print("\n§11. Сохраняю график α⁻¹(R)")
+        print("-"*40)
+
+        R_plot = np.linspace(0.5, 1.5, 200)
+        alpha_plot = alpha_inv(R_plot)
+
+        plt.figure(figsize=(10, 6))
+        plt.plot(R_plot, alpha_plot, 'b-', linewidth=2, label=r'$\alpha^{-1}(R)$')
+        plt.axhline(y=float(CODATA_ALPHA_INV), color='r', linestyle='--', label='CODATA')
+        plt.axvline(x=1.0, color='g', linestyle=':', label='R = 1')
+        plt.xlabel('R (планковские единицы)', fontsize=12)
+        plt.ylabel(r'$\alpha^{-1}$', fontsize=12)
+        plt.title(r'Зависимость $\alpha^{-1}$ от радиуса компактификации', fontsize=14)
+        plt.legend()
+        plt.grid(True, alpha=0.3)
+        plt.xlim(0.5, 1.5)
+        plt.ylim(50, 250)
+        plt.tight_layout()
+        plt.savefig('radius_dependence.png', dpi=150)
+        print("Сохранено: radius_dependence.png")
+    else:
+        print("\n§11. График: matplotlib недоступен, пропускаю")
+    print("\n" + "="*70)
+    print("ВЫВОД")
+    print("="*70)
+    print(f"""
+Точное R, дающее α⁻¹ = CODATA: R = {float(R_solution()[0]):.10f}
+Отклонение от R = 1: {float(abs(R_solution()[0] - 1))*100:.6f}%
 
 Это ОЧЕНЬ близко к 1 (отклонение < 0.001%)!
 
@@ -370,3 +352,25 @@ print(f"""
   R = 1.000... — не случайность, а следствие того, что
   планковский масштаб — единственный в теории.
 """)
+
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+    "7": section_7,
+    "8": section_8,
+    "9": section_9,
+    "10": section_10,
+    "11": section_11,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nСТАБИЛИЗАЦИЯ РАДИУСА КОМПАКТИФИКАЦИИ\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
+
@@ -10,23 +10,31 @@
   - Систола L_sys = π — геометрия, не QFT
 
 Идея: π — это ОБЪЁМ пространства модулей плоских связностей M_flat.
+
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 18_pi_term_rigorous.py [раздел ...] (rpft.sections).
 """
 
+import os
+import sys
+
 from mpmath import mp, pi, log, exp, sqrt, cos, sin, acos
-mp.dps = 50
 
-print("="*70)
-print("СТРОГИЙ ВЫВОД ЧЛЕНА π")
-print("="*70)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import s_geo
+from rpft.sections import run_sections
+
+DPS = 50
 
 # =============================================================================
-# §1. ПРОСТРАНСТВО МОДУЛЕЙ ПЛОСКИХ СВЯЗНОСТЕЙ
+# Разделы вывода
 # =============================================================================
 
-print("\n§1. M_flat(RP³, U(1))")
-print("-"*40)
-
-print("""
+def section_1():
+    """§1. ПРОСТРАНСТВО МОДУЛЕЙ ПЛОСКИХ СВЯЗНОСТЕЙ."""
+    print("\n§1. M_flat(RP³, U(1))")
+    print("-"*40)
+    print("""
 ТЕОРИЯ:
   Плоская U(1) связность на M определяется голономией.
   Для RP³ = S³/Z₂:
@@ -42,22 +50,18 @@ print("""
 Расстояние (в естественной метрике на U(1)):
   d(0, π) = |π - 0| = π
 """)
-
-theta_min = 0
-theta_max = pi
-distance = abs(theta_max - theta_min)
-print(f"θ_min = {float(theta_min)}")
-print(f"θ_max = {float(theta_max):.10f}")
-print(f"d(θ_min, θ_max) = π = {float(distance):.10f}")
-
-# =============================================================================
-# §2. ИНТЕРПРЕТАЦИЯ: ОБЪЁМ M_flat КАК ТОПОЛОГИЧЕСКИЙ ВКЛАД
-# =============================================================================
-
-print("\n§2. Физическая интерпретация")
-print("-"*40)
-
-print("""
+    theta_min = 0
+    theta_max = pi
+    distance = abs(theta_max - theta_min)
+    print(f"θ_min = {float(theta_min)}")
+    print(f"θ_max = {float(theta_max):.10f}")
+    print(f"d(θ_min, θ_max) = π = {float(distance):.10f}")
+
+def section_2():
+    """§2. ИНТЕРПРЕТАЦИЯ: ОБЪЁМ M_flat КАК ТОПОЛОГИЧЕСКИЙ ВКЛАД."""
+    print("\n§2. Физическая интерпретация")
+    print("-"*40)
+    print("""
 В TQFT partition function суммируется по плоским связностям:
 
   Z = Σ_{a ∈ M_flat} w(a) · e^{iS(a)}
@@ -78,14 +82,11 @@ print("""
 Этот сдвиг = СИСТОЛА × (1/ℏ) = π × 1 = π
 """)
 
-# =============================================================================
-# §3. CHERN-SIMONS ФОРМУЛИРОВКА
-# =============================================================================
-
-print("\n§3. Chern-Simons на RP³")
-print("-"*40)
-
-print("""
+def section_3():
+    """§3. CHERN-SIMONS ФОРМУЛИРОВКА."""
+    print("\n§3. Chern-Simons на RP³")
+    print("-"*40)
+    print("""
 U(1) Chern-Simons действие на M³:
   
   S_CS = (k/4π) ∫_M A ∧ dA
@@ -101,14 +102,11 @@ U(1) Chern-Simons действие на M³:
 ПРОБЛЕМА: Chern-Simons даёт π/2, не π!
 """)
 
-# =============================================================================
-# §4. АЛЬТЕРНАТИВА: WILSON LOOP ВКЛАД
-# =============================================================================
-
-print("\n§4. Wilson loop как источник π")
-print("-"*40)
-
-print("""
+def section_4():
+    """§4. АЛЬТЕРНАТИВА: WILSON LOOP ВКЛАД."""
+    print("\n§4. Wilson loop как источник π")
+    print("-"*40)
+    print("""
 Минимальный Wilson loop W_γ вдоль генератора π₁(RP³):
 
   W_γ = exp(i ∮_γ A) = exp(iθ)
@@ -124,26 +122,18 @@ print("""
 Если ⟨W_γ⟩ = e^{−π} (туннельная амплитуда):
   Γ_eff = π
 """)
-
-# Проверка: туннельный вклад
-# В WKB: амплитуда ~ exp(−S/ℏ), где S = (длина × импульс)
-# Для минимального пути: S = L_sys × p_min = π × 1 = π
-
-print("WKB приближение:")
-L_sys = pi
-p_min = 1  # В планковских единицах
-S_tunnel = L_sys * p_min
-print(f"  S_tunnel = L_sys × p = {float(L_sys):.10f} × {p_min} = {float(S_tunnel):.10f}")
-print(f"  Амплитуда ~ exp(−S) = exp(−π) = {float(exp(-pi)):.10e}")
-
-# =============================================================================
-# §5. КЛЮЧЕВОЙ АРГУМЕНТ: НОРМИРОВКА ДЕТЕРМИНАНТА
-# =============================================================================
-
-print("\n§5. КЛЮЧЕВОЙ АРГУМЕНТ")
-print("-"*40)
-
-print("""
+    print("WKB приближение:")
+    L_sys = pi
+    p_min = 1  # В планковских единицах
+    S_tunnel = L_sys * p_min
+    print(f"  S_tunnel = L_sys × p = {float(L_sys):.10f} × {p_min} = {float(S_tunnel):.10f}")
+    print(f"  Амплитуда ~ exp(−S) = exp(−π) = {float(exp(-pi)):.10e}")
+
+def section_5():
+    """§5. КЛЮЧЕВОЙ АРГУМЕНТ: НОРМИРОВКА ДЕТЕРМИНАНТА."""
+    print("\n§5. КЛЮЧЕВОЙ АРГУМЕНТ")
+    print("-"*40)
+    print("""
 В функциональном интеграле QED на RP³ × S¹:
 
   Z = ∫ DA Dψ Dψ̄ exp(−S[A, ψ])
@@ -171,14 +161,11 @@ print("""
   L_sys = π = π × (1 бит).
 """)
 
-# =============================================================================
-# §6. ФОРМАЛИЗАЦИЯ ЧЕРЕЗ ЛОКАЛИЗАЦИЮ
-# =============================================================================
-
-print("\n§6. Локализация в TQFT")
-print("-"*40)
-
-print("""
+def section_6():
+    """§6. ФОРМАЛИЗАЦИЯ ЧЕРЕЗ ЛОКАЛИЗАЦИЮ."""
+    print("\n§6. Локализация в TQFT")
+    print("-"*40)
+    print("""
 В топологической теории поля (TQFT):
   
   Z = Σ_{фикс. точки} (локальный вклад)
@@ -199,14 +186,11 @@ DUISTERMAAT-HECKMAN ФОРМУЛА:
 СТРОГОСТЬ: Этот аргумент формален, требует явного расчёта det'(D_θ).
 """)
 
-# =============================================================================
-# §7. СОГЛАСОВАННОСТЬ С ДРУГИМИ ЧЛЕНАМИ
-# =============================================================================
-
-print("\n§7. Согласованность формулы")
-print("-"*40)
-
-print("""
+def section_7():
+    """§7. СОГЛАСОВАННОСТЬ С ДРУГИМИ ЧЛЕНАМИ."""
+    print("\n§7. Согласованность формулы")
+    print("-"*40)
+    print("""
 СТРУКТУРА ФОРМУЛЫ α⁻¹ = 4π³ + π² + π:
 
   4π³ = Vol(S³×S¹) — 4D объём (фермионы, все KK-моды)
@@ -222,21 +206,17 @@ print("""
   - Каждый член — интеграл соответствующей размерности
   - В планковских единицах (L = 1) все становятся числами
 """)
-
-S_geo = 4*pi**3 + pi**2 + pi
-print(f"4π³ = {float(4*pi**3):.6f} (Vol 4D)")
-print(f"π² = {float(pi**2):.6f} (Vol 3D)")
-print(f"π = {float(pi):.6f} (Length 1D)")
-print(f"Сумма = {float(S_geo):.6f}")
-
-# =============================================================================
-# §8. ПОЧЕМУ НЕ 2π ИЛИ π/2?
-# =============================================================================
-
-print("\n§8. Почему именно π (не 2π, π/2)?")
-print("-"*40)
-
-print("""
+    S_geo = s_geo()
+    print(f"4π³ = {float(4*pi**3):.6f} (Vol 4D)")
+    print(f"π² = {float(pi**2):.6f} (Vol 3D)")
+    print(f"π = {float(pi):.6f} (Length 1D)")
+    print(f"Сумма = {float(S_geo):.6f}")
+
+def section_8():
+    """§8. ПОЧЕМУ НЕ 2π ИЛИ π/2?"""
+    print("\n§8. Почему именно π (не 2π, π/2)?")
+    print("-"*40)
+    print("""
 АРГУМЕНТ:
 
 1. Систола RP³ = π (не 2π):
@@ -256,15 +236,12 @@ print("""
 Это НЕ совпадение — это следствие Z₂ структуры RP³.
 """)
 
-# =============================================================================
-# §9. ИТОГОВЫЙ СТАТУС
-# =============================================================================
-
-print("\n" + "="*70)
-print("ИТОГ")
-print("="*70)
-
-print("""
+def section_9():
+    """§9. ИТОГОВЫЙ СТАТУС."""
+    print("\n" + "="*70)
+    print("ИТОГ")
+    print("="*70)
+    print("""
 ВЫВЕДЕНО:
   1. ✅ M_flat(RP³, U(1)) = {0, π} — расстояние = π
   2. ✅ L_sys(RP³) = π — геометрия
@@ -287,30 +264,21 @@ print("""
   Это не феноменология, а ГЕОМЕТРИЧЕСКИЙ ФАКТ.
 """)
 
-# =============================================================================
-# §10. СРАВНЕНИЕ С ДРУГИМИ ТОПОЛОГИЯМИ
-# =============================================================================
-
-print("\n§10. Проверка: другие топологии")
-print("-"*40)
-
-# Для L(p,1):
-# π₁ = Z_p
-# M_flat = {0, 2π/p, 4π/p, ..., 2π(p-1)/p}
-# Расстояние между соседними = 2π/p
-
-print("M_flat для разных L(p,1):")
-print()
-for p in [2, 3, 4, 5, 6]:
-    theta_values = [2*pi*k/p for k in range(p)]
-    spacing = 2*pi/p
-    total_length = 2*pi - spacing  # от 0 до 2π(p-1)/p
-    max_gap = spacing  # минимальное расстояние между соседними
-    print(f"L({p},1): |M_flat| = {p} точек, spacing = 2π/{p} = {float(spacing):.4f}")
-    if p == 2:
-        print(f"  → d(0, π) = π = {float(pi):.4f} ✓")
-
-print("""
+def section_10():
+    """§10. СРАВНЕНИЕ С ДРУГИМИ ТОПОЛОГИЯМИ."""
+    print("\n§10. Проверка: другие топологии")
+    print("-"*40)
+    print("M_flat для разных L(p,1):")
+    print()
+    for p in [2, 3, 4, 5, 6]:
+        theta_values = [2*pi*k/p for k in range(p)]
+        spacing = 2*pi/p
+        total_length = 2*pi - spacing  # от 0 до 2π(p-1)/p
+        max_gap = spacing  # минимальное расстояние между соседними
+        print(f"L({p},1): |M_flat| = {p} точек, spacing = 2π/{p} = {float(spacing):.4f}")
+        if p == 2:
+            print(f"  → d(0, π) = π = {float(pi):.4f} ✓")
+    print("""
 Только для RP³ = L(2,1):
   - Ровно 2 точки в M_flat
   - Расстояние = π
@@ -320,6 +288,24 @@ print("""
 → Член π СПЕЦИФИЧЕН для RP³!
 """)
 
-print("="*70)
-print("ВЫВОД: π = расстояние в M_flat(RP³, U(1)) — топологический инвариант")
-print("="*70)
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+    "7": section_7,
+    "8": section_8,
+    "9": section_9,
+    "10": section_10,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nСТРОГИЙ ВЫВОД ЧЛЕНА π\n" + "="*70,
+                        footer="="*70 + "\nВЫВОД: π = расстояние в M_flat(RP³, U(1)) — топологический инвариант\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
+
@@ -5,23 +5,32 @@
 Вопрос рецензента: "Почему именно 4π³ + π² + π, а не 4π³ + 2π² или 5π³ − π?"
 
 Цель: Показать, что структура формулы ФИКСИРОВАНА геометрией K = RP³ × S¹.
+
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 19_uniqueness.py [раздел ...] (rpft.sections).
 """
 
+import os
+import sys
+
 from mpmath import mp, pi, sqrt
-mp.dps = 50
 
-print("="*70)
-print("ЕДИНСТВЕННОСТЬ ФОРМУЛЫ α⁻¹")
-print("="*70)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import alpha_inv_terms
+from rpft.constants import constant, convention
+from rpft.sections import run_sections
+
+DPS = 50
 
 # =============================================================================
-# §1. ВОПРОС ЦИРКУЛЯРНОСТИ
+# Разделы вывода
 # =============================================================================
 
-print("\n§1. Постановка проблемы")
-print("-"*40)
-
-print("""
+def section_1():
+    """§1. ВОПРОС ЦИРКУЛЯРНОСТИ."""
+    print("\n§1. Постановка проблемы")
+    print("-"*40)
+    print("""
 КРИТИКА:
   Формула α⁻¹ = 4π³ + π² + π имеет РОВНО три члена.
   Совпадение с CODATA может быть случайным.
@@ -34,58 +43,47 @@ print("""
   Они ФИКСИРОВАНЫ геометрией K = RP³ × S¹.
 """)
 
-# =============================================================================
-# §2. ПРОИСХОЖДЕНИЕ КАЖДОГО ЧЛЕНА
-# =============================================================================
-
-print("\n§2. Происхождение членов")
-print("-"*40)
-
-# Член 4π³
-print("ЧЛЕН 4π³:")
-print("  Vol(S³) = 2π²  (при R = 1)")
-print("  Vol(S¹) = 2π   (при R = 1)")
-print("  Vol(S³ × S¹) = 2π² × 2π = 4π³")
-print("  Коэффициент 4 = 2 × 2 (произведение объёмов)")
-print()
-
-Vol_S3 = 2*pi**2
-Vol_S1 = 2*pi
-Vol_S3xS1 = Vol_S3 * Vol_S1
-print(f"  Проверка: {float(Vol_S3):.6f} × {float(Vol_S1):.6f} = {float(Vol_S3xS1):.6f}")
-print(f"  4π³ = {float(4*pi**3):.6f}")
-print(f"  Совпадение: {abs(float(Vol_S3xS1 - 4*pi**3)) < 1e-10}")
-print()
-
-# Член π²
-print("ЧЛЕН π²:")
-print("  Vol(RP³) = Vol(S³)/2 = π²  (при R = 1)")
-print("  Коэффициент 1 = 1/2 от S³")
-print()
-
-Vol_RP3 = Vol_S3 / 2
-print(f"  Проверка: Vol(RP³) = {float(Vol_RP3):.6f}")
-print(f"  π² = {float(pi**2):.6f}")
-print(f"  Совпадение: {abs(float(Vol_RP3 - pi**2)) < 1e-10}")
-print()
-
-# Член π
-print("ЧЛЕН π:")
-print("  L_sys(RP³) = π  (систола — кратчайший нестягиваемый цикл)")
-print("  Коэффициент 1 = минимальный топологический вклад")
-print()
-
-L_sys = pi
-print(f"  L_sys = π = {float(L_sys):.6f}")
-
-# =============================================================================
-# §3. ПОЧЕМУ КОЭФФИЦИЕНТЫ ФИКСИРОВАНЫ
-# =============================================================================
-
-print("\n§3. Почему коэффициенты фиксированы")
-print("-"*40)
-
-print("""
+def section_2():
+    """§2. ПРОИСХОЖДЕНИЕ КАЖДОГО ЧЛЕНА."""
+    print("\n§2. Происхождение членов")
+    print("-"*40)
+    # Член 4π³
+    print("ЧЛЕН 4π³:")
+    print("  Vol(S³) = 2π²  (при R = 1)")
+    print("  Vol(S¹) = 2π   (при R = 1)")
+    print("  Vol(S³ × S¹) = 2π² × 2π = 4π³")
+    print("  Коэффициент 4 = 2 × 2 (произведение объёмов)")
+    print()
+    Vol_S3 = 2*pi**2
+    Vol_S1 = 2*pi
+    Vol_S3xS1 = Vol_S3 * Vol_S1
+    print(f"  Проверка: {float(Vol_S3):.6f} × {float(Vol_S1):.6f} = {float(Vol_S3xS1):.6f}")
+    print(f"  4π³ = {float(4*pi**3):.6f}")
+    print(f"  Совпадение: {abs(float(Vol_S3xS1 - 4*pi**3)) < 1e-10}")
+    print()
+    # Член π²
+    print("ЧЛЕН π²:")
+    print("  Vol(RP³) = Vol(S³)/2 = π²  (при R = 1)")
+    print("  Коэффициент 1 = 1/2 от S³")
+    print()
+    Vol_RP3 = Vol_S3 / 2
+    print(f"  Проверка: Vol(RP³) = {float(Vol_RP3):.6f}")
+    print(f"  π² = {float(pi**2):.6f}")
+    print(f"  Совпадение: {abs(float(Vol_RP3 - pi**2)) < 1e-10}")
+    print()
+    # Член π
+    print("ЧЛЕН π:")
+    print("  L_sys(RP³) = π  (систола — кратчайший нестягиваемый цикл)")
+    print("  Коэффициент 1 = минимальный топологический вклад")
+    print()
+    L_sys = pi
+    print(f"  L_sys = π = {float(L_sys):.6f}")
+
+def section_3():
+    """§3. ПОЧЕМУ КОЭФФИЦИЕНТЫ ФИКСИРОВАНЫ."""
+    print("\n§3. Почему коэффициенты фиксированы")
+    print("-"*40)
+    print("""
 КЛЮЧЕВОЕ: Коэффициенты — это ГЕОМЕТРИЧЕСКИЕ ИНВАРИАНТЫ.
 
 1. Коэффициент 4 при π³:
@@ -103,14 +101,11 @@ print("""
 ВСЕ ТРИ КОЭФФИЦИЕНТА = ГЕОМЕТРИЧЕСКИЕ ФАКТЫ!
 """)
 
-# =============================================================================
-# §4. ПОЧЕМУ НЕТ ДРУГИХ ЧЛЕНОВ
-# =============================================================================
-
-print("\n§4. Почему нет других членов")
-print("-"*40)
-
-print("""
+def section_4():
+    """§4. ПОЧЕМУ НЕТ ДРУГИХ ЧЛЕНОВ."""
+    print("\n§4. Почему нет других членов")
+    print("-"*40)
+    print("""
 СТРУКТУРА ДЕЙСТВИЯ QED на M₄ × K:
 
   S_eff = S_fermion + S_boson + S_top
@@ -130,64 +125,49 @@ print("""
   - Нет других KK-секторов с нужной нормировкой
 """)
 
-# =============================================================================
-# §5. ПРОВЕРКА: ДРУГИЕ КОМБИНАЦИИ
-# =============================================================================
-
-print("\n§5. Проверка альтернативных формул")
-print("-"*40)
-
-alpha_codata = mp.mpf('137.035999177')
-sigma = mp.mpf('0.000000085')
-
-# Исходная формула
-S_geo = 4*pi**3 + pi**2 + pi
-delta_24 = 1/(24*S_geo)
-delta_pi4 = 1/(pi**4 * S_geo**2)
-alpha_theory = S_geo - delta_24 - delta_pi4
-
-print(f"Исходная: 4π³ + π² + π = {float(S_geo):.6f}")
-print(f"  α⁻¹ = {float(alpha_theory):.9f}")
-print(f"  Δσ = {float((alpha_theory - alpha_codata)/sigma):.2f}")
-print()
-
-# Альтернативы
-alternatives = [
-    ("4π³ + 2π²", 4*pi**3 + 2*pi**2),
-    ("4π³ + π²/2", 4*pi**3 + pi**2/2),
-    ("5π³", 5*pi**3),
-    ("4π³ + π² + 2π", 4*pi**3 + pi**2 + 2*pi),
-    ("4π³ + π² − π", 4*pi**3 + pi**2 - pi),
-    ("4π³ + π", 4*pi**3 + pi),
-    ("4π³", 4*pi**3),
-    ("3π³ + π² + π", 3*pi**3 + pi**2 + pi),
-    ("2π³ + 2π² + π", 2*pi**3 + 2*pi**2 + pi),
-]
-
-print("Альтернативные формулы:")
-print(f"{'Формула':<20} {'Значение':<12} {'Δσ':<10} {'Геом. смысл?':<15}")
-print("-"*60)
-
-for name, val in alternatives:
-    if val > 0:
-        d24 = 1/(24*val)
-        dpi4 = 1/(pi**4 * val**2)
-        alpha_alt = val - d24 - dpi4
-        diff_sigma = float((alpha_alt - alpha_codata)/sigma)
-        geom = "❌ Нет"
-        print(f"{name:<20} {float(val):<12.4f} {diff_sigma:<+10.0f} {geom:<15}")
-
-print()
-print(f"{'4π³ + π² + π':<20} {float(S_geo):<12.4f} {float((alpha_theory - alpha_codata)/sigma):<+10.2f} {'✅ Vol+Vol+Sys':<15}")
-
-# =============================================================================
-# §6. АРГУМЕНТ ЕДИНСТВЕННОСТИ
-# =============================================================================
-
-print("\n§6. Аргумент единственности")
-print("-"*40)
-
-print("""
+def section_5():
+    """§5. ПРОВЕРКА: ДРУГИЕ КОМБИНАЦИИ."""
+    print("\n§5. Проверка альтернативных формул")
+    print("-"*40)
+    alpha_codata = constant("alpha_inv").mpf()
+    sigma = mp.mpf(convention("sigma_alpha_inv"))
+    # Исходная формула
+    S_geo, delta_24, delta_pi4, alpha_theory = alpha_inv_terms()
+    print(f"Исходная: 4π³ + π² + π = {float(S_geo):.6f}")
+    print(f"  α⁻¹ = {float(alpha_theory):.9f}")
+    print(f"  Δσ = {float((alpha_theory - alpha_codata)/sigma):.2f}")
+    print()
+    # Альтернативы
+    alternatives = [
+        ("4π³ + 2π²", 4*pi**3 + 2*pi**2),
+        ("4π³ + π²/2", 4*pi**3 + pi**2/2),
+        ("5π³", 5*pi**3),
+        ("4π³ + π² + 2π", 4*pi**3 + pi**2 + 2*pi),
+        ("4π³ + π² − π", 4*pi**3 + pi**2 - pi),
+        ("4π³ + π", 4*pi**3 + pi),
+        ("4π³", 4*pi**3),
+        ("3π³ + π² + π", 3*pi**3 + pi**2 + pi),
+        ("2π³ + 2π² + π", 2*pi**3 + 2*pi**2 + pi),
+    ]
+    print("Альтернативные формулы:")
+    print(f"{'Формула':<20} {'Значение':<12} {'Δσ':<10} {'Геом. смысл?':<15}")
+    print("-"*60)
+    for name, val in alternatives:
+        if val > 0:
+            d24 = 1/(24*val)
+            dpi4 = 1/(pi**4 * val**2)
+            alpha_alt = val - d24 - dpi4
+            diff_sigma = float((alpha_alt - alpha_codata)/sigma)
+            geom = "❌ Нет"
+            print(f"{name:<20} {float(val):<12.4f} {diff_sigma:<+10.0f} {geom:<15}")
+    print()
+    print(f"{'4π³ + π² + π':<20} {float(S_geo):<12.4f} {float((alpha_theory - alpha_codata)/sigma):<+10.2f} {'✅ Vol+Vol+Sys':<15}")
+
+def section_6():
+    """§6. АРГУМЕНТ ЕДИНСТВЕННОСТИ."""
+    print("\n§6. Аргумент единственности")
+    print("-"*40)
+    print("""
 ТЕОРЕМА (неформальная):
 
 Для QED на M₄ × K, где K = RP³ × S¹:
@@ -208,14 +188,11 @@ print("""
 Q.E.D. (квази-)
 """)
 
-# =============================================================================
-# §7. ПОДСЧЁТ СВОБОДНЫХ ПАРАМЕТРОВ
-# =============================================================================
-
-print("\n§7. Подсчёт свободных параметров")
-print("-"*40)
-
-print("""
+def section_7():
+    """§7. ПОДСЧЁТ СВОБОДНЫХ ПАРАМЕТРОВ."""
+    print("\n§7. Подсчёт свободных параметров")
+    print("-"*40)
+    print("""
 ВХОДНЫЕ ПАРАМЕТРЫ ТЕОРИИ:
 
 1. Топология: K = RP³ × S¹           → ФИКСИРОВАНА (минимальность)
@@ -238,15 +215,12 @@ print("""
   UGSM: 0 свободных параметров (всё из геометрии K)
 """)
 
-# =============================================================================
-# §8. ОТВЕТ НА ВОПРОС РЕЦЕНЗЕНТА
-# =============================================================================
-
-print("\n" + "="*70)
-print("§8. ОТВЕТ НА ВОПРОС РЕЦЕНЗЕНТА")
-print("="*70)
-
-print("""
+def section_8():
+    """§8. ОТВЕТ НА ВОПРОС РЕЦЕНЗЕНТА."""
+    print("\n" + "="*70)
+    print("§8. ОТВЕТ НА ВОПРОС РЕЦЕНЗЕНТА")
+    print("="*70)
+    print("""
 ВОПРОС: "Почему именно 4π³ + π² + π?"
 
 ОТВЕТ:
@@ -275,15 +249,12 @@ print("""
        Изменение формулы требует ДРУГОЙ геометрии K.
 """)
 
-# =============================================================================
-# §9. ИТОГ
-# =============================================================================
-
-print("\n" + "="*70)
-print("ИТОГ")
-print("="*70)
-
-print(f"""
+def section_9():
+    """§9. ИТОГ."""
+    print("\n" + "="*70)
+    print("ИТОГ")
+    print("="*70)
+    print(f"""
 ЦИРКУЛЯРНОСТЬ ОТСУТСТВУЕТ:
 
 1. Формула НЕ подогнана — она СЛЕДУЕТ из геометрии K.
@@ -304,3 +275,23 @@ print(f"""
 
 СТАТУС: ⚠️ → ✅ ~70% (циркулярность устранена)
 """)
+
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+    "7": section_7,
+    "8": section_8,
+    "9": section_9,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nЕДИНСТВЕННОСТЬ ФОРМУЛЫ α⁻¹\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
+
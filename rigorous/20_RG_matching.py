@@ -8,76 +8,38 @@ RG MATCHING: Почему формула даёт α(0), а не α(m_Z)?
   - Как согласовать?
 
 Ответ: Формула даёт α в IR пределе (μ → 0), что соответствует α_QED.
-"""
-
-from mpmath import mp, pi, log, exp
-mp.dps = 50
 
-print("="*70)
-print("RG MATCHING: α(0) vs α(m_Z)")
-print("="*70)
+Модуль импортируется без вычислений; разделы (SECTIONS) печатают вывод при DPS:
+python 20_RG_matching.py [раздел ...] (rpft.sections).
+"""
 
-# =============================================================================
-# §1. ЭКСПЕРИМЕНТАЛЬНЫЕ ЗНАЧЕНИЯ
-# =============================================================================
+import os
+import sys
 
-print("\n§1. Экспериментальные значения α")
-print("-"*40)
+from mpmath import mp, pi, log, exp
 
-# CODATA 2018 (низкие энергии, μ → 0)
-alpha_inv_0 = mp.mpf('137.035999177')  # α⁻¹(0)
-alpha_0 = 1/alpha_inv_0
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import alpha_inv_terms
+from rpft.constants import constant
+from rpft.sections import run_sections
 
-# PDG 2022 (на масштабе m_Z)
-alpha_inv_mZ = mp.mpf('127.951')  # α⁻¹(m_Z) в MS-bar схеме
-alpha_mZ = 1/alpha_inv_mZ
+DPS = 50
 
-print(f"α⁻¹(0) = {float(alpha_inv_0):.6f}  (CODATA, μ → 0)")
-print(f"α⁻¹(m_Z) = {float(alpha_inv_mZ):.3f}  (PDG, μ = m_Z)")
-print(f"")
-print(f"Разница: Δα⁻¹ = {float(alpha_inv_0 - alpha_inv_mZ):.3f}")
-print(f"Относительно: {float((alpha_inv_0 - alpha_inv_mZ)/alpha_inv_0 * 100):.1f}%")
+ALPHA_INV_0 = constant("alpha_inv").value  # α⁻¹(0), CODATA (низкие энергии, μ → 0)
+ALPHA_INV_MZ = '127.951'       # α⁻¹(m_Z) в MS-bar схеме, PDG 2022
+M_E, M_MU, M_TAU = '0.511e-3', '0.1057', '1.777'  # массы лептонов, GeV
 
 # =============================================================================
 # §2. RUNNING α В QED
 # =============================================================================
 
-print("\n§2. Running coupling в QED")
-print("-"*40)
-
-print("""
-β-функция QED (1-loop):
-
-  β(α) = dα/d(log μ) = (2α²)/(3π) × N_f
-
-где N_f — число заряженных фермионов с m < μ.
-
-Решение:
-  α⁻¹(μ) = α⁻¹(0) - (2/(3π)) × Σ_f Q_f² × log(μ/m_f)
-
-Для электрона (единственный фермион при μ < m_μ):
-  α⁻¹(μ) ≈ α⁻¹(0) - (2/(3π)) × log(μ/m_e)
-""")
-
-# Константы
-m_e = mp.mpf('0.511e-3')  # GeV
-m_mu = mp.mpf('0.1057')  # GeV
-m_tau = mp.mpf('1.777')  # GeV
-m_Z = mp.mpf('91.1876')  # GeV
-
-# Заряды кварков
-Q_u = mp.mpf('2/3')  # up, charm, top
-Q_d = mp.mpf('1/3')  # down, strange, bottom
-
-# 1-loop running от 0 до m_Z
-# Нужно учесть все заряженные частицы SM
-
 def alpha_running(mu, alpha_0_inv):
     """
     Running α от μ = 0 до μ.
     Учитываем только лептоны (упрощённо).
     """
     result = alpha_0_inv
+    m_e, m_mu, m_tau = mp.mpf(M_E), mp.mpf(M_MU), mp.mpf(M_TAU)
     
     # Электрон (m_e < μ для любого разумного μ)
     if mu > m_e:
@@ -93,21 +55,57 @@ def alpha_running(mu, alpha_0_inv):
     
     return result
 
-# Проверка
-alpha_inv_calc = alpha_running(m_Z, alpha_inv_0)
-print(f"α⁻¹(m_Z) из running (только лептоны):")
-print(f"  Расчёт: {float(alpha_inv_calc):.3f}")
-print(f"  PDG:    {float(alpha_inv_mZ):.3f}")
-print(f"  (Нужно учесть кварки для точного значения)")
-
 # =============================================================================
-# §3. ПОЛНЫЙ SM RUNNING
+# Разделы вывода
 # =============================================================================
 
-print("\n§3. Полный SM running")
-print("-"*40)
+def section_1():
+    """§1. ЭКСПЕРИМЕНТАЛЬНЫЕ ЗНАЧЕНИЯ."""
+    print("\n§1. Экспериментальные значения α")
+    print("-"*40)
+    alpha_inv_0 = mp.mpf(ALPHA_INV_0)
+    alpha_inv_mZ = mp.mpf(ALPHA_INV_MZ)
+    print(f"α⁻¹(0) = {float(alpha_inv_0):.6f}  (CODATA, μ → 0)")
+    print(f"α⁻¹(m_Z) = {float(alpha_inv_mZ):.3f}  (PDG, μ = m_Z)")
+    print(f"")
+    print(f"Разница: Δα⁻¹ = {float(alpha_inv_0 - alpha_inv_mZ):.3f}")
+    print(f"Относительно: {float((alpha_inv_0 - alpha_inv_mZ)/alpha_inv_0 * 100):.1f}%")
+
+def section_2():
+    """§2. RUNNING α В QED."""
+    print("\n§2. Running coupling в QED")
+    print("-"*40)
+    print("""
+β-функция QED (1-loop):
+
+  β(α) = dα/d(log μ) = (2α²)/(3π) × N_f
+
+где N_f — число заряженных фермионов с m < μ.
 
-print("""
+Решение:
+  α⁻¹(μ) = α⁻¹(0) - (2/(3π)) × Σ_f Q_f² × log(μ/m_f)
+
+Для электрона (единственный фермион при μ < m_μ):
+  α⁻¹(μ) ≈ α⁻¹(0) - (2/(3π)) × log(μ/m_e)
+""")
+    # Константы
+    m_Z = mp.mpf('91.1876')  # GeV
+    # Заряды кварков
+    Q_u = mp.mpf('2/3')  # up, charm, top
+    Q_d = mp.mpf('1/3')  # down, strange, bottom
+    alpha_inv_0, alpha_inv_mZ = mp.mpf(ALPHA_INV_0), mp.mpf(ALPHA_INV_MZ)
+    # Проверка
+    alpha_inv_calc = alpha_running(m_Z, alpha_inv_0)
+    print(f"α⁻¹(m_Z) из running (только лептоны):")
+    print(f"  Расчёт: {float(alpha_inv_calc):.3f}")
+    print(f"  PDG:    {float(alpha_inv_mZ):.3f}")
+    print(f"  (Нужно учесть кварки для точного значения)")
+
+def section_3():
+    """§3. ПОЛНЫЙ SM RUNNING."""
+    print("\n§3. Полный SM running")
+    print("-"*40)
+    print("""
 В полной SM β-функция:
 
   β_1 = (4/3) × Σ_f Q_f² = (4/3) × [3×(4/9 + 1/9) + 3×1] 
@@ -117,22 +115,18 @@ print("""
 
 Эффективное число степеней свободы зависит от μ.
 """)
-
-# Стандартный результат из PDG
-print(f"α⁻¹(m_Z) = 127.951 ± 0.009 (PDG)")
-print(f"α⁻¹(0) = 137.036 (CODATA)")
-print(f"")
-print(f"Δα⁻¹ = 137.036 - 127.951 = 9.085")
-print(f"Это соответствует running от μ=0 до μ=m_Z")
-
-# =============================================================================
-# §4. ПОЧЕМУ НАША ФОРМУЛА ДАЁТ α(0)
-# =============================================================================
-
-print("\n§4. Почему формула даёт α(0), не α(m_Z)")
-print("-"*40)
-
-print("""
+    # Стандартный результат из PDG
+    print(f"α⁻¹(m_Z) = 127.951 ± 0.009 (PDG)")
+    print(f"α⁻¹(0) = 137.036 (CODATA)")
+    print(f"")
+    print(f"Δα⁻¹ = 137.036 - 127.951 = 9.085")
+    print(f"Это соответствует running от μ=0 до μ=m_Z")
+
+def section_4():
+    """§4. ПОЧЕМУ НАША ФОРМУЛА ДАЁТ α(0)."""
+    print("\n§4. Почему формула даёт α(0), не α(m_Z)")
+    print("-"*40)
+    print("""
 КЛЮЧЕВОЙ АРГУМЕНТ:
 
 Наша формула:
@@ -159,14 +153,11 @@ print("""
 ВЫВОД: Формула даёт α(0) по построению (IR предел геометрии).
 """)
 
-# =============================================================================
-# §5. СОГЛАСОВАННОСТЬ С SM
-# =============================================================================
-
-print("\n§5. Согласованность с SM")
-print("-"*40)
-
-print("""
+def section_5():
+    """§5. СОГЛАСОВАННОСТЬ С SM."""
+    print("\n§5. Согласованность с SM")
+    print("-"*40)
+    print("""
 ВОПРОС: Как наша теория согласуется с полной SM?
 
 ОТВЕТ:
@@ -188,40 +179,29 @@ print("""
    Мы даём НАЧАЛЬНОЕ УСЛОВИЕ для RG потока!
 """)
 
-# =============================================================================
-# §6. ЧИСЛЕННАЯ ПРОВЕРКА
-# =============================================================================
-
-print("\n§6. Численная проверка RG потока")
-print("-"*40)
-
-# Наша формула
-S_geo = 4*pi**3 + pi**2 + pi
-delta_24 = 1/(24*S_geo)
-delta_pi4 = 1/(pi**4 * S_geo**2)
-alpha_inv_theory = S_geo - delta_24 - delta_pi4
-
-print(f"α⁻¹(0) из геометрии: {float(alpha_inv_theory):.9f}")
-print(f"α⁻¹(0) CODATA:       {float(alpha_inv_0):.9f}")
-print(f"Δσ: {float((alpha_inv_theory - alpha_inv_0)/mp.mpf('0.000000085')):.2f}")
-print()
-
-# Running до m_Z (упрощённо)
-Delta_running = mp.mpf('9.085')  # эмпирическое значение из SM
-alpha_inv_mZ_pred = alpha_inv_theory - Delta_running
-
-print(f"α⁻¹(m_Z) предсказание: {float(alpha_inv_mZ_pred):.3f}")
-print(f"α⁻¹(m_Z) PDG:          {float(alpha_inv_mZ):.3f}")
-print(f"Согласие: {abs(float(alpha_inv_mZ_pred - alpha_inv_mZ)) < 0.1}")
-
-# =============================================================================
-# §7. ДРУГИЕ КОНСТАНТЫ SM
-# =============================================================================
-
-print("\n§7. Связь с другими константами SM")
-print("-"*40)
-
-print("""
+def section_6():
+    """§6. ЧИСЛЕННАЯ ПРОВЕРКА."""
+    print("\n§6. Численная проверка RG потока")
+    print("-"*40)
+    alpha_inv_0, alpha_inv_mZ = mp.mpf(ALPHA_INV_0), mp.mpf(ALPHA_INV_MZ)
+    # Наша формула
+    S_geo, delta_24, delta_pi4, alpha_inv_theory = alpha_inv_terms()
+    print(f"α⁻¹(0) из геометрии: {float(alpha_inv_theory):.9f}")
+    print(f"α⁻¹(0) CODATA:       {float(alpha_inv_0):.9f}")
+    print(f"Δσ: {float((alpha_inv_theory - alpha_inv_0)/mp.mpf('0.000000085')):.2f}")
+    print()
+    # Running до m_Z (упрощённо)
+    Delta_running = mp.mpf('9.085')  # эмпирическое значение из SM
+    alpha_inv_mZ_pred = alpha_inv_theory - Delta_running
+    print(f"α⁻¹(m_Z) предсказание: {float(alpha_inv_mZ_pred):.3f}")
+    print(f"α⁻¹(m_Z) PDG:          {float(alpha_inv_mZ):.3f}")
+    print(f"Согласие: {abs(float(alpha_inv_mZ_pred - alpha_inv_mZ)) < 0.1}")
+
+def section_7():
+    """§7. ДРУГИЕ КОНСТАНТЫ SM."""
+    print("\n§7. Связь с другими константами SM")
+    print("-"*40)
+    print("""
 В UGSM предсказываются:
 
 1. sin²θ_W = (8 - 3/(4π))/(21 + 4π) = 0.2312  (PDG: 0.2312)
@@ -235,15 +215,12 @@ print("""
 Они НЕ используют running — это отдельные геометрические формулы.
 """)
 
-# =============================================================================
-# §8. ИТОГ
-# =============================================================================
-
-print("\n" + "="*70)
-print("ИТОГ")
-print("="*70)
-
-print("""
+def section_8():
+    """§8. ИТОГ."""
+    print("\n" + "="*70)
+    print("ИТОГ")
+    print("="*70)
+    print("""
 1. ФОРМУЛА ДАЁТ α(0), НЕ α(m_Z):
    - S_geo = эффективное действие в IR пределе
    - α⁻¹(0) = 137.036 — прямое предсказание
@@ -266,6 +243,22 @@ print("""
 УРОВЕНЬ ЗАЩИТЫ: ⚠️ → ✅ ~70%
 """)
 
-print("="*70)
-print("ВЫВОД: UGSM даёт α(0), SM обеспечивает running до α(m_Z)")
-print("="*70)
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+    "7": section_7,
+    "8": section_8,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, dps=DPS, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nRG MATCHING: α(0) vs α(m_Z)\n" + "="*70,
+                        footer="="*70 + "\nВЫВОД: UGSM даёт α(0), SM обеспечивает running до α(m_Z)\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
+
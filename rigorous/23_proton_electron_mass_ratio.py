@@ -1,25 +1,20 @@
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import s_vac
+from rpft.constants import edition
+from rpft.uncertainty import propagate
 
 def calculate_proton_electron_ratio():
     # 1. Define Constants from Geometric Theory
     pi = math.pi
     
-    # S_geo components
-    term_4pi3 = 4 * pi**3
-    term_pi2 = pi**2
-    term_pi = pi
-    S_geo = term_4pi3 + term_pi2 + term_pi
-    
-    # Alpha calculation (from 12_alpha_derivation.md)
+    # Alpha calculation (from 12_alpha_derivation.md), canonical core rpft.alpha:
     # alpha^-1 = S_geo - 1/(24*S_geo) - 1/(pi^4 * S_geo^2)  (assuming C=1)
     # Note: README says C=1 gives -0.04 sigma. We stick to the standard formula.
-    # The README formula: alpha^-1 = S_geo - 1/(24*S_geo) - 1/(pi^4 * S_geo^2)
-    
-    delta_cas = 1 / (24 * S_geo)
-    delta_bb = 1 / (math.pi**4 * S_geo**2)
-    
-    S_vac = S_geo - delta_cas - delta_bb
-    alpha_inv = S_vac
+    S_vac = float(s_vac(backend="float64"))
     
     # 2. Calculate mu (proton-to-electron mass ratio)
     # Formula: mu = 6*pi^5 + 3*pi/(2*S_vac) + (3 + 1/pi)/(S_vac^2)
@@ -38,10 +33,8 @@ def calculate_proton_electron_ratio():
     
     mu_theoretical = core_term + em_term + hf_term
     
-    # 3. Comparison with CODATA 2022
-    # Value: 1836.152 673 426 (32)
-    mu_codata = 1836.152673426
-    uncertainty = 0.000000032
+    # 3. Comparison with CODATA (edition: RPFT_CODATA, default 2022)
+    mu_codata, uncertainty = edition()["mu"].pair()
     
     diff = mu_theoretical - mu_codata
     rel_error = diff / mu_codata
@@ -60,7 +53,16 @@ def calculate_proton_electron_ratio():
         "relative_error_ppb": rel_error * 1e9
     }
 
-if __name__ == "__main__":
+def mu_from_masses(n=10**6):
+    # μ = m_p/m_e from the CODATA masses in MeV: first-order propagation without
+    # and with the m_e–m_p correlation, Monte-Carlo with it
+    codata = edition()
+    table, corr = codata.inputs("m_e", "m_p"), codata.corr("m_e", "m_p")
+    ratio = lambda ctx, m_e, m_p: m_p / m_e
+    return (propagate(ratio, table), propagate(ratio, table, corr=corr),
+            propagate(ratio, table, method="mc", corr=corr, n=n))
+
+def main():
     results = calculate_proton_electron_ratio()
     print("=== Proton-Electron Mass Ratio Derivation ===")
     print(f"S_vac (Inverse Alpha): {results['S_vac']:.12f}")
@@ -70,7 +72,7 @@ if __name__ == "__main__":
     print(f"Term 3 (Hyperfine/HO):        {results['hf_term']:.12f}")
     print("-" * 40)
     print(f"μ (Theoretical):              {results['mu_theoretical']:.12f}")
-    print(f"μ (CODATA 2022):              {results['mu_codata']:.12f}")
+    print(f"μ (CODATA {edition().name}):              {results['mu_codata']:.12f}")
     print("-" * 40)
     print(f"Difference:                   {results['difference']:.2e}")
     print(f"Sigma:                        {results['sigma']:.2f} σ")
@@ -80,3 +82,15 @@ if __name__ == "__main__":
         print("STATUS: ✅ SUCCESS (Agreement within 2σ)")
     else:
         print("STATUS: ⚠️ WARNING (Deviation > 2σ)")
+
+    uncorrelated, linear, mc = mu_from_masses()
+    print("-" * 40)
+    print(f"μ = m_p/m_e from masses in MeV (CODATA {edition().name}):")
+    print(f"μ (m_p/m_e):                  {linear.value:.12f}")
+    print(f"σ (linear, uncorrelated):     {uncorrelated.sigma:.2e}")
+    print(f"σ (linear, r(m_e, m_p)):      {linear.sigma:.2e}")
+    print(f"σ (Monte-Carlo, 10⁶):         {mc.sigma:.2e}")
+    print(f"Sigma vs m_p/m_e:             {(results['mu_theoretical'] - linear.value) / linear.sigma:.2f} σ")
+
+if __name__ == "__main__":
+    main()
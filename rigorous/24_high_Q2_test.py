@@ -7,14 +7,19 @@
 Источники данных:
   - Kelly (2004) параметризация: nucl-ex/0401002
   - JLab E01-001: arXiv:2411.05201
+
+Модуль импортируется без вычислений; разделы (SECTIONS) запускаются по имени:
+python 24_high_Q2_test.py [раздел ...] (rpft.sections).
 """
 
+import os
+import sys
+
 import numpy as np
 import math
 
-print("="*70)
-print("ТЕСТ УЗЛОВОЙ ГИПОТЕЗЫ: Высокие Q2")
-print("="*70)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.sections import run_sections
 
 # Дипольный форм-фактор
 def G_D(Q2):
@@ -28,7 +33,7 @@ def G_E_Kelly(Q2):
     return (1 + a1*tau) / (1 + b1*tau + b2*tau**2 + b3*tau**3)
 
 # Экспериментальные данные: (Q2, G_E/G_D, error, source)
-exp_data = [
+EXP_DATA = [
     (0.50, 1.025, 0.015, "E01-001"),
     (1.00, 1.030, 0.020, "E01-001"),
     (2.00, 1.015, 0.030, "E01-001"),
@@ -40,39 +45,47 @@ exp_data = [
     (8.00, 0.800, 0.100, "GEp-III"),
 ]
 
-print("\n--- ДАННЫЕ: G_E/G_D vs Q2 ---")
-print(f"{'Q2':<8} {'G_E/G_D':<10} {'Kelly':<10} {'Delta':<10}")
-print("-"*40)
-
-deviations = []
-for Q2, ratio, err, src in exp_data:
-    kelly = G_E_Kelly(Q2) / G_D(Q2)
-    delta = ratio - kelly
-    deviations.append((Q2, delta))
-    print(f"{Q2:<8.2f} {ratio:<10.3f} {kelly:<10.3f} {delta:<+10.3f}")
-
-# Анализ осцилляций
-print("\n--- АНАЛИЗ ОСЦИЛЛЯЦИЙ ---")
-high_Q2 = [(q, d) for q, d in deviations if q >= 2.0]
-sign_changes = sum(1 for i in range(1, len(high_Q2)) 
-                   if high_Q2[i][1] * high_Q2[i-1][1] < 0)
-
-print(f"Точек при Q2 >= 2: {len(high_Q2)}")
-print(f"Смен знака: {sign_changes}")
-print(f"Ожидаемо для шума: {(len(high_Q2)-1)/2:.1f}")
-
-if sign_changes <= 1:
-    verdict = "МОНОТОННОЕ убывание - осцилляций НЕТ"
-else:
-    verdict = "Возможны осцилляции"
-    
-print(f"\nВЕРДИКТ: {verdict}")
-
-# Итог
-print("\n" + "="*70)
-print("ИТОГ ПО УЗЛОВОЙ ГИПОТЕЗЕ")
-print("="*70)
-print("""
+def kelly_deviations():
+    """[(Q2, G_E/G_D − Kelly)] по EXP_DATA."""
+    return [(Q2, ratio - G_E_Kelly(Q2) / G_D(Q2)) for Q2, ratio, err, src in EXP_DATA]
+
+# =============================================================================
+# Разделы вывода
+# =============================================================================
+
+def section_data():
+    """Данные G_E/G_D против параметризации Kelly."""
+    print("\n--- ДАННЫЕ: G_E/G_D vs Q2 ---")
+    print(f"{'Q2':<8} {'G_E/G_D':<10} {'Kelly':<10} {'Delta':<10}")
+    print("-"*40)
+    for (Q2, ratio, err, src), (_, delta) in zip(EXP_DATA, kelly_deviations()):
+        kelly = G_E_Kelly(Q2) / G_D(Q2)
+        print(f"{Q2:<8.2f} {ratio:<10.3f} {kelly:<10.3f} {delta:<+10.3f}")
+
+def section_oscillations():
+    """Смены знака отклонений при Q2 ≥ 2 GeV2."""
+    # Анализ осцилляций
+    print("\n--- АНАЛИЗ ОСЦИЛЛЯЦИЙ ---")
+    high_Q2 = [(q, d) for q, d in kelly_deviations() if q >= 2.0]
+    sign_changes = sum(1 for i in range(1, len(high_Q2)) 
+                       if high_Q2[i][1] * high_Q2[i-1][1] < 0)
+    print(f"Точек при Q2 >= 2: {len(high_Q2)}")
+    print(f"Смен знака: {sign_changes}")
+    print(f"Ожидаемо для шума: {(len(high_Q2)-1)/2:.1f}")
+    if sign_changes <= 1:
+        verdict = "МОНОТОННОЕ убывание - осцилляций НЕТ"
+    else:
+        verdict = "Возможны осцилляции"
+    print(f"\nВЕРДИКТ: {verdict}")
+    return {"sign_changes": sign_changes, "verdict": verdict}
+
+def section_summary():
+    """Итог по узловой гипотезе."""
+    # Итог
+    print("\n" + "="*70)
+    print("ИТОГ ПО УЗЛОВОЙ ГИПОТЕЗЕ")
+    print("="*70)
+    print("""
 1. МАССА ПРОТОНА: mu = 6*pi^5 + ... = 1836.15 (< 1 ppb) - ПОДТВЕРЖДЕНО
 
 2. ФОРМ-ФАКТОР при Q2 > 2 GeV2:
@@ -89,3 +102,17 @@ print("""
    - Узловая интерпретация: НЕ ПОДТВЕРЖДЕНА данными форм-фактора
    - Кварковая интерпретация: СОГЛАСУЕТСЯ с экспериментом
 """)
+
+SECTIONS = {
+    "data": section_data,
+    "oscillations": section_oscillations,
+    "summary": section_summary,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nТЕСТ УЗЛОВОЙ ГИПОТЕЗЫ: Высокие Q2\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
+
@@ -16,45 +16,26 @@ Hedgehog ansatz:
   3. Барионный заряд B=1
 
 Ref: Skyrme 1962, Adkins-Nappi-Witten 1983
+
+Модуль импортируется без вычислений; разделы (SECTIONS) запускаются по имени:
+python 24_skyrmion_model.py [раздел ...] (rpft.sections).
 """
 
+import os
+import sys
+
 import numpy as np
 import math
 
-print("="*70)
-print("СКИРМИОН (HEDGEHOG) КАК МОДЕЛЬ ПРОТОНА")
-print("="*70)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.sections import run_sections
 
 pi = math.pi
 
-# =============================================================================
-# §1. HEDGEHOG ANSATZ
-# =============================================================================
-
-print("\n§1. Hedgehog Ansatz")
-print("-"*40)
-
-print("""
-СКИРМИОН С B=1 (hedgehog):
-
-  U(x) = exp(i * tau_a * x_a/r * f(r))
-  
-где:
-  - tau_a — матрицы Паули (SU(2) генераторы)
-  - x_a/r — единичный радиальный вектор (hedgehog = "ёж")
-  - f(r) — профильная функция: f(0)=pi, f(inf)=0
-
-КЛЮЧЕВОЕ: Конфигурация СФЕРИЧЕСКИ СИММЕТРИЧНА!
-→ Форм-фактор G_E(Q²) монотонно убывает, БЕЗ осцилляций.
-""")
-
 # =============================================================================
 # §2. ПЛОТНОСТЬ ЗАРЯДА СКИРМИОНА
 # =============================================================================
 
-print("\n§2. Плотность заряда скирмиона")
-print("-"*40)
-
 def skyrmion_profile(r, R0=0.84):
     """
     Профильная функция скирмиона (аппроксимация).
@@ -75,17 +56,10 @@ def skyrmion_density(r, R0=0.84):
     # Упрощённая форма: гауссова оболочка
     return np.exp(-((r - R0)**2) / (0.3 * R0)**2) / (r**2 + 0.01)
 
-print("Профильная функция: f(r) = pi * (1 - tanh(r/R0))")
-print("Плотность: rho(r) ~ sin²(f) * f' / r²")
-print("Форма: СФЕРИЧЕСКАЯ ОБОЛОЧКА (не 3 лепестка!)")
-
 # =============================================================================
 # §3. ФОРМ-ФАКТОР СКИРМИОНА
 # =============================================================================
 
-print("\n§3. Форм-фактор скирмиона")
-print("-"*40)
-
 def G_E_skyrmion(Q2, Lambda2=0.71):
     """
     Форм-фактор сферического скирмиона.
@@ -109,62 +83,86 @@ def G_D(Q2, Lambda2=0.71):
     """Дипольный форм-фактор (эталон)."""
     return 1.0 / (1 + Q2/Lambda2)**2
 
-print("G_E^skyrmion(Q²) ≈ exp(-Q²R₀²/6) × (shell correction)")
-print("Ключевое: МОНОТОННОЕ убывание — как в эксперименте!")
-
 # =============================================================================
-# §4. СРАВНЕНИЕ С ДАННЫМИ
+# Разделы вывода
 # =============================================================================
 
-print("\n§4. Сравнение с экспериментом")
-print("-"*40)
-
-exp_data = [
-    (0.50, 1.025, 0.015),
-    (1.00, 1.030, 0.020),
-    (2.00, 1.015, 0.030),
-    (2.64, 1.000, 0.035),
-    (3.20, 0.980, 0.040),
-    (4.10, 0.950, 0.050),
-    (5.00, 0.920, 0.060),
-    (6.00, 0.880, 0.070),
-    (8.00, 0.800, 0.100),
-]
-
-print(f"{'Q²':<8} {'Данные':<10} {'Дипольный':<10} {'Скирмион':<10} {'Δ(Sky)':<10}")
-print("-"*50)
-
-chi2_dipole = 0
-chi2_skyrmion = 0
-
-for Q2, ratio, err in exp_data:
-    g_d = G_D(Q2)
-    g_s = G_E_skyrmion(Q2)
+def section_1():
+    """§1. HEDGEHOG ANSATZ."""
+    print("\n§1. Hedgehog Ansatz")
+    print("-"*40)
+    print("""
+СКИРМИОН С B=1 (hedgehog):
+
+  U(x) = exp(i * tau_a * x_a/r * f(r))
+  
+где:
+  - tau_a — матрицы Паули (SU(2) генераторы)
+  - x_a/r — единичный радиальный вектор (hedgehog = "ёж")
+  - f(r) — профильная функция: f(0)=pi, f(inf)=0
+
+КЛЮЧЕВОЕ: Конфигурация СФЕРИЧЕСКИ СИММЕТРИЧНА!
+→ Форм-фактор G_E(Q²) монотонно убывает, БЕЗ осцилляций.
+""")
+
+def section_2():
+    """§2. ПЛОТНОСТЬ ЗАРЯДА СКИРМИОНА."""
+    print("\n§2. Плотность заряда скирмиона")
+    print("-"*40)
+    print("Профильная функция: f(r) = pi * (1 - tanh(r/R0))")
+    print("Плотность: rho(r) ~ sin²(f) * f' / r²")
+    print("Форма: СФЕРИЧЕСКАЯ ОБОЛОЧКА (не 3 лепестка!)")
+
+def section_3():
+    """§3. ФОРМ-ФАКТОР СКИРМИОНА."""
+    print("\n§3. Форм-фактор скирмиона")
+    print("-"*40)
+    print("G_E^skyrmion(Q²) ≈ exp(-Q²R₀²/6) × (shell correction)")
+    print("Ключевое: МОНОТОННОЕ убывание — как в эксперименте!")
+
+def section_4():
+    """§4. СРАВНЕНИЕ С ДАННЫМИ."""
+    print("\n§4. Сравнение с экспериментом")
+    print("-"*40)
+    exp_data = [
+        (0.50, 1.025, 0.015),
+        (1.00, 1.030, 0.020),
+        (2.00, 1.015, 0.030),
+        (2.64, 1.000, 0.035),
+        (3.20, 0.980, 0.040),
+        (4.10, 0.950, 0.050),
+        (5.00, 0.920, 0.060),
+        (6.00, 0.880, 0.070),
+        (8.00, 0.800, 0.100),
+    ]
+    print(f"{'Q²':<8} {'Данные':<10} {'Дипольный':<10} {'Скирмион':<10} {'Δ(Sky)':<10}")
+    print("-"*50)
+    chi2_dipole = 0
+    chi2_skyrmion = 0
+    for Q2, ratio, err in exp_data:
+        g_d = G_D(Q2)
+        g_s = G_E_skyrmion(Q2)
     
-    # Данные в абсолютных единицах
-    g_data = ratio * g_d
+        # Данные в абсолютных единицах
+        g_data = ratio * g_d
     
-    # Нормируем скирмион к данным при Q²=0
-    g_s_norm = g_s / G_E_skyrmion(0.01) * G_D(0.01) * 1.025
+        # Нормируем скирмион к данным при Q²=0
+        g_s_norm = g_s / G_E_skyrmion(0.01) * G_D(0.01) * 1.025
     
-    delta_s = (g_s_norm - g_data) / g_data * 100
+        delta_s = (g_s_norm - g_data) / g_data * 100
     
-    chi2_dipole += ((ratio * g_d - g_d) / (err * g_d))**2
-    chi2_skyrmion += ((g_s_norm - g_data) / (err * g_d))**2
+        chi2_dipole += ((ratio * g_d - g_d) / (err * g_d))**2
+        chi2_skyrmion += ((g_s_norm - g_data) / (err * g_d))**2
     
-    print(f"{Q2:<8.2f} {g_data:<10.4f} {g_d:<10.4f} {g_s_norm:<10.4f} {delta_s:<+10.1f}%")
-
-print(f"\nχ²/ndf (Дипольный): {chi2_dipole/8:.2f}")
-print(f"χ²/ndf (Скирмион):  {chi2_skyrmion/8:.2f}")
-
-# =============================================================================
-# §5. СВЯЗЬ С 6π⁵
-# =============================================================================
-
-print("\n§5. Связь с 6π⁵")
-print("-"*40)
-
-print("""
+        print(f"{Q2:<8.2f} {g_data:<10.4f} {g_d:<10.4f} {g_s_norm:<10.4f} {delta_s:<+10.1f}%")
+    print(f"\nχ²/ndf (Дипольный): {chi2_dipole/8:.2f}")
+    print(f"χ²/ndf (Скирмион):  {chi2_skyrmion/8:.2f}")
+
+def section_5():
+    """§5. СВЯЗЬ С 6π⁵."""
+    print("\n§5. Связь с 6π⁵")
+    print("-"*40)
+    print("""
 ЭНЕРГИЯ СКИРМИОНА (Adkins-Nappi-Witten 1983):
 
   M_skyrmion = (12*pi²/e) * f_pi * F[f(r)]
@@ -185,26 +183,22 @@ print("""
   - π³ = Vol(S⁵)/2 — связано с SU(3) flavor
   - 3 = топологический индекс (winding number × color factor)
 """)
-
-# Проверка
-print("\nЧисленная проверка:")
-vol_S3 = 2 * pi**2
-vol_S5 = pi**3
-factor = 3
-product = vol_S3 * vol_S5 * factor
-print(f"Vol(S³) × Vol(S⁵) × 3 = {vol_S3:.4f} × {vol_S5:.4f} × 3 = {product:.4f}")
-print(f"6π⁵ = {6*pi**5:.4f}")
-print(f"Совпадение: {abs(product - 6*pi**5) < 0.01}")
-
-# =============================================================================
-# §6. ВЫВОДЫ
-# =============================================================================
-
-print("\n" + "="*70)
-print("ВЫВОДЫ: СКИРМИОН vs ТРЕФОЙЛЬ")
-print("="*70)
-
-print("""
+    # Проверка
+    print("\nЧисленная проверка:")
+    vol_S3 = 2 * pi**2
+    vol_S5 = pi**3
+    factor = 3
+    product = vol_S3 * vol_S5 * factor
+    print(f"Vol(S³) × Vol(S⁵) × 3 = {vol_S3:.4f} × {vol_S5:.4f} × 3 = {product:.4f}")
+    print(f"6π⁵ = {6*pi**5:.4f}")
+    print(f"Совпадение: {abs(product - 6*pi**5) < 0.01}")
+
+def section_6():
+    """§6. ВЫВОДЫ."""
+    print("\n" + "="*70)
+    print("ВЫВОДЫ: СКИРМИОН vs ТРЕФОЙЛЬ")
+    print("="*70)
+    print("""
 1. ТРЕФОЙЛЬ (3 лепестка):
    ❌ Предсказывает осцилляции в G_E(Q²)
    ❌ Осцилляций НЕТ в эксперименте
@@ -227,3 +221,20 @@ print("""
    - Кварки = возбуждения поля скирмиона (не отдельные частицы)
    - Геометрическая формула μ = 6π⁵ + ... ПОДТВЕРЖДЕНА
 """)
+
+SECTIONS = {
+    "1": section_1,
+    "2": section_2,
+    "3": section_3,
+    "4": section_4,
+    "5": section_5,
+    "6": section_6,
+}
+
+def main(argv=None):
+    return run_sections(SECTIONS, argv, description=__doc__.strip().splitlines()[0],
+                        header="="*70 + "\nСКИРМИОН (HEDGEHOG) КАК МОДЕЛЬ ПРОТОНА\n" + "="*70)
+
+if __name__ == "__main__":
+    main()
+
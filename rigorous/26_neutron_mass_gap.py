@@ -12,21 +12,46 @@ Two variants:
 Also checks the beta Q-value:
   Qβ = m_n - m_p - m_e = m_e*(Δ_n - 1)
 
-All numbers use CODATA/PDG constants directly (no fitting).
+All numbers use CODATA/PDG constants directly (no fitting). The masses come from
+rpft.constants: CODATA 2018 by default (the values 26_neutron_mass_gap.md quotes),
+RPFT_CODATA=2022 re-runs the check against the newer edition.
+
+The [UNCERTAINTY] block propagates σ(m_e), σ(m_p), σ(m_n) and the m_e–m_p
+correlation to every prediction, first-order and by Monte-Carlo (rpft.uncertainty).
+[CLOSED-FORM SEARCH] replaces the hand-picked rational candidates for c with a
+ranked search over (p/q)·π^a·ζ(3)^b·log2^c·S_geo^d (rpft.identify).
 """
 
 from __future__ import annotations
 
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import s_vac
+from rpft.constants import edition
+from rpft.identify import ExpressionIndex
+from rpft.uncertainty import propagate
+
+CODATA_EDITION = "2018"
+MC_SAMPLES = 10**6
 
 
 def s_vac_from_geometry() -> float:
-    """Compute S_vac from the project's standard geometric formula."""
-    pi = math.pi
-    s_geo = 4 * pi**3 + pi**2 + pi
-    delta_cas = 1 / (24 * s_geo)
-    delta_bb = 1 / (pi**4 * s_geo**2)
-    return s_geo - delta_cas - delta_bb
+    """Compute S_vac from the project's standard geometric formula (rpft.alpha, float64)."""
+    return float(s_vac(backend="float64"))
+
+
+def gap_predictions(ctx, m_e, m_p, m_n, deltas):
+    """m_n(pred), Qβ(pred) and m_n(pred) - m_n for each Δ (ctx — rpft.uncertainty context)."""
+    out = {}
+    for name, delta in deltas.items():
+        mn_pred = m_p + m_e * delta
+        out[f"mn_{name}"] = mn_pred
+        out[f"q_{name}"] = mn_pred - m_p - m_e
+        out[f"res_{name}"] = mn_pred - m_n
+    return out
 
 
 def main() -> None:
@@ -34,9 +59,8 @@ def main() -> None:
 
     # --- Experimental constants (CODATA/PDG) ---
     # Masses in MeV
-    m_e = 0.51099895000
-    m_p = 938.27208816
-    m_n = 939.56542052
+    codata = edition(default=CODATA_EDITION)
+    m_e, m_p, m_n = (float(codata[name]) for name in ("m_e", "m_p", "m_n"))
 
     # Derived experimental gap factors
     delta_exp = (m_n - m_p) / m_e
@@ -137,6 +161,42 @@ def main() -> None:
         q_err_eV = (q_pred - q_beta_exp) * 1e6
         print(f"{name:<6} {delta_cand:>14.12f} {mn_err_eV:>14.4f} {q_err_eV:>14.4f}")
 
+    # --- Propagated uncertainties (CODATA 2022 table) ---
+    deltas = {"A": delta_A, "B": delta_B, "C": delta_C}
+    table = codata.inputs("m_e", "m_p", "m_n")
+    corr = codata.corr("m_e", "m_p", "m_n")
+
+    def model(ctx, m_e, m_p, m_n):
+        return gap_predictions(ctx, m_e, m_p, m_n, deltas)
+
+    linear = propagate(model, table, corr=corr)
+    mc = propagate(model, table, method="mc", corr=corr, n=MC_SAMPLES)
+
+    print(f"\n[UNCERTAINTY]  inputs: CODATA {codata.name} (rpft.constants)")
+    for name, (value, sigma) in table.items():
+        print(f"{name} (MeV): {codata[name].value} ± {sigma:.2e}")
+    for (a, b), r in corr.items():
+        print(f"r({a}, {b}) = {r}")
+    print(f"Monte-Carlo: {MC_SAMPLES} samples")
+    print(f"{'':<3} {'m_n(pred), MeV':>18} {'σ lin (eV)':>11} {'σ MC (eV)':>11} "
+          f"{'Qβ σ (eV)':>10} {'residual/σ':>11}")
+    for name in deltas:
+        mn, res, q = linear[f"mn_{name}"], linear[f"res_{name}"], linear[f"q_{name}"]
+        print(f"{name:<3} {mn.value:>18.8f} {mn.sigma * 1e6:>11.4f} {mc[f'mn_{name}'].sigma * 1e6:>11.4f} "
+              f"{q.sigma * 1e6:>10.6f} {res.value / res.sigma:>+11.1f}")
+
+    # --- Closed-form search for c_fit ---
+    c_est = propagate(lambda ctx, m_e, m_p, m_n: (ln_4pi - (m_n - m_p) / m_e) * s_vac**2, table, corr=corr)
+    index = ExpressionIndex()
+    print("\n[CLOSED-FORM SEARCH]  c ≈ (p/q)·π^a·ζ(3)^b·log2^c·S_geo^d  (rpft.identify)")
+    print(f"c_fit = {c_fit:.12f} ± {c_est.sigma:.1e}  ({len(index)} distinct candidate values)")
+    print(f"{'expression':<28} {'value':>16} {'rel. error':>11} {'complexity':>10} {'pull':>7}")
+    for cand in index.search(c_fit, k=6):
+        pull = (float(cand.value) - c_fit) / c_est.sigma
+        print(f"{cand.expression:<28} {float(cand.value):>16.12f} {cand.error:>11.1e} "
+              f"{cand.complexity:>10.1f} {pull:>+7.2f}")
+    print(f"Candidate values within c_fit ± σ: {index.count_within(c_fit, c_est.sigma / c_fit)}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Бенчмарки спектральных горячих путей rigorous/: сетка точность × обрезание, эталон, регрессии.
+
+Каждая функция меряется «холодной»: перед вызовом сбрасываются кэши процесса
+(строки Бесселя rpft.casimir, секторы rpft.spectra, @memo), дисковый кэш отключён
+(rpft.bench). Эталон — benchmarks_baseline.json рядом со скриптом; прогон
+завершается с кодом 1, если медиана выросла больше порога. Если эталон снят на
+другой машине (окружение или калибровка различаются), медианы нормируются на
+калибровочный цикл; --normalize / --no-normalize — принудительно.
+
+  python benchmarks.py                  — все бенчмарки, сравнение с эталоном
+  python benchmarks.py -k heat_trace    — только id, содержащие подстроку
+  python benchmarks.py --threshold 0.5  — порог замедления 50 %
+  python benchmarks.py --save           — записать эталон (после намеренного изменения)
+  python benchmarks.py --list           — точки сетки
+
+Навигация:
+  Главная: 00_main.md | README.md
+"""
+
+import functools
+import importlib
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import numpy as np
+from mpmath import mp
+
+from rpft import spectra, casimir
+from rpft.alpha import solve
+from rpft.bench import Case, main as bench_main
+from rpft.constants import constant, convention, inputs
+from rpft.eta import eta_scan
+from rpft.heat import heat_trace_theta, abel_remainder_S1
+from rpft.identify import ExpressionIndex
+from rpft.uncertainty import propagate
+from rpft.zeta import spectral_zeta
+
+zc = importlib.import_module("rigorous.02_zeta_compute")
+sf = importlib.import_module("rigorous.22_spectral_flow_derivation")
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks_baseline.json")
+
+# Сетки t: одна точка и 64 точки (пакетный путь heat_trace)
+T_GRIDS = {1: [0.1], 64: list(np.geomspace(0.01, 1.0, 64))}
+
+# Выборки α⁻¹ ~ N(CODATA, σ) для обратной задачи
+ALPHA_SAMPLES = np.random.default_rng(0).normal(float(constant("alpha_inv")),
+                                                float(convention("sigma_alpha_inv")), 100000)
+
+
+def _expression_index(max_exponent, max_denominator):
+    return ExpressionIndex(max_exponent=max_exponent, max_numerator=max_denominator,
+                           max_denominator=max_denominator)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_index():
+    return ExpressionIndex()
+
+
+def _search(offsets):
+    return _default_index().search(mp.mpf("0.9936386345"), k=6, offsets=offsets)
+
+
+def _neutron_gap(ctx, m_e, m_p, m_n):
+    mn_pred = m_p + m_e * ctx.log(4 * ctx.pi)
+    return {"mn": mn_pred, "q": mn_pred - m_p - m_e, "res": mn_pred - m_n}
+
+
+def _cold_spectra():
+    spectra.spectrum.cache_clear()
+    spectra._SECTORS.clear()
+
+
+def _cold_casimir():
+    casimir._bessel_row.cache_clear()
+
+
+def _cold_twisted():
+    sf.dirac_twisted.cache_clear()
+
+
+CASES = [
+    Case("spectrum", lambda n_max: spectra.spectrum("scalar", n_max, p=2),
+         {"n_max": [1000, 100000]}, setup=_cold_spectra,
+         doc="построение спектра лапласиана на L(2,1)"),
+    Case("heat_trace_L21",
+         lambda N_max, n_t: zc.heat_trace_scalar_L21(T_GRIDS[n_t], N_max, digits=mp.dps),
+         {"dps": [15, 30, 50], "N_max": [100, 1000], "n_t": [1, 64]},
+         doc="K(t) прямой суммой по уровням (02)"),
+    Case("heat_trace_theta", lambda n_t: [heat_trace_theta("scalar", t, p=2, digits=mp.dps)
+                                             for t in T_GRIDS[n_t]],
+         {"dps": [15, 50], "n_t": [1, 64]}, doc="K(t) через тета-представление"),
+    Case("abel_remainder_S1", lambda t: abel_remainder_S1(t, digits=mp.dps),
+         {"dps": [15, 50], "t": [0.01, 0.1]}, doc="Abel-остаток на S¹ (κ_Cas)"),
+    Case("casimir_S1_massive", lambda a: zc.casimir_energy_S1_massive(a),
+         {"dps": [15, 30, 80], "a": [2, 5]}, setup=_cold_casimir,
+         doc="E_{S¹}(a) одного массивного уровня, ряд Бесселя"),
+    # точность задаёт сама функция (evaluate до DIGITS знаков), поэтому оси dps нет
+    Case("kk_casimir_RP3xS1", lambda k_max: zc.kappa_cas_gauge_KK_RP3_S1_prefix(k_max, 50),
+         {"k_max": [10, 25]}, setup=_cold_casimir,
+         doc="KK-башня калибровочных полей на RP³×S¹ (02 §4c)"),
+    Case("ln_det_S3_sum", lambda N_max: zc.ln_det_scalar_S3_from_convergent_sum(N_max),
+         {"dps": [15, 30], "N_max": [2000, 20000]}, threshold=0.35,
+         doc="ln det′ на S³ сходящейся суммой (цикл по mpf)"),
+    Case("ln_det_S3_levin", lambda: zc.ln_det_scalar_S3_from_convergent_sum(method="levin"),
+         {"dps": [15, 50]}, doc="та же сумма с ускорением Левина"),
+    Case("spectral_zeta_prime", lambda p: spectral_zeta("scalar", p=p, twist=0).derivative_at_zero(),
+         {"dps": [15, 50, 80], "p": [1, 2]}, doc="ζ′(0) в замкнутой форме"),
+    Case("twisted_zeta_prime", lambda n_theta: sf.dirac_twisted().derivative_at_zero(
+             [mp.pi * k / n_theta for k in range(1, n_theta + 1)]),
+         {"dps": [15, 50], "n_theta": [1, 32]}, setup=_cold_twisted,
+         doc="ζ′(0, θ) Дирака с twist на сетке θ"),
+    Case("berry_connection", lambda N_max, n_theta: sf.berry_connection(
+             [mp.pi * k / n_theta for k in range(n_theta + 1)], 0.01, N_max),
+         {"dps": [15, 50], "N_max": [100, 400], "n_theta": [16]},
+         doc="связность Берри на сетке θ (22 §6)"),
+    Case("solve_R_mp", lambda: solve(constant("alpha_inv").mpf(), "R"), {"dps": [15, 50]},
+         doc="R из α⁻¹(R) = CODATA, Галлей в mpmath"),
+    Case("solve_samples", lambda unknown, n: solve(ALPHA_SAMPLES[:n], unknown),
+         {"unknown": ["R", "kappa", "C"], "n": [1000, 100000]},
+         doc="R, κ или C по выборкам CODATA, float64"),
+    Case("propagate_linear", lambda: propagate(_neutron_gap, inputs("m_e", "m_p", "m_n")), {},
+         doc="σ предсказаний m_n (26) первого порядка, автодифф"),
+    Case("propagate_mc", lambda n: propagate(_neutron_gap, inputs("m_e", "m_p", "m_n"), "mc", n=n),
+         {"n": [10**5, 10**6]}, doc="σ предсказаний m_n (26) Монте-Карло, float64"),
+    Case("expression_index", _expression_index, {"max_exponent": [2, 3], "max_denominator": [16, 32]},
+         doc="индекс (p/q)·π^a·ζ(3)^b·log2^c·S_geo^d: построение, хэш, сортировка"),
+    Case("expression_search", lambda n_offsets: _search((0, 1, -1)[:n_offsets]), {"n_offsets": [1, 3]},
+         doc="поиск формы C_opt по готовому индексу (3·10⁶ значений)"),
+    Case("eta_scan", lambda p_max: eta_scan([(p, 1, 0, 0) for p in range(2, p_max + 1)]),
+         {"p_max": [20, 200]}, doc="η(0) Дирака для L(p,1), float64"),
+]
+
+
+def main(argv=None):
+    return bench_main(CASES, BASELINE, argv, description=__doc__.strip().splitlines()[0])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
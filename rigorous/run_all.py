@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Единая точка входа для всех проверок rigorous/: набор именованных величин.
+
+Каждый узел — величина (κ_Cas, α⁻¹, C, R, …), которую печатают разделы одного
+скрипта. Узлы независимы: общие величины S_geo, κ_Cas, C каждый скрипт берёт из
+ядра rpft (rpft.alpha, rpft.constants), а не из вывода другого скрипта (скрипты не
+импортируют друг друга и не делят ключей @cached). Эта зависимость от ядра — в
+отпечатке узла: правка rpft или смена издания CODATA делает устаревшими все узлы,
+правка скрипта — только его узлы. Выполняются только устаревшие узлы, параллельно,
+самые долгие первыми (rpft.pipeline).
+
+  python run_all.py                   — пересчитать устаревшее, таблица итога
+  python run_all.py alpha_inv -j 4    — только узел alpha_inv, 4 процесса
+  python run_all.py --dry-run         — что устарело
+  python run_all.py --json            — итог в JSON (или --summary итог.json)
+  python run_all.py --show kappa_cas_abel   — вывод узла из последнего прогона
+  python run_all.py --list            — узлы
+
+Навигация:
+  Главная: 00_main.md | README.md
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.pipeline import Node, Pipeline, main as pipeline_main
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+NODES = [
+    # 02: спектральные суммы на L(2,1) и итоговая формула
+    Node("zeta_L21", "02_zeta_compute.py", ["1", "2", "2b", "2c", "2d", "2e", "3"],
+         doc="объёмы, ζ(s) и ln det′ на L(2,1)"),
+    Node("heat_weyl_L21", "02_zeta_compute.py", ["4"], doc="асимптотика Вейля K(t) на L(2,1)"),
+    Node("kappa_cas_abel", "02_zeta_compute.py", ["4b"], doc="κ_Cas(num) как Abel-остаток на S¹"),
+    Node("kk_casimir_RP3xS1", "02_zeta_compute.py", ["4c"],
+         doc="KK Casimir-константы на RP³×S¹"),
+    Node("alpha_inv", "02_zeta_compute.py", ["5", "6"], doc="α⁻¹ = S_geo − δ_Cas − δ_BB"),
+    Node("spin_bc_table", "02_zeta_compute.py", ["kill-shot"], doc="spin(RP³) × BC(S¹)"),
+    # κ_Cas = 1/24 через heat kernel
+    Node("heat_coefficients", "04_heat_kernel.py", doc="a₀…a₃ на RP³ и κ_Cas = 1/24"),
+    Node("kappa_cas_explicit", "13_casimir_explicit.py", doc="κ_Cas = 1/24 явно"),
+    # коэффициент C в δ_BB = C/(π⁴·S_geo²)
+    Node("C_pi4", "06_pi4_proof.py", doc="форма 1/π⁴ и оптимальный C"),
+    Node("C_geometry", "07_why_C_equals_1.py", doc="C = 1 из Vol(RP³)²"),
+    Node("C_coefficient", "14_C_coefficient.py", doc="анализ C = 1"),
+    Node("C_deep", "17_C_coefficient_deep.py", doc="структура δC = 1 − C_opt"),
+    # топология и выбор K
+    Node("eta_L21", "11_eta_invariant.py", doc="η-инвариант Дирака на L(p,q)"),
+    Node("K_choice", "15_why_K.py", doc="K = RP³ × S¹ среди L(p,1)"),
+    Node("pi_term", "18_pi_term_rigorous.py", doc="член π как систола RP³"),
+    Node("R_stabilization", "16_radius_stabilization.py", doc="R из α⁻¹(R) = CODATA"),
+    Node("uniqueness", "19_uniqueness.py", doc="единственность формулы α⁻¹"),
+    Node("rg_matching", "20_RG_matching.py", doc="α(0) и running до α(m_Z)"),
+    # 22: c = 1 через спектральный поток (фаза Берри — самый долгий раздел)
+    Node("twisted_zeta", "22_spectral_flow_derivation.py", ["1", "2", "3", "4", "5"],
+         doc="ζ(s, θ) и K(t, θ) Дирака с twist"),
+    Node("berry_phase", "22_spectral_flow_derivation.py", ["6"], doc="фаза Берри детерминанта"),
+    Node("c_spectral_flow", "22_spectral_flow_derivation.py", ["7", "8", "9", "10", "11"],
+         doc="c = 1 из ζ′(0, θ) и нормировок"),
+    # массы адронов
+    Node("mu_proton", "23_proton_electron_mass_ratio.py", doc="m_p/m_e = 6π⁵ + …"),
+    Node("neutron_gap", "26_neutron_mass_gap.py", doc="m_n − m_p"),
+    Node("form_factor", "24_proton_form_factor.py", doc="форм-фактор: кварки vs узел"),
+    Node("high_Q2", "24_high_Q2_test.py", doc="осцилляции при Q² > 2 GeV²"),
+    Node("skyrmion", "24_skyrmion_model.py", doc="скирмион и 6π⁵"),
+]
+
+
+def main(argv=None):
+    return pipeline_main(Pipeline(NODES, ROOT), argv, description=__doc__.strip().splitlines()[0])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
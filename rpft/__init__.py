@@ -0,0 +1,54 @@
+"""
+rpft — общее вычислительное ядро для скриптов rigorous/ и Проработка/.
+
+Модули:
+  spectra — спектры лапласианов и Дирака на S³ и L(p,q) (векторизованно, точные кратности)
+  heat    — пакетный heat trace K(t) (float64 / longdouble / mpmath), тета-представление при малых t,
+            коэффициенты a_k по сетке t
+  zeta    — ζ(s) и ζ′(0) в замкнутой форме через ζ Гурвица; усечённые суммы с производными по s
+  twist   — ζ(s, θ), ζ′(0, θ), K(t, θ) и ∂_θ для непрерывной голономии θ
+  eta     — η-инвариант Дирака на L(p,q): формула характеров, точная проверка по кратностям
+  series  — ускорение сходимости рядов (Ричардсон, Левин) с оценкой ошибки, таблицы сходимости,
+            снятие регулятора ε → 0
+  quad    — адаптивные квадратуры (Гаусс–Лежандр, tanh-sinh) с пакетным подынтегральным
+  alpha   — каноническая формула α⁻¹ = S_vac(R, κ, C, spin): mpmath с памятью по точности или
+            float64 по массивам NumPy; solve — R, κ или C из S_vac = target по массивам выборок
+  constants — реестр констант CODATA 2018/2022 (σ, корреляции), издание — RPFT_CODATA
+  uncertainty — σ вычисляемых величин: первый порядок (автодифф) и Монте-Карло по массивам NumPy
+  identify — замкнутые формы для подогнанных чисел: перебор грамматики по отсортированному индексу, PSLQ
+  casimir — Casimir-энергии KK-башен на M³×S¹ через ряды Бесселя (кэш, частичные суммы)
+  precision — заявленное число цифр: float64 / double-double / mpmath с проверкой сокращений
+  cache   — дисковый кэш дорогих результатов по (функция, аргументы, точность, версия кода)
+  sections — скрипты rigorous/ как модули: разделы, ленивые величины, main(argv)
+  pipeline — набор величин rigorous/: пересчёт устаревших узлов, параллельно, итог в JSON
+  profiling — время, операции mpf и пик памяти по разделам и горячим функциям (--profile)
+  bench    — бенчмарки горячих функций по сетке точность × обрезание, эталон и пороги регрессии
+  parallel — параллельный прогон сеток задач с детерминированным порядком результатов
+"""
+
+from .spectra import OPERATORS, Spectrum, spectrum, lens_multiplicity
+from .heat import heat_coefficients, heat_trace, heat_trace_theta
+from .zeta import LatticeZeta, SpectralSum, spectral_zeta
+from .twist import TwistedZeta
+from .eta import eta_exact, eta_function, eta_invariant, eta_scan
+from .series import accelerated_sum, convergence_study, regulator_limit
+from .quad import integrate
+from .casimir import casimir_energy_S1, kk_casimir, kk_logdet_remainder
+from .alpha import alpha_inv_terms, s_geo, s_vac
+from .uncertainty import Estimate, propagate
+from .identify import ExpressionIndex, integer_relation
+from .precision import evaluate
+from .cache import cached, invalidate
+from .sections import memo, run_sections
+from .pipeline import Node, Pipeline
+from .parallel import run_grid
+
+__all__ = ["OPERATORS", "Spectrum", "spectrum", "lens_multiplicity", "heat_trace", "heat_trace_theta",
+           "heat_coefficients",
+           "LatticeZeta", "SpectralSum", "spectral_zeta", "TwistedZeta",
+           "eta_exact", "eta_function", "eta_invariant", "eta_scan",
+           "accelerated_sum", "convergence_study", "regulator_limit", "integrate",
+           "casimir_energy_S1", "kk_casimir", "kk_logdet_remainder",
+           "alpha_inv_terms", "s_geo", "s_vac", "Estimate", "propagate", "ExpressionIndex", "integer_relation", "evaluate",
+           "cached", "invalidate", "memo", "run_sections",
+           "Node", "Pipeline", "run_grid"]
@@ -0,0 +1,221 @@
+"""
+Каноническая формула α⁻¹ = S_vac: S_geo и поправки δ_Cas, δ_BB в одном месте.
+
+  S_geo(R) = F·R⁴ + B·R³ + T·R
+      F = Vol(S³×S¹) = 4π³ (фермионы; при нетривиальной спиновой структуре RP³ — 2π³)
+      B = Vol(L(p,1)) = 2π²/p (бозоны; p = 2 — Vol(RP³) = π²)
+      T = Sys(RP³) = π (топология)
+  δ_Cas = κ/S_geo,  δ_BB = C/(π⁴·S_geo²),  S_vac = S_geo − δ_Cas − δ_BB
+  (по умолчанию R = 1, κ = κ_Cas = 1/24, C = 1).
+
+Бэкенды:
+  "mp"      — mpmath при текущей mp.dps; скалярный результат запоминается на процесс
+              для каждой точности (rpft.sections.memo), массивы считаются поэлементно
+              (объектный массив mpf);
+  "float64" — NumPy: R, κ, C — скаляры или массивы (с трансляцией формы), так что скан
+              по (R, κ, C) — одна операция над массивами.
+backend=None: "float64", если хотя бы один из R, κ, C — числовой массив или список
+чисел, иначе "mp". Явные члены F, B, T (fermion=, boson=, systole=) заменяют
+стандартные — для проверок вида «Z_A = 2π³ вместо π²».
+
+solve(target, unknown) — обратная задача S_vac = target относительно R, κ или C по
+массивам target (например, выборкам CODATA с учётом σ): κ и C входят линейно и
+находятся в замкнутой форме, R — итерациями Галлея по аналитическим производным
+многочлена S_geo(R) с запасной бисекцией внутри вилки; возвращаются корни и
+оценки их ошибки.
+"""
+
+import numpy as np
+from mpmath import mp
+
+from .sections import memo
+
+BACKENDS = ("mp", "float64")
+SPINS = ("trivial", "nontrivial")
+
+
+def _backend(values, backend):
+    if backend is not None:
+        if backend not in BACKENDS:
+            raise ValueError(f"backend должен быть одним из {BACKENDS}, получено {backend!r}")
+        return backend
+    for x in values:
+        if isinstance(x, (np.ndarray, list, tuple)) and np.asarray(x).dtype != object:
+            return "float64"
+    return "mp"
+
+
+def _coefficients(spin, p, fermion, boson, systole, pi):
+    """(F, B, T) при данном π (mp.pi или np.pi)."""
+    if spin not in SPINS:
+        raise ValueError(f"spin должен быть одним из {SPINS}, получено {spin!r}")
+    F = (4 if spin == "trivial" else 2) * pi**3 if fermion is None else fermion
+    B = (pi**2 if p == 2 else 2 * pi**2 / p) if boson is None else boson
+    T = pi if systole is None else systole
+    return F, B, T
+
+
+def _terms(R, kappa, C, F, B, T, pi):
+    """(S_geo, δ_Cas, δ_BB, S_vac) — общая арифметика для mpf и массивов float64."""
+    S = F * R**4 + B * R**3 + T * R
+    delta_cas = kappa / S
+    delta_bb = C / (pi**4 * S**2)
+    return S, delta_cas, delta_bb, S - delta_cas - delta_bb
+
+
+@memo
+def _terms_mp(R, kappa, C, spin, p, fermion, boson, systole):
+    R = mp.mpf(R)
+    kappa = mp.mpf(1) / 24 if kappa is None else mp.mpf(kappa)
+    C = mp.mpf(C)
+    F, B, T = _coefficients(spin, p, fermion, boson, systole, mp.pi)
+    return _terms(R, kappa, C, F, B, T, mp.pi)
+
+
+def alpha_inv_terms(R=1, kappa=None, C=1, spin="trivial", p=2, backend=None,
+                    fermion=None, boson=None, systole=None):
+    """
+    (S_geo, δ_Cas, δ_BB, S_vac) при радиусе R, κ_Cas = kappa (None — 1/24) и коэффициенте C.
+
+    spin — спиновая структура RP³: "trivial" (F = 4π³) / "nontrivial" (F = 2π³)
+    p    — L(p,1) в бозонном члене B = 2π²/p
+    """
+    backend = _backend((R, kappa, C), backend)
+    if backend == "float64":
+        R = np.asarray(R, dtype=np.float64)
+        kappa = np.asarray(1 / 24 if kappa is None else kappa, dtype=np.float64)
+        C = np.asarray(C, dtype=np.float64)
+        F, B, T = _coefficients(spin, p, fermion, boson, systole, np.pi)
+        return tuple(x[()] for x in np.broadcast_arrays(*_terms(R, kappa, C, F, B, T, np.pi)))
+    extra = (spin, p, fermion, boson, systole)
+    if all(np.ndim(x) == 0 for x in (R, kappa, C)):
+        return _terms_mp(R, kappa, C, *extra)
+    cells = np.frompyfunc(lambda r, k, c: _terms_mp(r, k, c, *extra), 3, 1)(
+        np.asarray(R, dtype=object), np.asarray(kappa, dtype=object), np.asarray(C, dtype=object))
+    return tuple(np.frompyfunc(lambda t, i=i: t[i], 1, 1)(cells) for i in range(4))
+
+
+def s_geo(R=1, spin="trivial", p=2, backend=None, fermion=None, boson=None, systole=None):
+    """S_geo(R) = F·R⁴ + B·R³ + T·R (см. alpha_inv_terms)."""
+    return alpha_inv_terms(R, None, 1, spin, p, backend, fermion, boson, systole)[0]
+
+
+def s_vac(R=1, kappa=None, C=1, spin="trivial", p=2, backend=None,
+          fermion=None, boson=None, systole=None):
+    """α⁻¹ = S_vac = S_geo − κ/S_geo − C/(π⁴·S_geo²) (см. alpha_inv_terms)."""
+    return alpha_inv_terms(R, kappa, C, spin, p, backend, fermion, boson, systole)[3]
+
+
+# =============================================================================
+# Обратная задача: S_vac(R, κ, C) = target
+# =============================================================================
+UNKNOWNS = ("R", "kappa", "C")
+
+
+def _mask(x):
+    return np.asarray(x, dtype=bool)
+
+
+def _finite(x):
+    if x.dtype == object:
+        return np.asarray(np.frompyfunc(mp.isfinite, 1, 1)(x), dtype=bool)
+    return np.isfinite(x)
+
+
+def _solve_R(target, kappa, C, F, B, T, pi, R0, eps, max_iter):
+    """
+    Галлей по R с вилкой (0, hi]; массивы float64 или объектные массивы mpf одной формы.
+    Нечисловые target, κ, C (nan, ±inf) дают корень и ошибку nan.
+    """
+    pi4 = pi**4
+    # nan/inf не участвуют в поиске вилки: на их месте решается S_vac = 0
+    bad = ~(_finite(target) & _finite(kappa) & _finite(C))
+    nan = mp.nan if target.dtype == object else np.nan
+    if bad.any():
+        zero = R0 * 0
+        target, kappa, C = (np.where(bad, zero, x) for x in (target, kappa, C))
+
+    def f_derivs(R):
+        S = F * R**4 + B * R**3 + T * R
+        dS = 4 * F * R**3 + 3 * B * R**2 + T
+        d2S = 12 * F * R**2 + 6 * B * R
+        g = S - kappa / S - C / (pi4 * S**2)
+        dg = 1 + kappa / S**2 + 2 * C / (pi4 * S**3)
+        d2g = -2 * kappa / S**3 - 6 * C / (pi4 * S**4)
+        return g - target, dg * dS, d2g * dS**2 + dg * d2S, S
+
+    # S_vac(R) растёт при R > 0 и → −∞ при R → 0+: вилка (0, hi], hi — удвоением
+    lo = R0 * 0
+    hi = R0 * 0 + 1
+    for _ in range(1100):
+        low = _mask(f_derivs(hi)[0] < 0)
+        if not low.any():
+            break
+        lo = np.where(low, hi, lo)
+        hi = np.where(low, hi * 2, hi)
+    R = np.where((R0 > lo) & (R0 < hi), R0, (lo + hi) / 2)
+    active = np.ones(np.shape(R), dtype=bool)
+    for _ in range(max_iter):
+        f, df, d2f, S = f_derivs(R)
+        neg = _mask(f < 0)
+        lo = np.where(neg, R, lo)
+        hi = np.where(neg, hi, R)
+        step = 2 * f * df / (2 * df**2 - f * d2f)
+        new = R - step
+        # шаг на уровне округления принимается как есть (новая точка может совпасть с краем вилки)
+        done = _mask(abs(step) <= 4 * eps * abs(R))
+        new = np.where(done | _mask(new > lo) & _mask(new < hi), new, (lo + hi) / 2)
+        R = np.where(active, new, R)
+        active &= ~done
+        if not active.any():
+            break
+    f, df, _, S = f_derivs(R)
+    # |R − R*| ≤ (|f| + ошибка вычисления f)/|f′|, но не больше ширины вилки
+    err = (abs(f) + 8 * eps * S) / abs(df)
+    err = np.minimum(err, hi - lo)
+    if bad.any():
+        R, err = np.where(bad, nan, R), np.where(bad, nan, err)
+    return R, err
+
+
+def solve(target, unknown="R", R=1, kappa=None, C=1, spin="trivial", p=2, backend=None,
+          max_iter=50, fermion=None, boson=None, systole=None):
+    """
+    (корень, оценка ошибки) — значение unknown ∈ {"R", "kappa", "C"}, при котором S_vac = target.
+
+    target и остальные параметры — скаляры или массивы (форма результата — их общая
+    трансляция); для unknown = "R" аргумент R — начальное приближение. backend — как в
+    alpha_inv_terms (по target, R, κ, C): "float64" — одна векторная итерация по всем
+    элементам, "mp" — при текущей mp.dps (массивы — объектные).
+    Оценка ошибки учитывает невязку после итераций и ошибку округления при вычислении
+    S_vac (машинный эпсилон float64 или 2^−mp.prec).
+    """
+    if unknown not in UNKNOWNS:
+        raise ValueError(f"unknown должно быть одним из {UNKNOWNS}, получено {unknown!r}")
+    backend = _backend((target, R, kappa, C), backend)
+    if backend == "float64":
+        pi, eps, dtype = np.pi, np.finfo(np.float64).eps, np.float64
+        kappa = 1 / 24 if kappa is None else kappa
+    else:
+        pi, eps, dtype = mp.pi, mp.mpf(2) ** (-mp.prec), object
+        kappa = mp.mpf(1) / 24 if kappa is None else kappa
+        target, R, kappa, C = (np.frompyfunc(mp.mpf, 1, 1)(np.asarray(x, dtype=object))
+                               for x in (target, R, kappa, C))
+    target, R, kappa, C = np.broadcast_arrays(*(np.asarray(x, dtype=dtype) for x in (target, R, kappa, C)))
+    F, B, T = _coefficients(spin, p, fermion, boson, systole, pi)
+    if unknown == "R":
+        root, err = _solve_R(target, kappa, C, F, B, T, pi, R, eps, max_iter)
+    else:
+        S = F * R**4 + B * R**3 + T * R
+        delta_bb = C / (pi**4 * S**2)
+        delta_cas = kappa / S
+        if unknown == "kappa":
+            # S − κ/S − δ_BB = target → κ = S (S − δ_BB − target)
+            root = S * (S - delta_bb - target)
+            err = 4 * eps * S * (S + abs(target) + delta_bb)
+        else:
+            # S − δ_Cas − C/(π⁴S²) = target → C = π⁴S² (S − δ_Cas − target)
+            root = pi**4 * S**2 * (S - delta_cas - target)
+            err = 4 * eps * pi**4 * S**2 * (S + abs(target) + delta_cas)
+    return np.asarray(root, dtype=dtype)[()], np.asarray(err, dtype=dtype)[()]
+
@@ -0,0 +1,250 @@
+"""
+Бенчмарки горячих функций: сетка (точность × обрезание), сохранённый эталон, пороги регрессии.
+
+Набор — список Case: функция, сетка параметров и подготовка перед каждым замером
+(сброс кэшей процесса, чтобы мерить счёт, а не обращение к кэшу). Параметр dps
+сетки не передаётся функции — замер идёт под mp.workdps(dps). Дисковый кэш
+rpft.cache на время прогона отключается (RPFT_CACHE=0).
+
+Замер (как в asv / timeit): прогрев, затем repeat выборок по number вызовов,
+number подбирается так, чтобы выборка длилась не меньше min_time; в итоге —
+медиана и минимум времени одного вызова. Время подготовки в замер не входит.
+
+Эталон — JSON {"meta": ..., "results": {id: {...}}}. Регрессия: отношение медиан
+больше 1 + threshold (порог общий или свой у Case). В meta записывается
+калибровочный замер (фиксированный цикл mpf-операций) и окружение (Python, NumPy,
+mpmath, процессор). По умолчанию медианы масштабируются по калибровке, только если
+эталон снят на другой машине: окружение отличается или калибровки расходятся больше
+шума калибровки на одной машине (10–20 %, CALIBRATION_NOISE); --normalize /
+--no-normalize — принудительно.
+
+  python benchmarks.py                      — прогон и сравнение с эталоном
+  python benchmarks.py -k casimir --repeat 9
+  python benchmarks.py --save               — записать эталон заново
+  python benchmarks.py --json итог.json     — результаты и сравнение в JSON
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import time
+
+import mpmath
+import numpy as np
+from mpmath import mp
+
+DEFAULT_THRESHOLD = 0.25
+CALIBRATION_NOISE = 0.25  # разброс калибровки между прогонами на одной машине
+_ENVIRONMENT = ("python", "numpy", "mpmath", "machine", "processor")
+
+
+class Case:
+    """Бенчмарк func(**params) на сетке params = {имя: [значения]}; setup() — перед каждым вызовом."""
+
+    __slots__ = ("name", "func", "params", "setup", "threshold", "doc")
+
+    def __init__(self, name, func, params=None, setup=None, threshold=None, doc=""):
+        self.name = name
+        self.func = func
+        self.params = dict(params or {})
+        self.setup = setup
+        self.threshold = threshold
+        self.doc = doc
+
+    def points(self):
+        """[(id, kwargs)] — все точки сетки; id = "имя[p=v,...]"."""
+        keys = list(self.params)
+        out = []
+        for values in itertools.product(*(self.params[k] for k in keys)):
+            kwargs = dict(zip(keys, values))
+            label = ",".join(f"{k}={v}" for k, v in kwargs.items())
+            out.append((f"{self.name}[{label}]" if label else self.name, kwargs))
+        return out
+
+
+def _call(case, kwargs):
+    """Один вызов: (время, с) без учёта setup."""
+    kwargs = dict(kwargs)
+    dps = kwargs.pop("dps", None)
+    with mp.workdps(dps or mp.dps):
+        if case.setup is not None:
+            case.setup()
+        start = time.perf_counter()
+        case.func(**kwargs)
+        return time.perf_counter() - start
+
+
+def measure(case, kwargs, repeat=5, min_time=0.2):
+    """Медиана, минимум и разброс (MAD) времени одного вызова по repeat выборкам."""
+    first = _call(case, kwargs)
+    number = max(1, min(1000, int(min_time / max(first, 1e-9))))
+    samples = []
+    for _ in range(repeat):
+        samples.append(sum(_call(case, kwargs) for _ in range(number)) / number)
+    median = statistics.median(samples)
+    return {"median": median, "min": min(samples),
+            "mad": statistics.median(abs(s - median) for s in samples),
+            "repeat": repeat, "number": number}
+
+
+def calibrate(n=20000):
+    """Время фиксированного цикла mpf-операций при 15 знаках (с) — масштаб машины."""
+    with mp.workdps(15):
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            x = mp.mpf(0)
+            for m in range(1, n + 1):
+                x += mp.log(1 + mp.mpf(1) / m) * m
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(cases, pattern=None, repeat=5, min_time=0.2, verbose=True):
+    """Прогнать точки сетки, чей id содержит pattern; {"meta": ..., "results": ...}."""
+    saved_env = os.environ.get("RPFT_CACHE")
+    os.environ["RPFT_CACHE"] = "0"
+    meta = {"python": platform.python_version(), "numpy": np.__version__,
+            "mpmath": mpmath.__version__, "machine": platform.machine(),
+            "processor": platform.processor(), "calibration": calibrate(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+    results = {}
+    try:
+        for case in cases:
+            for key, kwargs in case.points():
+                if pattern and pattern not in key:
+                    continue
+                results[key] = measure(case, kwargs, repeat, min_time)
+                if verbose:
+                    r = results[key]
+                    print(f"  {key:<58} {_fmt(r['median'])}  (min {_fmt(r['min'])}, ×{r['number']})",
+                          flush=True)
+    finally:
+        if saved_env is None:
+            del os.environ["RPFT_CACHE"]
+        else:
+            os.environ["RPFT_CACHE"] = saved_env
+    return {"meta": meta, "results": results}
+
+
+def other_machine(current, baseline):
+    """Снят ли эталон на другой машине: окружение в meta или калибровка (сверх шума) различаются."""
+    a, b = current["meta"], baseline["meta"]
+    if any(a.get(key) != b.get(key) for key in _ENVIRONMENT):
+        return True
+    ratio = a["calibration"] / b["calibration"]
+    return not 1 / (1 + CALIBRATION_NOISE) <= ratio <= 1 + CALIBRATION_NOISE
+
+
+def calibration_scale(current, baseline, normalize=None):
+    """Множитель медиан текущего прогона; normalize=None — по other_machine."""
+    if normalize is None:
+        normalize = other_machine(current, baseline)
+    return baseline["meta"]["calibration"] / current["meta"]["calibration"] if normalize else 1
+
+
+def compare(current, baseline, cases=(), threshold=DEFAULT_THRESHOLD, normalize=None):
+    """
+    {id: {"ratio", "threshold", "status"}} — status: "regression" / "faster" / "ok" / "new".
+
+    ratio — отношение медиан; normalize=True — с поправкой на калибровку обоих прогонов,
+    False — без неё, None — с поправкой, если эталон снят на другой машине.
+    """
+    thresholds = {key: case.threshold for case in cases for key, _ in case.points()
+                  if case.threshold is not None}
+    scale = calibration_scale(current, baseline, normalize)
+    out = {}
+    for key, r in current["results"].items():
+        limit = thresholds.get(key, threshold)
+        base = baseline["results"].get(key)
+        if base is None:
+            out[key] = {"ratio": None, "threshold": limit, "status": "new"}
+            continue
+        ratio = r["median"] * scale / base["median"]
+        status = "regression" if ratio > 1 + limit else "faster" if ratio < 1 / (1 + limit) else "ok"
+        out[key] = {"ratio": ratio, "threshold": limit, "status": status}
+    return out
+
+
+def _fmt(seconds):
+    if seconds >= 1:
+        return f"{seconds:8.3f} s "
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.3f} ms"
+    return f"{seconds * 1e6:8.1f} µs"
+
+
+def format_comparison(current, comparison):
+    lines = [f"{'бенчмарк':<58} {'медиана':>11}  {'× эталон':>8}  итог"]
+    for key, c in comparison.items():
+        ratio = "—" if c["ratio"] is None else f"{c['ratio']:.2f}"
+        lines.append(f"{key:<58} {_fmt(current['results'][key]['median'])}  {ratio:>8}  {c['status']}")
+    counts = {s: sum(c["status"] == s for c in comparison.values())
+              for s in ("regression", "faster", "ok", "new")}
+    lines.append("итог: " + ", ".join(f"{s} {n}" for s, n in counts.items() if n))
+    return "\n".join(lines)
+
+
+def main(cases, baseline_path, argv=None, description=None):
+    """CLI набора бенчмарков; код возврата 1 при регрессии относительно эталона."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("-k", dest="pattern", help="только бенчмарки, чей id содержит подстроку")
+    parser.add_argument("--repeat", type=int, default=5, help="число выборок (5)")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="минимальная длительность выборки, с (0.2)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"допустимое замедление, доля ({DEFAULT_THRESHOLD})")
+    parser.add_argument("--baseline", default=baseline_path, help="файл эталона")
+    parser.add_argument("--normalize", action=argparse.BooleanOptionalAction, default=None,
+                        help="поправка на калибровку машины (по умолчанию — если эталон "
+                             "снят на другой машине)")
+    parser.add_argument("--save", action="store_true",
+                        help="записать результаты как эталон (с -k — обновить только выбранные)")
+    parser.add_argument("--json", metavar="FILE", help="записать результаты и сравнение в JSON")
+    parser.add_argument("--list", action="store_true", help="перечислить точки сетки и выйти")
+    args = parser.parse_args(argv)
+    if args.list:
+        for case in cases:
+            for key, _ in case.points():
+                print(f"{key:<58} {case.doc}")
+        return 0
+
+    current = run(cases, args.pattern, args.repeat, args.min_time)
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    comparison = {}
+    scale = 1
+    if baseline is not None:
+        scale = calibration_scale(current, baseline, args.normalize)
+        comparison = compare(current, baseline, cases, args.threshold, scale != 1)
+        print()
+        if scale != 1:
+            print(f"поправка на калибровку машины: ×{scale:.2f} (эталон {baseline['meta']['date']})")
+        print(format_comparison(current, comparison))
+    else:
+        print(f"\nэталон {args.baseline} не найден (--save, чтобы записать)")
+
+    if args.save:
+        saved = current
+        if baseline is not None and args.pattern:
+            saved = {"meta": baseline["meta"], "results": dict(baseline["results"])}
+            for key, r in current["results"].items():
+                saved["results"][key] = {**r, "median": r["median"] * scale, "min": r["min"] * scale,
+                                         "mad": r["mad"] * scale}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(saved, f, indent=1, ensure_ascii=False, sort_keys=True)
+            f.write("\n")
+        print(f"эталон записан: {args.baseline}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**current, "comparison": comparison}, f, indent=1, ensure_ascii=False)
+            f.write("\n")
+
+    if args.save:
+        return 0
+    return 1 if any(c["status"] == "regression" for c in comparison.values()) else 0
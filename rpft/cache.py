@@ -0,0 +1,304 @@
+"""
+Дисковый кэш результатов дорогих вычислений, адресуемый содержимым.
+
+@cached помечает функцию, значение которой зависит только от аргументов и mp.prec:
+ключ — SHA-256 от (имя функции, аргументы после подстановки умолчаний, mp.prec,
+версия кода). Версия кода — хэш исходного файла функции, всех модулей rpft, таблицы
+codata.json, выбранного издания CODATA и явного номера version=: правка формулы в
+скрипте или в ядре и смена издания делают старые записи недостижимыми, а при
+следующей записи той же функции они удаляются.
+
+Хранение: запись — <ключ>.json (описание значения; mpf — точно, как (знак, мантисса,
+порядок)) и массивы NumPy с числовым dtype в <ключ>.<i>.npy, которые читаются через
+np.load(mmap_mode="r") без копирования в память. Время последнего обращения —
+mtime файла .json; при превышении лимита размера удаляются давно не читанные
+записи (LRU). Запись атомарна (временный файл + os.replace), поэтому кэш
+безопасен для параллельных исполнителей rpft.parallel.
+
+Окружение: RPFT_CACHE=0 — отключить; RPFT_CACHE_DIR — каталог
+(по умолчанию $XDG_CACHE_HOME/rpft или ~/.cache/rpft); RPFT_CACHE_MB — лимит (512).
+Явная очистка: invalidate(func) / invalidate("имя") / invalidate().
+"""
+
+import functools
+import glob
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+from mpmath import mp
+
+from .constants import DATA as CODATA_PATH, edition
+
+_DEFAULT_LIMIT_MB = 512
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def cache_dir():
+    """Каталог кэша (создаётся при первой записи)."""
+    env = os.environ.get("RPFT_CACHE_DIR")
+    if env:
+        return env
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "rpft")
+
+
+def enabled():
+    return os.environ.get("RPFT_CACHE", "1") not in ("0", "", "off", "no")
+
+
+def _limit_bytes():
+    return int(float(os.environ.get("RPFT_CACHE_MB", _DEFAULT_LIMIT_MB)) * 2**20)
+
+
+# =============================================================================
+# Ключи
+# =============================================================================
+
+def _canonical(value):
+    """Аргумент → однозначное JSON-представление (mpf — точно, по мантиссе и порядку)."""
+    if hasattr(value, "_mpf_"):  # mpf и константы mpmath (mp.pi, …) при текущей точности
+        return ["mpf", *map(str, value._mpf_)]
+    if isinstance(value, (bool, str, type(None))):
+        return value
+    if isinstance(value, (int, np.integer)):
+        return ["int", str(int(value))]
+    if isinstance(value, (float, np.floating)):
+        return ["float", float(value).hex()]
+    if isinstance(value, (tuple, list)):
+        return [type(value).__name__, [_canonical(v) for v in value]]
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return ["ndarray", value.dtype.str, list(value.shape),
+                hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()]
+    raise TypeError(f"аргумент типа {type(value).__name__} не поддерживается ключом кэша")
+
+
+@functools.lru_cache(maxsize=None)
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _package_hash():
+    """Модули и данные rpft (*.py, codata.json) и выбранное издание CODATA (RPFT_CODATA)."""
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(_PACKAGE_DIR, "*.py"))) + [CODATA_PATH]:
+        digest.update(_file_hash(path).encode())
+    digest.update(f"CODATA {edition().name}".encode())
+    return digest.hexdigest()
+
+
+def _function_name(func):
+    module = func.__module__
+    if module == "__main__":
+        module = os.path.splitext(os.path.basename(inspect.getsourcefile(func)))[0]
+    return f"{module}.{func.__qualname__}"
+
+
+def _code_version(func, version):
+    return hashlib.sha256(f"{_file_hash(inspect.getsourcefile(func))}:{_package_hash()}:{version}"
+                          .encode()).hexdigest()
+
+
+# =============================================================================
+# Значения: JSON + массивы .npy (mmap)
+# =============================================================================
+
+def _encode(value, arrays):
+    if hasattr(value, "_mpf_"):
+        sign, man, exp, bc = value._mpf_
+        return {"mpf": [sign, hex(man), exp, bc]}
+    if isinstance(value, mp.mpc):
+        return {"mpc": [_encode(value.real, arrays), _encode(value.imag, arrays)]}
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return {"objects": [list(value.shape), [_encode(v, arrays) for v in value.ravel()]]}
+        arrays.append(np.ascontiguousarray(value))
+        return {"npy": len(arrays) - 1}
+    if isinstance(value, tuple):
+        return {"tuple": [_encode(v, arrays) for v in value]}
+    if isinstance(value, list):
+        return {"list": [_encode(v, arrays) for v in value]}
+    if isinstance(value, (bool, str, type(None))):
+        return {"plain": value}
+    if isinstance(value, (int, np.integer)):
+        return {"int": str(int(value))}
+    if isinstance(value, (float, np.floating)):
+        return {"float": float(value).hex()}
+    raise TypeError(f"значение типа {type(value).__name__} не поддерживается кэшем")
+
+
+def _decode(node, path):
+    (kind, data), = node.items()
+    if kind == "mpf":
+        sign, man, exp, bc = data
+        return mp.make_mpf((sign, int(man, 16), exp, bc))
+    if kind == "mpc":
+        return mp.mpc(_decode(data[0], path), _decode(data[1], path))
+    if kind == "objects":
+        shape, items = data
+        out = np.empty(len(items), dtype=object)
+        for i, item in enumerate(items):
+            out[i] = _decode(item, path)
+        return out.reshape(shape)
+    if kind == "npy":
+        return np.load(f"{path}.{data}.npy", mmap_mode="r")
+    if kind == "tuple":
+        return tuple(_decode(v, path) for v in data)
+    if kind == "list":
+        return [_decode(v, path) for v in data]
+    if kind == "int":
+        return int(data)
+    if kind == "float":
+        return float.fromhex(data)
+    return data
+
+
+def _atomic_write(path, write):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _entries(root):
+    """[(путь без расширения, метаданные, размер в байтах, время обращения)] всех записей."""
+    out = []
+    for meta_path in glob.glob(os.path.join(root, "*.json")):
+        base = meta_path[:-len(".json")]
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            files = [meta_path] + glob.glob(f"{base}.*.npy")
+            size = sum(os.path.getsize(p) for p in files)
+            out.append((base, meta, size, os.path.getmtime(meta_path)))
+        except (OSError, ValueError):
+            continue  # запись удаляется параллельным процессом
+    return out
+
+
+def _remove(base):
+    for path in [f"{base}.json"] + glob.glob(f"{base}.*.npy"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _evict(root, limit):
+    entries = sorted(_entries(root), key=lambda e: e[3])
+    total = sum(e[2] for e in entries)
+    for base, _, size, _ in entries:
+        if total <= limit:
+            break
+        _remove(base)
+        total -= size
+
+
+def _load(base):
+    meta_path = f"{base}.json"
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        value = _decode(meta["value"], base)
+    except (FileNotFoundError, ValueError, KeyError):
+        return False, None
+    os.utime(meta_path)  # LRU: время последнего обращения
+    return True, value
+
+
+def _store(root, base, name, version, args, value):
+    os.makedirs(root, exist_ok=True)
+    # записи той же функции от прежней версии кода больше недостижимы
+    for old_base, meta, _, _ in _entries(root):
+        if meta.get("name") == name and meta.get("version") != version:
+            _remove(old_base)
+    arrays = []
+    meta = {"name": name, "version": version, "prec": mp.prec, "args": args,
+            "value": _encode(value, arrays)}
+    for i, array in enumerate(arrays):
+        _atomic_write(f"{base}.{i}.npy", lambda f, a=array: np.save(f, a))
+    _atomic_write(f"{base}.json", lambda f: f.write(json.dumps(meta, ensure_ascii=False).encode()))
+    _evict(root, _limit_bytes())
+
+
+# =============================================================================
+# Интерфейс
+# =============================================================================
+
+def cached(func=None, *, version=0):
+    """
+    Декоратор: результат func(*args, **kwargs) при текущем mp.prec берётся с диска.
+
+    version — явный номер версии формулы (увеличить, если результат меняется без правки
+              исходного файла функции или rpft, например из-за данных)
+    Значения: mpf, mpc, числа, строки, массивы NumPy (числовые — через mmap, только
+    чтение; объектные — поэлементно), кортежи и списки из них.
+    """
+    if func is None:
+        return functools.partial(cached, version=version)
+    signature = inspect.signature(func)
+    name = _function_name(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not enabled():
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        canonical = {k: _canonical(v) for k, v in bound.arguments.items()}
+        code = _code_version(func, version)
+        key = hashlib.sha256(json.dumps([name, canonical, mp.prec, code], sort_keys=True)
+                             .encode()).hexdigest()
+        root = cache_dir()
+        base = os.path.join(root, key)
+        hit, value = _load(base)
+        if hit:
+            return value
+        value = func(*args, **kwargs)
+        _store(root, base, name, code, canonical, value)
+        return value
+
+    wrapper.cache_name = name
+    return wrapper
+
+
+def invalidate(func=None):
+    """
+    Удалить записи: функции (декорированной или по имени «модуль.функция»)
+    или, при func=None, все. Возвращает число удалённых записей.
+    """
+    name = None if func is None else getattr(func, "cache_name", func)
+    removed = 0
+    for base, meta, _, _ in _entries(cache_dir()):
+        if name is None or meta.get("name") == name:
+            _remove(base)
+            removed += 1
+    return removed
+
+
+def cache_info():
+    """{имя функции: (число записей, байт)} по текущему каталогу кэша."""
+    info = {}
+    for _, meta, size, _ in _entries(cache_dir()):
+        count, total = info.get(meta.get("name"), (0, 0))
+        info[meta.get("name")] = (count + 1, total + size)
+    return info
+
+
+if __name__ == "__main__":
+    # python -m rpft.cache [clear [имя]]
+    if sys.argv[1:2] == ["clear"]:
+        print(f"удалено записей: {invalidate(sys.argv[2] if len(sys.argv) > 2 else None)}")
+    else:
+        for entry_name, (count, size) in sorted(cache_info().items()):
+            print(f"{entry_name}: {count} записей, {size / 1024:.1f} КиБ")
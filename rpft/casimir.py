@@ -0,0 +1,121 @@
+"""
+Casimir-энергии KK-башен на M³ × S¹ (M³ = S³, L(p,q)) через ряды Бесселя.
+
+Уровень λ_n на M³ даёт на S¹ длины L массивное поле с a_n = √λ_n:
+  E_{S¹}(a) = −(a/π) Σ_{m≥1} s_m K₁(L a m)/m,   s_m = 1 (P) или (−1)^m (AP),
+  E_{S¹}(0) = −π/(6L) (P),  +π/(12L) (AP),
+а башня — E = Σ_n d_n E_{S¹}(a_n). Нелокальный остаток ln det по S¹ —
+  Σ_n d_n · 2 ln(1 ∓ e^{−a_n L}).
+
+Строка Бесселя K₁(L a m)/m, m = 1…, вычисляется один раз на (a, L, M_max, точность)
+и кэшируется: её разделяют периодические и антипериодические условия, любые
+секторы с совпадающими массами и повторные вызовы с другим k_max. Ряд по m
+обрывается, когда геометрически мажорированный хвост (K₁(x) ~ e^{−x}) меньше
+10^(−mp.dps) от суммы, поэтому тяжёлые уровни стоят одну функцию Бесселя.
+cumulative=True возвращает частичные суммы по уровням — таблица сходимости по
+k_max получается из одного прохода. L=None — 2π при точности вызова.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from mpmath import mp
+
+from .heat import _levels
+from .profiling import profiled
+
+
+@lru_cache(maxsize=4096)
+@profiled
+def _bessel_row(a, L, M_max, prec):
+    """(K₁(L a m)/m для m = 1…M, r = e^{−La}); M ≤ M_max — точка обрыва по точности prec."""
+    with mp.workprec(prec):
+        x = L * a
+        r = mp.exp(-x)
+        eps = mp.mpf(2) ** (-prec)
+        row = []
+        total = mp.mpf(0)
+        for m in range(1, M_max + 1):
+            term = mp.besselk(1, x * m) / m
+            row.append(term)
+            total += term
+            # K₁(x(m+j))/(m+j) ≤ K₁(xm)/m · r^j: хвост ≤ term · r/(1 − r)
+            if r < 1 and term * r / (1 - r) < eps * total:
+                break
+        return tuple(row), r
+
+
+def _S1_length(L):
+    """Длина S¹: по умолчанию 2π при точности вызова (а не при импорте модуля)."""
+    return 2 * mp.pi if L is None else mp.mpf(L)
+
+
+@profiled
+def casimir_energy_S1(a, L=None, M_max=50, antiperiodic=False):
+    """E_{S¹}(a) одного массивного уровня (строка Бесселя берётся из кэша); L=None — 2π."""
+    a, L = mp.mpf(a), _S1_length(L)
+    if a == 0:
+        return mp.pi / (12 * L) if antiperiodic else -mp.pi / (6 * L)
+    row, _ = _bessel_row(a, L, M_max, mp.prec)
+    if antiperiodic:
+        total = mp.fsum(-t if m % 2 else t for m, t in enumerate(row, 1))
+    else:
+        total = mp.fsum(row)
+    return -(a / mp.pi) * total
+
+
+def _masses(spec):
+    """(a_n = √λ_n как mpf, d_n) для Spectrum или пары (λ, d)."""
+    _, mult, lam_mp = _levels(spec)
+    return [mp.sqrt(lam) for lam in lam_mp()], [int(d) for d in mult]
+
+
+def _tower(values, mult, cumulative):
+    if not cumulative:
+        return mp.fsum(d * v for v, d in zip(values, mult))
+    out = np.empty(len(values), dtype=object)
+    total = mp.mpf(0)
+    for i, (v, d) in enumerate(zip(values, mult)):
+        total += d * v
+        out[i] = total
+    return out
+
+
+@profiled
+def kk_casimir(spec, L=None, M_max=50, antiperiodic=False, cumulative=False):
+    """
+    Σ_n d_n E_{S¹}(√λ_n) по спектру (Spectrum или пара (λ, d)).
+
+    cumulative — вернуть массив частичных сумм по уровням (dtype=object, mpf)
+    """
+    masses, mult = _masses(spec)
+    values = [casimir_energy_S1(a, L=L, M_max=M_max, antiperiodic=antiperiodic) for a in masses]
+    return _tower(values, mult, cumulative)
+
+
+@profiled
+def kk_logdet_remainder(spec, L=None, antiperiodic=False, cumulative=False, ctx=None):
+    """
+    Σ_n d_n · 2 ln(1 ∓ e^{−√λ_n L}) (нулевая мода даёт −∞, как и одиночный уровень).
+
+    ctx — контекст уровня точности rpft.precision (float64 / double-double / mpmath):
+          все уровни считаются одним векторным проходом; только для cumulative=False.
+          None — mpmath при текущем mp.dps.
+    """
+    L = _S1_length(L)
+    if ctx is not None:
+        if cumulative:
+            raise ValueError("cumulative=True поддерживается только при ctx=None")
+        _, mult, lam_mp = _levels(spec)
+        lam = lam_mp()
+        if any(x == 0 for x in lam):
+            return -np.inf
+        a = ctx.sqrt(ctx.array(lam))
+        sign = 1 if antiperiodic else -1
+        values = 2 * ctx.log1p(sign * ctx.exp(-(a * ctx.array(L))))
+        # все слагаемые одного знака: fsum фиксирует нулевую потерю разрядов
+        return ctx.fsum([values[i] * int(d) for i, d in enumerate(mult)])
+    masses, mult = _masses(spec)
+    sign = 1 if antiperiodic else -1
+    values = [2 * mp.log(1 + sign * mp.exp(-a * L)) if a > 0 else mp.ninf for a in masses]
+    return _tower(values, mult, cumulative)
@@ -0,0 +1,141 @@
+"""
+Экспериментальные константы по изданиям CODATA (2018, 2022): значения, σ, корреляции.
+
+Данные — codata.json рядом с модулем; файл читается один раз при первом обращении,
+записи издания создаются один раз и дальше отдаются из памяти. Значения хранятся
+строками, как в таблицах CODATA, чтобы mpmath получал их без округления до float64.
+
+Издание: edition(name) — явно; edition() — из переменной окружения RPFT_CODATA,
+иначе default (у скрипта может быть своё: edition(default="2018")), иначе
+DEFAULT_EDITION. Так все проверки пересчитываются под другое издание одним
+переключателем: RPFT_CODATA=2018 python run_all.py.
+
+Constant — неизменяемая запись (__slots__): name, value, sigma, unit, description,
+edition; float(c), c.mpf(), c.pair() = (значение, σ) во float.
+convention(name) — принятые в проекте величины, не зависящие от издания (σ(α⁻¹) в
+проверках).
+"""
+
+import functools
+import json
+import os
+
+from mpmath import mp
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "codata.json")
+EDITIONS = ("2018", "2022")
+DEFAULT_EDITION = "2022"
+
+
+class Constant:
+    """Значение CODATA с погрешностью (строки, как в таблице); запись неизменяема."""
+
+    __slots__ = ("name", "value", "sigma", "unit", "description", "edition")
+
+    def __init__(self, name, value, sigma, unit="", description="", edition=None):
+        for field, x in zip(self.__slots__, (name, value, sigma, unit, description, edition)):
+            object.__setattr__(self, field, x)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Constant неизменяема: {self.name}.{name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Constant неизменяема: {self.name}.{name}")
+
+    def __float__(self):
+        return float(self.value)
+
+    def mpf(self):
+        """Значение при текущей mp.dps."""
+        return mp.mpf(self.value)
+
+    def pair(self):
+        """(значение, σ) во float — вход rpft.uncertainty.propagate."""
+        return float(self.value), float(self.sigma)
+
+    @property
+    def exact(self):
+        return float(self.sigma) == 0
+
+    def __repr__(self):
+        unit = f" {self.unit}" if self.unit else ""
+        return f"{self.name} = {self.value} ± {self.sigma}{unit} [CODATA {self.edition}]"
+
+
+class Edition:
+    """Константы одного издания CODATA: ed["m_e"], ed.inputs(...), ed.corr(...)."""
+
+    __slots__ = ("name", "constants", "correlations")
+
+    def __init__(self, name, constants, correlations):
+        self.name = name
+        self.constants = constants
+        self.correlations = correlations
+
+    def __getitem__(self, name):
+        try:
+            return self.constants[name]
+        except KeyError:
+            raise KeyError(f"нет константы {name!r} в CODATA {self.name}") from None
+
+    def __contains__(self, name):
+        return name in self.constants
+
+    def __iter__(self):
+        return iter(self.constants)
+
+    def correlation(self, a, b):
+        """Коэффициент корреляции a и b (1 при a = b, 0 — если не указан)."""
+        if a == b:
+            return 1.0
+        return self.correlations.get((a, b), self.correlations.get((b, a), 0.0))
+
+    def inputs(self, *names):
+        """{имя: (значение, σ)} — входы для rpft.uncertainty.propagate."""
+        return {name: self[name].pair() for name in names}
+
+    def corr(self, *names):
+        """{(имя₁, имя₂): r} для пар из names — аргумент corr= у propagate."""
+        return {(a, b): r for (a, b), r in self.correlations.items() if a in names and b in names}
+
+    def __repr__(self):
+        return f"Edition(CODATA {self.name}, {len(self.constants)} констант)"
+
+
+@functools.lru_cache(maxsize=None)
+def _data():
+    with open(DATA, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _edition(name):
+    data = _data()
+    quantities, entry = data["quantities"], data["editions"][name]
+    constants = {key: Constant(key, value, sigma, *quantities[key], edition=name)
+                 for key, (value, sigma) in entry["values"].items()}
+    correlations = {(a, b): float(r) for a, b, r in entry.get("correlations", ())}
+    return Edition(name, constants, correlations)
+
+
+def edition(name=None, default=None):
+    """Издание CODATA: name, иначе RPFT_CODATA, иначе default, иначе DEFAULT_EDITION."""
+    name = str(name or os.environ.get("RPFT_CODATA") or default or DEFAULT_EDITION)
+    if name not in EDITIONS:
+        raise ValueError(f"издание CODATA должно быть одним из {EDITIONS}, получено {name!r}")
+    return _edition(name)
+
+
+def constant(name, edition_name=None, default=None):
+    """Запись Constant из издания edition(edition_name, default)."""
+    return edition(edition_name, default)[name]
+
+
+def inputs(*names, edition_name=None, default=None):
+    """{имя: (значение, σ)} во float — входы для rpft.uncertainty.propagate."""
+    return edition(edition_name, default).inputs(*names)
+
+
+def convention(name):
+    """Величина, принятая в проекте независимо от издания (строка), например σ(α⁻¹) проверок."""
+    return _data()["conventions"][name][0]
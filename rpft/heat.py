@@ -0,0 +1,323 @@
+"""
+Пакетное вычисление heat trace K(t) = Σ d_n exp(−t λ_n).
+
+Один вызов считает K для массива t и нескольких спектров сразу. Бэкенд выбирается
+по требуемому числу значащих цифр `digits`:
+  digits ≤ 15               → NumPy float64 (матрица exp(−t λ) × вектор d)
+  digits ≤ точность longdouble → NumPy longdouble
+  иначе                     → mpmath при mp.workdps(digits + запас), с обрывом
+                               суммы, когда оценка хвоста e^{−tλ}·Σ|d| по
+                               оставшимся уровням меньше 10^(−digits) от K
+Члены положительны, поэтому ошибка округления относительная и не накапливается.
+
+heat_coefficients извлекает коэффициенты a_k асимптотики (4πt)^{d/2} K(t) = Σ a_k t^k
+взвешенным МНК по плотной сетке t: K считается одним пакетным вызовом, известные
+младшие коэффициенты вычитаются до перехода к float64, ошибка — статистическая
+(ковариация МНК) плюс систематическая (разность с подгонкой на степень выше).
+"""
+
+from itertools import accumulate
+
+import numpy as np
+from mpmath import mp
+
+from .profiling import profiled
+from .spectra import Spectrum
+
+# Предел на число элементов матрицы exp(−t λ) в одном блоке (≈ 32 МБ float64)
+_CHUNK = 1 << 22
+
+# Дополнительные разряды mpmath сверх запрошенных
+_GUARD_DIGITS = 5
+
+
+def backend_for(digits):
+    """Имя бэкенда, достаточного для `digits` значащих цифр."""
+    if digits <= 15:
+        return "float64"
+    if digits <= np.finfo(np.longdouble).precision:
+        return "longdouble"
+    return "mpmath"
+
+
+def _levels(spec):
+    """
+    (λ float64, d int64, λ mpf-геттер) для Spectrum или пары (λ, d).
+
+    Пара приводится к виду Spectrum: уровни с d = 0 отбрасываются, λ сортируются по
+    возрастанию (на этом строится обрыв суммы в _trace_mp).
+    """
+    if isinstance(spec, Spectrum):
+        return spec.eigenvalues, spec.mult, spec.eigenvalues_mp
+    lam, mult = spec
+    levels = sorted(((mp.mpf(x), x, d) for x, d in zip(lam, mult) if d != 0), key=lambda level: level[0])
+    lam_list = [x for _, x, _ in levels]
+    return (np.array([float(x) for x in lam_list]), np.asarray([d for _, _, d in levels]),
+            lambda: [mp.mpf(x) for x in lam_list])
+
+
+def _trace_numpy(lam, mult, t, dtype):
+    lam = lam.astype(dtype)
+    mult = mult.astype(dtype)
+    out = np.empty(len(t), dtype=dtype)
+    step = max(1, _CHUNK // max(1, len(lam)))
+    for i in range(0, len(t), step):
+        out[i:i + step] = np.exp(-np.outer(t[i:i + step], lam)) @ mult
+    return out
+
+
+def _trace_mp(lam_mp, mult, t, digits):
+    eps = mp.mpf(10) ** (-(digits + _GUARD_DIGITS))
+    mult = [int(d) for d in mult]
+    # rest[j] = Σ_{i≥j} |d_i|: при возрастающих λ хвост с уровня j ≤ rest[j]·e^{−tλ_j}
+    rest = list(accumulate(abs(d) for d in reversed(mult)))[::-1]
+    out = np.empty(len(t), dtype=object)
+    for i, tt in enumerate(t):
+        total = mp.mpf(0)
+        for j, (lam, d) in enumerate(zip(lam_mp, mult)):
+            weight = mp.exp(-tt * lam)
+            if j and rest[j] * weight < eps * abs(total):
+                break
+            total += d * weight
+        out[i] = total
+    return out
+
+
+@profiled
+def heat_trace(spectra, t, digits=15):
+    """
+    K(t) для спектра (или списка спектров) и скаляра или массива t.
+
+    spectra — Spectrum, пара (λ, d) или список таких объектов
+    digits  — требуемое число значащих цифр (определяет бэкенд, см. backend_for)
+
+    Возвращает скаляр, массив по t или массив формы (число спектров, число t).
+    На пути mpmath элементы — mpf (dtype=object).
+    """
+    single = isinstance(spectra, Spectrum) or (
+        isinstance(spectra, tuple) and len(spectra) == 2 and not isinstance(spectra[0], Spectrum))
+    spec_list = [spectra] if single else list(spectra)
+    scalar_t = np.ndim(t) == 0
+    t_list = [t] if scalar_t else list(t)
+
+    backend = backend_for(digits)
+    rows = []
+    if backend == "mpmath":
+        with mp.workdps(digits + _GUARD_DIGITS):
+            tt = [mp.mpf(x) for x in t_list]
+            for spec in spec_list:
+                _, mult, lam_mp = _levels(spec)
+                rows.append(_trace_mp(lam_mp(), mult, tt, digits))
+        out = np.array(rows, dtype=object)
+    else:
+        dtype = np.float64 if backend == "float64" else np.longdouble
+        tt = np.array([float(x) for x in t_list], dtype=dtype)
+        for spec in spec_list:
+            lam, mult, _ = _levels(spec)
+            rows.append(_trace_numpy(lam, mult, tt, dtype))
+        out = np.array(rows, dtype=dtype)
+
+    if single:
+        out = out[0]
+        return out[0] if scalar_t else out
+    return out[:, 0] if scalar_t else out
+
+
+def _wls(t, y, sigma, powers):
+    """Взвешенный МНК y ≈ Σ c_k t^k по степеням powers: (c, ковариация, χ² на степень свободы)."""
+    scale = t.max()
+    A = (t[:, None] / scale) ** np.asarray(powers)[None, :] / sigma[:, None]
+    b = y / sigma
+    coef, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
+    resid = b - A @ coef
+    dof = max(1, len(t) - len(powers))
+    chi2 = float(resid @ resid) / dof
+    cov = np.linalg.pinv(A.T @ A)
+    unscale = scale ** -np.asarray(powers, dtype=float)
+    return coef * unscale, cov * np.outer(unscale, unscale), chi2
+
+
+@profiled
+def heat_coefficients(spec, t, d=3, k_max=6, known=(), digits=15, zero_modes=0):
+    """
+    Коэффициенты a_0…a_{k_max} разложения (4πt)^{d/2} K(t) = Σ a_k t^k + O(t^{k_max+1}).
+
+    spec       — Spectrum или пара (λ, d); уровни должны покрывать t_min (проверяется)
+    t          — плотная сетка малых t (экспоненциальные поправки e^{−ℓ²/4t} от
+                 замкнутых геодезических длины ℓ должны быть ниже точности)
+    known      — известные младшие коэффициенты (a_0, a_1, …): вычитаются точно
+                 (в бэкенде heat_trace) до подгонки остальных
+    digits     — точность K (бэкенд heat_trace); веса МНК — 10^(−digits)·(4πt)^{d/2}K
+    zero_modes — число нулевых мод, отсутствующих в spec (асимптотика включает λ = 0)
+    Возвращает (a, err) — массивы float64 длины k_max + 1; для известных err = 0.
+    """
+    t_list = [float(x) for x in np.atleast_1d(t)]
+    known = list(known)
+    powers = list(range(len(known), k_max + 1))
+    if len(t_list) < len(powers) + 3:
+        raise ValueError(f"для {len(powers)} коэффициентов нужно не меньше {len(powers) + 3} точек t, "
+                         f"получено {len(t_list)}")
+    lam, mult, _ = _levels(spec)
+    K = heat_trace(spec, t_list, digits=digits)
+    t_min = min(t_list)
+    K_min = K[t_list.index(t_min)]
+    if mult[-1] * np.exp(-t_min * lam[-1]) > 10.0 ** (-digits) * float(K_min):
+        raise ValueError(f"спектр обрезан при λ = {lam[-1]:g}: при t = {t_min:g} хвост выше 10^(-{digits})")
+    if K.dtype == object:
+        with mp.workdps(digits + _GUARD_DIGITS):
+            Y = [(4 * mp.pi * mp.mpf(tt)) ** (mp.mpf(d) / 2) * (k + zero_modes) for tt, k in zip(t_list, K)]
+            rest = [y - mp.fsum(mp.mpf(a) * mp.mpf(tt) ** i for i, a in enumerate(known))
+                    for tt, y in zip(t_list, Y)]
+        Y = np.array([float(y) for y in Y])
+        y = np.array([float(r) for r in rest])
+    else:
+        tt = np.array(t_list, dtype=K.dtype)
+        Yk = (4 * np.pi * tt) ** (d / 2) * (K + zero_modes)
+        rest = Yk - sum(K.dtype.type(a) * tt**i for i, a in enumerate(known))
+        Y, y = Yk.astype(float), rest.astype(float)
+    t_arr = np.array(t_list)
+    sigma = 10.0 ** (-digits) * np.abs(Y)
+    coef, cov, chi2 = _wls(t_arr, y, sigma, powers)
+    # Систематика обрыва ряда: та же подгонка со степенью k_max + 1
+    coef_up, _, _ = _wls(t_arr, y, sigma, powers + [k_max + 1])
+    err = np.sqrt(np.diag(cov) * max(1.0, chi2)) + np.abs(coef - coef_up[:-1])
+    a = np.array([float(x) for x in known] + list(coef))
+    return a, np.concatenate([np.zeros(len(known)), err])
+
+
+# =============================================================================
+# Тета-представление (пуассоновское пересуммирование) для S³ и RP³
+# =============================================================================
+#
+# Для S³ и RP³ все спектры имеют вид  λ = (m² − c)/1,  d = α m² + β,  где m
+# пробегает положительную часть решётки h·(Z + a). Тогда
+#   K(t) = e^{t c} Σ_{m>0} (α m² + β) e^{−t m²}
+# и по формуле Пуассона (u = t h²)
+#   Σ_{j∈Z} e^{−u(j+a)²}        = √(π/u) Σ_k cos(2πka) e^{−π²k²/u}
+#   Σ_{j∈Z} (j+a)² e^{−u(j+a)²} = √π Σ_k cos(2πka) e^{−π²k²/u} (u^{−3/2}/2 − π²k² u^{−5/2})
+# Образ k=0 — вейлевский член; при малом t ряд по k сходится за O(1) членов.
+
+# (h, a, c, α, β) по (оператор, p, twist); уровни совпадают с rpft.spectra
+_THETA_LATTICE = {
+    ("scalar", 1, 0): (1, 0, 1, 1, 0),
+    ("scalar", 2, 0): (2, mp.mpf(1) / 2, 1, 1, 0),
+    ("scalar", 2, 1): (2, 0, 1, 1, 0),
+    ("coexact", 1, 0): (1, 0, 0, 2, -2),
+    ("coexact", 2, 0): (2, 0, 0, 2, -2),
+    ("coexact", 2, 1): (2, mp.mpf(1) / 2, 0, 2, -2),
+    ("dirac", 1, 0): (1, mp.mpf(1) / 2, 0, 2, -mp.mpf(1) / 2),
+    ("dirac", 2, 0): (1, mp.mpf(1) / 2, 0, 1, -mp.mpf(1) / 4),
+    ("dirac", 2, 1): (1, mp.mpf(1) / 2, 0, 1, -mp.mpf(1) / 4),
+}
+
+# Кратность нулевой моды (λ = 0) в тех же секторах
+_ZERO_MODES = {("scalar", 1, 0): 1, ("scalar", 2, 0): 1}
+
+
+def _image_sums(u, a, h, K_terms):
+    """
+    (Σ_Z m² e^{−tm²}, Σ_Z e^{−tm²}) по m ∈ h(Z+a) через образы |k| ≤ K_terms
+    и те же суммы модулей членов (масштаб ошибки округления при сокращении).
+    """
+    s0 = mp.mpf(0)
+    s2 = mp.mpf(0)
+    abs0 = mp.mpf(0)
+    abs2 = mp.mpf(0)
+    for k in range(0, K_terms + 1):
+        w = (1 if k == 0 else 2) * mp.cos(2 * mp.pi * k * a) * mp.exp(-mp.pi**2 * k**2 / u)
+        t0 = w * mp.sqrt(mp.pi / u)
+        t2 = w * mp.sqrt(mp.pi) * (u**(-1.5) / 2 - mp.pi**2 * k**2 * u**(-2.5)) * h**2
+        s0 += t0
+        s2 += t2
+        abs0 += abs(t0)
+        abs2 += abs(t2)
+    return s2, s0, abs2, abs0
+
+
+def _image_tail_bound(u, h, alpha, beta, K_terms):
+    """Оценка сверху отброшенных образов |k| > K_terms."""
+    k = K_terms + 1
+    g = lambda kk: 2 * mp.exp(-mp.pi**2 * kk**2 / u) * (
+        abs(alpha) * mp.sqrt(mp.pi) * (u**(-1.5) / 2 + mp.pi**2 * kk**2 * u**(-2.5)) * h**2
+        + abs(beta) * mp.sqrt(mp.pi / u))
+    r = g(k + 1) / g(k)
+    return g(k) / (1 - r) if r < 1 else mp.inf
+
+
+@profiled
+def heat_trace_theta(operator, t, p=1, twist=0, digits=15, method="auto", include_zero=True):
+    """
+    K(t) на S³ (p=1) или RP³ (p=2) через тета-представление с оценкой ошибки.
+
+    method — "image" (пересуммирование Пуассона, быстро при малом t),
+             "direct" (прямая сумма по уровням, быстро при большом t)
+             или "auto": image при t·h² < π (там образов нужно меньше, чем уровней).
+    Возвращает (K, оценка ошибки) в mpf при mp.workdps(digits + запас); для "image"
+    оценка включает округление при сокращении членов (велико при t·h² ≫ π).
+    """
+    key = (operator, p, twist % p if p > 1 else 0)
+    if key not in _THETA_LATTICE:
+        raise ValueError(f"тета-представление есть только для S³ и RP³, получено {key}")
+    h, a, c, alpha, beta = _THETA_LATTICE[key]
+    with mp.workdps(digits + _GUARD_DIGITS):
+        t = mp.mpf(t)
+        u = t * h**2
+        if method == "auto":
+            method = "image" if u < mp.pi else "direct"
+        D = (digits + _GUARD_DIGITS) * mp.log(10)
+        if method == "image":
+            K_terms = int(mp.ceil(mp.sqrt(D * u) / mp.pi))
+            s2, s0, abs2, abs0 = _image_sums(u, a, h, K_terms)
+            # Σ_{m>0} = (Σ_Z − f(0))/2; f(0) = β, если 0 лежит на решётке
+            f0 = beta if a == 0 else 0
+            value = (alpha * s2 + beta * s0 - f0) / 2
+            # усечение + округление: при u ≳ π члены ~ u^{−3/2} сокращаются до ~ e^{−u}
+            roundoff = (K_terms + 1) * mp.eps * (abs(alpha) * abs2 + abs(beta) * abs0 + abs(f0))
+            err = _image_tail_bound(u, h, alpha, beta, K_terms) / 2 + roundoff
+        elif method == "direct":
+            J = int(mp.ceil(mp.sqrt(D / u))) + 2
+            value = mp.mpf(0)
+            for j in range(0, J + 1):
+                m = h * (j + a)
+                if m > 0:
+                    value += (alpha * m**2 + beta) * mp.exp(-t * m**2)
+            m = h * (J + 1 + a)
+            g = (abs(alpha) * m**2 + abs(beta)) * mp.exp(-t * m**2)
+            r = mp.exp(-t * h**2 * (2 * (J + 1 + a) + 1)) * ((m + h) / m)**2
+            err = g / (1 - r)
+        else:
+            raise ValueError(f"method должен быть 'auto', 'image' или 'direct', получено {method!r}")
+        scale = mp.exp(t * c)
+        value *= scale
+        err *= scale
+        if not include_zero:
+            value -= _ZERO_MODES.get(key, 0)
+        return +value, +err
+
+
+@profiled
+def abel_remainder_S1(t, digits=15):
+    """
+    κ(t) = −(Σ_{m≥1} m e^{−tm} − 1/t²)/2 = −(1/(4 sh²(t/2)) − 1/t²)/2 без сокращений.
+
+    Ряд Бернулли: κ(t) = ½ Σ_{k≥1} (2k−1) B_{2k} t^{2k−2}/(2k)!  (= 1/24 − t²/480 + …),
+    сходится при |t| < 2π. Возвращает (κ, оценка ошибки усечения).
+    """
+    with mp.workdps(digits + _GUARD_DIGITS):
+        t = mp.mpf(t)
+        if abs(t) >= mp.pi:
+            # Вне области быстрой сходимости прямая формула не теряет разрядов
+            S = 1 / (4 * mp.sinh(t / 2)**2)
+            return +(-(S - 1 / t**2) / 2), mp.mpf(0)
+        eps = mp.mpf(10) ** (-(digits + _GUARD_DIGITS))
+        total = mp.mpf(0)
+        k = 1
+        while True:
+            term = (2 * k - 1) * mp.bernoulli(2 * k) * t**(2 * k - 2) / mp.factorial(2 * k) / 2
+            total += term
+            if k > 1 and abs(term) < eps * abs(total):
+                break
+            k += 1
+        # |B_{2k}|/(2k)! ~ 2/(2π)^{2k}: хвост мажорируется геометрической прогрессией
+        err = abs(term) * (t / (2 * mp.pi))**2 / (1 - (t / (2 * mp.pi))**2) * 2
+        return +total, +err
@@ -0,0 +1,246 @@
+"""
+Поиск замкнутой формы для числа: перебор по ограниченной грамматике и целочисленные соотношения.
+
+Грамматика: x ≈ r0 + (p/q)·Π b_i^{e_i}, где b_i — базис (по умолчанию π, ζ(3), log 2,
+S_geo), |e_i| ≤ max_exponent, 1 ≤ |p| ≤ max_numerator, 1 ≤ q ≤ max_denominator
+(p/q несократима), r0 — сдвиг из offsets (0, ±1, ...). Сложность выражения —
+Σ|e_i| + log₂(|p|·q) (+1 за ненулевой сдвиг).
+
+ExpressionIndex строит все значения (p/q)·Π b_i^{e_i} разом (массивы NumPy, миллионы
+кандидатов за доли секунды), убирает совпадающие значения (хэш — двоичное
+представление float64 без младших бит мантиссы; из равных остаётся самое простое
+выражение) и хранит их отсортированными: ближайшие к x находятся бинарным поиском
+(np.searchsorted), а не перебором. Ранжирование — по
+    score = log₁₀(относительная ошибка) + penalty·сложность,
+т. е. каждая единица сложности должна окупаться penalty десятичными знаками
+совпадения. Найденные формы перепроверяются в mpmath при текущей mp.dps.
+
+integer_relation / identify — PSLQ (mp.pslq, mp.identify): целочисленное
+соотношение a₀x + Σ a_i t_i + a_c = 0 по членам t_i (степени π, ζ(3), log 2, 1/S_geo)
+и формулы mpmath над базисом.
+"""
+
+import math
+from fractions import Fraction
+
+import numpy as np
+from mpmath import mp
+
+from .alpha import s_geo
+
+
+def default_basis():
+    """{имя: значение} при текущей mp.dps: π, ζ(3), log 2, S_geo."""
+    return {"π": +mp.pi, "ζ(3)": mp.zeta(3), "log2": mp.log(2), "S_geo": s_geo()}
+
+
+class Candidate:
+    """Найденное выражение: текст, значение (mpf), относительная ошибка, сложность, score."""
+
+    __slots__ = ("expression", "value", "error", "complexity", "score")
+
+    def __init__(self, expression, value, error, complexity, score):
+        self.expression = expression
+        self.value = value
+        self.error = error
+        self.complexity = complexity
+        self.score = score
+
+    def __repr__(self):
+        return f"Candidate({self.expression} = {mp.nstr(self.value, 15)}, ошибка {self.error:.2e})"
+
+
+def _rationals(max_numerator, max_denominator):
+    p, q = np.meshgrid(np.arange(1, max_numerator + 1), np.arange(1, max_denominator + 1), indexing="ij")
+    keep = np.gcd(p, q) == 1
+    p, q = p[keep], q[keep]
+    return np.concatenate([p, -p]), np.concatenate([q, q])
+
+
+def _power(name, e):
+    label = f"({name})" if any(op in name for op in "+-*/· ") else name
+    return label if e == 1 else f"{label}^{e}"
+
+
+def _offset(r0):
+    return str(int(r0)) if r0 == int(r0) else mp.nstr(r0, 6)
+
+
+class ExpressionIndex:
+    """
+    Отсортированный индекс значений (p/q)·Π b_i^{e_i} без повторов.
+
+    basis         — {имя: значение} (mpf или float; по умолчанию default_basis())
+    max_exponent  — граница |e_i|: число или {имя: граница}
+    """
+
+    def __init__(self, basis=None, max_exponent=3, max_numerator=32, max_denominator=32):
+        basis = default_basis() if basis is None else basis
+        self.names = list(basis)
+        self.basis = {name: mp.mpf(value) for name, value in basis.items()}
+        bounds = [max_exponent.get(name, 0) if isinstance(max_exponent, dict) else max_exponent
+                  for name in self.names]
+        # все векторы показателей (e_1, ..., e_k) и log Π b_i^{e_i}
+        grids = np.meshgrid(*(np.arange(-b, b + 1) for b in bounds), indexing="ij")
+        self.exponents = np.stack([g.ravel() for g in grids], axis=1).astype(np.int8)
+        logs = np.array([math.log(float(self.basis[name])) for name in self.names])
+        monomials = np.exp(self.exponents @ logs)
+        self.p, self.q = _rationals(max_numerator, max_denominator)
+        # кандидат k = (моном k // n_r, дробь k % n_r)
+        n_r = len(self.p)
+        values = (monomials[:, None] * (self.p / self.q)[None, :]).ravel()
+        complexity = (np.abs(self.exponents).sum(axis=1)[:, None]
+                      + np.log2(np.abs(self.p) * self.q)[None, :]).ravel()
+        self.size = values.size
+        # хэш значения: float64 без 12 младших бит мантиссы (~2·10⁻¹³ относительно)
+        keys = values.view(np.int64) >> 12
+        order = np.lexsort((complexity, keys))
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = keys[order[1:]] != keys[order[:-1]]
+        unique = order[first]
+        by_value = unique[np.argsort(values[unique], kind="stable")]
+        self.values = values[by_value]
+        self.complexity = complexity[by_value]
+        self.code = by_value.astype(np.int64)
+        self._n_r = n_r
+
+    def __len__(self):
+        return self.values.size
+
+    # --- выражения ----------------------------------------------------------
+    def expression(self, i):
+        """Текст выражения i-го (по значению) элемента индекса."""
+        m, r = divmod(int(self.code[i]), self._n_r)
+        p, q = int(self.p[r]), int(self.q[r])
+        num = [_power(n, e) for n, e in zip(self.names, self.exponents[m]) if e > 0]
+        den = [_power(n, -e) for n, e in zip(self.names, self.exponents[m]) if e < 0]
+        top = "·".join(([str(abs(p))] if abs(p) != 1 or not num else []) + num)
+        bottom = "·".join(([str(q)] if q != 1 else []) + den)
+        if bottom:
+            bottom = bottom if len(den) + (q != 1) == 1 else f"({bottom})"
+            text = f"{top}/{bottom}"
+        else:
+            text = top
+        return ("-" if p < 0 else "") + text
+
+    def evaluate(self, i):
+        """Значение i-го выражения в mpmath при текущей mp.dps."""
+        m, r = divmod(int(self.code[i]), self._n_r)
+        value = mp.mpf(int(self.p[r])) / int(self.q[r])
+        for name, e in zip(self.names, self.exponents[m]):
+            if e:
+                value *= self.basis[name] ** int(e)
+        return value
+
+    # --- запросы ------------------------------------------------------------
+    def nearest(self, x, k=10):
+        """Индексы k значений, ближайших к x (бинарный поиск по отсортированному индексу)."""
+        x = float(x)
+        pos = int(np.searchsorted(self.values, x))
+        lo, hi = max(pos - k, 0), min(pos + k, len(self))
+        window = np.arange(lo, hi)
+        return window[np.argsort(np.abs(self.values[window] - x), kind="stable")[:k]]
+
+    def search(self, x, k=5, offsets=(0,), penalty=0.5, rtol=None, window=64):
+        """
+        Лучшие по score выражения для x (список Candidate, по возрастанию score).
+
+        offsets — сдвиги r0: ищется x − r0 (формы вида 1 − 1/π²)
+        rtol    — отбросить кандидатов с относительной ошибкой больше rtol
+
+        Сначала score считается для window ближайших значений; лучший из них s ограничивает
+        ошибку любого более удачного кандидата: log₁₀(ошибка) < s (сложность ≥ 0). Все
+        значения в этом диапазоне (бинарный поиск) оцениваются векторно во float64, k
+        лучших на каждый сдвиг перепроверяются в mpmath.
+        """
+        x = mp.mpf(x)
+        xf = float(x)
+        scale = abs(xf) or 1.0
+        floor = np.finfo(np.float64).eps
+
+        def scores(idx, r0):
+            error = np.maximum(np.abs(r0 + self.values[idx] - xf) / scale, floor)
+            return np.log10(error) + penalty * (self.complexity[idx] + (1 if r0 else 0))
+
+        offsets = [float(r0) for r0 in offsets]
+        bound = min(scores(self.nearest(xf - r0, window), r0).min() for r0 in offsets)
+        tol = scale * 10.0 ** bound
+        if rtol is not None:
+            tol = min(tol, scale * rtol)
+        found = {}
+        for r0 in offsets:
+            lo = np.searchsorted(self.values, xf - r0 - tol)
+            hi = np.searchsorted(self.values, xf - r0 + tol, side="right")
+            idx = np.arange(lo, hi)
+            if idx.size > k:
+                idx = idx[np.argpartition(scores(idx, r0), k)[:k]]
+            for i in idx:
+                value = r0 + self.evaluate(i)
+                error = float(abs(value - x) / abs(x)) if x else float(abs(value))
+                if rtol is not None and error > rtol:
+                    continue
+                complexity = float(self.complexity[i]) + (1 if r0 else 0)
+                score = math.log10(max(error, 2.0 ** -mp.prec)) + penalty * complexity
+                text = self.expression(i)
+                if r0:
+                    text = f"{_offset(r0)} {'-' if text.startswith('-') else '+'} {text.lstrip('-')}"
+                # одно значение через разные сдвиги (2/3 = 1 − 1/3) — остаётся лучшее
+                key = mp.nstr(value, 12)
+                if key not in found or score < found[key].score:
+                    found[key] = Candidate(text, value, error, complexity, score)
+        return sorted(found.values(), key=lambda c: (c.score, c.complexity))[:k]
+
+    def count_within(self, x, rtol):
+        """Число различных значений индекса в пределах относительной ошибки rtol от x."""
+        x = float(x)
+        lo, hi = sorted((x * (1 - rtol), x * (1 + rtol)))
+        return int(np.searchsorted(self.values, hi, side="right") - np.searchsorted(self.values, lo))
+
+
+# =============================================================================
+# PSLQ
+# =============================================================================
+def relation_terms():
+    """Члены линейного соотношения по умолчанию: π, π², π⁴, ζ(3), log 2, 1/S_geo, 1/S_geo²."""
+    S = s_geo()
+    return {"π": +mp.pi, "π²": mp.pi**2, "π⁴": mp.pi**4, "ζ(3)": mp.zeta(3), "log2": mp.log(2),
+            "1/S_geo": 1 / S, "1/S_geo²": 1 / S**2}
+
+
+def integer_relation(x, terms=None, maxcoeff=1000, maxsteps=10**5, margin=10):
+    """
+    Целочисленное соотношение a₀·x + Σ a_i·t_i + a_c = 0 (mp.pslq) в виде текста x = ...; None — не найдено.
+
+    terms  — {имя: значение} членов t_i (по умолчанию relation_terms()); соотношение
+             линейно по t_i, поэтому степени и произведения базиса задаются отдельными членами
+    margin — соотношение принимается, только если Σ log₁₀|a_i| меньше mp.dps − margin:
+             иначе при данной точности PSLQ находит случайное соотношение
+    """
+    terms = relation_terms() if terms is None else terms
+    names = list(terms)
+    relation = mp.pslq([mp.mpf(x)] + [mp.mpf(terms[n]) for n in names] + [mp.mpf(1)],
+                       maxcoeff=maxcoeff, maxsteps=maxsteps)
+    if relation is None or relation[0] == 0:
+        return None
+    if sum(math.log10(abs(a)) for a in relation if a) >= mp.dps - margin:
+        return None
+    parts = []
+    for coeff, name in zip(relation[1:], names + [None]):
+        if coeff:
+            c = Fraction(-coeff, relation[0])
+            sign = "-" if c < 0 else "+"
+            c = abs(c)
+            if name is None:
+                text = str(c)
+            else:
+                text = name if c == 1 else f"({c})·{name}" if c.denominator != 1 else f"{c}·{name}"
+            parts.append((sign, text))
+    text = " ".join(f"{sign} {t}" for sign, t in parts)
+    return "x = " + (text[2:] if text.startswith("+") else "-" + text[2:])
+
+
+def identify(x, basis=None, tol=None, maxcoeff=1000):
+    """Формулы mp.identify для x над базисом (список строк, самые простые первыми)."""
+    basis = default_basis() if basis is None else basis
+    return mp.identify(x, {name: mp.mpf(v) for name, v in basis.items()},
+                       tol=tol, maxcoeff=maxcoeff, full=True)
@@ -0,0 +1,81 @@
+"""
+Параллельный прогон независимых задач сетки (оператор × обрезание, spin × BC, …).
+
+run_grid выполняет func(*args) для каждого набора аргументов в пуле процессов
+и возвращает результаты строго в порядке задач, так что вывод скриптов не зависит
+от числа ядер. Каждая задача считается при mp.dps вызывающего процесса (или явно
+заданном dps) и сообщает своё время счёта и pid исполнителя.
+
+Число процессов: аргумент workers, иначе переменная окружения RPFT_WORKERS,
+иначе число доступных процессу ядер. При workers = 1 задачи идут последовательно
+в текущем процессе.
+Процессы порождаются через fork (где он есть): функции из запущенного скрипта
+(__main__) доступны исполнителям без повторного импорта скрипта.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from mpmath import mp
+
+
+class TaskResult:
+    """Результат одной задачи: аргументы, значение, время счёта (с) и pid исполнителя."""
+
+    __slots__ = ("args", "value", "elapsed", "worker")
+
+    def __init__(self, args, value, elapsed, worker):
+        self.args = args
+        self.value = value
+        self.elapsed = elapsed
+        self.worker = worker
+
+    def __repr__(self):
+        return f"TaskResult(args={self.args}, elapsed={self.elapsed:.3f} с, worker={self.worker})"
+
+
+def default_workers():
+    """Число процессов по умолчанию: RPFT_WORKERS или число доступных ядер."""
+    env = os.environ.get("RPFT_WORKERS")
+    if env:
+        return max(1, int(env))
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _run_task(func, args, dps):
+    with mp.workdps(dps):
+        start = time.perf_counter()
+        value = func(*args)
+        elapsed = time.perf_counter() - start
+    return TaskResult(args, value, elapsed, os.getpid())
+
+
+def _context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else None)
+
+
+def run_grid(func, tasks, workers=None, dps=None):
+    """
+    [func(*args) for args in tasks] параллельно, результаты — TaskResult в порядке tasks.
+
+    func    — функция уровня модуля (передаётся исполнителям по ссылке)
+    tasks   — итерируемое наборов аргументов (кортежи; одиночное значение оборачивается)
+    workers — число процессов (по умолчанию default_workers())
+    dps     — точность mpmath в задачах (по умолчанию текущая mp.dps)
+    """
+    tasks = [args if isinstance(args, tuple) else (args,) for args in tasks]
+    if dps is None:
+        dps = mp.dps
+    if workers is None:
+        workers = default_workers()
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        return [_run_task(func, args, dps) for args in tasks]
+    n = len(tasks)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_context()) as pool:
+        return list(pool.map(_run_task, [func] * n, tasks, [dps] * n))
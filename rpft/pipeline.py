@@ -0,0 +1,238 @@
+"""
+Набор проверок rigorous/: именованные величины, пересчёт только устаревших узлов.
+
+Узел — именованная величина (κ_Cas, α⁻¹, C, …), которую печатают разделы одного
+скрипта (rpft.sections). Рёбер между узлами нет: скрипты не читают вывод друг друга,
+а общие величины (S_geo, κ_Cas, C) каждый берёт из ядра rpft. Поэтому эта связь
+представлена отпечатком: SHA-256 от (исходный файл скрипта, модули rpft и
+codata.json с выбранным изданием CODATA, разделы). Правка скрипта делает устаревшим
+его узлы, правка ядра или смена издания (RPFT_CODATA) — все узлы. Свежие узлы не
+пересчитываются — их вывод берётся из журнала.
+
+Устаревшие узлы выполняются отдельными процессами (python скрипт раздел ...),
+до workers одновременно, самые долгие (по времени прошлых прогонов) — первыми:
+полный пересчёт занимает около max(самый долгий узел, сумма времён / workers).
+
+Состояние и журналы — в <каталог кэша rpft>/pipeline (RPFT_CACHE_DIR), либо state_dir.
+Итог — словарь (JSON): статус, время и журнал каждого узла, самый долгий узел.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .cache import _file_hash, _package_hash, cache_dir
+from .parallel import default_workers
+
+_DEFAULT_ELAPSED = 1.0  # оценка времени узла без истории прогонов, с
+
+
+class Node:
+    """Именованная величина: скрипт и его разделы (пусто — весь скрипт)."""
+
+    __slots__ = ("name", "script", "sections", "doc")
+
+    def __init__(self, name, script, sections=(), doc=""):
+        self.name = name
+        self.script = script
+        self.sections = tuple(sections)
+        self.doc = doc
+
+    def __repr__(self):
+        return f"Node({self.name!r}, {self.script!r}, sections={self.sections})"
+
+
+class Pipeline:
+    """
+    Независимые узлы со скриптами в каталоге root.
+
+    nodes     — итерируемое Node (имена уникальны)
+    root      — каталог скриптов
+    state_dir — каталог состояния и журналов (по умолчанию <кэш rpft>/pipeline)
+    """
+
+    def __init__(self, nodes, root, state_dir=None):
+        self.nodes = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"узел {node.name!r} объявлен дважды")
+            self.nodes[node.name] = node
+        self.root = root
+        self.state_dir = state_dir or os.path.join(cache_dir(), "pipeline")
+
+    # -------------------------------------------------------------------------
+    # Отпечатки и состояние
+    # -------------------------------------------------------------------------
+
+    def fingerprints(self):
+        """{узел: отпечаток} по текущим исходникам."""
+        package = _package_hash()
+        prints = {}
+        for name, node in self.nodes.items():
+            payload = [_file_hash(os.path.join(self.root, node.script)), package, list(node.sections)]
+            prints[name] = hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+        return prints
+
+    def _state_path(self):
+        return os.path.join(self.state_dir, "state.json")
+
+    def log_path(self, name):
+        return os.path.join(self.state_dir, f"{name}.log")
+
+    def load_state(self):
+        try:
+            with open(self._state_path(), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_state(self, state):
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp = self._state_path() + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, self._state_path())
+
+    def select(self, targets=None):
+        """Имена узлов targets (по умолчанию — все) в порядке объявления."""
+        if not targets:
+            return list(self.nodes)
+        unknown = [t for t in targets if t not in self.nodes]
+        if unknown:
+            raise ValueError(f"неизвестные узлы: {unknown}")
+        return [name for name in self.nodes if name in targets]
+
+    def stale(self, targets=None, force=False):
+        """Устаревшие узлы среди целей (по умолчанию — всех)."""
+        names = self.select(targets)
+        if force:
+            return names
+        prints, state = self.fingerprints(), self.load_state()
+        return [name for name in names
+                if state.get(name, {}).get("fingerprint") != prints[name]
+                or state[name].get("status") != "ok"
+                or not os.path.exists(self.log_path(name))]
+
+    # -------------------------------------------------------------------------
+    # Выполнение
+    # -------------------------------------------------------------------------
+
+    def _execute(self, name):
+        node = self.nodes[name]
+        command = [sys.executable, os.path.join(self.root, node.script), *node.sections]
+        start = time.perf_counter()
+        with open(self.log_path(name), "w", encoding="utf-8") as log:
+            code = subprocess.call(command, cwd=self.root, stdout=log, stderr=subprocess.STDOUT)
+        return code, time.perf_counter() - start
+
+    def run(self, targets=None, force=False, workers=None, dry_run=False):
+        """
+        Пересчитать устаревшие узлы среди целей и вернуть итог.
+
+        targets — имена узлов (по умолчанию все)
+        force   — считать устаревшими все узлы
+        workers — число одновременных процессов (по умолчанию default_workers())
+        dry_run — только определить устаревшие узлы, ничего не выполняя
+        Итог: {"nodes": {имя: {"status", "elapsed", "fingerprint", "log", ...}},
+               "wall", "work", "longest", "longest_time", "ok"}.
+        Статусы: "fresh" (не устарел), "ran", "failed", "stale" (при dry_run).
+        """
+        names = self.select(targets)
+        stale = self.stale(targets, force)
+        prints, state = self.fingerprints(), self.load_state()
+        estimates = {name: state.get(name, {}).get("elapsed", _DEFAULT_ELAPSED) for name in names}
+        status = {name: ("stale" if name in stale else "fresh") for name in names}
+        elapsed = {name: 0.0 for name in names}
+        wall_start = time.perf_counter()
+
+        if stale and not dry_run:
+            os.makedirs(self.state_dir, exist_ok=True)
+            workers = max(1, min(workers or default_workers(), len(stale)))
+            # самые долгие — первыми: хвост прогона не ждёт одного долгого узла
+            queue = sorted(stale, key=lambda n: -estimates[n])
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(self._execute, name): name for name in queue}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    code, elapsed[name] = future.result()
+                    status[name] = "ran" if code == 0 else "failed"
+                    state[name] = {"fingerprint": prints[name], "elapsed": elapsed[name],
+                                   "status": "ok" if code == 0 else f"exit {code}",
+                                   "finished": time.time()}
+                    self._save_state(state)
+
+        times = {n: elapsed[n] if status[n] in ("ran", "failed") else estimates[n] for n in names}
+        longest = max(names, key=lambda n: times[n], default=None)
+        return {
+            "nodes": {name: {"script": self.nodes[name].script,
+                             "sections": list(self.nodes[name].sections),
+                             "status": status[name],
+                             "elapsed": elapsed[name] if status[name] in ("ran", "failed")
+                             else state.get(name, {}).get("elapsed"),
+                             "fingerprint": prints[name],
+                             "log": self.log_path(name)}
+                      for name in names},
+            "wall": time.perf_counter() - wall_start,
+            "work": sum(elapsed.values()),
+            "longest": longest,
+            "longest_time": times[longest] if longest else 0.0,
+            "ok": "failed" not in status.values(),
+        }
+
+
+def format_summary(summary):
+    """Итог run() в виде таблицы для терминала."""
+    lines = [f"{'узел':<22} {'статус':<8} {'время, с':>9}  скрипт [разделы]", "-" * 70]
+    for name, info in summary["nodes"].items():
+        t = "" if info["elapsed"] is None else f"{info['elapsed']:.2f}"
+        sections = f" [{' '.join(info['sections'])}]" if info["sections"] else ""
+        lines.append(f"{name:<22} {info['status']:<8} {t:>9}  {info['script']}{sections}")
+    lines.append("-" * 70)
+    lines.append(f"стена: {summary['wall']:.2f} с; сумма узлов: {summary['work']:.2f} с; "
+                 f"самый долгий узел: {summary['longest_time']:.2f} с ({summary['longest']})")
+    return "\n".join(lines)
+
+
+def main(pipeline, argv=None, description=None):
+    """
+    Командная строка набора узлов: [УЗЕЛ ...] [--force] [--dry-run] [--list] [--show УЗЕЛ]
+    [-j N] [--json] [--summary ФАЙЛ]. Код возврата 1, если узел упал.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("targets", nargs="*", metavar="NODE", help="узлы; по умолчанию все")
+    parser.add_argument("--force", action="store_true", help="пересчитать узлы независимо от отпечатков")
+    parser.add_argument("--dry-run", action="store_true", help="только показать устаревшие узлы")
+    parser.add_argument("--list", action="store_true", help="перечислить узлы")
+    parser.add_argument("--show", metavar="NODE", help="напечатать журнал (вывод) узла")
+    parser.add_argument("-j", "--workers", type=int, help="число одновременных процессов")
+    parser.add_argument("--json", action="store_true", help="итог в JSON на stdout")
+    parser.add_argument("--summary", metavar="FILE", help="записать итог в JSON-файл")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, node in pipeline.nodes.items():
+            print(f"{name:<22} {node.doc}")
+        return 0
+    if args.show:
+        if args.show not in pipeline.nodes:
+            parser.error(f"неизвестный узел {args.show!r}; узлы: {', '.join(pipeline.nodes)}")
+        if not os.path.exists(pipeline.log_path(args.show)):
+            parser.error(f"узел {args.show!r} ещё не выполнялся (нет журнала)")
+        with open(pipeline.log_path(args.show), encoding="utf-8") as f:
+            sys.stdout.write(f.read())
+        return 0
+    try:
+        summary = pipeline.run(args.targets or None, force=args.force, workers=args.workers,
+                               dry_run=args.dry_run)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=1)
+    print(json.dumps(summary, ensure_ascii=False, indent=1) if args.json else format_summary(summary))
+    return 0 if summary["ok"] else 1
@@ -0,0 +1,458 @@
+"""
+Политика точности: вычисление с заявленным числом верных цифр на самом дешёвом уровне.
+
+Уровни (по возрастанию стоимости):
+  float64       — NumPy, ~15 цифр; только элементарные функции (exp, log, log1p, sqrt, степени)
+  double-double — пары float64 (hi + lo) с компенсированной арифметикой (Dekker, Knuth), ~31 цифра,
+                  те же элементарные функции, векторизованно по массивам NumPy
+  mpmath        — mp.workdps(digits + запас + потеря на сокращениях); доступны все функции mpmath
+
+Вычисление пишется один раз как func(ctx): ctx.exp, ctx.log, ctx.log1p, ctx.sqrt, ctx.pi, ctx.array,
+ctx.fsum — общие для всех уровней; на уровне mpmath ctx пропускает любое имя mpmath
+(ctx.besselk, ctx.zeta, …), а на уровнях float64 / double-double обращение к нему
+означает «уровень не подходит» и вычисление поднимается выше.
+
+Проверка сокращений: ctx.fsum запоминает потерю разрядов log10(Σ|x_i| / |Σ x_i|).
+Уровень принимается, если его точность минус наибольшая потеря покрывает digits + guard;
+иначе вычисление повторяется на следующем уровне (на mpmath — с dps, увеличенным на потерю).
+Поэтому вычитания, где возможны сокращения, нужно проводить через ctx.fsum, а ln(1 + x)
+при малых x — через ctx.log1p.
+"""
+
+import math
+
+import numpy as np
+from mpmath import mp
+
+TIERS = ("float64", "double-double", "mpmath")
+
+# Число верных значащих цифр уровня без учёта сокращений
+_CAPACITY = {"float64": 15, "double-double": 31}
+
+# Наибольшее число повторов на уровне mpmath при растущей потере разрядов
+_MP_RETRIES = 4
+
+
+class TierUnsupported(Exception):
+    """Функция недоступна на данном уровне точности (нужен уровень выше)."""
+
+
+# =============================================================================
+# double-double
+# =============================================================================
+
+_SPLITTER = 134217729.0  # 2^27 + 1
+
+
+def _two_sum(a, b):
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+
+def _quick_two_sum(a, b):
+    s = a + b
+    return s, b - (s - a)
+
+
+def _split(a):
+    t = _SPLITTER * a
+    hi = t - (t - a)
+    return hi, a - hi
+
+
+def _two_prod(a, b):
+    p = a * b
+    ah, al = _split(a)
+    bh, bl = _split(b)
+    return p, ((ah * bh - p) + ah * bl + al * bh) + al * bl
+
+
+class DoubleDouble:
+    """
+    Число (или массив NumPy) hi + lo с |lo| ≤ ulp(hi)/2: ~106 бит мантиссы.
+
+    Сложение и умножение — без потери младшей половины (two_sum / two_prod),
+    деление — три шага уточнения частного; exp, log, sqrt — см. функции модуля.
+    """
+
+    __slots__ = ("hi", "lo")
+
+    def __init__(self, hi, lo=0.0):
+        self.hi = np.asarray(hi, dtype=np.float64)
+        self.lo = np.asarray(lo, dtype=np.float64) + np.zeros_like(self.hi)
+
+    @classmethod
+    def from_mpf(cls, values):
+        """Точное приближение mpf (или массива mpf) парой float64."""
+        flat = np.ravel(np.asarray(values, dtype=object))
+        with mp.workprec(max(mp.prec, 120)):
+            hi = np.array([float(mp.mpf(v)) for v in flat])
+            lo = np.array([float(mp.mpf(v) - h) for v, h in zip(flat, hi)])
+        shape = np.shape(values)
+        return cls(hi.reshape(shape), lo.reshape(shape))
+
+    @staticmethod
+    def _wrap(x):
+        if isinstance(x, DoubleDouble):
+            return x
+        if isinstance(x, mp.mpf) or (isinstance(x, np.ndarray) and x.dtype == object):
+            return DoubleDouble.from_mpf(x)
+        return DoubleDouble(x)
+
+    def to_mpf(self):
+        """mpf (или объектный массив mpf) с точностью не ниже 106 бит."""
+        with mp.workprec(max(mp.prec, 110)):
+            if self.hi.ndim == 0:
+                return mp.mpf(float(self.hi)) + mp.mpf(float(self.lo))
+            out = np.empty(self.hi.shape, dtype=object)
+            for idx in np.ndindex(self.hi.shape):
+                out[idx] = mp.mpf(float(self.hi[idx])) + mp.mpf(float(self.lo[idx]))
+            return out
+
+    def __float__(self):
+        return float(self.hi)
+
+    def __len__(self):
+        return len(self.hi)
+
+    def __getitem__(self, idx):
+        return DoubleDouble(self.hi[idx], self.lo[idx])
+
+    def __repr__(self):
+        return f"DoubleDouble({self.hi!r}, {self.lo!r})"
+
+    def __neg__(self):
+        return DoubleDouble(-self.hi, -self.lo)
+
+    def __abs__(self):
+        sign = np.where(self.hi < 0, -1.0, 1.0)
+        return DoubleDouble(sign * self.hi, sign * self.lo)
+
+    def __add__(self, other):
+        other = self._wrap(other)
+        s, e = _two_sum(self.hi, other.hi)
+        t, f = _two_sum(self.lo, other.lo)
+        s, e = _quick_two_sum(s, e + t)
+        return DoubleDouble(*_quick_two_sum(s, e + f))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-self._wrap(other))
+
+    def __rsub__(self, other):
+        return self._wrap(other) + (-self)
+
+    def __mul__(self, other):
+        other = self._wrap(other)
+        p, e = _two_prod(self.hi, other.hi)
+        e = e + (self.hi * other.lo + self.lo * other.hi)
+        return DoubleDouble(*_quick_two_sum(p, e))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = self._wrap(other)
+        q1 = self.hi / other.hi
+        r = self - other * q1
+        q2 = r.hi / other.hi
+        r = r - other * q2
+        q3 = r.hi / other.hi
+        q1, q2 = _quick_two_sum(q1, q2)
+        return DoubleDouble(q1, q2) + q3
+
+    def __rtruediv__(self, other):
+        return self._wrap(other) / self
+
+    def __pow__(self, n):
+        if isinstance(n, (int, np.integer)):
+            if n < 0:
+                return 1 / (self ** (-n))
+            result = DoubleDouble(np.ones_like(self.hi))
+            base = self
+            while n:
+                if n & 1:
+                    result = result * base
+                base = base * base
+                n >>= 1
+            return result
+        return dd_exp(dd_log(self) * n)
+
+    def ldexp(self, k):
+        """self · 2^k точно."""
+        return DoubleDouble(np.ldexp(self.hi, k), np.ldexp(self.lo, k))
+
+    def __lt__(self, other):
+        other = self._wrap(other)
+        return (self.hi < other.hi) | ((self.hi == other.hi) & (self.lo < other.lo))
+
+    def __gt__(self, other):
+        return self._wrap(other) < self
+
+
+def _dd_const(value):
+    return DoubleDouble.from_mpf(value)
+
+
+with mp.workprec(120):
+    _DD_LN2 = _dd_const(mp.ln2)
+    _DD_PI = _dd_const(mp.pi)
+
+# exp: аргумент делится на 2^_EXP_HALVINGS, ряд Тейлора для expm1, затем удвоения
+_EXP_HALVINGS = 10
+_EXP_TERMS = 10
+
+
+def dd_exp(x):
+    """e^x для DoubleDouble: редукция по ln 2, ряд для expm1 и удвоения s → 2s + s²."""
+    x = DoubleDouble._wrap(x)
+    k = np.rint(x.hi / float(_DD_LN2.hi))
+    r = (x - _DD_LN2 * k).ldexp(-_EXP_HALVINGS)
+    s = r
+    term = r
+    for n in range(2, _EXP_TERMS + 1):
+        term = term * r / n
+        s = s + term
+    for _ in range(_EXP_HALVINGS):
+        s = s.ldexp(1) + s * s
+    out = s + 1.0
+    return out.ldexp(k.astype(np.int64))
+
+
+# ln вблизи 1: 2 atanh z = 2 Σ z^{2k+1}/(2k+1) при |z| ≤ 0.05 (|x − 1| < 0.1), 14 членов ~ 10^{−36}
+_LOG_NEAR_ONE = 0.1
+_LOG_TERMS = 14
+
+
+def _select(mask, a, b):
+    return DoubleDouble(np.where(mask, a.hi, b.hi), np.where(mask, a.lo, b.lo))
+
+
+def _log_series(z):
+    z2 = z * z
+    s = z
+    power = z
+    for k in range(1, _LOG_TERMS):
+        power = power * z2
+        s = s + power / (2 * k + 1)
+    return s.ldexp(1)
+
+
+def dd_log(x):
+    """
+    ln x для DoubleDouble: шаг Ньютона y ← y + x e^{−y} − 1 от float64-приближения;
+    при x ≈ 1 — ряд 2 atanh((x − 1)/(x + 1)), сохраняющий относительную точность.
+    """
+    x = DoubleDouble._wrap(x)
+    y = DoubleDouble(np.log(x.hi))
+    far = y + x * dd_exp(-y) - 1.0
+    near = np.abs(x.hi - 1) < _LOG_NEAR_ONE
+    if not np.any(near):
+        return far
+    return _select(near, _log_series((x - 1.0) / (x + 1.0)), far)
+
+
+def dd_log1p(x):
+    """ln(1 + x) для DoubleDouble без потери разрядов при малых x (ряд 2 atanh(x/(x + 2)))."""
+    x = DoubleDouble._wrap(x)
+    near = np.abs(x.hi) < _LOG_NEAR_ONE
+    near_value = _log_series(x / (x + 2.0))
+    if np.all(near):
+        return near_value
+    return _select(near, near_value, dd_log(x + 1.0))
+
+
+def dd_sqrt(x):
+    """√x для DoubleDouble: один шаг Ньютона от float64-приближения."""
+    x = DoubleDouble._wrap(x)
+    s = np.sqrt(x.hi)
+    safe = np.where(s == 0, 1.0, s)
+    return DoubleDouble(s) + (x - DoubleDouble(s) * s) / (2 * safe)
+
+
+# =============================================================================
+# Контексты уровней
+# =============================================================================
+
+def _loss(total_abs, total):
+    """Потеря десятичных разрядов при сложении: log10(Σ|x| / |Σx|)."""
+    total_abs = np.asarray(total_abs, dtype=float)
+    total = np.abs(np.asarray(total, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        loss = np.where(total_abs == 0, 0.0,
+                        np.where(total == 0, np.inf, np.log10(total_abs / np.where(total == 0, 1, total))))
+    return float(np.max(loss)) if loss.size else 0.0
+
+
+class _Context:
+    """Общая часть: учёт потери разрядов в fsum."""
+
+    name = None
+
+    def __init__(self):
+        self.loss = 0.0
+
+    def _record(self, total_abs, total):
+        self.loss = max(self.loss, _loss(total_abs, total))
+
+    def __getattr__(self, name):
+        raise TierUnsupported(f"{name} недоступна на уровне {self.name}")
+
+
+class _Float64Context(_Context):
+    name = "float64"
+    pi = np.pi
+    exp = staticmethod(np.exp)
+    log = staticmethod(np.log)
+    log1p = staticmethod(np.log1p)
+    sqrt = staticmethod(np.sqrt)
+
+    @staticmethod
+    def array(values):
+        return np.array([float(v) for v in np.ravel(np.asarray(values, dtype=object))]).reshape(np.shape(values))
+
+    def fsum(self, terms):
+        """Σ terms (по первой оси для массивов): math.fsum — точно округлённая сумма."""
+        terms = np.asarray([np.asarray(t, dtype=float) for t in terms])
+        flat = terms.reshape(len(terms), -1)
+        total = np.array([math.fsum(col) for col in flat.T]).reshape(terms.shape[1:])
+        self._record(np.sum(np.abs(terms), axis=0), total)
+        return total if total.ndim else float(total)
+
+
+class _DoubleDoubleContext(_Context):
+    name = "double-double"
+    pi = _DD_PI
+    exp = staticmethod(dd_exp)
+    log = staticmethod(dd_log)
+    log1p = staticmethod(dd_log1p)
+    sqrt = staticmethod(dd_sqrt)
+
+    @staticmethod
+    def array(values):
+        return DoubleDouble._wrap(np.asarray(values, dtype=object))
+
+    def fsum(self, terms):
+        """Σ terms в double-double (парное сложение по первой оси)."""
+        terms = [DoubleDouble._wrap(t) for t in terms]
+        total_abs = sum(np.abs(t.hi) for t in terms)
+        while len(terms) > 1:
+            paired = [terms[i] + terms[i + 1] for i in range(0, len(terms) - 1, 2)]
+            if len(terms) % 2:
+                paired.append(terms[-1])
+            terms = paired
+        total = terms[0] if terms else DoubleDouble(0.0)
+        self._record(total_abs, total.hi)
+        return total
+
+
+def _elementwise(func):
+    ufunc = np.frompyfunc(func, 1, 1)
+
+    def apply(x):
+        return ufunc(x) if isinstance(x, np.ndarray) else func(x)
+    return apply
+
+
+class _MPContext(_Context):
+    name = "mpmath"
+
+    def __init__(self):
+        super().__init__()
+        self.exp = _elementwise(mp.exp)
+        self.log = _elementwise(mp.log)
+        self.log1p = _elementwise(mp.log1p)
+        self.sqrt = _elementwise(mp.sqrt)
+
+    def __getattr__(self, name):
+        return getattr(mp, name)
+
+    @property
+    def pi(self):
+        return +mp.pi
+
+    @staticmethod
+    def array(values):
+        out = np.empty(np.shape(values), dtype=object)
+        for idx in np.ndindex(out.shape):
+            out[idx] = mp.mpf(np.asarray(values, dtype=object)[idx])
+        return out
+
+    def fsum(self, terms):
+        """Σ terms через mp.fsum (по первой оси для массивов)."""
+        terms = list(terms)
+        if terms and isinstance(terms[0], np.ndarray):
+            stacked = np.array(terms, dtype=object)
+            total = np.empty(stacked.shape[1:], dtype=object)
+            total_abs = np.empty(stacked.shape[1:], dtype=object)
+            for idx in np.ndindex(total.shape):
+                column = [row[idx] for row in stacked]
+                total[idx] = mp.fsum(column)
+                total_abs[idx] = mp.fsum(column, absolute=True)
+            self._record(np.array([float(x) for x in total_abs.ravel()]),
+                         np.array([float(x) for x in total.ravel()]))
+            return total
+        total = mp.fsum(terms)
+        self._record(float(mp.fsum(terms, absolute=True)), float(total))
+        return total
+
+
+_CONTEXTS = {"float64": _Float64Context, "double-double": _DoubleDoubleContext, "mpmath": _MPContext}
+
+
+def _to_mpf(value):
+    """Результат уровня → mpf (кортежи и массивы — поэлементно)."""
+    if isinstance(value, tuple):
+        return tuple(_to_mpf(v) for v in value)
+    if isinstance(value, DoubleDouble):
+        out = value.to_mpf()
+        return out if isinstance(out, np.ndarray) else +out
+    if isinstance(value, np.ndarray):
+        out = np.empty(value.shape, dtype=object)
+        for idx in np.ndindex(value.shape):
+            out[idx] = mp.mpf(value[idx])
+        return out
+    return +mp.mpf(value)
+
+
+def evaluate(func, digits, tiers=TIERS, guard=2, report=False):
+    """
+    func(ctx) с digits верными значащими цифрами на первом подходящем уровне.
+
+    tiers  — допустимые уровни по возрастанию стоимости (подмножество TIERS)
+    guard  — запас цифр сверх digits
+    report — вернуть (значение, уровень, потеря разрядов)
+    Значение возвращается в mpf (кортежи и массивы — поэлементно).
+    """
+    loss = 0.0
+    for tier in tiers:
+        if tier not in _CONTEXTS:
+            raise ValueError(f"неизвестный уровень {tier!r}; ожидается один из {TIERS}")
+        if tier == "mpmath":
+            continue
+        if _CAPACITY[tier] < digits + guard:
+            continue
+        ctx = _CONTEXTS[tier]()
+        try:
+            value = func(ctx)
+        except TierUnsupported:
+            continue
+        # потеря, измеренная на дешёвом уровне, сразу учитывается в dps уровня mpmath
+        loss = max(loss, ctx.loss)
+        if _CAPACITY[tier] - ctx.loss >= digits + guard:
+            out = _to_mpf(value)
+            return (out, tier, ctx.loss) if report else out
+    if "mpmath" not in tiers:
+        raise ValueError(f"{digits} цифр недостижимы на уровнях {tuple(tiers)}")
+    for _ in range(_MP_RETRIES):
+        extra = int(math.ceil(loss)) if math.isfinite(loss) else 0
+        ctx = _MPContext()
+        with mp.workdps(digits + guard + extra):
+            value = func(ctx)
+        # точный ноль суммы (бесконечная потеря) повышением dps не исправить
+        if not math.isfinite(ctx.loss) or math.ceil(ctx.loss) <= extra:
+            break
+        loss = ctx.loss
+    out = _to_mpf(value)
+    return (out, "mpmath", ctx.loss) if report else out
@@ -0,0 +1,243 @@
+"""
+Профилирование скриптов по разделам и горячим функциям (включается явно).
+
+Включение: переменная окружения RPFT_PROFILE или флаг --profile [FILE] у скрипта
+с разделами (rpft.sections). Для каждого раздела и каждой функции под @profiled
+записываются время (полное и собственное, без вложенных замеров), число
+арифметических операций с mpf/mpc (+ − × ÷ ** и унарный минус на уровне Python;
+операции внутри libmp — например, в mp.besselk или mp.fsum — не считаются) и пик
+памяти (tracemalloc) относительно входа.
+
+Вывод — два файла:
+  FILE.json   — разделы, функции (вызовы, время, операции, пик) и дерево стеков;
+  FILE.folded — стеки в формате «скрипт;§2b;heat_trace мкс» (собственное время),
+                который читают flamegraph.pl, speedscope и inferno.
+RPFT_PROFILE=1 — файлы <скрипт>[.разделы].profile.* в текущем каталоге;
+RPFT_PROFILE=каталог — в этом каталоге; иначе значение — путь FILE (без расширения
+или с .json). Вне профилирования @profiled стоит одной проверки на вызов.
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from mpmath.ctx_mp_python import _mpc, _mpf
+
+_OPS = ("__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__",
+        "__truediv__", "__rtruediv__", "__pow__", "__rpow__", "__neg__")
+
+_ACTIVE = None  # текущий Profiler или None
+
+
+class _Frame:
+    __slots__ = ("key", "start", "ops", "mem", "peak", "child_wall", "child_ops")
+
+    def __init__(self, key, start, ops, mem):
+        self.key = key
+        self.start = start
+        self.ops = ops
+        self.mem = mem
+        self.peak = mem
+        self.child_wall = 0.0
+        self.child_ops = 0
+
+
+class Profiler:
+    """Сессия профилирования: стек замеров и агрегаты по путям стека."""
+
+    def __init__(self, root="rpft", memory=True):
+        self.root = root
+        self.memory = memory
+        self.ops = 0
+        self.stack = []
+        self.stats = {}  # путь стека (кортеж имён) → [вызовы, время, собственное, опер., собств. опер., пик]
+        self._saved = []
+
+    # --- счётчик операций mpf/mpc -------------------------------------------
+    def _count(self, method):
+        def counted(*args):
+            self.ops += 1
+            return method(*args)
+        return counted
+
+    def start(self):
+        global _ACTIVE
+        for cls in (_mpf, _mpc):
+            for name in _OPS:
+                if name in cls.__dict__:
+                    method = cls.__dict__[name]
+                    self._saved.append((cls, name, method))
+                    setattr(cls, name, self._count(method))
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _ACTIVE = self
+        return self
+
+    def stop(self):
+        global _ACTIVE
+        _ACTIVE = None
+        for cls, name, method in reversed(self._saved):
+            setattr(cls, name, method)
+        self._saved.clear()
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # --- замеры -------------------------------------------------------------
+    def _memory(self):
+        return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+
+    def enter(self, name):
+        current, peak = self._memory()
+        if self.stack:
+            parent = self.stack[-1]
+            parent.peak = max(parent.peak, peak)
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        key = (self.stack[-1].key if self.stack else ()) + (name,)
+        self.stack.append(_Frame(key, time.perf_counter(), self.ops, current))
+
+    def exit(self):
+        frame = self.stack.pop()
+        wall = time.perf_counter() - frame.start
+        ops = self.ops - frame.ops
+        frame.peak = max(frame.peak, self._memory()[1])
+        if self.stack:
+            parent = self.stack[-1]
+            parent.child_wall += wall
+            parent.child_ops += ops
+            parent.peak = max(parent.peak, frame.peak)
+        entry = self.stats.setdefault(frame.key, [0, 0.0, 0.0, 0, 0, 0])
+        entry[0] += 1
+        entry[1] += wall
+        entry[2] += wall - frame.child_wall
+        entry[3] += ops
+        entry[4] += ops - frame.child_ops
+        entry[5] = max(entry[5], frame.peak - frame.mem)
+
+    def frame(self, name):
+        return _Scope(self, name)
+
+    # --- отчёт --------------------------------------------------------------
+    def summary(self):
+        """{"sections": ..., "functions": ..., "stacks": ...}; разделы — пути длины 1."""
+        sections, functions, stacks = {}, {}, []
+        for key, (calls, wall, self_wall, ops, self_ops, peak) in self.stats.items():
+            record = {"calls": calls, "wall": wall, "self_wall": self_wall, "mpf_ops": ops,
+                      "self_mpf_ops": self_ops, "peak_bytes": peak}
+            stacks.append({"stack": list(key), **record})
+            if len(key) == 1:
+                sections[key[0]] = record
+                continue
+            f = functions.setdefault(key[-1], {"calls": 0, "wall": 0.0, "self_wall": 0.0,
+                                               "mpf_ops": 0, "self_mpf_ops": 0, "peak_bytes": 0})
+            # полное время рекурсивных/повторно вложенных вызовов не удваивается
+            if key[-1] not in key[:-1]:
+                f["wall"] += wall
+                f["mpf_ops"] += ops
+            f["calls"] += calls
+            f["self_wall"] += self_wall
+            f["self_mpf_ops"] += self_ops
+            f["peak_bytes"] = max(f["peak_bytes"], peak)
+        return {"sections": sections, "functions": functions, "stacks": stacks}
+
+    def folded(self):
+        """Строки «root;a;b мкс» — собственное время каждого пути стека."""
+        return [f"{';'.join((self.root,) + key)} {max(1, round(s[2] * 1e6))}"
+                for key, s in self.stats.items()]
+
+    def write(self, path, meta=None):
+        """Записать path.json и path.folded; вернуть (json, folded)."""
+        base = path[:-5] if path.endswith(".json") else path
+        json_path, folded_path = base + ".json", base + ".folded"
+        directory = os.path.dirname(json_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"meta": {"root": self.root, **(meta or {})}, **self.summary()},
+                      f, indent=1, ensure_ascii=False)
+            f.write("\n")
+        with open(folded_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.folded()) + "\n")
+        return json_path, folded_path
+
+    def format(self, top=15):
+        """Таблица разделов и top функций по собственному времени."""
+        summary = self.summary()
+        lines = [f"{'раздел':<24} {'время, с':>10} {'опер. mpf':>12} {'пик, МБ':>9}"]
+        for name, r in summary["sections"].items():
+            lines.append(f"{name:<24} {r['wall']:10.3f} {r['mpf_ops']:12d} {r['peak_bytes'] / 2**20:9.2f}")
+        functions = sorted(summary["functions"].items(), key=lambda kv: -kv[1]["self_wall"])[:top]
+        if functions:
+            lines.append("")
+            lines.append(f"{'функция':<40} {'вызовы':>7} {'время, с':>10} {'собств.':>9} {'опер. mpf':>12}")
+            for name, r in functions:
+                lines.append(f"{name:<40} {r['calls']:7d} {r['wall']:10.3f} {r['self_wall']:9.3f} "
+                             f"{r['mpf_ops']:12d}")
+        return "\n".join(lines)
+
+
+class _Scope:
+    __slots__ = ("profiler", "name")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.enter(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.exit()
+        return False
+
+
+def profiled(func=None, *, name=None):
+    """Декоратор: вызовы func — отдельные узлы стека, если профилирование включено."""
+    if func is None:
+        return functools.partial(profiled, name=name)
+    label = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _ACTIVE
+        if profiler is None:
+            return func(*args, **kwargs)
+        profiler.enter(label)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.exit()
+
+    return wrapper
+
+
+def active():
+    """Текущая сессия профилирования или None."""
+    return _ACTIVE
+
+
+def script_name():
+    """Имя запущенного скрипта без расширения (корень стеков профиля)."""
+    main = sys.modules.get("__main__")
+    return os.path.splitext(os.path.basename(getattr(main, "__file__", None) or "rpft"))[0]
+
+
+def output_path(option=None, sections=()):
+    """
+    Путь отчёта (без расширения) по флагу --profile или RPFT_PROFILE; None — выключено.
+
+    option — значение флага (None — флаг не задан, "" — задан без аргумента).
+    """
+    value = option if option is not None else os.environ.get("RPFT_PROFILE", "")
+    if option is None and value.lower() in ("", "0", "off", "no"):
+        return None
+    stem = script_name() + ("." + "_".join(sections) if sections else "") + ".profile"
+    if value in ("", "1", "on", "yes"):
+        return stem
+    if os.path.isdir(value):
+        return os.path.join(value, stem)
+    return value
@@ -0,0 +1,64 @@
+"""
+Адаптивные квадратуры по отрезку с контролем ошибки и пакетным подынтегральным.
+
+integrate(f, a, b) повышает степень правила, пока апостериорная оценка ошибки
+(экстраполяция разностей соседних степеней, как в mp.quad) не станет меньше tol:
+  gauss-legendre — 3·2^(k−1) узлов на степени k; для аналитических на отрезке
+                   функций ошибка падает экспоненциально, узлы кэшируются mpmath
+  tanh-sinh      — двойная экспоненциальная замена; узлы степени k содержат узлы
+                   степени k−1, поэтому на каждом шаге считаются только новые узлы,
+                   а особенности на концах отрезка допустимы
+f получает сразу список всех узлов степени и возвращает список значений — так
+подынтегральное, само являющееся суммой по спектру, считается одним проходом по
+уровням для всех узлов (рекуррентности по n, общие множители) вместо вызова на узел.
+"""
+
+from mpmath import mp
+from mpmath.calculus.quadrature import GaussLegendre, TanhSinh
+
+from .profiling import profiled
+
+RULES = {"gauss-legendre": GaussLegendre(mp), "tanh-sinh": TanhSinh(mp)}
+
+# Максимальная степень по умолчанию: 384 узла Гаусса–Лежандра, ~2^10 узлов tanh-sinh
+_MAX_DEGREE = {"gauss-legendre": 8, "tanh-sinh": 10}
+
+
+@profiled
+def integrate(f, a, b, method="gauss-legendre", tol=None, max_degree=None):
+    """
+    ∫_a^b f(x) dx с оценкой ошибки.
+
+    f          — пакетная функция: список узлов (mpf) -> список значений
+    method     — "gauss-legendre" (по умолчанию) или "tanh-sinh"
+    tol        — требуемая абсолютная ошибка (по умолчанию 2^(10 − mp.prec), как в mp.quad)
+    max_degree — предельная степень правила; если точность не достигнута, возвращается
+                 последняя оценка с её ошибкой
+    Возвращает (значение, оценка ошибки, число вычисленных узлов).
+    """
+    if method not in RULES:
+        raise ValueError(f"method должен быть одним из {tuple(RULES)}, получено {method!r}")
+    rule = RULES[method]
+    if max_degree is None:
+        max_degree = _MAX_DEGREE[method]
+    if tol is None:
+        tol = mp.ldexp(1, 10 - mp.prec)
+    prec = mp.prec
+    results = []
+    n_evals = 0
+    err = mp.inf
+    with mp.extraprec(20):
+        a, b = mp.mpf(a), mp.mpf(b)
+        for degree in range(1, max_degree + 1):
+            nodes = rule.get_nodes(a, b, degree, mp.prec)
+            values = iter(f([x for x, _ in nodes]))
+            n_evals += len(nodes)
+            # sum_next правила (для tanh-sinh — с учётом предыдущего уровня) по готовым значениям
+            results.append(rule.sum_next(lambda x: next(values), nodes, degree, mp.prec, results))
+            if degree > 1:
+                err = rule.estimate_error(results, prec, mp.ldexp(1, -prec))
+                if err <= tol:
+                    break
+    value = +results[-1]
+    # оценка mpmath бывает ниже точности вычисления: не меньше единицы последнего разряда
+    return value, max(+err, mp.ldexp(abs(value), -prec)), n_evals
@@ -0,0 +1,102 @@
+"""
+Скрипты rigorous/ как импортируемые модули: разделы, ленивые величины, точка входа.
+
+Скрипт объявляет разделы — функции без аргументов, которые печатают свой вывод
+и возвращают словарь результатов, — в SECTIONS = {"2b": section_2b, ...} и
+вызывает run_sections из main(); при импорте ничего не вычисляется и mp.dps не
+меняется. Величины, нужные нескольким разделам, — функции под @memo: считаются
+при первом обращении и запоминаются на процесс для каждой точности mp.prec, так
+что раздел, запущенный отдельно, досчитывает только то, что ему нужно.
+
+  python 02_zeta_compute.py          — все разделы по порядку
+  python 02_zeta_compute.py 4c 5     — только указанные (в порядке SECTIONS)
+  python 02_zeta_compute.py --list   — список разделов
+  python 02_zeta_compute.py --profile [FILE]   — время, операции mpf и пик памяти по
+                                       разделам и горячим функциям (rpft.profiling;
+                                       то же — RPFT_PROFILE=1)
+
+Из другого кода (каталог rigorous/ — пакет пространства имён):
+  mod = importlib.import_module("rigorous.02_zeta_compute")
+  mod.kappa_cas_gauge_KK_RP3_S1(30, 50)     # при текущем mp.dps вызывающего
+  mod.main(["4c"])                          # раздел с печатью при DPS скрипта
+"""
+
+import argparse
+import functools
+import sys
+import time
+
+from mpmath import mp
+
+from .profiling import Profiler, output_path, script_name
+
+
+def memo(func):
+    """func(*args, **kwargs) вычисляется один раз на процесс для каждой mp.prec (аргументы — хэшируемые)."""
+    values = {}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (mp.prec, args, tuple(sorted(kwargs.items())))
+        if key not in values:
+            values[key] = func(*args, **kwargs)
+        return values[key]
+
+    wrapper.cache_clear = values.clear
+    return wrapper
+
+
+def run_sections(sections, argv=None, dps=None, description=None, header=None, footer=None):
+    """
+    Выполнить разделы скрипта, выбранные в argv (по умолчанию — все), в порядке sections.
+
+    sections    — упорядоченный словарь {имя: функция раздела}
+    argv        — аргументы командной строки (None — sys.argv[1:])
+    dps         — mp.dps на время выполнения (None — текущая)
+    description — текст для --help
+    header, footer — текст, печатаемый до и после разделов (заголовок и итог скрипта)
+    Возвращает {имя: результат раздела}.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("sections", nargs="*", metavar="SECTION",
+                        help=f"разделы: {', '.join(sections)} (по умолчанию все)")
+    parser.add_argument("--list", action="store_true", help="перечислить разделы и выйти")
+    parser.add_argument("--profile", nargs="?", const="", metavar="FILE",
+                        help="профиль разделов и горячих функций в FILE.json и FILE.folded "
+                             "(по умолчанию — RPFT_PROFILE)")
+    args = parser.parse_args(argv)
+    if args.list:
+        for name, func in sections.items():
+            doc = (func.__doc__ or "").strip().splitlines()
+            print(f"{name:>8}  {doc[0] if doc else func.__name__}")
+        return {}
+    unknown = [name for name in args.sections if name not in sections]
+    if unknown:
+        parser.error(f"неизвестные разделы: {', '.join(unknown)}")
+    selected = [name for name in sections if not args.sections or name in args.sections]
+    profile = output_path(args.profile, args.sections)
+    profiler = None
+    if profile is not None:
+        profiler = Profiler(script_name()).start()
+    results = {}
+    try:
+        if header is not None:
+            print(header)
+        with mp.workdps(dps or mp.dps):
+            for name in selected:
+                if profiler is None:
+                    results[name] = sections[name]()
+                    continue
+                with profiler.frame(f"§{name}"):
+                    results[name] = sections[name]()
+        if footer is not None:
+            print(footer)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            sys.stdout.flush()
+            paths = profiler.write(profile, {"sections": selected, "dps": dps or mp.dps,
+                                             "date": time.strftime("%Y-%m-%d %H:%M:%S")})
+            print(profiler.format(), file=sys.stderr)
+            print(f"профиль: {paths[0]}, {paths[1]}", file=sys.stderr)
+    return results
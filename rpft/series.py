@@ -0,0 +1,216 @@
+"""
+Ускорение сходимости медленных рядов Σ_{n≥n0} f(n) с апостериорной оценкой ошибки.
+
+Типичный член ряда для ln det′ (m² ln(1 − 1/m²) + 1 и т.п.) убывает как рациональная
+функция n, поэтому частичные суммы S_N = S + c₁/N + c₂/N² + … Вместо сотен тысяч
+членов с ручным хвостом Σ 1/m^{2k} берутся несколько сотен частичных сумм и
+экстраполируются к N → ∞:
+  richardson — N-точечная экстраполяция Ричардсона (mp.richardson), O(N) операций;
+               точна для рядов вида Σ P(n)/Q(n) и их асимптотических аналогов
+  levin      — нелинейное u-преобразование Левина (mp.levin), подходит и для
+               логарифмической сходимости общего вида, но дороже (O(N²))
+Ошибка оценивается апостериорно: разность экстраполяций по всем N и по первым 3N/4
+частичным суммам плюс потеря точности на сокращениях.
+
+convergence_study строит таблицу сходимости по нескольким обрезаниям за один проход
+(частичные суммы в контрольных точках) и при желании оценивает предел.
+
+regulator_limit снимает регулятор: по значениям F(ε) на убывающей сетке ε подгоняет
+анзац «сингулярные степени + ln ε + константа + регулярные степени» и возвращает
+конечную часть при ε → 0.
+"""
+
+from mpmath import mp
+
+from .profiling import profiled
+
+METHODS = ("richardson", "levin")
+
+# Число частичных сумм по умолчанию
+_N_TERMS = {"richardson": 200, "levin": 100}
+
+
+def partial_sums(term, n0, n_terms):
+    """Список частичных сумм S_k = Σ_{n=n0}^{n0+k} term(n), k < n_terms (аргумент term — mpf)."""
+    sums = []
+    total = mp.mpf(0)
+    for n in range(n0, n0 + n_terms):
+        total += term(mp.mpf(n))
+        sums.append(total)
+    return sums
+
+
+def _levin(sums):
+    """Левин-u по частичным суммам; вес сокращений принимается равным 1."""
+    L = mp.levin(method="levin", variant="u")
+    value, _ = L.update_psum(sums)
+    return value, mp.mpf(1)
+
+
+def _extra_prec(method, n_terms):
+    # Веса Ричардсона растут как ~4^N: запас 3N бит; Левину — удвоенная точность
+    return 3 * n_terms if method == "richardson" else mp.prec
+
+
+def _extrapolate(sums, method):
+    """(предел, оценка ошибки) по частичным суммам; вызывать при повышенной точности."""
+    n_terms = len(sums)
+    transform = mp.richardson if method == "richardson" else _levin
+    value, weight = transform(sums)
+    coarse, _ = transform(sums[:n_terms - n_terms // 4])
+    noise = weight * abs(value) * mp.mpf(2) ** (-mp.prec)
+    return value, abs(value - coarse) + noise
+
+
+@profiled
+def accelerated_sum(term, n0=1, method="richardson", n_terms=None):
+    """
+    Σ_{n≥n0} term(n) по n_terms частичным суммам и экстраполяции к N → ∞.
+
+    method — "richardson" (по умолчанию, 200 членов) или "levin" (100 членов)
+    Возвращает (значение, апостериорная оценка ошибки) при текущем mp.dps.
+    Частичные суммы считаются с запасом точности: экстраполяция сокращает разряды.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method должен быть одним из {METHODS}, получено {method!r}")
+    if n_terms is None:
+        n_terms = _N_TERMS[method]
+    if n_terms < 8:
+        raise ValueError(f"n_terms должно быть не меньше 8, получено {n_terms}")
+    with mp.extraprec(_extra_prec(method, n_terms)):
+        sums = partial_sums(term, n0, n_terms)
+        value, err = _extrapolate(sums, method)
+    return +value, _error_floor(value, err)
+
+
+def _error_floor(value, err):
+    """Оценка ошибки не меньше единицы последнего разряда текущей точности."""
+    return max(+err, mp.mpf(2) ** (-mp.prec) * abs(value))
+
+
+def _add(total, term):
+    if isinstance(term, tuple):
+        return term if total is None else tuple(x + y for x, y in zip(total, term))
+    return term if total is None else total + term
+
+
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+def _round(x):
+    return tuple(+v for v in x) if isinstance(x, tuple) else +x
+
+
+class ConvergenceTable:
+    """
+    Таблица сходимости: частичные суммы values[i] по первым checkpoints[i] членам,
+    оценка предела limit и её ошибка error (None, если предел не оценивался).
+    Для рядов-кортежей values, limit и error — кортежи той же длины.
+    """
+
+    __slots__ = ("checkpoints", "values", "limit", "error")
+
+    def __init__(self, checkpoints, values, limit=None, error=None):
+        self.checkpoints = checkpoints
+        self.values = values
+        self.limit = limit
+        self.error = error
+
+    def __iter__(self):
+        return iter(zip(self.checkpoints, self.values))
+
+    def __getitem__(self, N):
+        """Частичная сумма по первым N членам (N — одна из контрольных точек)."""
+        return self.values[self.checkpoints.index(N)]
+
+    def __repr__(self):
+        return f"ConvergenceTable(checkpoints={self.checkpoints}, limit={self.limit}, error={self.error})"
+
+
+LIMITS = (None, "last") + METHODS
+
+
+@profiled
+def convergence_study(term, checkpoints, n0=1, limit=None):
+    """
+    Частичные суммы Σ_{n=n0}^{n0+N−1} term(n) для всех N из checkpoints за один проход.
+
+    term  — вклад n-го члена (n — целое); кортеж значений суммируется покомпонентно,
+            так что несколько рядов (например, P и AP) идут одним проходом
+    limit — оценка предела:
+              None         — не оценивать
+              "last"       — для экспоненциальной сходимости: последняя частичная сумма,
+                             ошибка — её разность с предпоследней контрольной точкой
+              "richardson" / "levin" — экстраполяция по первым ≤ 200/100 частичным суммам,
+                             как в accelerated_sum (степенная сходимость)
+    """
+    if limit not in LIMITS:
+        raise ValueError(f"limit должен быть одним из {LIMITS}, получено {limit!r}")
+    checkpoints = sorted({int(N) for N in checkpoints})
+    if not checkpoints or checkpoints[0] < 1:
+        raise ValueError(f"контрольные точки должны быть натуральными, получено {checkpoints}")
+    if limit == "last" and len(checkpoints) < 2:
+        raise ValueError("limit='last' требует хотя бы двух контрольных точек")
+    N_max = checkpoints[-1]
+    n_extrap = min(N_max, _N_TERMS[limit]) if limit in METHODS else 0
+    with mp.extraprec(_extra_prec(limit, n_extrap) if n_extrap else 0):
+        total = None
+        head = []
+        values = []
+        marks = iter(checkpoints)
+        mark = next(marks)
+        for i, n in enumerate(range(n0, n0 + N_max), 1):
+            total = _add(total, term(n))
+            if i <= n_extrap:
+                head.append(total)
+            if i == mark:
+                values.append(total)
+                mark = next(marks, None)
+        if limit == "last":
+            pairs = [(x, abs(x - y)) for x, y in zip(_as_tuple(values[-1]), _as_tuple(values[-2]))]
+        elif n_extrap:
+            heads = [_as_tuple(h) for h in head]
+            pairs = [_extrapolate([h[j] for h in heads], limit) for j in range(len(heads[0]))]
+    value = error = None
+    if limit is not None:
+        value = tuple(+v for v, _ in pairs)
+        error = tuple(_error_floor(v, e) for v, e in pairs)
+        if not isinstance(total, tuple):
+            value, error = value[0], error[0]
+    values = [_round(v) for v in values]
+    return ConvergenceTable(checkpoints, values, value, error)
+
+
+def regulator_limit(eps, values, singular=(-1,), log_term=False, regular=None):
+    """
+    Конечная часть F(ε) при ε → 0 по значениям values = F(eps).
+
+    Анзац: F(ε) = Σ_p a_p ε^p (p из singular) [+ c ln ε] + C + Σ_q r_q ε^q (q из regular).
+    regular по умолчанию — ε, ε², … столько, сколько позволяет число точек минус одна.
+    Коэффициенты — решение МНК (mp.qr_solve); ошибка — разность C с подгонкой,
+    в которой отброшены наибольшее ε и старшая регулярная степень.
+    Возвращает (C, оценка ошибки, словарь коэффициентов {p: a_p, "log": c, q: r_q}).
+    """
+    eps = [mp.mpf(e) for e in eps]
+    values = [mp.mpf(v) for v in values]
+    if len(eps) != len(values):
+        raise ValueError(f"длины eps и values различны: {len(eps)} и {len(values)}")
+    n_fixed = len(singular) + bool(log_term) + 1
+    if regular is None:
+        regular = tuple(range(1, len(eps) - n_fixed))
+    if len(eps) < n_fixed + len(regular) + 1:
+        raise ValueError(f"нужно не меньше {n_fixed + len(regular) + 1} точек, получено {len(eps)}")
+    keys = list(singular) + (["log"] if log_term else []) + [0] + list(regular)
+
+    def fit(points, keys):
+        rows = [[mp.log(e) if k == "log" else e**k for k in keys] for e, _ in points]
+        x, _ = mp.qr_solve(mp.matrix(rows), mp.matrix([v for _, v in points]))
+        return dict(zip(keys, x))
+
+    with mp.extraprec(mp.prec):
+        points = sorted(zip(eps, values))
+        coeffs = fit(points, keys)
+        coarse = fit(points[:-1], keys[:-1] if regular else keys)
+        err = abs(coeffs[0] - coarse[0])
+    return +coeffs[0], _error_floor(coeffs[0], err), {k: +v for k, v in coeffs.items()}
@@ -0,0 +1,266 @@
+"""
+Спектры операторов Лапласа-типа на S³ и линзовых пространствах L(p,q) = S³/Z_p.
+
+Операторы (R = 1):
+  scalar  — Δ₀:              λ_n = n(n+2),     d_n(S³) = (n+1)²,       n ≥ 0
+  coexact — Δ₁ на коэкз. 1-формах: λ_n = (n+1)², d_n(S³) = 2n(n+2),  n ≥ 1
+  dirac   — D²:              λ_n = (n+3/2)²,   d_n(S³) = 2(n+1)(n+2),  n ≥ 0
+
+Проекция на L(p,q) (Ikeda 1979, Bär 1996):
+  Уровень n на S³ раскладывается по SU(2)_L × SU(2)_R на V_a ⊗ V_b:
+    scalar:  V_{n/2} ⊗ V_{n/2}
+    coexact: V_{(n+1)/2} ⊗ V_{(n-1)/2}  ⊕  V_{(n-1)/2} ⊗ V_{(n+1)/2}   (*d = ±(n+1))
+    dirac:   V_{(n+1)/2} ⊗ V_{n/2}  (λ > 0)  ⊕  V_{n/2} ⊗ V_{(n+1)/2}  (λ < 0)
+  Генератор Z_p действует на весовой вектор (m₁, m₂) фазой
+    exp(iπ/p · Φ),  Φ = 2m₁(1+q) + 2m₂(1−q) + 2κ + σp,
+  где κ ∈ Z_p — голономия плоского U(1)-расслоения (twist), σ — spin-структура
+  (только для спиноров). Кратность на L(p,q) = число весов с Φ ≡ 0 (mod 2p) —
+  точное целое, без округления характеров.
+
+Для L(2,1) = RP³:
+  scalar, κ=0 → чётные n (d = (n+1)²);  scalar, κ=1 → нечётные n;
+  dirac, σ=0 → λ>0 на нечётных n, λ<0 на чётных n (спектр несимметричен по ветвям).
+Старые скрипты используют «правило чётности» (уровни S³, ограниченные чётными/нечётными n);
+оно воспроизводится через spectrum(op, n_max, p=1, parity="even"/"odd").
+"""
+
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+from mpmath import mp
+
+from .profiling import profiled
+
+OPERATORS = ("scalar", "coexact", "dirac")
+
+# Минимальный уровень n на S³
+_N_MIN = {"scalar": 0, "coexact": 1, "dirac": 0}
+
+# Знаменатель собственного значения: λ_n = num(n) / den
+_LAM_DEN = {"scalar": 1, "coexact": 1, "dirac": 4}
+
+
+def _check_operator(operator):
+    if operator not in OPERATORS:
+        raise ValueError(f"неизвестный оператор {operator!r}; ожидается один из {OPERATORS}")
+
+
+def _lam_num(operator, n):
+    if operator == "scalar":
+        return n * (n + 2)
+    if operator == "coexact":
+        return (n + 1) ** 2
+    return (2 * n + 3) ** 2
+
+
+def _branches(operator, n):
+    """Пары (2a, 2b) представлений V_a ⊗ V_b на уровне n (по ветвям)."""
+    if operator == "scalar":
+        return [(n, n)]
+    if operator == "coexact":
+        return [(n + 1, n - 1), (n - 1, n + 1)]
+    return [(n + 1, n), (n, n + 1)]
+
+
+def _spin_sign(operator, p, q, spin):
+    """σ в фазе Φ: для бозонов 0, для спиноров — выбранная spin-структура."""
+    if operator != "dirac":
+        return 0
+    if p % 2 == 1:
+        # При нечётном p spin-структура единственна: σ фиксирован чётностью Φ
+        return 1 if q % 2 == 0 else 0
+    if spin not in (0, 1):
+        raise ValueError(f"spin должен быть 0 или 1, получено {spin!r}")
+    return spin
+
+
+def _invariant_count(A, B, p, q, twist, sigma):
+    """
+    Число весов (m₁, m₂) в V_{A/2} ⊗ V_{B/2}, инвариантных относительно Z_p.
+
+    Веса: 2m₁ = A − 2i, 2m₂ = B − 2k, 0 ≤ i ≤ A, 0 ≤ k ≤ B.
+    Условие зависит только от (i mod p, k mod p), поэтому считаем по вычетам: O(p²·N),
+    вычеты k — одним массивом (p, …) на каждый вычет i.
+    """
+    base = A * (1 + q) + B * (1 - q) + 2 * twist + sigma * p
+    r = np.arange(p).reshape((p,) + (1,) * np.ndim(A))
+    cnt_i = np.where(A >= r, (A - r) // p + 1, 0)
+    cnt_k = np.where(B >= r, (B - r) // p + 1, 0)
+    phase_k = base - 2 * r * (1 - q)
+    total = np.zeros_like(A)
+    for ri in range(p):
+        ok = (phase_k - 2 * ri * (1 + q)) % (2 * p) == 0
+        total += cnt_i[ri] * (ok * cnt_k).sum(axis=0)
+    return total
+
+
+def lens_multiplicity(operator, n, p=1, q=1, spin=0, twist=0, branch=None):
+    """
+    Точные кратности уровней n оператора на L(p,q).
+
+    n      — целое или массив целых
+    spin   — spin-структура (0/1) для dirac при чётном p
+    twist  — κ ∈ Z_p, голономия exp(2πiκ/p) плоского U(1)-расслоения
+    branch — None (сумма ветвей), 0 или 1 (ветвь из _branches: для dirac 0 = λ>0, 1 = λ<0)
+    """
+    _check_operator(operator)
+    p, q = int(p), int(q)
+    if p < 1 or gcd(p, q) != 1:
+        raise ValueError(f"L(p,q) требует p ≥ 1 и gcd(p,q) = 1, получено p={p}, q={q}")
+    q %= p
+    twist = int(twist) % p
+    sigma = _spin_sign(operator, p, q, spin)
+    n = np.asarray(n, dtype=np.int64)
+    branches = _branches(operator, n)
+    if branch is not None:
+        branches = [branches[branch]]
+    mult = np.zeros(n.shape, dtype=np.int64)
+    for A, B in branches:
+        mult += _invariant_count(np.asarray(A), np.asarray(B), p, q, twist, sigma)
+    return np.where(n >= _N_MIN[operator], mult, 0)
+
+
+class _SectorLevels:
+    """
+    Все уровни n ≥ n_min(S³) одного сектора (оператор, L(p,q), spin, twist), включая d_n = 0.
+
+    Целочисленные массивы n, d_n, num(λ_n) растут удвоением и разделяются всеми
+    spectrum(...) этого сектора при любых обрезаниях. λ_n и ln λ_n в mpf кэшируются
+    по точности mp.prec и дорастают по мере надобности: повторные суммы (разные s,
+    разные обрезания, разные потребители) не пересчитывают ни кратности, ни логарифмы.
+    """
+
+    __slots__ = ("operator", "p", "q", "spin", "twist", "n", "mult", "lam_num", "_mp")
+
+    def __init__(self, operator, p, q, spin, twist):
+        self.operator = operator
+        self.p, self.q, self.spin, self.twist = p, q, spin, twist
+        self.n = np.zeros(0, dtype=np.int64)
+        self.mult = np.zeros(0, dtype=np.int64)
+        self.lam_num = np.zeros(0, dtype=np.int64)
+        self._mp = {}
+
+    def grow(self, n_max):
+        """Досчитать уровни до n_max включительно (не меньше чем удвоением)."""
+        n_min = _N_MIN[self.operator]
+        have = n_min + len(self.n) - 1
+        if have >= n_max:
+            return
+        top = max(n_max, 2 * have, 32)
+        n_new = np.arange(have + 1, top + 1, dtype=np.int64)
+        mult_new = lens_multiplicity(self.operator, n_new, p=self.p, q=self.q,
+                                     spin=self.spin, twist=self.twist)
+        self.n = np.concatenate([self.n, n_new])
+        self.mult = np.concatenate([self.mult, mult_new])
+        self.lam_num = np.concatenate([self.lam_num, _lam_num(self.operator, n_new)])
+        for arr in (self.n, self.mult, self.lam_num):
+            arr.setflags(write=False)
+
+    def mp_values(self, n, kind="lam"):
+        """λ_n (kind="lam") или ln λ_n (kind="log") как список mpf при текущей точности."""
+        idx = np.asarray(n) - _N_MIN[self.operator]
+        if len(idx) == 0:
+            return []
+        self.grow(_N_MIN[self.operator] + int(idx.max()))
+        vals = self._mp.setdefault((mp.prec, kind), [])
+        den = mp.mpf(_LAM_DEN[self.operator])
+        for i in range(len(vals), int(idx.max()) + 1):
+            lam = mp.mpf(int(self.lam_num[i])) / den
+            vals.append(lam if kind == "lam" else mp.log(lam))
+        return [vals[i] for i in idx]
+
+
+# Кэш секторов: (оператор, p, q, spin, twist) → _SectorLevels
+_SECTORS = {}
+
+
+def _sector(operator, p, q, spin, twist):
+    key = (operator, int(p), int(q), spin, int(twist))
+    if key not in _SECTORS:
+        sector = _SectorLevels(*key)
+        sector.grow(0)  # проверка аргументов до записи в кэш
+        _SECTORS[key] = sector
+    return _SECTORS[key]
+
+
+class Spectrum:
+    """
+    Усечённый спектр: уровни n, точные кратности d_n и λ_n = lam_num / lam_den.
+
+    Массивы только для чтения: объект кэшируется и разделяется между потребителями.
+    Значения в mpf берутся из общего кэша сектора (см. _SectorLevels), если он задан.
+    """
+
+    __slots__ = ("operator", "p", "q", "spin", "twist", "n", "mult", "lam_num", "lam_den", "_levels")
+
+    def __init__(self, operator, n, mult, lam_num, lam_den, p=1, q=1, spin=0, twist=0, levels=None):
+        self.operator = operator
+        self.p, self.q, self.spin, self.twist = p, q, spin, twist
+        self.n = n
+        self.mult = mult
+        self.lam_num = lam_num
+        self.lam_den = lam_den
+        self._levels = levels
+        for arr in (n, mult, lam_num):
+            arr.setflags(write=False)
+
+    def __len__(self):
+        return len(self.n)
+
+    def __repr__(self):
+        n_range = f"n={self.n[0]}..{self.n[-1]}" if len(self) else "пусто"
+        return (f"Spectrum({self.operator}, L({self.p},{self.q}), spin={self.spin}, "
+                f"twist={self.twist}, {n_range}, уровней={len(self)})")
+
+    @property
+    def eigenvalues(self):
+        """λ_n в float64."""
+        return self.lam_num / self.lam_den
+
+    def eigenvalues_mp(self):
+        """λ_n как список mpf (точно при текущем mp.dps)."""
+        if self._levels is not None:
+            return self._levels.mp_values(self.n, "lam")
+        den = mp.mpf(self.lam_den)
+        return [mp.mpf(int(v)) / den for v in self.lam_num]
+
+    def log_eigenvalues_mp(self):
+        """ln λ_n как список mpf (нулевая мода даёт −∞)."""
+        if self._levels is not None:
+            return self._levels.mp_values(self.n, "log")
+        return [mp.log(lam) for lam in self.eigenvalues_mp()]
+
+    def positive(self):
+        """Спектр без нулевых мод (для det′ и ζ)."""
+        keep = self.lam_num != 0
+        return Spectrum(self.operator, self.n[keep], self.mult[keep], self.lam_num[keep],
+                        self.lam_den, self.p, self.q, self.spin, self.twist, levels=self._levels)
+
+
+@lru_cache(maxsize=128)
+@profiled
+def spectrum(operator, n_max, p=1, q=1, spin=0, twist=0, n_min=None, parity=None):
+    """
+    Спектр оператора на L(p,q) для уровней n_min ≤ n ≤ n_max (уровни с d_n = 0 отброшены).
+
+    parity — "even"/"odd": дополнительно оставить только чётные/нечётные n
+             («правило чётности» старых скриптов при p=1).
+    Результат кэшируется: повторные вызовы с теми же аргументами бесплатны, а уровни
+    и их mpf-значения общие для всех обрезаний одного сектора.
+    """
+    _check_operator(operator)
+    if parity not in (None, "even", "odd"):
+        raise ValueError(f"parity должно быть 'even' или 'odd', получено {parity!r}")
+    if n_min is None:
+        n_min = _N_MIN[operator]
+    sector = _sector(operator, p, q, spin, twist)
+    sector.grow(n_max)
+    lo = max(n_min, _N_MIN[operator]) - _N_MIN[operator]
+    hi = max(n_max - _N_MIN[operator] + 1, lo)
+    n, mult = sector.n[lo:hi], sector.mult[lo:hi]
+    keep = mult > 0
+    if parity is not None:
+        keep &= n % 2 == (0 if parity == "even" else 1)
+    return Spectrum(operator, n[keep], mult[keep], sector.lam_num[lo:hi][keep], _LAM_DEN[operator],
+                    p=p, q=q % p if p > 1 else q, spin=spin, twist=twist % p, levels=sector)
@@ -0,0 +1,168 @@
+"""
+Спектры с непрерывной голономией θ плоского U(1)-расслоения (модель сдвига уровней).
+
+Голономия e^{iθ} сдвигает квантовое число уровня, не меняя его кратности:
+  λ_j(θ) = m_j(θ)² − c,   m_j(θ) = h·(j + a + νθ),   d_j = Σ_e β_e j^e,   j ≥ 0.
+Так устроены спектры 22_spectral_flow_derivation.py (n_eff = n + θ/π, ν = 1/π);
+на L(p,q) дискретные сектора κ ∈ Z_p с точными кратностями дают
+rpft.zeta.lattice_classes / spectral_zeta(..., twist=κ).
+
+При каждом θ спектр — объединение решёток, поэтому ζ(s, θ), ζ′(0, θ) и K(t, θ)
+берутся в замкнутой форме (rpft.zeta.LatticeZeta, rpft.heat), а производная по θ —
+аналитически:
+  ∂_θ ζ(s, θ)  = −2 s h ν Z(s + 1),   Z(w) = Σ_j d_j m_j (m_j² − c)^{−w},
+  ∂_θ ζ′(0, θ) = −2 h ν · FP_{w=1} Z(w)   (конечная часть в полюсе),
+  ∂_θ ζ(0, θ)  = −2 h ν · Res_{w=1} Z(w).
+Все методы принимают скаляр θ или массив θ и возвращают скаляр или массив.
+"""
+
+from math import comb
+
+import numpy as np
+from mpmath import mp
+
+from .heat import heat_trace
+from .profiling import profiled
+from .zeta import LatticeZeta
+
+
+def _grid(theta):
+    """(список θ, флаг скаляра)."""
+    if np.ndim(theta) == 0:
+        return [theta], True
+    return list(theta), False
+
+
+def _out(values, scalar):
+    if scalar:
+        return values[0]
+    out = np.empty(len(values), dtype=object)
+    out[:] = values
+    return out
+
+
+class TwistedZeta:
+    """
+    ζ(s, θ) = Σ_классы Σ_{j≥0} d_j (m_j(θ)² − c)^{−s},  m_j(θ) = h(j + a + νθ).
+
+    classes — список (h, a, ν, c, ((e, β_e), ...)), d_j = Σ β_e j^e
+    m_cut   — как в LatticeZeta: уровни с m < m_cut суммируются явно
+    """
+
+    def __init__(self, classes, m_cut=32):
+        self.classes = list(classes)
+        self.m_cut = m_cut
+
+    def _lattice(self, theta, extra_power=0):
+        """
+        Классы LatticeZeta при данном θ: d как многочлен от m (j = m/h − A, A = a + νθ),
+        умноженный на m^extra_power.
+        """
+        theta = mp.mpf(theta)
+        out = []
+        for h, a, nu, c, betas in self.classes:
+            h, nu = mp.mpf(h), mp.mpf(nu)
+            A = mp.mpf(a) + nu * theta
+            alphas = {}
+            for e, beta in betas:
+                # β (m/h − A)^e = β Σ_k C(e,k) h^{−k} (−A)^{e−k} m^k
+                for k in range(e + 1):
+                    alphas[k + extra_power] = (alphas.get(k + extra_power, 0)
+                                               + mp.mpf(beta) * comb(e, k) * h**(-k) * (-A)**(e - k))
+            out.append((h, A, c, tuple(sorted(alphas.items()))))
+        return out
+
+    def lattice(self, theta):
+        """LatticeZeta спектра при фиксированном θ."""
+        return LatticeZeta(self._lattice(theta), m_cut=self.m_cut)
+
+    def zeta(self, s, theta):
+        """ζ(s, θ) по сетке θ."""
+        thetas, scalar = _grid(theta)
+        return _out([self.lattice(th)(s) for th in thetas], scalar)
+
+    def value_at_zero(self, theta):
+        """ζ(0, θ)."""
+        thetas, scalar = _grid(theta)
+        return _out([self.lattice(th).value_at_zero() for th in thetas], scalar)
+
+    @profiled
+    def derivative_at_zero(self, theta):
+        """ζ′(0, θ) = −ln det′ по сетке θ."""
+        thetas, scalar = _grid(theta)
+        return _out([self.lattice(th).derivative_at_zero() for th in thetas], scalar)
+
+    def laurent(self, s0, theta):
+        """(вычеты, конечные части) ζ(s, θ) в точке s0 > 0 по сетке θ."""
+        thetas, scalar = _grid(theta)
+        pairs = [self.lattice(th).laurent(s0) for th in thetas]
+        return _out([r for r, _ in pairs], scalar), _out([f for _, f in pairs], scalar)
+
+    def _moment_lattices(self, theta):
+        """Для каждого класса: (h·ν, LatticeZeta для Z(w) = Σ d_j m_j (m_j² − c)^{−w})."""
+        rows = self._lattice(theta, extra_power=1)
+        return [(mp.mpf(h) * mp.mpf(nu), LatticeZeta([row], m_cut=self.m_cut))
+                for (h, _, nu, _, _), row in zip(self.classes, rows)]
+
+    def dtheta_zeta(self, s, theta):
+        """∂_θ ζ(s, θ) = −2 s h ν Z(s + 1) (аналитически)."""
+        thetas, scalar = _grid(theta)
+        s = mp.mpf(s)
+        vals = [mp.fsum(-2 * s * hn * Z(s + 1) for hn, Z in self._moment_lattices(th)) for th in thetas]
+        return _out(vals, scalar)
+
+    @profiled
+    def dtheta_derivative_at_zero(self, theta):
+        """∂_θ ζ′(0, θ) через конечную часть Z(w) в w = 1 (аналитически)."""
+        thetas, scalar = _grid(theta)
+        vals = [mp.fsum(-2 * hn * Z.laurent(1)[1] for hn, Z in self._moment_lattices(th)) for th in thetas]
+        return _out(vals, scalar)
+
+    def dtheta_value_at_zero(self, theta):
+        """∂_θ ζ(0, θ) через вычет Z(w) в w = 1."""
+        thetas, scalar = _grid(theta)
+        vals = [mp.fsum(-2 * hn * Z.laurent(1)[0] for hn, Z in self._moment_lattices(th)) for th in thetas]
+        return _out(vals, scalar)
+
+    def levels(self, theta, lam_max):
+        """(λ_j(θ), d_j) со всеми λ ≤ lam_max, отсортированные по λ (mpf, int)."""
+        theta = mp.mpf(theta)
+        out = []
+        for h, a, nu, c, betas in self.classes:
+            h, c = mp.mpf(h), mp.mpf(c)
+            A = mp.mpf(a) + mp.mpf(nu) * theta
+            j = 0
+            while True:
+                m = h * (j + A)
+                lam = m * m - c
+                if m > 0 and lam > lam_max:
+                    break
+                d = sum(beta * j**e for e, beta in betas)
+                if d != 0 and lam != 0:
+                    out.append((lam, int(d)))
+                j += 1
+        out.sort(key=lambda x: x[0])
+        return [lam for lam, _ in out], [d for _, d in out]
+
+    @profiled
+    def heat_trace(self, t, theta, digits=15):
+        """
+        K(t, θ) = Σ d_j e^{−t λ_j(θ)} по сетке θ и t: форма (число θ, число t) без скаляров.
+
+        Уровни обрезаются при t_min·λ > 2(digits + 5)·ln 10 — хвост ниже точности.
+        """
+        thetas, scalar_th = _grid(theta)
+        scalar_t = np.ndim(t) == 0
+        t_list = [t] if scalar_t else list(t)
+        t_min = min(mp.mpf(x) for x in t_list)
+        D = (digits + 5) * mp.log(10)
+        # удвоенная граница покрывает рост кратностей (ln d ≪ D)
+        lam_max = 2 * D / t_min + 10
+        rows = []
+        for th in thetas:
+            lam, d = self.levels(th, lam_max)
+            rows.append(heat_trace((lam, np.array(d, dtype=np.int64)), t_list, digits=digits))
+        out = np.array(rows, dtype=rows[0].dtype)
+        if scalar_t:
+            out = out[:, 0]
+        return out[0] if scalar_th else out
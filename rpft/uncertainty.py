@@ -0,0 +1,213 @@
+"""
+Распространение погрешностей входных констант на вычисляемые величины.
+
+Формула пишется один раз как func(ctx, **входы) и возвращает число или словарь
+{имя: величина}; ctx.exp, ctx.log, ctx.log1p, ctx.sqrt, ctx.pi — общие для обоих методов
+(как в rpft.precision).
+
+  "linear" — первый порядок: производные по всем входам сразу (прямой автодифф,
+             Dual — значение + градиент), σ² = gᵀ Σ g;
+  "mc"     — Монте-Карло: входы ~ N(значение, Σ) (Σ из σ и корреляций, квадратный
+             корень Σ по собственному разложению — допускает σ = 0 и |r| = 1),
+             формула считается на массивах NumPy блоками по chunk
+             выборок; среднее и σ накапливаются по блокам (Чан и др.), так что
+             миллионы выборок не требуют памяти под все сразу.
+
+inputs — {имя: (значение, σ)} (например, rpft.constants.inputs("m_e", "m_p")),
+corr — {(имя₁, имя₂): коэффициент корреляции}.
+"""
+
+import math
+
+import numpy as np
+
+METHODS = ("linear", "mc")
+
+
+class Estimate:
+    """Величина с погрешностью: центральное значение, σ, среднее по выборкам (MC), градиент (linear)."""
+
+    __slots__ = ("value", "sigma", "mean", "method", "gradient")
+
+    def __init__(self, value, sigma, mean=None, method="linear", gradient=None):
+        self.value = value
+        self.sigma = sigma
+        self.mean = value if mean is None else mean
+        self.method = method
+        self.gradient = gradient
+
+    def __repr__(self):
+        return f"Estimate({self.value!r} ± {self.sigma:.3g}, {self.method})"
+
+
+# =============================================================================
+# Прямой автодифф
+# =============================================================================
+class Dual:
+    """Значение и градиент по входам (массив длины числа входов)."""
+
+    __slots__ = ("value", "grad")
+
+    def __init__(self, value, grad):
+        self.value = value
+        self.grad = grad
+
+    @staticmethod
+    def _parts(x):
+        return (x.value, x.grad) if isinstance(x, Dual) else (x, 0.0)
+
+    def __add__(self, other):
+        v, g = self._parts(other)
+        return Dual(self.value + v, self.grad + g)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        v, g = self._parts(other)
+        return Dual(self.value - v, self.grad - g)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.grad)
+
+    def __mul__(self, other):
+        v, g = self._parts(other)
+        return Dual(self.value * v, self.grad * v + self.value * g)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        v, g = self._parts(other)
+        return Dual(self.value / v, (self.grad * v - self.value * g) / v**2)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.value, -other * self.grad / self.value**2)
+
+    def __pow__(self, other):
+        v, g = self._parts(other)
+        value = self.value**v
+        grad = v * self.value ** (v - 1) * self.grad
+        if isinstance(other, Dual):
+            grad = grad + value * math.log(self.value) * g
+        return Dual(value, grad)
+
+    def __rpow__(self, other):
+        value = other**self.value
+        return Dual(value, value * math.log(other) * self.grad)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.grad)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.value < 0 else self
+
+    def __float__(self):
+        return float(self.value)
+
+
+def _unary(f, df):
+    def apply(x):
+        if isinstance(x, Dual):
+            return Dual(f(x.value), df(x.value) * x.grad)
+        return f(x)
+    return apply
+
+
+class _DualContext:
+    pi = math.pi
+    e = math.e
+    exp = staticmethod(_unary(math.exp, math.exp))
+    log = staticmethod(_unary(math.log, lambda x: 1 / x))
+    log1p = staticmethod(_unary(math.log1p, lambda x: 1 / (1 + x)))
+    sqrt = staticmethod(_unary(math.sqrt, lambda x: 0.5 / math.sqrt(x)))
+    sin = staticmethod(_unary(math.sin, math.cos))
+    cos = staticmethod(_unary(math.cos, lambda x: -math.sin(x)))
+
+
+class _ArrayContext:
+    pi = np.pi
+    e = np.e
+    exp = staticmethod(np.exp)
+    log = staticmethod(np.log)
+    log1p = staticmethod(np.log1p)
+    sqrt = staticmethod(np.sqrt)
+    sin = staticmethod(np.sin)
+    cos = staticmethod(np.cos)
+
+
+# =============================================================================
+# Распространение
+# =============================================================================
+def _covariance(names, sigmas, corr):
+    cov = np.diag(np.square(sigmas))
+    index = {name: i for i, name in enumerate(names)}
+    for (a, b), r in (corr or {}).items():
+        i, j = index[a], index[b]
+        cov[i, j] = cov[j, i] = r * sigmas[i] * sigmas[j]
+    return cov
+
+
+def _as_dict(result):
+    return (result, False) if isinstance(result, dict) else ({None: result}, True)
+
+
+def _linear(func, names, values, cov):
+    duals = {name: Dual(float(v), np.eye(len(names))[i]) for i, (name, v) in enumerate(zip(names, values))}
+    out, single = _as_dict(func(_DualContext, **duals))
+    estimates = {}
+    for key, x in out.items():
+        value, grad = Dual._parts(x)
+        grad = np.broadcast_to(np.asarray(grad, dtype=float), (len(names),))
+        sigma = math.sqrt(max(float(grad @ cov @ grad), 0.0))
+        estimates[key] = Estimate(float(value), sigma, method="linear", gradient=dict(zip(names, grad.tolist())))
+    return estimates[None] if single else estimates
+
+
+def _monte_carlo(func, names, values, cov, n, seed, chunk):
+    rng = np.random.default_rng(seed)
+    # Σ = L Lᵀ через собственное разложение: Σ лишь полуопределена при σ = 0 (точные
+    # константы СИ) и |r| = 1, где разложение Холецкого невозможно
+    w, V = np.linalg.eigh(cov)
+    L = V * np.sqrt(np.clip(w, 0.0, None))
+    central, single = _as_dict(func(_ArrayContext, **dict(zip(names, values))))
+    count, mean, m2 = 0, {}, {}
+    while count < n:
+        m = min(chunk, n - count)
+        draws = values + rng.standard_normal((m, len(names))) @ L.T
+        out, _ = _as_dict(func(_ArrayContext, **{name: draws[:, i] for i, name in enumerate(names)}))
+        for key, x in out.items():
+            x = np.broadcast_to(np.asarray(x, dtype=float), (m,))
+            chunk_mean = x.mean()
+            chunk_m2 = np.square(x - chunk_mean).sum()
+            if count == 0:
+                mean[key], m2[key] = chunk_mean, chunk_m2
+            else:
+                delta = chunk_mean - mean[key]
+                total = count + m
+                mean[key] += delta * m / total
+                m2[key] += chunk_m2 + delta**2 * count * m / total
+        count += m
+    estimates = {key: Estimate(float(central[key]), math.sqrt(m2[key] / max(n - 1, 1)), mean=float(mean[key]),
+                               method="mc")
+                 for key in central}
+    return estimates[None] if single else estimates
+
+
+def propagate(func, inputs, method="linear", corr=None, n=10**6, seed=0, chunk=2**20):
+    """
+    Estimate (или {имя: Estimate}) для func(ctx, **входы) при входах inputs = {имя: (значение, σ)}.
+
+    method — "linear" (автодифф, первый порядок) или "mc" (n выборок, блоками по chunk)
+    corr   — {(имя₁, имя₂): r} — корреляции входов
+    """
+    if method not in METHODS:
+        raise ValueError(f"method должен быть одним из {METHODS}, получено {method!r}")
+    names = list(inputs)
+    values = np.array([float(inputs[name][0]) for name in names])
+    sigmas = np.array([float(inputs[name][1]) for name in names])
+    cov = _covariance(names, sigmas, corr)
+    if method == "linear":
+        return _linear(func, names, values, cov)
+    return _monte_carlo(func, names, values, cov, n, seed, chunk)
@@ -0,0 +1,297 @@
+"""
+Аналитическое продолжение спектральных ζ-функций через ζ Гурвица.
+
+Все спектры rpft.spectra имеют вид λ = m² − c (scalar: m = n+1, c = 1; coexact:
+m = n+1, c = 0; dirac: m = n+3/2, c = 0), а кратность на L(p,q) — квазиполином
+по n с периодом 2p. Поэтому спектр разбивается на классы-решётки
+  m = h(j + a), j ≥ 0,   d(m) = Σ_e α_e m^e,
+и для каждого класса (после явной «головы» m < m_cut)
+  Σ_j d(m) (m² − c)^{−s} = Σ_e α_e Σ_k (s)_k/k! · c^k · h^{e−2s−2k} ζ_H(2s+2k−e, a),
+ряд по k сходится как (c/m_cut²)^k. В s = 0 члены k ≥ 1 дают вклад только в ζ′(0)
+(множитель (s)_k ~ s), а полюс ζ_H(1 + 2s, a) = 1/(2s) − ψ(a) + O(s) раскрывается явно.
+Результат: ζ(s), ζ(0) и ζ′(0) в замкнутой форме при любом mp.dps.
+
+SpectralSum — усечённая сумма ζ_N(s) = Σ w_n λ_n^{−s} со значением и производными
+по s за один проход (вместо численного mp.diff по полным пересуммированиям).
+"""
+
+from fractions import Fraction
+
+import numpy as np
+from mpmath import mp
+
+from .profiling import profiled
+from .series import convergence_study
+from .spectra import Spectrum, _check_operator, lens_multiplicity
+
+# λ = m² − c, m = n + shift
+_SHIFT = {"scalar": Fraction(1), "coexact": Fraction(1), "dirac": Fraction(3, 2)}
+_C = {"scalar": 1, "coexact": 0, "dirac": 0}
+_N_MIN = {"scalar": 0, "coexact": 1, "dirac": 0}
+
+# Дополнительные разряды при суммировании рядов
+_GUARD_DIGITS = 10
+
+
+def _fit_quadratic(ns, ds):
+    """Коэффициенты (c0, c1, c2) квадратичного многочлена по трём точкам (точно, Fraction)."""
+    (x0, x1, x2), (y0, y1, y2) = ns, ds
+    c2 = Fraction(y2 - y1, x2 - x1) - Fraction(y1 - y0, x1 - x0)
+    c2 /= (x2 - x0)
+    c1 = Fraction(y1 - y0, x1 - x0) - c2 * (x0 + x1)
+    c0 = y0 - c1 * x0 - c2 * x0 * x0
+    return c0, c1, c2
+
+
+def lattice_classes(operator, p=1, q=1, spin=0, twist=0, parity=None, branch=None):
+    """
+    Разбиение спектра на L(p,q) на классы (h, a, c, ((e, α_e), ...)).
+
+    Кратность d(n) на каждом классе вычетов n ≡ r (mod 2p) восстанавливается точно
+    по трём значениям rpft.spectra.lens_multiplicity и проверяется ещё на двух.
+    branch — только одна ветвь (для dirac 0 = λ>0, 1 = λ<0), как в lens_multiplicity.
+    """
+    _check_operator(operator)
+    P = 2 * p
+    shift, c = _SHIFT[operator], _C[operator]
+    residues = [r for r in range(P)
+                if not (parity == "even" and r % 2 or parity == "odd" and r % 2 == 0)]
+    # j0 — первый j с r + P·j ≥ n_min; кратности всех классов — одним вызовом lens_multiplicity
+    starts = [(r, max(0, -((r - _N_MIN[operator]) // P))) for r in residues]
+    grid = [[r + P * (j0 + i) for i in range(5)] for r, j0 in starts]
+    mult = lens_multiplicity(operator, grid, p=p, q=q, spin=spin, twist=twist, branch=branch) if grid else []
+    classes = []
+    for (r, j0), ns, row in zip(starts, grid, mult):
+        ds = [int(x) for x in row]
+        c0, c1, c2 = _fit_quadratic(ns[:3], ds[:3])
+        for n, d in zip(ns[3:], ds[3:]):
+            if c0 + c1 * n + c2 * n * n != d:
+                raise RuntimeError(f"кратность {operator} на L({p},{q}) не квадратична на классе r={r}")
+        if c0 == c1 == c2 == 0:
+            continue
+        # d как многочлен от m = n + shift
+        a2 = c2
+        a1 = c1 - 2 * c2 * shift
+        a0 = c0 - c1 * shift + c2 * shift * shift
+        coeffs = tuple((e, v) for e, v in ((0, a0), (1, a1), (2, a2)) if v != 0)
+        classes.append((P, (Fraction(r) + shift) / P + j0, c, coeffs))
+    return classes
+
+
+def _mpf(x):
+    if isinstance(x, Fraction):
+        return mp.mpf(x.numerator) / x.denominator
+    return mp.mpf(x)
+
+
+class LatticeZeta:
+    """
+    ζ(s) = Σ d(m) (m² − c)^{−s} по объединению классов m = h(j + a), j ≥ 0.
+
+    classes — список (h, a, c, ((e, α_e), ...)); a, c, α могут быть Fraction, int или mpf
+              (нецелые a задают, например, непрерывный twist θ)
+    m_cut   — уровни с m < m_cut суммируются явно, остальные — через ζ Гурвица
+    Нулевые моды (λ = 0) исключаются: это ζ для det′.
+    """
+
+    def __init__(self, classes, m_cut=32):
+        self.classes = list(classes)
+        self.m_cut = m_cut
+
+    def _split(self):
+        """Голова: список (λ, d) для m < m_cut; хвост: классы со сдвинутым a."""
+        head = []
+        tail = []
+        for h, a, c, coeffs in self.classes:
+            h, a, c = _mpf(h), _mpf(a), _mpf(c)
+            alphas = [(e, _mpf(v)) for e, v in coeffs]
+            j = 0
+            while h * (j + a) < self.m_cut:
+                m = h * (j + a)
+                lam = m * m - c
+                d = sum(v * m**e for e, v in alphas)
+                if lam != 0 and d != 0:
+                    head.append((lam, d))
+                j += 1
+            tail.append((h, a + j, c, alphas))
+        return head, tail
+
+    @staticmethod
+    def _at_class_pole(s, tail):
+        """Попадает ли s в полюс ζ_H(2s + 2k − e, a) хотя бы одного класса хвоста."""
+        for h, a, c, alphas in tail:
+            for e, _ in alphas:
+                k = (1 + e - 2*s) / 2
+                if k >= 0 and k == int(k) and (c != 0 or k == 0):
+                    return True
+        return False
+
+    @profiled
+    def __call__(self, s):
+        """
+        ζ(s) в любой точке. В полюсе отдельного класса вычеты классов складываются
+        (laurent): если они сокращаются, возвращается конечная часть, иначе ±∞.
+        """
+        with mp.workdps(mp.dps + _GUARD_DIGITS):
+            s = mp.mpf(s)
+            eps = mp.mpf(10) ** (-mp.dps)
+            head, tail = self._split()
+            if s > 0 and self._at_class_pole(s, tail):
+                residue, finite = self.laurent(s)
+                if abs(residue) < eps * (1 + abs(finite)):
+                    return +finite
+                return mp.inf if residue > 0 else mp.ninf
+            total = mp.fsum(d * lam**(-s) for lam, d in head)
+            for h, a, c, alphas in tail:
+                for e, alpha in alphas:
+                    k = 0
+                    while True:
+                        coef = mp.rf(s, k) / mp.factorial(k) * c**k
+                        term = coef * h**(e - 2*s - 2*k) * mp.zeta(2*s + 2*k - e, a)
+                        total += alpha * term
+                        if c == 0 or (k > 0 and abs(alpha * term) < eps * (1 + abs(total))):
+                            break
+                        k += 1
+        return +total
+
+    @profiled
+    def _at_zero(self):
+        """(ζ(0), ζ′(0)) по разложению каждого члена в s = 0."""
+        with mp.workdps(mp.dps + _GUARD_DIGITS):
+            eps = mp.mpf(10) ** (-mp.dps)
+            head, tail = self._split()
+            value = mp.fsum(d for _, d in head)
+            deriv = -mp.fsum(d * mp.log(lam) for lam, d in head)
+            for h, a, c, alphas in tail:
+                lnh = mp.log(h)
+                for e, alpha in alphas:
+                    # k = 0: h^{e−2s} ζ_H(2s − e, a)
+                    z = mp.zeta(-e, a)
+                    value += alpha * h**e * z
+                    deriv += alpha * h**e * (2 * mp.zeta(-e, a, 1) - 2 * lnh * z)
+                    if c == 0:
+                        continue
+                    k = 1
+                    harmonic = mp.mpf(0)  # H_{k−1}
+                    while True:
+                        A = alpha * c**k * h**(e - 2*k) / k
+                        if 2*k - e == 1:
+                            value += A / 2
+                            term = A * (harmonic / 2 - lnh - mp.digamma(a))
+                        else:
+                            term = A * mp.zeta(2*k - e, a)
+                        deriv += term
+                        if abs(term) < eps * (1 + abs(deriv)) and 2*k - e > 1:
+                            break
+                        harmonic += mp.mpf(1) / k
+                        k += 1
+        return +value, +deriv
+
+    @profiled
+    def laurent(self, s0):
+        """
+        (вычет, конечная часть) ζ(s) в точке s0 > 0: ζ(s) = R/(s − s0) + F + O(s − s0).
+
+        Полюс ζ_H(1 + 2(s − s0), a) = 1/(2(s − s0)) − ψ(a) + … раскрывается вместе с
+        производной коэффициента (s)_k/k!·h^{−2s}. Вне полюсов R = 0, F = ζ(s0).
+        """
+        with mp.workdps(mp.dps + _GUARD_DIGITS):
+            s0 = mp.mpf(s0)
+            if s0 <= 0:
+                raise ValueError(f"laurent требует s0 > 0, получено {s0}")
+            eps = mp.mpf(10) ** (-mp.dps)
+            head, tail = self._split()
+            residue = mp.mpf(0)
+            finite = mp.fsum(d * lam**(-s0) for lam, d in head)
+            for h, a, c, alphas in tail:
+                lnh = mp.log(h)
+                for e, alpha in alphas:
+                    k = 0
+                    dlog_rf = mp.mpf(0)  # d/ds ln (s)_k в s0
+                    while True:
+                        C = alpha * mp.rf(s0, k) / mp.factorial(k) * c**k * h**(e - 2*s0 - 2*k)
+                        arg = 2*s0 + 2*k - e
+                        if arg == 1:
+                            residue += C / 2
+                            term = C * ((dlog_rf - 2 * lnh) / 2 - mp.digamma(a))
+                        else:
+                            term = C * mp.zeta(arg, a)
+                        finite += term
+                        if c == 0 or (k > 0 and arg > 1 and abs(term) < eps * (1 + abs(finite))):
+                            break
+                        dlog_rf += 1 / (s0 + k)
+                        k += 1
+        return +residue, +finite
+
+    def value_at_zero(self):
+        """ζ(0)."""
+        return self._at_zero()[0]
+
+    def derivative_at_zero(self):
+        """ζ′(0)."""
+        return self._at_zero()[1]
+
+    def log_det(self):
+        """ln det′ = −ζ′(0)."""
+        return -self.derivative_at_zero()
+
+
+def spectral_zeta(operator, p=1, q=1, spin=0, twist=0, parity=None, m_cut=32):
+    """LatticeZeta для оператора на L(p,q) (аргументы как у rpft.spectra.spectrum)."""
+    return LatticeZeta(lattice_classes(operator, p=p, q=q, spin=spin, twist=twist, parity=parity),
+                       m_cut=m_cut)
+
+
+class SpectralSum:
+    """
+    ζ_N(s) = Σ_n w_n λ_n^{−s} по конечному спектру и её производные
+      ∂_s^k ζ_N(s) = Σ_n w_n λ_n^{−s} (−ln λ_n)^k
+    за один проход по уровням (ln λ_n — из общего кэша уровней rpft.spectra).
+
+    spec    — Spectrum или пара (λ, d); нулевые моды пропускаются
+    weights — веса w_n вместо кратностей d_n (например, целая разность двух секторов)
+    """
+
+    def __init__(self, spec, weights=None):
+        self.spec = spec
+        if isinstance(spec, Spectrum):
+            mult = spec.mult
+        else:
+            mult = spec[1]
+        self.weights = [int(w) if isinstance(w, (int, np.integer)) else w
+                        for w in (mult if weights is None else weights)]
+
+    def _logs(self):
+        if isinstance(self.spec, Spectrum):
+            return self.spec.log_eigenvalues_mp()
+        return [mp.log(mp.mpf(lam)) if lam != 0 else mp.ninf for lam in self.spec[0]]
+
+    def level_terms(self, s, order=1):
+        """Вклады уровней: кортежи (w λ^{−s}, w λ^{−s}(−ln λ), …) длины order + 1."""
+        s = mp.mpf(s)
+        rows = []
+        for w, L in zip(self.weights, self._logs()):
+            if L == mp.ninf or w == 0:
+                continue
+            e = w * mp.exp(-s * L)
+            row = [e]
+            for _ in range(order):
+                row.append(-row[-1] * L)
+            rows.append(tuple(row))
+        return rows
+
+    @profiled
+    def derivatives(self, s, order=2, checkpoints=None):
+        """
+        (ζ_N(s), ζ_N′(s), …, ζ_N^{(order)}(s)).
+
+        checkpoints — числа уровней: тогда возвращается ConvergenceTable (rpft.series)
+                      с теми же кортежами по всем обрезаниям за один проход.
+        """
+        rows = self.level_terms(s, order)
+        if checkpoints is None:
+            return tuple(mp.fsum(col) for col in zip(*rows))
+        return convergence_study(lambda i: rows[i], checkpoints, n0=0)
+
+    def __call__(self, s):
+        return self.derivatives(s, order=0)[0]
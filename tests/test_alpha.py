@@ -0,0 +1,43 @@
+"""S_vac: бэкенды mp и float64 согласованы; solve обращает S_vac по R, κ и C, nan — поэлементно."""
+
+import os
+import sys
+
+import numpy as np
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.alpha import s_geo, s_vac, solve
+
+
+def test_s_vac_backends_agree():
+    with mp.workdps(30):
+        pi = mp.pi
+        S = 4 * pi**3 + pi**2 + pi
+        assert s_geo() == S
+        assert abs(s_vac() - (S - 1 / (24 * S) - 1 / (pi**4 * S**2))) < mp.mpf(10) ** -28
+        R = np.linspace(0.5, 1.5, 7)
+        kappa = np.array([[1 / 24], [0.1]])
+        grid = s_vac(R, kappa, spin="nontrivial", p=3)
+        assert grid.shape == (2, 7)
+        for i in range(2):
+            for j, r in enumerate(R):
+                exact = s_vac(mp.mpf(r), mp.mpf(kappa[i, 0]), spin="nontrivial", p=3)
+                assert abs(grid[i, j] - exact) < 1e-13 * abs(exact)
+
+
+def test_solve_round_trip_and_nan():
+    target = np.array([137.036, 100.0, np.nan, 500.0])
+    R, err = solve(target)
+    ok = ~np.isnan(target)
+    assert np.isnan(R[2]) and np.isnan(err[2])
+    assert np.all(np.abs(s_vac(R[ok]) - target[ok]) < 1e-12 * target[ok])
+    assert np.all(err[ok] < 1e-13)
+    kappa, _ = solve(137.036, unknown="kappa", R=R[0], backend="float64")
+    C, _ = solve(137.036, unknown="C", R=R[0], backend="float64")
+    assert abs(kappa - 1 / 24) < 1e-9 and abs(C - 1) < 1e-5
+    with mp.workdps(40):
+        root, err = solve(mp.mpf("137.035999177"))
+        assert abs(s_vac(root) - mp.mpf("137.035999177")) < mp.mpf(10) ** -35
+        assert err < mp.mpf(10) ** -36
@@ -0,0 +1,32 @@
+"""Сравнение с эталоном: поправка на калибровку только для эталона с другой машины."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.bench import compare, other_machine
+
+
+def _run(calibration, median, **env):
+    meta = {"python": "3.11", "numpy": "2", "mpmath": "1.4", "machine": "x86_64", "processor": "",
+            "calibration": calibration, "date": ""}
+    meta.update(env)
+    return {"meta": meta, "results": {"f": {"median": median}}}
+
+
+def test_same_machine_compares_raw_medians():
+    baseline, current = _run(1.0, 1.0), _run(1.1, 1.5)
+    assert not other_machine(current, baseline)
+    assert compare(current, baseline)["f"]["status"] == "regression"
+
+
+def test_slower_machine_is_normalized():
+    baseline, current = _run(1.0, 1.0), _run(2.0, 2.1)
+    assert other_machine(current, baseline)
+    assert compare(current, baseline)["f"]["status"] == "ok"
+    assert compare(current, baseline, normalize=False)["f"]["status"] == "regression"
+
+
+def test_other_environment_is_normalized():
+    assert other_machine(_run(1.0, 1.0, numpy="1.26"), _run(1.0, 1.0))
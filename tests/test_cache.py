@@ -0,0 +1,84 @@
+"""Дисковый кэш: повторный вызов берётся с диска, ключ меняется с mp.prec, version=, исходником и изданием CODATA."""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.cache import _file_hash, cache_info, cached, invalidate
+
+_SOURCE = '''
+from mpmath import mp
+
+calls = []
+
+
+def constant(n, scale=1):
+    calls.append(n)
+    return mp.mpf(n) * scale + mp.pi * {offset}
+'''
+
+
+def _load(path, offset):
+    """Модуль с функцией constant, декорированной @cached (исходник — отдельный файл)."""
+    path.write_text(_SOURCE.format(offset=offset))
+    _file_hash.cache_clear()
+    spec = importlib.util.spec_from_file_location("rpft_cache_probe", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module, cached(module.constant)
+
+
+def test_cached_hit_and_key_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("RPFT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("RPFT_CODATA", raising=False)
+    module, constant = _load(tmp_path / "probe.py", 0)
+    with mp.workdps(30):
+        first = constant(3)
+        assert constant(3) == first and constant(n=3, scale=1) == first
+        assert module.calls == [3]
+        constant(4)
+        assert module.calls == [3, 4]
+    with mp.workdps(40):
+        constant(3)
+    assert module.calls == [3, 4, 3]
+    with mp.workdps(30):
+        assert cached(version=1)(module.constant)(3) == first
+        assert module.calls == [3, 4, 3, 3]
+
+        monkeypatch.setenv("RPFT_CODATA", "2018")
+        _file_hash.cache_clear()
+        constant(3)
+        assert module.calls[-1] == 3 and len(module.calls) == 5
+        monkeypatch.delenv("RPFT_CODATA")
+
+        # правка исходника: старая запись недостижима и удаляется при новой записи
+        module, constant = _load(tmp_path / "probe.py", 1)
+        assert constant(3) == first + mp.pi
+        assert module.calls == [3]
+    assert cache_info()[constant.cache_name][0] == 1
+
+
+def test_cached_arrays_and_invalidate(tmp_path, monkeypatch):
+    monkeypatch.setenv("RPFT_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    @cached
+    def table(n):
+        calls.append(n)
+        return np.arange(n, dtype=float), mp.mpf(1) / 3
+
+    with mp.workdps(25):
+        values, third = table(5)
+        again, third_again = table(5)
+    assert calls == [5]
+    assert np.array_equal(values, again) and isinstance(again, np.memmap)
+    assert third_again == third
+    assert invalidate(table) == 1
+    table(5)
+    assert calls == [5, 5]
+    assert invalidate() == 1 and cache_info() == {}
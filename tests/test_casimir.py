@@ -0,0 +1,21 @@
+"""Casimir-энергии на S¹: длина по умолчанию 2π берётся при точности вызова."""
+
+import os
+import sys
+
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.casimir import casimir_energy_S1
+
+
+def test_massless_default_length_at_high_precision():
+    with mp.workdps(50):
+        assert casimir_energy_S1(0) == -mp.mpf(1) / 12
+        assert casimir_energy_S1(0, antiperiodic=True) == mp.mpf(1) / 24
+
+
+def test_massive_default_length_matches_explicit():
+    with mp.workdps(40):
+        assert casimir_energy_S1(1) == casimir_energy_S1(1, L=2 * mp.pi)
@@ -0,0 +1,43 @@
+"""Реестр CODATA: выбор издания, неизменяемость записей, входы и корреляции для propagate."""
+
+import os
+import sys
+
+import pytest
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.constants import DEFAULT_EDITION, EDITIONS, constant, edition
+
+
+def test_edition_selection(monkeypatch):
+    monkeypatch.delenv("RPFT_CODATA", raising=False)
+    assert edition().name == DEFAULT_EDITION
+    assert edition(default="2018").name == "2018"
+    monkeypatch.setenv("RPFT_CODATA", "2018")
+    assert edition().name == "2018" and edition("2022").name == "2022"
+    assert edition() is edition("2018")
+    with pytest.raises(ValueError):
+        edition("1998")
+    with pytest.raises(KeyError):
+        edition()["no_such_constant"]
+
+
+def test_constant_records():
+    for name in EDITIONS:
+        ed = edition(name)
+        m_e = ed["m_e"]
+        assert m_e.edition == name and "m_e" in ed
+        with mp.workdps(40):
+            # строковое значение не проходит через float64
+            assert m_e.mpf() == mp.mpf(m_e.value)
+        assert m_e.pair() == (float(m_e.value), float(m_e.sigma))
+        assert ed.inputs("m_e", "m_p") == {"m_e": m_e.pair(), "m_p": ed["m_p"].pair()}
+        assert ed.correlation("m_e", "m_p") == ed.correlation("m_p", "m_e")
+        assert ed.correlation("m_e", "m_e") == 1.0
+        with pytest.raises(AttributeError):
+            m_e.value = "0"
+        with pytest.raises(AttributeError):
+            del m_e.sigma
+    assert constant("m_e", "2018") is edition("2018")["m_e"]
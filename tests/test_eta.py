@@ -0,0 +1,39 @@
+"""η(s) в полюсах ζ Гурвица отдельных классов: вычеты ветвей ±λ сокращаются; точное η(0) против формулы характеров."""
+
+import math
+import os
+import sys
+
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.eta import eta_exact, eta_function, eta_invariant
+
+
+def test_eta_L21_at_class_pole():
+    with mp.workdps(20):
+        value = eta_function(1, p=2, q=1)
+        assert mp.isfinite(value)
+        assert abs(value + mp.pi / 8) < mp.mpf(10) ** -15
+        left, right = eta_function(mp.mpf(1) - mp.mpf(10) ** -8, p=2), eta_function(mp.mpf(1) + mp.mpf(10) ** -8, p=2)
+        assert abs(left - value) < 1e-7 and abs(right - value) < 1e-7
+
+
+def test_eta_finite_at_other_class_poles():
+    assert mp.isfinite(eta_function(3, p=2, q=1))
+    assert mp.isfinite(eta_function(2, p=3, q=1))
+
+
+def test_eta_exact_matches_character_formula():
+    # точная сумма по ветвям (Fraction) против формулы характеров
+    with mp.workdps(30):
+        for p in range(2, 8):
+            for q in range(1, p):
+                if math.gcd(p, q) != 1:
+                    continue
+                for spin in range(2 if p % 2 == 0 else 1):
+                    for twist in range(p):
+                        exact = eta_exact(p, q, spin, twist)
+                        value = eta_invariant(p, q, spin, twist)
+                        assert abs(mp.mpf(exact.numerator) / exact.denominator - value) < mp.mpf(10) ** -25
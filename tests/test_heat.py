@@ -0,0 +1,55 @@
+"""heat_trace на пути mpmath: обрыв суммы не теряет уровней пары (λ, d); тета-представление против прямой суммы; МНК-коэффициенты."""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.heat import heat_coefficients, heat_trace, heat_trace_theta
+from rpft.spectra import spectrum
+
+
+def test_zero_multiplicities_do_not_stop_the_sum():
+    with mp.workdps(30):
+        exact = mp.exp(-1) + 5 * mp.exp(-50)
+        value = heat_trace(([1, 2, 3, 50], [1, 0, 0, 5]), [1], digits=30)[0]
+        assert abs(value - exact) < mp.mpf(10) ** -30 * exact
+
+
+def test_unsorted_and_negative_multiplicities():
+    with mp.workdps(30):
+        assert abs(heat_trace(([50, 1], [5, 1]), 1, digits=30) - (mp.exp(-1) + 5 * mp.exp(-50))) < mp.mpf(10) ** -30
+        assert abs(heat_trace(([1, 2], [1, -1]), 1, digits=30) - (mp.exp(-1) - mp.exp(-2))) < mp.mpf(10) ** -30
+
+
+def test_theta_image_matches_direct_and_spectrum():
+    # тета-представление (образы Пуассона) против прямой суммы по уровням rpft.spectra
+    with mp.workdps(30):
+        for operator in ("scalar", "coexact", "dirac"):
+            for p, twist in ((1, 0), (2, 0), (2, 1)):
+                for t in ("0.05", "0.8", "3"):
+                    image, err_image = heat_trace_theta(operator, t, p=p, twist=twist, digits=25, method="image")
+                    direct, err_direct = heat_trace_theta(operator, t, p=p, twist=twist, digits=25, method="direct")
+                    assert abs(image - direct) <= 2 * (err_image + err_direct) + mp.mpf(10) ** -24 * abs(direct)
+                exact = heat_trace(spectrum(operator, 40, p=p, twist=twist), [mp.mpf(1)], digits=25)[0]
+                value, err = heat_trace_theta(operator, 1, p=p, twist=twist, digits=25)
+                assert abs(value - exact) <= err + mp.mpf(10) ** -24 * abs(exact)
+
+
+def test_heat_coefficients_scalar_S3():
+    # (4πt)^{3/2} K(t) = 2π² e^t с точностью до e^{−π²/t}: a_k = 2π²/k!
+    spec = spectrum("scalar", 400)
+    t = np.linspace(0.02, 0.2, 24)
+    exact = np.array([2 * math.pi**2 / math.factorial(k) for k in range(5)])
+    a, err = heat_coefficients(spec, t, k_max=4)
+    assert np.all(np.abs(a - exact) <= err) and abs(a[0] - exact[0]) < 1e-6 * exact[0]
+    a_known, err_known = heat_coefficients(spec, t, k_max=4, known=exact[:1], digits=30)
+    assert a_known[0] == exact[0] and err_known[0] == 0
+    assert np.all(np.abs(a_known - exact) <= err_known) and np.all(err_known[1:] < err[1:])
+    with pytest.raises(ValueError):
+        heat_coefficients(spectrum("scalar", 20), t, k_max=4)
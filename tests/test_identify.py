@@ -0,0 +1,36 @@
+"""Поиск замкнутой формы: индекс находит простые выражения со сдвигом, PSLQ — целочисленные соотношения."""
+
+import os
+import sys
+
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.identify import ExpressionIndex, integer_relation
+
+
+def test_index_finds_simple_forms():
+    with mp.workdps(30):
+        index = ExpressionIndex(max_exponent=2, max_numerator=12, max_denominator=12)
+        best = index.search(1 - 1 / mp.pi**2, offsets=(0, 1, -1))[0]
+        assert best.expression == "1 - 1/π^2" and best.error < 1e-25
+        best = index.search(3 * mp.zeta(3) / (4 * mp.pi))[0]
+        assert best.expression == "3·ζ(3)/(4·π)"
+        i = index.nearest(7 * mp.log(2) ** 2 / 5, k=1)[0]
+        assert abs(index.evaluate(i) - 7 * mp.log(2) ** 2 / 5) < mp.mpf(10) ** -28
+
+
+def test_integer_relation():
+    with mp.workdps(40):
+        assert integer_relation(mp.pi**2 / 6 - 3 * mp.zeta(3) + 1) == "x = (1/6)·π² - 3·ζ(3) + 1"
+        assert integer_relation(mp.e) is None
+
+
+def test_index_drops_equal_values():
+    # π² и «π2» = π² дают одни и те же значения: остаётся самое простое выражение
+    with mp.workdps(30):
+        index = ExpressionIndex({"π": mp.pi, "π2": mp.pi**2}, max_exponent=2, max_numerator=3, max_denominator=3)
+        assert len(index) < index.size
+        assert index.search(2 * mp.pi**4)[0].expression == "2·π2^2"
+        assert index.count_within(mp.pi**2, 1e-12) == 1
@@ -0,0 +1,28 @@
+"""run_grid: результаты в порядке задач, точность вызывающего процесса, исполнители — отдельные процессы."""
+
+import os
+import sys
+
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.parallel import run_grid
+
+
+def _task(n, shift=0):
+    return mp.dps, mp.zeta(n) + shift
+
+
+def test_run_grid_order_and_precision():
+    tasks = [(n, k) for n in range(2, 8) for k in (0, 1)] + [9]
+    with mp.workdps(40):
+        serial = run_grid(_task, tasks, workers=1)
+        pooled = run_grid(_task, tasks, workers=3)
+        assert [r.args for r in pooled] == [t if isinstance(t, tuple) else (t,) for t in tasks]
+        assert [r.value for r in pooled] == [r.value for r in serial]
+        assert all(r.value[0] == 40 for r in pooled)
+        assert abs(pooled[0].value[1] - mp.pi**2 / 6) < mp.mpf(10) ** -38
+    assert all(r.worker == os.getpid() for r in serial)
+    assert all(r.worker != os.getpid() and r.elapsed >= 0 for r in pooled)
+    assert run_grid(_task, [2], dps=60)[0].value[0] == 60
@@ -0,0 +1,36 @@
+"""Набор узлов rigorous/: пересчёт только устаревших узлов, ошибки командной строки."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.cache import _file_hash
+from rpft.pipeline import Node, Pipeline, main
+
+
+def _pipeline(tmp_path):
+    (tmp_path / "a.py").write_text("print('a')\n")
+    (tmp_path / "b.py").write_text("print('b')\n")
+    nodes = [Node("a", "a.py"), Node("b", "b.py")]
+    return Pipeline(nodes, str(tmp_path), state_dir=str(tmp_path / "state"))
+
+
+def test_only_stale_nodes_rerun(tmp_path):
+    pipeline = _pipeline(tmp_path)
+    first = pipeline.run(workers=2)
+    assert first["ok"] and {n["status"] for n in first["nodes"].values()} == {"ran"}
+    assert pipeline.stale() == []
+    (tmp_path / "b.py").write_text("print('b2')\n")
+    _file_hash.cache_clear()  # хэши файлов кэшируются на процесс
+    assert pipeline.stale() == ["b"]
+    second = pipeline.run(workers=2)
+    assert second["nodes"]["a"]["status"] == "fresh" and second["nodes"]["b"]["status"] == "ran"
+
+
+def test_show_unknown_node_is_a_usage_error(tmp_path):
+    with pytest.raises(SystemExit) as exc:
+        main(_pipeline(tmp_path), ["--show", "nope"])
+    assert exc.value.code == 2
@@ -0,0 +1,72 @@
+"""Уровни точности: арифметика double-double против mpmath и выбор уровня в evaluate."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.precision import DoubleDouble, dd_exp, dd_log, dd_log1p, dd_sqrt, evaluate
+
+_POINTS = ["0.3", "1.7", "2.5e-6", "12.25", "0.95"]
+
+
+def _close(dd, exact, digits=30):
+    with mp.workdps(50):
+        return abs(dd.to_mpf() - exact) <= mp.mpf(10) ** -digits * max(1, abs(exact))
+
+
+def test_double_double_arithmetic_and_functions():
+    with mp.workdps(50):
+        for a in _POINTS:
+            for b in _POINTS:
+                x, y = DoubleDouble.from_mpf(mp.mpf(a)), DoubleDouble.from_mpf(mp.mpf(b))
+                xm, ym = x.to_mpf(), y.to_mpf()
+                assert _close(x + y, xm + ym) and _close(x - y, xm - ym, 28)
+                assert _close(x * y, xm * ym) and _close(x / y, xm / ym)
+            x = DoubleDouble.from_mpf(mp.mpf(a))
+            xm = x.to_mpf()
+            assert _close(dd_exp(x), mp.exp(xm)) and _close(dd_sqrt(x), mp.sqrt(xm))
+            assert _close(dd_log(x), mp.log(xm)) and _close(dd_log1p(x), mp.log1p(xm))
+            assert _close(x ** 5, xm ** 5) and _close(x ** -3, xm ** -3)
+
+
+def test_double_double_vectorized():
+    with mp.workdps(50):
+        values = np.array([mp.mpf(a) for a in _POINTS], dtype=object)
+        x = DoubleDouble.from_mpf(values)
+        out = dd_exp(x).to_mpf()
+        assert all(abs(o - mp.exp(x[i].to_mpf())) < mp.mpf(10) ** -30 * mp.exp(v)
+                   for i, (o, v) in enumerate(zip(out, values)))
+
+
+def test_evaluate_picks_cheapest_tier():
+    def f(ctx):
+        return ctx.log1p(ctx.array([mp.mpf("1e-3")])[0]) + ctx.pi
+
+    with mp.workdps(40):
+        exact = mp.log1p(mp.mpf("1e-3")) + mp.pi
+        for digits, tier in ((10, "float64"), (25, "double-double"), (35, "mpmath")):
+            value, used, _ = evaluate(f, digits, report=True)
+            assert used == tier
+            assert abs(value - exact) < mp.mpf(10) ** -digits
+
+
+def test_evaluate_escalates_on_cancellation_and_missing_functions():
+    # 1 + 1e-12 − 1: двенадцать разрядов теряются, float64 не годится даже для 5 цифр
+    def cancel(ctx):
+        one, tiny = ctx.array([1, mp.mpf("1e-12")])
+        return ctx.fsum([one, tiny, -one])
+
+    value, tier, loss = evaluate(cancel, 5, report=True)
+    assert tier == "double-double" and loss > 11
+    assert abs(value - mp.mpf("1e-12")) < mp.mpf("1e-17")
+
+    value, tier, _ = evaluate(lambda ctx: ctx.zeta(3), 10, report=True)
+    assert tier == "mpmath" and abs(value - mp.zeta(3)) < 1e-10
+
+    with pytest.raises(ValueError):
+        evaluate(lambda ctx: ctx.zeta(3), 10, tiers=("float64", "double-double"))
@@ -0,0 +1,63 @@
+"""Профилирование: вложенные замеры, счёт операций mpf, отчёты JSON и folded; без профиля — прозрачно."""
+
+import json
+import os
+import sys
+
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.profiling import Profiler, active, profiled
+from rpft.sections import run_sections
+
+
+@profiled
+def _inner(x):
+    return x * x + x
+
+
+@profiled(name="outer")
+def _outer(n):
+    x = mp.mpf(2)
+    total = mp.mpf(0)
+    for _ in range(n):
+        total += _inner(x)
+    return total
+
+
+def test_profiler_stacks_and_operations():
+    assert active() is None and _outer(3) == 18
+    mul = type(mp.mpf(1)).__mul__
+    profiler = Profiler("probe", memory=False).start()
+    try:
+        with profiler.frame("§1"):
+            _outer(4)
+            _outer(1)
+    finally:
+        profiler.stop()
+    assert active() is None and type(mp.mpf(1)).__mul__ is mul
+    summary = profiler.summary()
+    assert summary["sections"]["§1"]["calls"] == 1
+    inner, outer = summary["functions"]["_inner"], summary["functions"]["outer"]
+    assert inner["calls"] == 5 and outer["calls"] == 2
+    # _inner: × и + на вызов; outer: ещё += на вызов _inner
+    assert inner["mpf_ops"] == 10 and outer["mpf_ops"] == 15 and outer["self_mpf_ops"] == 5
+    assert outer["wall"] >= inner["wall"] and summary["sections"]["§1"]["mpf_ops"] == 15
+    folded = profiler.folded()
+    assert any(line.startswith("probe;§1;outer;_inner ") for line in folded)
+
+
+def test_run_sections_profile_output(tmp_path, capsys):
+    sections = {"a": lambda: {"v": _outer(2)}}
+    path = str(tmp_path / "report")
+    run_sections(sections, ["--profile", path], dps=20)
+    with open(path + ".json", encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["meta"]["sections"] == ["a"] and report["meta"]["dps"] == 20
+    assert report["functions"]["outer"]["calls"] == 1
+    with open(path + ".folded", encoding="utf-8") as f:
+        stacks = [line.rsplit(" ", 1)[0].split(";") for line in f.read().splitlines()]
+    assert sorted(s[1:] for s in stacks) == [["§a"], ["§a", "outer"], ["§a", "outer", "_inner"]]
+    assert "профиль:" in capsys.readouterr().err
+    assert active() is None
@@ -0,0 +1,43 @@
+"""Адаптивные квадратуры: пакетное подынтегральное, обе схемы против точных интегралов."""
+
+import os
+import sys
+
+import pytest
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.quad import integrate
+
+
+def test_integrate_against_exact():
+    with mp.workdps(30):
+        cases = [
+            (lambda xs: [mp.exp(-x) * mp.cos(3 * x) for x in xs], 0, 2,
+             (1 - mp.exp(-2) * (mp.cos(6) - 3 * mp.sin(6))) / 10, "gauss-legendre"),
+            (lambda xs: [1 / (1 + x**2) for x in xs], -1, 1, mp.pi / 2, "gauss-legendre"),
+            # особенность на конце отрезка: только tanh-sinh
+            (lambda xs: [mp.sqrt(x) * mp.log(x) for x in xs], 0, 1, -mp.mpf(4) / 9, "tanh-sinh"),
+        ]
+        for f, a, b, exact, method in cases:
+            value, err, n_evals = integrate(f, a, b, method=method)
+            assert abs(value - exact) <= err + mp.mpf(10) ** -28
+            assert err < mp.mpf(10) ** -25 and n_evals > 0
+
+
+def test_integrate_batches_and_limits():
+    calls = []
+
+    def f(xs):
+        calls.append(len(xs))
+        return [mp.sin(x) for x in xs]
+
+    with mp.workdps(20):
+        value, err, n_evals = integrate(f, 0, mp.pi)
+        assert abs(value - 2) <= err + mp.mpf(10) ** -18
+        assert sum(calls) == n_evals and len(calls) <= 8  # один вызов на степень правила
+        _, err_low, _ = integrate(lambda xs: [mp.sqrt(x) for x in xs], 0, 1, max_degree=2)
+        assert err_low > mp.mpf(10) ** -10
+    with pytest.raises(ValueError):
+        integrate(f, 0, 1, method="simpson")
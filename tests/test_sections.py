@@ -0,0 +1,47 @@
+"""Скрипты rigorous/ импортируются без вычислений; run_sections выбирает разделы, @memo — по точности."""
+
+import glob
+import importlib
+import os
+import sys
+
+import pytest
+from mpmath import mp
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from rpft.sections import memo, run_sections
+
+
+def test_scripts_import_without_side_effects(capsys):
+    dps = mp.dps
+    for path in sorted(glob.glob(os.path.join(ROOT, "rigorous", "[0-9]*.py"))):
+        module = importlib.import_module("rigorous." + os.path.basename(path)[:-3])
+        assert callable(module.main), path
+        assert mp.dps == dps, path
+    assert capsys.readouterr().out == ""
+
+
+def test_run_sections_selection_and_memo(capsys):
+    calls = []
+
+    @memo
+    def shared(n):
+        calls.append((n, mp.dps))
+        return mp.mpf(n) / 3
+
+    sections = {"1": lambda: {"x": shared(1)}, "2a": lambda: {"y": shared(1) + shared(2)}}
+    results = run_sections(sections, ["2a"], dps=25)
+    assert list(results) == ["2a"] and calls == [(1, 25), (2, 25)]
+    results = run_sections(sections, [], dps=25)
+    assert list(results) == ["1", "2a"] and len(calls) == 2
+    run_sections(sections, ["1"], dps=40)
+    assert calls[-1] == (1, 40)
+    shared.cache_clear()
+    run_sections(sections, ["1"], dps=25)
+    assert calls[-1] == (1, 25) and len(calls) == 4
+    assert run_sections(sections, ["--list"]) == {}
+    with pytest.raises(SystemExit):
+        run_sections(sections, ["3"])
+    assert "неизвестные разделы: 3" in capsys.readouterr().err
@@ -0,0 +1,36 @@
+"""Ускорение рядов и таблицы сходимости: против ζ Гурвица; оценка ошибки не занижена."""
+
+import os
+import sys
+
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.series import accelerated_sum, convergence_study
+
+
+def test_richardson_and_levin_match_hurwitz():
+    with mp.workdps(30):
+        cases = [
+            (lambda n: 1 / n**2, 1, mp.zeta(2)),
+            (lambda n: 1 / (n + mp.mpf(1) / 3)**3, 0, mp.zeta(3, mp.mpf(1) / 3)),
+            (lambda n: 1 / (n * n - mp.mpf(1) / 4), 1, mp.mpf(2)),  # Σ 1/((n−½)(n+½)) = 2
+        ]
+        # Левин-u по 100 суммам на степенной сходимости точен лишь до ~10⁻⁸
+        accuracy = {"richardson": mp.mpf(10) ** -25, "levin": mp.mpf(10) ** -6}
+        for term, n0, exact in cases:
+            for method, target in accuracy.items():
+                value, err = accelerated_sum(term, n0=n0, method=method)
+                # оценка ошибки не занижена (с точностью до округления)
+                assert abs(value - exact) <= 1.01 * err + mp.mpf(10) ** -27, (method, n0)
+                assert err < target, (method, n0)
+
+
+def test_convergence_table_and_limit():
+    with mp.workdps(30):
+        table = convergence_study(lambda n: 1 / mp.mpf(n)**2, [10, 100, 400], limit="richardson")
+        assert table.checkpoints == [10, 100, 400]
+        for N, value in zip(table.checkpoints, table.values):
+            assert abs(value - (mp.zeta(2) - mp.zeta(2, N + 1))) < mp.mpf(10) ** -25
+        assert abs(table.limit - mp.zeta(2)) <= 1.01 * table.error + mp.mpf(10) ** -27
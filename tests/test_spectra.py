@@ -0,0 +1,75 @@
+"""Кратности на L(p,q): счёт по вычетам против прямого перебора весов и тождеств по twist; общий кэш уровней."""
+
+import os
+import sys
+from math import gcd
+
+import numpy as np
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.spectra import _branches, _spin_sign, lens_multiplicity, spectrum
+
+S3_MULT = {"scalar": lambda n: (n + 1)**2, "coexact": lambda n: 2 * n * (n + 2),
+           "dirac": lambda n: 2 * (n + 1) * (n + 2)}
+
+
+def _brute_force(operator, n, p, q, spin, twist):
+    """Прямой перебор весов (m₁, m₂): Φ = 2m₁(1+q) + 2m₂(1−q) + 2κ + σp ≡ 0 (mod 2p)."""
+    q %= p
+    sigma = _spin_sign(operator, p, q, spin)
+    count = 0
+    for A, B in _branches(operator, n):
+        for i in range(A + 1):
+            for k in range(B + 1):
+                phi = (A - 2 * i) * (1 + q) + (B - 2 * k) * (1 - q) + 2 * twist + sigma * p
+                count += phi % (2 * p) == 0
+    return count
+
+
+def test_residue_count_matches_brute_force():
+    for operator in ("scalar", "coexact", "dirac"):
+        for p in range(1, 6):
+            for q in [q for q in range(1, max(p, 2)) if gcd(p, q) == 1]:
+                for spin in ((0, 1) if p % 2 == 0 else (0,)):
+                    for twist in range(p):
+                        n = np.arange(1 if operator == "coexact" else 0, 12)
+                        fast = lens_multiplicity(operator, n, p, q, spin, twist)
+                        slow = [_brute_force(operator, int(m), p, q, spin, twist) for m in n]
+                        assert fast.tolist() == slow, (operator, p, q, spin, twist)
+
+
+def test_twists_partition_the_S3_level():
+    n = np.arange(0, 30)
+    for operator, d in S3_MULT.items():
+        for p, q in ((2, 1), (3, 1), (5, 2), (7, 3)):
+            total = sum(lens_multiplicity(operator, n, p, q, 0, twist) for twist in range(p))
+            expected = np.where(n >= (1 if operator == "coexact" else 0), d(n), 0)
+            assert total.tolist() == expected.tolist(), (operator, p, q)
+
+
+def test_RP3_scalar_parity_rule():
+    n = np.arange(0, 40)
+    even = lens_multiplicity("scalar", n, p=2, twist=0)
+    odd = lens_multiplicity("scalar", n, p=2, twist=1)
+    assert even.tolist() == np.where(n % 2 == 0, (n + 1)**2, 0).tolist()
+    assert odd.tolist() == np.where(n % 2 == 1, (n + 1)**2, 0).tolist()
+    legacy = spectrum("scalar", 39, p=1, parity="even")
+    assert legacy.mult.tolist() == spectrum("scalar", 39, p=2).mult.tolist()
+
+
+def test_cutoffs_share_sector_levels():
+    # разные обрезания одного сектора — префиксы общих массивов и общих mpf-значений
+    small, large = spectrum("coexact", 30, p=3, twist=1), spectrum("coexact", 90, p=3, twist=1)
+    assert spectrum("coexact", 30, p=3, twist=1) is small
+    assert small._levels is large._levels
+    assert np.array_equal(large.n[:len(small)], small.n) and np.array_equal(large.mult[:len(small)], small.mult)
+    assert not large.mult.flags.writeable
+    with mp.workdps(30):
+        logs = large.log_eigenvalues_mp()
+        assert all(a is b for a, b in zip(small.log_eigenvalues_mp(), logs))
+        assert all(v == mp.log(lam) for v, lam in zip(logs, large.eigenvalues_mp()))
+    with mp.workdps(50):
+        assert abs(small.log_eigenvalues_mp()[0] - mp.log(mp.mpf(int(small.lam_num[0])) / small.lam_den)) \
+            < mp.mpf(10) ** -48
@@ -0,0 +1,77 @@
+"""Распространение погрешностей: производные Dual против аналитических и разностных; linear против mc."""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.uncertainty import Dual, _DualContext, propagate
+
+_POINT = {"x": 0.7, "y": 1.9}
+
+
+def _formula(ctx, x, y):
+    return ctx.exp(x) * ctx.sqrt(y) / (1 + x * y) + ctx.log1p(x) ** 2 - y ** x + 2 ** x - ctx.cos(y) / x
+
+
+def test_dual_gradient_matches_finite_differences():
+    duals = {name: Dual(v, np.eye(2)[i]) for i, (name, v) in enumerate(_POINT.items())}
+    out = _formula(_DualContext, **duals)
+    assert out.value == pytest.approx(_formula(_DualContext, **_POINT), rel=1e-15)
+    h = 1e-6
+    for i, name in enumerate(_POINT):
+        up, down = dict(_POINT), dict(_POINT)
+        up[name] += h
+        down[name] -= h
+        fd = (_formula(_DualContext, **up) - _formula(_DualContext, **down)) / (2 * h)
+        assert out.grad[i] == pytest.approx(fd, rel=1e-8)
+
+
+def test_dual_analytic_derivatives():
+    x = Dual(0.5, np.array([1.0]))
+    cases = [
+        (x ** 3, 3 * 0.5 ** 2),
+        (x ** x, 0.5 ** 0.5 * (math.log(0.5) + 1)),
+        (3 / x, -3 / 0.25),
+        (1 - x, -1.0),
+        (abs(-x), 1.0),
+        (_DualContext.sin(x) * _DualContext.log(x), math.cos(0.5) * math.log(0.5) + math.sin(0.5) / 0.5),
+    ]
+    for value, derivative in cases:
+        assert value.grad[0] == pytest.approx(derivative, rel=1e-14)
+
+
+def test_linear_and_mc_agree():
+    inputs = {"x": (0.7, 1e-3), "y": (1.9, 2e-3)}
+    corr = {("x", "y"): 0.6}
+    linear = propagate(_formula, inputs, corr=corr)
+    mc = propagate(_formula, inputs, method="mc", corr=corr, n=200_000, chunk=30_000)
+    g = np.array([linear.gradient["x"], linear.gradient["y"]])
+    cov = np.array([[1e-6, 0.6 * 2e-6], [0.6 * 2e-6, 4e-6]])
+    assert linear.sigma == pytest.approx(math.sqrt(g @ cov @ g), rel=1e-12)
+    assert mc.value == linear.value
+    assert mc.sigma == pytest.approx(linear.sigma, rel=0.02)
+    assert mc.mean == pytest.approx(linear.value, abs=3 * linear.sigma / math.sqrt(200_000) + 1e-9)
+
+
+def test_exact_and_fully_correlated_inputs():
+    # σ = 0 (точная константа) и r = 1: Σ вырождена, выборка всё равно корректна
+    inputs = {"a": (2.0, 0.0), "b": (3.0, 0.01), "c": (5.0, 0.02)}
+    corr = {("b", "c"): 1.0}
+
+    def combine(ctx, a, b, c):
+        return {"sum": a * b + c, "diff": c - 2 * b}
+
+    linear = propagate(combine, inputs, corr=corr)
+    mc = propagate(combine, inputs, method="mc", corr=corr, n=50_000)
+    assert linear["sum"].sigma == pytest.approx(2 * 0.01 + 0.02, rel=1e-12)
+    assert linear["diff"].sigma < 1e-15 and mc["diff"].sigma < 1e-12
+    assert mc["sum"].sigma == pytest.approx(linear["sum"].sigma, rel=0.02)
+    assert linear["sum"].gradient["a"] == 3.0
+
+    with pytest.raises(ValueError):
+        propagate(combine, inputs, method="quadrature")
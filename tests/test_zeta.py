@@ -0,0 +1,80 @@
+"""LatticeZeta: ζ(s), ζ(0) и ζ′(0) против замкнутых форм через ζ Гурвица и прямых сумм; ∂_θ TwistedZeta; ∂_s SpectralSum."""
+
+import os
+import sys
+
+from mpmath import mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpft.twist import TwistedZeta
+from rpft.spectra import spectrum
+from rpft.zeta import SpectralSum, spectral_zeta
+
+
+def _tol():
+    return mp.mpf(10) ** (-mp.dps + 3)
+
+
+def test_dirac_S3_closed_form():
+    # λ = m², d = 2(m² − 1/4), m ∈ 3/2 + N₀: ζ(s) = 2ζ_H(2s−2, 3/2) − ½ζ_H(2s, 3/2)
+    with mp.workdps(30):
+        a = mp.mpf(3) / 2
+        zeta = spectral_zeta("dirac", p=1)
+        assert abs(zeta.value_at_zero() - (2 * mp.zeta(-2, a) - mp.zeta(0, a) / 2)) < _tol()
+        expected = 4 * mp.zeta(-2, a, 1) - mp.zeta(0, a, 1)
+        assert abs(zeta.derivative_at_zero() - expected) < _tol()
+
+
+def test_coexact_S3_closed_form():
+    # λ = m², d = 2(m² − 1), m ≥ 2: ζ(s) = 2ζ_H(2s−2, 2) − 2ζ_H(2s, 2)
+    with mp.workdps(30):
+        zeta = spectral_zeta("coexact", p=1)
+        assert abs(zeta.value_at_zero() - (2 * mp.zeta(-2, 2) - 2 * mp.zeta(0, 2))) < _tol()
+        expected = 4 * mp.zeta(-2, 2, 1) - 4 * mp.zeta(0, 2, 1)
+        assert abs(zeta.derivative_at_zero() - expected) < _tol()
+
+
+def test_scalar_S3_matches_direct_sum():
+    # λ = m² − 1 (c ≠ 0: биномиальный ряд по c), d = m², m ≥ 2; при s = 3 ряд сходится быстро
+    with mp.workdps(30):
+        direct = mp.nsum(lambda m: m**2 * (m**2 - 1)**-3, [2, mp.inf])
+        assert abs(spectral_zeta("scalar", p=1)(3) - direct) < _tol()
+
+
+def test_RP3_sectors_add_up_to_S3():
+    # секторы twist = 0, 1 на RP³ вместе дают все уровни S³
+    with mp.workdps(25):
+        for operator in ("scalar", "coexact", "dirac"):
+            total = sum(spectral_zeta(operator, p=2, twist=k).derivative_at_zero() for k in (0, 1))
+            assert abs(total - spectral_zeta(operator, p=1).derivative_at_zero()) < _tol(), operator
+
+
+def test_twisted_theta_derivatives():
+    # λ_j = (j + 1 + θ/π)², d_j = (j + 1)²: аналитическая ∂_θ против численного дифференцирования
+    with mp.workdps(30):
+        zeta = TwistedZeta([(1, 1, 1 / mp.pi, 0, ((0, 1), (1, 2), (2, 1)))])
+        theta = mp.mpf("0.3")
+        tol = mp.mpf(10) ** -18
+        assert abs(zeta.dtheta_zeta(3, theta) - mp.diff(lambda x: zeta.zeta(3, x), theta)) < tol
+        assert abs(zeta.dtheta_derivative_at_zero(theta)
+                   - mp.diff(zeta.derivative_at_zero, theta)) < tol
+        assert abs(zeta.dtheta_value_at_zero(theta) - mp.diff(zeta.value_at_zero, theta)) < tol
+        # θ = 0: спектр λ = m², d = m², m ≥ 1, т. е. ζ(s) = ζ_R(2s − 2)
+        assert abs(zeta.zeta(3, 0) - mp.zeta(4)) < tol
+
+
+def test_spectral_sum_derivatives():
+    # аналитические ∂_s^k конечной суммы против численного дифференцирования
+    with mp.workdps(30):
+        spec = spectrum("dirac", 60, p=2, twist=1)
+        total = SpectralSum(spec)
+        s = mp.mpf("0.4")
+        values = total.derivatives(s, order=2)
+        for k, value in enumerate(values):
+            assert abs(value - mp.diff(total, s, k)) < mp.mpf(10) ** -20 * max(1, abs(value))
+        table = total.derivatives(s, order=1, checkpoints=[10, len(spec.mult)])
+        assert all(abs(a - b) < _tol() * abs(b) for a, b in zip(table.values[-1], values[:2]))
+        weights = [1 if n % 2 else -1 for n in range(len(spec.mult))]
+        assert abs(SpectralSum(spec, weights)(s)
+                   - mp.fsum(w * mp.mpf(lam) ** -s for w, lam in zip(weights, spec.eigenvalues_mp()))) < _tol()
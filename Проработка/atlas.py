@@ -1,6 +1,13 @@
+import os
+import sys
+
 import numpy as np
 import math
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft.alpha import s_vac
+from rpft.constants import edition
+
 class UGVP_Atlas_Verifier:
     def __init__(self):
         print("================================================================")
@@ -11,25 +18,23 @@ class UGVP_Atlas_Verifier:
         # --- 1. ВХОДНЫЕ ДАННЫЕ (ТОЛЬКО ФУНДАМЕНТ) ---
         self.pi = np.pi
         
-        # SI Constants (Input for Scale only) - CODATA 2022
-        self.h = 6.62607015e-34
-        self.e = 1.602176634e-19
-        self.me_kg = 9.1093837015e-31
-        self.c_exact = 299792458
-        self.G = 6.67430e-11
+        # SI Constants (Input for Scale only) - CODATA, издание RPFT_CODATA (по умолчанию 2018)
+        codata = edition(default="2018")
+        self.h = float(codata["h"])
+        self.e = float(codata["e"])
+        self.me_kg = float(codata["m_e_kg"])
+        self.c_exact = int(codata["c"].value)
+        self.G = float(codata["G"])
         self.ke = 8.98755179e9  # Coulomb constant
         
         # Atomic Mass Units (u)
-        self.me_u = 0.000548579909
-        self.mp_u_ref = 1.007276466621
-        self.mn_u_ref = 1.008664915950
+        self.me_u = float(codata["m_e_u"])
+        self.mp_u_ref = float(codata["m_p_u"])
+        self.mn_u_ref = float(codata["m_n_u"])
         
         # --- 2. ГЕОМЕТРИЧЕСКОЕ ЯДРО (ВЫЧИСЛЕНИЕ S_vac) ---
-        S_geo = 4 * self.pi**3 + self.pi**2 + self.pi
-        delta_lat = 1 / (24 * S_geo)
-        delta_bb = 1 / (self.pi**4 * S_geo**2)
-        
-        self.S_vac = S_geo - delta_lat - delta_bb
+        # S_vac = S_geo − 1/(24·S_geo) − 1/(π⁴·S_geo²), S_geo = 4π³ + π² + π (rpft.alpha)
+        self.S_vac = float(s_vac(backend="float64"))
         self.alpha_geo = 1 / self.S_vac
         
         print(f"[AXIOM] Calculated S_vac: {self.S_vac:.12f}")
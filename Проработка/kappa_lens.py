@@ -1,4 +1,13 @@
+import os
+import sys
+
 import mpmath as mp
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rpft import spectrum
+from rpft.parallel import run_grid
+from rpft.zeta import SpectralSum
 
 mp.mp.dps = 80
 
@@ -7,51 +16,29 @@ mp.mp.dps = 80
 # Vectors coexact (Delta_1): lambda_n = (n+1)^2, mult_S3 = 2 n (n+2)
 # Dirac: eigenvalues ±(n+3/2), mult_S3 = 2 (n+1)(n+2)
 # On L(2,1): even n survive for bosons; odd n survive for spinor.
+# Reference sector: half of the S3 multiplicity at every n. The difference
+# d_L - d_ref = ±(1/2) d_S3 is a half-integer, so we keep the exact integers
+# 2(d_L - d_ref) = ±d_S3 and divide the sum by 2 once.
+# Levels, multiplicities and log(lambda) come from the shared rpft cache (exact ints, mpf per precision).
 
-def mult_scalar_L(n):
-    return 0.5 * (1 + (-1) ** n) * (n + 1) ** 2
-
-def mult_scalar_even_S3(n):
-    return 0.5 * (n + 1) ** 2
-
-def mult_vector_L(n):
-    return 0.5 * (1 + (-1) ** n) * 2 * n * (n + 2)
-
-def mult_vector_even_S3(n):
-    return 0.5 * 2 * n * (n + 2)
+OPERATOR = {"scalar": "scalar", "vector": "coexact", "dirac": "dirac"}
+SURVIVING_PARITY = {"scalar": 0, "vector": 0, "dirac": 1}
 
-def mult_dirac_L(n):
-    # note: odd n suppressed, so factor (1+(-1)^{n+1})
-    return 0.5 * (1 + (-1) ** (n + 1)) * 2 * (n + 1) * (n + 2)
+def twice_delta_mult(label, N):
+    sp = spectrum(OPERATOR[label], N, n_min=1)
+    sign = np.where(sp.n % 2 == SURVIVING_PARITY[label], 1, -1)
+    return sp, [int(w) for w in sign * sp.mult]
 
-def mult_dirac_even_S3(n):
-    # reference even sector
-    return 0.5 * 2 * (n + 1) * (n + 2)
+def delta_zeta_sum(N, label):
+    # 2·Δζ(s;N) as a SpectralSum: value and s-derivatives in one pass over the levels
+    sp, w2 = twice_delta_mult(label, N)
+    return SpectralSum(sp, weights=w2)
 
-def lam_scalar(n):
-    return n * (n + 2)
+def delta_zeta(s, N, label):
+    return delta_zeta_sum(N, label)(s) / 2
 
-def lam_vector(n):
-    return (n + 1) ** 2
-
-def lam_dirac(n):
-    return (n + 1.5) ** 2  # use square of eigenvalue for determinant
-
-def delta_zeta(s, N, mult_L, mult_ref, lam_fn):
-    s = mp.mpf(s)
-    total = mp.mpf("0")
-    for n in range(1, N + 1):
-        dL = mult_L(n)
-        dR = mult_ref(n)
-        if dL:
-            total += dL * lam_fn(n) ** (-s)
-        if dR:
-            total -= dR * lam_fn(n) ** (-s)
-    return total
-
-def delta_zeta_deriv0(N, mult_L, mult_ref, lam_fn):
-    f = lambda ss: delta_zeta(ss, N, mult_L, mult_ref, lam_fn)
-    return mp.diff(f, 0)
+def delta_zeta_deriv0(N, label):
+    return delta_zeta_sum(N, label).derivatives(0, order=1)[1] / 2
 
 # Reference circle scalar value
 ref_circle = -mp.log(mp.sqrt(2 * mp.pi))
@@ -59,13 +46,17 @@ ref_circle = -mp.log(mp.sqrt(2 * mp.pi))
 Ns = [10, 20, 40, 80]
 print("ref circle =", ref_circle)
 
-for label, mL, mR, lam in [
-    ("scalar", mult_scalar_L, mult_scalar_even_S3, lam_scalar),
-    ("vector", mult_vector_L, mult_vector_even_S3, lam_vector),
-    ("dirac", mult_dirac_L, mult_dirac_even_S3, lam_dirac),
-]:
+def kappa_table(label):
+    # One sweep to max(Ns): partial sums of (2Δζ, 2Δζ') at every cutoff
+    table = delta_zeta_sum(max(Ns), label).derivatives(0, order=1, checkpoints=Ns)
+    return [(N, dz0_twice / 2) for N, (_, dz0_twice) in table]
+
+# Operators run in parallel (RPFT_WORKERS processes); results come back in task order
+for res in run_grid(kappa_table, ["scalar", "vector", "dirac"]):
+    label = res.args[0]
     print(f"\n=== {label} Δζ'(0;N) with even-S3 subtraction ===")
-    for N in Ns:
-        dz0 = delta_zeta_deriv0(N, mL, mR, lam)
+    for N, dz0 in res.value:
         kappa = (-dz0) / ref_circle
         print(f"N={N:3d} dz0={dz0} kappa≈{kappa}")
+    if os.environ.get("RPFT_TIMINGS"):
+        print(f"[{label}: {res.elapsed:.3f} s, pid {res.worker}]", file=sys.stderr)